@@ -0,0 +1,327 @@
+"""In-process fake of the AMQP 0-9-1 topology methods used by ``RabbitMqAmqpService``.
+
+The fake shares its topology with a ``FakeRabbitMqManagement``, so entities declared over AMQP
+are listed by the management API and the other way round. It authenticates users and vhost
+access against the management fake, refuses inequivalent redeclares like a real broker and
+counts every method. Latency is added before each reply, the way a network round trip would,
+so pipelined ``nowait`` methods are not slowed down. Frames are encoded and decoded with pamqp,
+the codec aiormq uses.
+"""
+
+import asyncio
+from collections import Counter
+from typing import Any
+
+from pamqp import commands, constants, frame, header, heartbeat
+from pamqp.base import Frame
+
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement, _binding, _queue_type_error, _VHost
+
+# The heartbeat the fake proposes, the client negotiates its own
+_HEARTBEAT_SECONDS = 60
+
+
+class _ChannelError(Exception):
+    def __init__(self, reply_code: int, reply_text: str):
+        super().__init__(reply_text)
+        self.reply_code = reply_code
+        self.reply_text = reply_text
+
+
+class FakeAmqpServer:
+    """Serves the AMQP topology methods on a free localhost port.
+
+    Use as an async context manager; ``port`` is the value to put in ``RABBITMQ_AMQP_PORT``.
+
+    Attributes:
+        management (FakeRabbitMqManagement): The fake whose topology, users and permissions are used.
+        latency_seconds (float): Delay added before every reply.
+        fail_methods (dict[str, int]): Number of upcoming calls of a method, e.g. "queue.declare", answered
+            by forcing the connection closed.
+        method_counts (Counter[str]): Methods received, per method name.
+        round_trips (int): Replies sent to topology methods, pipelined ``nowait`` methods get none.
+        connections (int): Connections opened since the counts were reset.
+        heartbeats (list[int]): The heartbeat timeout each connection negotiated, in seconds.
+    """
+
+    def __init__(
+        self,
+        management: FakeRabbitMqManagement,
+        latency_seconds: float = 0.0,
+        fail_methods: dict[str, int] | None = None,
+    ):
+        self.management = management
+        self.latency_seconds = latency_seconds
+        self.fail_methods = dict(fail_methods or {})
+        self.method_counts: Counter[str] = Counter()
+        self.round_trips = 0
+        self.connections = 0
+        self.heartbeats: list[int] = []
+        self.host = "127.0.0.1"
+        self.port = 0
+        self._server: asyncio.Server | None = None
+        self._binding_index: dict[str, tuple[int, set[tuple[str, ...]]]] = {}
+        self._indexed_lengths: dict[str, int] = {}
+
+    def reset_counts(self) -> None:
+        self.method_counts.clear()
+        self.round_trips = 0
+        self.connections = 0
+
+    async def __aenter__(self) -> "FakeAmqpServer":
+        self._server = await asyncio.start_server(self._serve, self.host, 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._server = None
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            protocol_header = header.ProtocolHeader().marshal()
+            if await reader.readexactly(len(protocol_header)) != protocol_header:
+                writer.write(protocol_header)
+                return
+
+            vhost = await self._handshake(reader, writer)
+            if vhost is None:
+                return
+
+            closing_channels: set[int] = set()
+            while True:
+                channel, method = await _read_method(reader)
+                if isinstance(method, commands.Connection.Close):
+                    writer.write(frame.marshal(commands.Connection.CloseOk(), 0))
+                    return
+                if isinstance(method, commands.Channel.CloseOk):
+                    closing_channels.discard(channel)
+                    continue
+                if channel in closing_channels:
+                    # A closing channel discards every method until the client confirms the close
+                    continue
+                if isinstance(method, commands.Channel.Open):
+                    writer.write(frame.marshal(commands.Channel.OpenOk(), channel))
+                    continue
+                if isinstance(method, commands.Channel.Close):
+                    writer.write(frame.marshal(commands.Channel.CloseOk(), channel))
+                    continue
+
+                name = method.name.lower()
+                self.method_counts[name] += 1
+                if self.fail_methods.get(name):
+                    self.fail_methods[name] -= 1
+                    self._close_connection(writer, 320, "CONNECTION_FORCED - injected failure")
+                    return
+
+                try:
+                    reply = self._apply(self.management.vhosts[vhost], vhost, method)
+                except _ChannelError as e:
+                    await self._reply(
+                        writer,
+                        frame.marshal(
+                            commands.Channel.Close(
+                                reply_code=e.reply_code,
+                                reply_text=e.reply_text,
+                                class_id=method.index >> 16,
+                                method_id=method.index & 0xFFFF,
+                            ),
+                            channel,
+                        ),
+                    )
+                    closing_channels.add(channel)
+                    continue
+
+                if not getattr(method, "nowait", False):
+                    self.round_trips += 1
+                    await self._reply(writer, frame.marshal(reply, channel))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handshake(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> str | None:
+        writer.write(
+            frame.marshal(
+                commands.Connection.Start(
+                    server_properties={"product": "FakeAmqpServer", "capabilities": {"publisher_confirms": False}},
+                    mechanisms="PLAIN",
+                    locales="en_US",
+                ),
+                0,
+            )
+        )
+        _, start_ok = await _read_method(reader)
+        assert isinstance(start_ok, commands.Connection.StartOk)
+        _, username, _ = start_ok.response.split("\x00")
+        if username not in self.management.users:
+            self._close_connection(writer, 403, f"ACCESS_REFUSED - Login was refused for user '{username}'")
+            return None
+
+        writer.write(
+            frame.marshal(commands.Connection.Tune(channel_max=2047, frame_max=131072, heartbeat=_HEARTBEAT_SECONDS), 0)
+        )
+        _, tune_ok = await _read_method(reader)
+        assert isinstance(tune_ok, commands.Connection.TuneOk)
+
+        _, open_method = await _read_method(reader)
+        assert isinstance(open_method, commands.Connection.Open)
+        vhost = open_method.virtual_host
+        if vhost not in self.management.vhosts or (vhost, username) not in self.management.permissions:
+            self._close_connection(
+                writer, 530, f"NOT_ALLOWED - access to vhost '{vhost}' refused for user '{username}'"
+            )
+            return None
+
+        self.connections += 1
+        self.heartbeats.append(tune_ok.heartbeat)
+        writer.write(frame.marshal(commands.Connection.OpenOk(), 0))
+        return vhost
+
+    def _apply(self, state: _VHost, vhost: str, method: Frame) -> Frame:
+        if isinstance(method, commands.Exchange.Declare):
+            name = method.exchange
+            if name.startswith("amq."):
+                raise _ChannelError(403, f"ACCESS_REFUSED - exchange name '{name}' contains reserved prefix 'amq.*'")
+            declared = {
+                "type": method.exchange_type,
+                "durable": method.durable,
+                "auto_delete": method.auto_delete,
+                "internal": method.internal,
+            }
+            existing = state.exchanges.get(name)
+            if existing is not None:
+                _check_equivalent("exchange", name, vhost, existing, declared)
+            else:
+                state.exchanges[name] = {"name": name, "vhost": vhost, **declared, "arguments": method.arguments or {}}
+            return commands.Exchange.DeclareOk()
+
+        if isinstance(method, commands.Exchange.Delete):
+            name = method.exchange
+            if state.exchanges.pop(name, None) is not None:
+                state.bindings = [
+                    binding
+                    for binding in state.bindings
+                    if binding["source"] != name
+                    and not (binding["destination_type"] == "exchange" and binding["destination"] == name)
+                ]
+            return commands.Exchange.DeleteOk()
+
+        if isinstance(
+            method, (commands.Exchange.Bind, commands.Exchange.Unbind, commands.Queue.Bind, commands.Queue.Unbind)
+        ):
+            if isinstance(method, (commands.Exchange.Bind, commands.Exchange.Unbind)):
+                source, destination, destination_type = method.source, method.destination, "exchange"
+            else:
+                source, destination, destination_type = method.exchange, method.queue, "queue"
+            destinations = state.exchanges if destination_type == "exchange" else state.queues
+            if source not in state.exchanges:
+                raise _ChannelError(404, f"NOT_FOUND - no exchange '{source}' in vhost '{vhost}'")
+            if destination not in destinations:
+                raise _ChannelError(404, f"NOT_FOUND - no {destination_type} '{destination}' in vhost '{vhost}'")
+
+            binding = _binding(vhost, source, destination, destination_type, method.routing_key, method.arguments or {})
+            if isinstance(method, commands.Exchange.Bind):
+                reply: Frame = commands.Exchange.BindOk()
+            elif isinstance(method, commands.Queue.Bind):
+                reply = commands.Queue.BindOk()
+            else:
+                state.bindings[:] = [
+                    existing for existing in state.bindings if _binding_key(existing) != _binding_key(binding)
+                ]
+                return (
+                    commands.Exchange.UnbindOk()
+                    if isinstance(method, commands.Exchange.Unbind)
+                    else commands.Queue.UnbindOk()
+                )
+
+            keys = self._binding_keys(vhost, state)
+            if _binding_key(binding) not in keys:
+                state.bindings.append(binding)
+                keys.add(_binding_key(binding))
+                self._indexed_lengths[vhost] = len(state.bindings)
+            return reply
+
+        if isinstance(method, commands.Queue.Declare):
+            name = method.queue
+            declared = {
+                "durable": method.durable,
+                "auto_delete": method.auto_delete,
+                "exclusive": method.exclusive,
+                "arguments": method.arguments or {},
+            }
+            error = _queue_type_error(name, vhost, declared)
+            if error is not None:
+                raise _ChannelError(406, error)
+            existing = state.queues.get(name)
+            if existing is not None:
+                _check_equivalent("queue", name, vhost, existing, declared)
+            else:
+                # Every queue is bound to the default exchange with its own name as routing key
+                state.bindings.append(_binding(vhost, "", name, "queue", name, {}))
+                state.queues[name] = {"name": name, "vhost": vhost, **declared, "messages": 0}
+            return commands.Queue.DeclareOk(queue=name, message_count=0, consumer_count=0)
+
+        if isinstance(method, commands.Queue.Delete):
+            name = method.queue
+            if state.queues.pop(name, None) is not None:
+                state.bindings = [
+                    binding
+                    for binding in state.bindings
+                    if not (binding["destination_type"] == "queue" and binding["destination"] == name)
+                ]
+            return commands.Queue.DeleteOk(message_count=0)
+
+        raise _ChannelError(540, f"NOT_IMPLEMENTED - {method.name} is not supported by the fake")
+
+    def _binding_keys(self, vhost: str, state: _VHost) -> set[tuple[str, ...]]:
+        """Gets the keys of a vhost's bindings, so large pipelined batches are not checked in quadratic time.
+
+        The index is rebuilt whenever the binding list was replaced or resized by the management fake.
+        """
+        list_id, keys = self._binding_index.get(vhost, (0, set()))
+        if list_id != id(state.bindings) or self._indexed_lengths.get(vhost) != len(state.bindings):
+            keys = {_binding_key(binding) for binding in state.bindings}
+            self._binding_index[vhost] = (id(state.bindings), keys)
+            self._indexed_lengths[vhost] = len(state.bindings)
+        return keys
+
+    async def _reply(self, writer: asyncio.StreamWriter, data: bytes) -> None:
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        writer.write(data)
+        await writer.drain()
+
+    def _close_connection(self, writer: asyncio.StreamWriter, reply_code: int, reply_text: str) -> None:
+        writer.write(
+            frame.marshal(
+                commands.Connection.Close(reply_code=reply_code, reply_text=reply_text, class_id=0, method_id=0), 0
+            )
+        )
+
+
+async def _read_method(reader: asyncio.StreamReader) -> tuple[int, Frame]:
+    while True:
+        frame_header = await reader.readexactly(constants.FRAME_HEADER_SIZE)
+        _, _, size = frame.frame_parts(frame_header)
+        _, channel, value = frame.unmarshal(frame_header + await reader.readexactly((size or 0) + 1))
+        if isinstance(value, heartbeat.Heartbeat):
+            continue
+        if isinstance(value, Frame):
+            return channel, value
+
+
+def _binding_key(binding: dict[str, Any]) -> tuple[str, ...]:
+    return (binding["source"], binding["destination_type"], binding["destination"], binding["properties_key"])
+
+
+def _check_equivalent(kind: str, name: str, vhost: str, existing: dict[str, Any], declared: dict[str, Any]) -> None:
+    for key, value in declared.items():
+        if existing.get(key, value) != value:
+            raise _ChannelError(
+                406,
+                f"PRECONDITION_FAILED - inequivalent arg '{key}' for {kind} '{name}' in vhost '{vhost}': "
+                f"received '{value}' but current is '{existing.get(key)}'",
+            )
@@ -0,0 +1,230 @@
+"""In-process fake of the confluent-kafka ``AdminClient`` calls used by ``KafkaService``.
+
+The fake keeps the cluster topics and their configs in memory, answers with the same metadata,
+future and config types as the real client and counts every call. The metadata of every partition
+is built on each ``list_topics`` call like the real client does, so its cost grows with the
+cluster size. Latency, controller errors and partition leader elections can be simulated.
+"""
+
+import random
+import time
+from collections import Counter
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any
+
+from confluent_kafka import KafkaError, KafkaException
+from confluent_kafka.admin import (
+    BrokerMetadata,
+    ClusterMetadata,
+    ConfigEntry,
+    ConfigResource,
+    ConfigSource,
+    NewTopic,
+    PartitionMetadata,
+    TopicMetadata,
+)
+
+from cezzis_com_bootstrapper.domain.config import KafkaOptions
+from cezzis_com_bootstrapper.infrastructure.services.kafka_service import KafkaService
+
+DEFAULT_TOPIC_CONFIGS: dict[str, str] = {
+    "cleanup.policy": "delete",
+    "compression.type": "producer",
+    "max.message.bytes": "1048588",
+    "min.insync.replicas": "1",
+    "retention.bytes": "-1",
+    "retention.ms": "604800000",
+    "segment.bytes": "1073741824",
+}
+
+
+@dataclass
+class KafkaFaultInjection:
+    """Latency, errors and leader elections added to admin calls.
+
+    Attributes:
+        latency_seconds (float): Fixed delay added to every admin call.
+        metadata_latency_per_partition_seconds (float): Extra ``list_topics`` delay per partition in the cluster,
+            simulating the transfer of large metadata responses.
+        controller_error_rate (float): Probability of failing a topic create or config alter with a retriable
+            NOT_CONTROLLER error, as during a controller failover.
+        fail_calls (dict[str, int]): Number of upcoming calls to fail with a transport error per method,
+            e.g. {"list_topics": 2}.
+        ready_after_polls (int): Metadata requests a new topic's partitions stay without leader.
+        seed (int | None): Seed of the random source, so runs can be replayed.
+    """
+
+    latency_seconds: float = 0.0
+    metadata_latency_per_partition_seconds: float = 0.0
+    controller_error_rate: float = 0.0
+    fail_calls: dict[str, int] = field(default_factory=dict)
+    ready_after_polls: int = 0
+    seed: int | None = None
+
+
+@dataclass
+class _Topic:
+    partitions: int
+    configs: dict[str, str] = field(default_factory=dict)
+    leaderless_polls: int = 0
+
+
+class FakeKafkaAdmin:
+    """The in-memory cluster state, answering the ``AdminClient`` calls ``KafkaService`` makes.
+
+    Attributes:
+        brokers (int): Number of brokers partition leaders are spread over.
+        faults (KafkaFaultInjection): The latency, errors and leader elections simulated.
+        call_counts (Counter[str]): Admin calls served per method, e.g. "list_topics".
+        topics (dict[str, _Topic]): The topics in the cluster.
+    """
+
+    def __init__(self, brokers: int = 3, faults: KafkaFaultInjection | None = None):
+        self.brokers = brokers
+        self.faults = faults or KafkaFaultInjection()
+        self.call_counts: Counter[str] = Counter()
+        self.topics: dict[str, _Topic] = {}
+        self._random = random.Random(self.faults.seed)
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.call_counts.values())
+
+    @property
+    def total_partitions(self) -> int:
+        return sum(topic.partitions for topic in self.topics.values())
+
+    def reset_counts(self) -> None:
+        self.call_counts.clear()
+
+    def add_topics(self, count: int, partitions: int, prefix: str = "existing") -> None:
+        """Adds ready topics to the cluster, to grow its metadata before a run."""
+        for index in range(count):
+            self.topics[f"{prefix}-{index:05d}"] = _Topic(partitions=partitions, configs=dict(DEFAULT_TOPIC_CONFIGS))
+
+    def list_topics(self, topic: str | None = None, timeout: float = -1) -> ClusterMetadata:
+        self._begin_call("list_topics")
+        self._sleep(self.faults.metadata_latency_per_partition_seconds * self.total_partitions)
+
+        metadata = ClusterMetadata()
+        metadata.cluster_id = "fake-cluster"
+        metadata.controller_id = 0
+        for broker_id in range(self.brokers):
+            broker = BrokerMetadata()
+            broker.id, broker.host, broker.port = broker_id, f"broker-{broker_id}", 9092
+            metadata.brokers[broker_id] = broker
+
+        for name, state in self.topics.items():
+            if topic is not None and name != topic:
+                continue
+            metadata.topics[name] = self._topic_metadata(name, state)
+            if state.leaderless_polls:
+                state.leaderless_polls -= 1
+        return metadata
+
+    def create_topics(self, new_topics: list[NewTopic], **kwargs: Any) -> dict[str, Future]:
+        self._begin_call("create_topics")
+        futures: dict[str, Future] = {}
+        for new_topic in new_topics:
+            if new_topic.topic in self.topics:
+                futures[new_topic.topic] = _failed(KafkaError(KafkaError.TOPIC_ALREADY_EXISTS))
+            elif self._controller_error():
+                futures[new_topic.topic] = _failed(KafkaError(KafkaError.NOT_CONTROLLER, retriable=True))
+            else:
+                self.topics[new_topic.topic] = _Topic(
+                    partitions=new_topic.num_partitions,
+                    configs={**DEFAULT_TOPIC_CONFIGS, **(new_topic.config or {})},
+                    leaderless_polls=self.faults.ready_after_polls,
+                )
+                futures[new_topic.topic] = _completed(None)
+        return futures
+
+    def describe_configs(self, resources: list[ConfigResource], **kwargs: Any) -> dict[ConfigResource, Future]:
+        self._begin_call("describe_configs")
+        futures: dict[ConfigResource, Future] = {}
+        for resource in resources:
+            state = self.topics.get(resource.name)
+            if state is None:
+                futures[resource] = _failed(KafkaError(KafkaError.UNKNOWN_TOPIC_OR_PART))
+                continue
+            futures[resource] = _completed(
+                {
+                    name: ConfigEntry(
+                        name,
+                        value,
+                        source=ConfigSource.DEFAULT_CONFIG
+                        if DEFAULT_TOPIC_CONFIGS.get(name) == value
+                        else ConfigSource.DYNAMIC_TOPIC_CONFIG,
+                        is_default=DEFAULT_TOPIC_CONFIGS.get(name) == value,
+                    )
+                    for name, value in state.configs.items()
+                }
+            )
+        return futures
+
+    def incremental_alter_configs(self, resources: list[ConfigResource], **kwargs: Any) -> dict[ConfigResource, Future]:
+        self._begin_call("incremental_alter_configs")
+        futures: dict[ConfigResource, Future] = {}
+        for resource in resources:
+            state = self.topics.get(resource.name)
+            if state is None:
+                futures[resource] = _failed(KafkaError(KafkaError.UNKNOWN_TOPIC_OR_PART))
+            elif self._controller_error():
+                futures[resource] = _failed(KafkaError(KafkaError.NOT_CONTROLLER, retriable=True))
+            else:
+                state.configs.update({entry.name: entry.value for entry in resource.incremental_configs})
+                futures[resource] = _completed(None)
+        return futures
+
+    def _begin_call(self, method: str) -> None:
+        self.call_counts[method] += 1
+        self._sleep(self.faults.latency_seconds)
+        remaining = self.faults.fail_calls.get(method, 0)
+        if remaining:
+            self.faults.fail_calls[method] = remaining - 1
+            raise KafkaException(KafkaError(KafkaError._TRANSPORT, f"Injected failure of {method}"))
+
+    def _controller_error(self) -> bool:
+        return bool(self.faults.controller_error_rate) and self._random.random() < self.faults.controller_error_rate
+
+    def _topic_metadata(self, name: str, state: _Topic) -> TopicMetadata:
+        topic = TopicMetadata()
+        topic.topic = name
+        for partition_id in range(state.partitions):
+            partition = PartitionMetadata()
+            partition.id = partition_id
+            partition.leader = -1 if state.leaderless_polls else partition_id % self.brokers
+            partition.replicas = [partition_id % self.brokers]
+            partition.isrs = [] if state.leaderless_polls else partition.replicas
+            topic.partitions[partition_id] = partition
+        return topic
+
+    @staticmethod
+    def _sleep(seconds: float) -> None:
+        # Admin calls block their caller like the real client, KafkaService runs them in a worker thread
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class FakeKafkaService(KafkaService):
+    """A ``KafkaService`` whose admin calls are answered by a ``FakeKafkaAdmin``."""
+
+    def __init__(self, kafka_options: KafkaOptions, admin: FakeKafkaAdmin):
+        super().__init__(kafka_options)
+        self.admin = admin
+
+    def _create_admin_client(self) -> FakeKafkaAdmin:
+        return self.admin
+
+
+def _completed(result: Any) -> Future:
+    future: Future = Future()
+    future.set_result(result)
+    return future
+
+
+def _failed(error: KafkaError) -> Future:
+    future: Future = Future()
+    future.set_exception(KafkaException(error))
+    return future
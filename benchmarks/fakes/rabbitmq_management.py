@@ -0,0 +1,705 @@
+"""In-process fake of the RabbitMQ management HTTP API endpoints used by ``RabbitMqAdminService``.
+
+The fake keeps the broker topology in memory, answers with the same JSON shapes as the real
+management plugin and counts every request. Latency and failures can be injected per request
+so reconcile behaviour can be measured without a broker.
+"""
+
+import asyncio
+import hashlib
+import random
+import re
+import urllib.parse
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from aiohttp import web
+
+_DEFAULT_EXCHANGES: dict[str, str] = {
+    "": "direct",
+    "amq.direct": "direct",
+    "amq.fanout": "fanout",
+    "amq.headers": "headers",
+    "amq.match": "headers",
+    "amq.rabbitmq.trace": "topic",
+    "amq.topic": "topic",
+}
+
+
+@dataclass
+class FaultInjection:
+    """Latency and failures added to every request.
+
+    Attributes:
+        latency_seconds (float): Fixed delay added before answering.
+        jitter_seconds (float): Random extra delay, drawn uniformly up to this value.
+        failure_rate (float): Probability of answering with ``failure_status`` instead of serving the request.
+        failure_status (int): Status code of injected failures.
+        fail_routes (dict[str, int]): Number of upcoming requests to fail per route, e.g. {"PUT /api/queues/{vhost}/{name}": 2}.
+        seed (int | None): Seed of the random source, so runs can be replayed.
+        stuck_shovels (bool): Whether shovels never move a message or finish, like a shovel outpaced by publishers.
+    """
+
+    latency_seconds: float = 0.0
+    jitter_seconds: float = 0.0
+    failure_rate: float = 0.0
+    failure_status: int = 503
+    fail_routes: dict[str, int] = field(default_factory=dict)
+    seed: int | None = None
+    stuck_shovels: bool = False
+
+
+@dataclass
+class _VHost:
+    exchanges: dict[str, dict[str, Any]] = field(default_factory=dict)
+    queues: dict[str, dict[str, Any]] = field(default_factory=dict)
+    bindings: list[dict[str, Any]] = field(default_factory=list)
+    policies: dict[str, dict[str, Any]] = field(default_factory=dict)
+    operator_policies: dict[str, dict[str, Any]] = field(default_factory=dict)
+    shovels: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+
+_Handler = Callable[["FakeRabbitMqManagement", web.Request, dict[str, str]], Awaitable[web.StreamResponse]]
+
+
+class FakeRabbitMqManagement:
+    """The in-memory broker state and the aiohttp application serving it.
+
+    Attributes:
+        admin_username (str): The administrator account, created at startup like on a real broker.
+        faults (FaultInjection): The latency and failures injected into requests.
+        request_counts (Counter[str]): Requests served per route, e.g. "GET /api/exchanges/{vhost}".
+        in_flight (int): Requests being served.
+        peak_in_flight (int): The most requests served at once since the counts were reset.
+        passwords (dict[str, str]): The password each user was last created or updated with.
+    """
+
+    def __init__(self, admin_username: str = "admin", faults: FaultInjection | None = None):
+        self.admin_username = admin_username
+        self.faults = faults or FaultInjection()
+        self.request_counts: Counter[str] = Counter()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.vhosts: dict[str, _VHost] = {}
+        self.users: dict[str, dict[str, Any]] = {admin_username: {"name": admin_username, "tags": ["administrator"]}}
+        self.permissions: dict[tuple[str, str], dict[str, str]] = {}
+        self.topic_permissions: dict[tuple[str, str], list[dict[str, str]]] = {}
+        self.passwords: dict[str, str] = {}
+        self._random = random.Random(self.faults.seed)
+        self._routes: list[tuple[str, re.Pattern[str], str, _Handler]] = []
+
+        self._route("GET", "/api/overview", _get_overview)
+        self._route("GET", "/api/definitions", _get_definitions)
+        self._route("GET", "/api/definitions/{vhost}", _get_definitions)
+        self._route("GET", "/api/vhosts/{vhost}", _get_vhost)
+        self._route("PUT", "/api/vhosts/{vhost}", _put_vhost)
+        self._route("GET", "/api/vhosts/{vhost}/permissions", _list_vhost_permissions)
+        self._route("GET", "/api/vhosts/{vhost}/topic-permissions", _list_vhost_topic_permissions)
+        self._route("GET", "/api/users", _list_users)
+        self._route("GET", "/api/users/{user}", _get_user)
+        self._route("PUT", "/api/users/{user}", _put_user)
+        self._route("DELETE", "/api/users/{user}", _delete_user)
+        self._route("POST", "/api/users/bulk-delete", _bulk_delete_users)
+        self._route("GET", "/api/users/{user}/permissions", _list_user_permissions)
+        self._route("GET", "/api/permissions/{vhost}/{user}", _get_permissions)
+        self._route("PUT", "/api/permissions/{vhost}/{user}", _put_permissions)
+        self._route("DELETE", "/api/permissions/{vhost}/{user}", _delete_permissions)
+        self._route("PUT", "/api/topic-permissions/{vhost}/{user}", _put_topic_permissions)
+        self._route("DELETE", "/api/topic-permissions/{vhost}/{user}", _delete_topic_permissions)
+        self._route("GET", "/api/exchanges/{vhost}", _list_exchanges)
+        self._route("PUT", "/api/exchanges/{vhost}/{name}", _put_exchange)
+        self._route("DELETE", "/api/exchanges/{vhost}/{name}", _delete_exchange)
+        self._route("GET", "/api/exchanges/{vhost}/{name}/bindings/{direction}", _list_exchange_bindings)
+        self._route("GET", "/api/queues/{vhost}", _list_queues)
+        self._route("PUT", "/api/queues/{vhost}/{name}", _put_queue)
+        self._route("DELETE", "/api/queues/{vhost}/{name}", _delete_queue)
+        self._route("GET", "/api/queues/{vhost}/{name}/bindings", _list_queue_bindings)
+        self._route("GET", "/api/parameters/shovel/{vhost}/{name}", _get_shovel)
+        self._route("PUT", "/api/parameters/shovel/{vhost}/{name}", _put_shovel)
+        self._route("GET", "/api/bindings/{vhost}", _list_bindings)
+        self._route("GET", "/api/bindings/{vhost}/e/{source}/{type}/{destination}", _list_bindings_between)
+        self._route("POST", "/api/bindings/{vhost}/e/{source}/{type}/{destination}", _post_binding)
+        self._route("DELETE", "/api/bindings/{vhost}/e/{source}/{type}/{destination}/{props}", _delete_binding_between)
+        for policies_path in ("/api/policies", "/api/operator-policies"):
+            self._route("GET", policies_path + "/{vhost}", _list_policies)
+            self._route("PUT", policies_path + "/{vhost}/{name}", _put_policy)
+            self._route("DELETE", policies_path + "/{vhost}/{name}", _delete_policy)
+
+        self.app = web.Application()
+        self.app.router.add_route("*", "/api/{tail:.*}", self._dispatch)
+
+    @property
+    def total_requests(self) -> int:
+        return sum(self.request_counts.values())
+
+    def reset_counts(self) -> None:
+        self.request_counts.clear()
+        self.peak_in_flight = self.in_flight
+
+    def add_vhost(self, vhost: str) -> _VHost:
+        """Creates a vhost with the default exchanges a real broker declares."""
+        if vhost not in self.vhosts:
+            self.vhosts[vhost] = _VHost(
+                exchanges={
+                    name: {"name": name, "vhost": vhost, "type": kind, "durable": True, "auto_delete": False}
+                    for name, kind in _DEFAULT_EXCHANGES.items()
+                }
+            )
+        return self.vhosts[vhost]
+
+    def _route(self, method: str, template: str, handler: _Handler) -> None:
+        pattern = re.compile("^" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]*)", template) + "$")
+        self._routes.append((method, pattern, f"{method} {template}", handler))
+
+    async def _dispatch(self, request: web.Request) -> web.StreamResponse:
+        # Match on the raw path, names are quote_plus encoded and may contain encoded slashes
+        raw_path = request.raw_path.split("?", 1)[0]
+        for method, pattern, route, handler in self._routes:
+            match = pattern.match(raw_path)
+            if method == request.method and match:
+                self.request_counts[route] += 1
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                try:
+                    await self._inject_latency()
+                    if self._should_fail(route):
+                        return web.json_response(
+                            {"error": "injected_failure", "reason": route}, status=self.faults.failure_status
+                        )
+                    # Binding property keys are sent as returned by the API, already escaped
+                    params = {
+                        key: value if key == "props" else urllib.parse.unquote_plus(value)
+                        for key, value in match.groupdict().items()
+                    }
+                    return await handler(self, request, params)
+                finally:
+                    self.in_flight -= 1
+
+        self.request_counts[f"{request.method} <unknown>"] += 1
+        return _not_found()
+
+    async def _inject_latency(self) -> None:
+        delay = self.faults.latency_seconds
+        if self.faults.jitter_seconds:
+            delay += self._random.uniform(0, self.faults.jitter_seconds)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def _should_fail(self, route: str) -> bool:
+        remaining = self.faults.fail_routes.get(route, 0)
+        if remaining:
+            self.faults.fail_routes[route] = remaining - 1
+            return True
+        return bool(self.faults.failure_rate) and self._random.random() < self.faults.failure_rate
+
+
+class FakeRabbitMqServer:
+    """Serves a ``FakeRabbitMqManagement`` on a free localhost port.
+
+    Use as an async context manager; ``host`` and ``port`` are the values to put in ``RabbitMqOptions``.
+    """
+
+    def __init__(self, management: FakeRabbitMqManagement | None = None):
+        self.management = management or FakeRabbitMqManagement()
+        self.host = "http://127.0.0.1"
+        self.port = 0
+        self._runner: web.AppRunner | None = None
+
+    async def __aenter__(self) -> "FakeRabbitMqServer":
+        self._runner = web.AppRunner(self.management.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+        self._runner = None
+
+
+def _not_found() -> web.Response:
+    return web.json_response({"error": "Object Not Found", "reason": "Not Found"}, status=404)
+
+
+def _no_content() -> web.Response:
+    return web.Response(status=204)
+
+
+async def _json_body(request: web.Request) -> dict[str, Any]:
+    return await request.json() if request.can_read_body else {}
+
+
+async def _get_overview(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    return web.json_response({"management_version": "fake", "rabbitmq_version": "fake", "cluster_name": "fake"})
+
+
+async def _get_definitions(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    vhosts = [params["vhost"]] if "vhost" in params else list(fake.vhosts)
+    if any(vhost not in fake.vhosts for vhost in vhosts):
+        return _not_found()
+
+    return web.json_response(
+        {
+            "vhosts": [{"name": vhost} for vhost in vhosts],
+            "users": list(fake.users.values()),
+            "permissions": [
+                {"vhost": vhost, "user": user, **permissions}
+                for (vhost, user), permissions in fake.permissions.items()
+                if vhost in vhosts
+            ],
+            "topic_permissions": [
+                {"vhost": vhost, "user": user, **permission}
+                for (vhost, user), permissions in fake.topic_permissions.items()
+                if vhost in vhosts
+                for permission in permissions
+            ],
+            "exchanges": [
+                exchange
+                for vhost in vhosts
+                for name, exchange in fake.vhosts[vhost].exchanges.items()
+                if name and not name.startswith("amq.")
+            ],
+            "queues": [queue for vhost in vhosts for queue in fake.vhosts[vhost].queues.values()],
+            "bindings": [binding for vhost in vhosts for binding in fake.vhosts[vhost].bindings if binding["source"]],
+            "policies": [policy for vhost in vhosts for policy in fake.vhosts[vhost].policies.values()],
+        }
+    )
+
+
+async def _get_vhost(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    if params["vhost"] not in fake.vhosts:
+        return _not_found()
+    return web.json_response({"name": params["vhost"]})
+
+
+async def _put_vhost(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    if params["vhost"] not in fake.vhosts:
+        # Like the management plugin, the user creating a vhost is granted full permissions on it
+        fake.permissions[(params["vhost"], fake.admin_username)] = {"configure": ".*", "write": ".*", "read": ".*"}
+    fake.add_vhost(params["vhost"])
+    return _no_content()
+
+
+async def _list_users(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    return web.json_response(list(fake.users.values()))
+
+
+async def _get_user(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    user = fake.users.get(params["user"])
+    return web.json_response(user) if user is not None else _not_found()
+
+
+async def _put_user(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    body = await _json_body(request)
+    tags = body.get("tags", "")
+    fake.users[params["user"]] = {
+        "name": params["user"],
+        "tags": [tag for tag in tags.split(",") if tag] if isinstance(tags, str) else tags,
+    }
+    if "password" in body:
+        fake.passwords[params["user"]] = body["password"]
+    return _no_content()
+
+
+async def _delete_user(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    if params["user"] not in fake.users:
+        return _not_found()
+    _remove_user(fake, params["user"])
+    return _no_content()
+
+
+async def _bulk_delete_users(
+    fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]
+) -> web.Response:
+    body = await _json_body(request)
+    if not isinstance(body.get("users"), list):
+        return web.json_response({"error": "bad_request", "reason": "users must be a list"}, status=400)
+    # Like the broker, users that do not exist are ignored
+    for user in body["users"]:
+        _remove_user(fake, user)
+    return _no_content()
+
+
+def _remove_user(fake: FakeRabbitMqManagement, user: str) -> None:
+    fake.users.pop(user, None)
+    fake.passwords.pop(user, None)
+    for permissions in (fake.permissions, fake.topic_permissions):
+        for key in [key for key in permissions if key[1] == user]:
+            del permissions[key]
+
+
+async def _list_user_permissions(
+    fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]
+) -> web.Response:
+    if params["user"] not in fake.users:
+        return _not_found()
+    return web.json_response(
+        [
+            {"vhost": vhost, "user": user, **permissions}
+            for (vhost, user), permissions in fake.permissions.items()
+            if user == params["user"]
+        ]
+    )
+
+
+async def _get_permissions(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    permissions = fake.permissions.get((params["vhost"], params["user"]))
+    if permissions is None:
+        return _not_found()
+    return web.json_response({"vhost": params["vhost"], "user": params["user"], **permissions})
+
+
+async def _put_permissions(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    if params["vhost"] not in fake.vhosts or params["user"] not in fake.users:
+        return _not_found()
+    body = await _json_body(request)
+    fake.permissions[(params["vhost"], params["user"])] = {
+        "configure": body.get("configure", ""),
+        "write": body.get("write", ""),
+        "read": body.get("read", ""),
+    }
+    return _no_content()
+
+
+async def _delete_permissions(
+    fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]
+) -> web.Response:
+    if fake.permissions.pop((params["vhost"], params["user"]), None) is None:
+        return _not_found()
+    return _no_content()
+
+
+async def _list_vhost_permissions(
+    fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]
+) -> web.Response:
+    if params["vhost"] not in fake.vhosts:
+        return _not_found()
+    return web.json_response(
+        [
+            {"vhost": vhost, "user": user, **permissions}
+            for (vhost, user), permissions in fake.permissions.items()
+            if vhost == params["vhost"]
+        ]
+    )
+
+
+async def _list_vhost_topic_permissions(
+    fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]
+) -> web.Response:
+    if params["vhost"] not in fake.vhosts:
+        return _not_found()
+    return web.json_response(
+        [
+            {"vhost": vhost, "user": user, **permission}
+            for (vhost, user), permissions in fake.topic_permissions.items()
+            if vhost == params["vhost"]
+            for permission in permissions
+        ]
+    )
+
+
+async def _put_topic_permissions(
+    fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]
+) -> web.Response:
+    if params["vhost"] not in fake.vhosts or params["user"] not in fake.users:
+        return _not_found()
+    body = await _json_body(request)
+    # One topic permission per exchange, putting it again replaces it
+    permissions = fake.topic_permissions.setdefault((params["vhost"], params["user"]), [])
+    permissions[:] = [permission for permission in permissions if permission["exchange"] != body.get("exchange")]
+    permissions.append(
+        {"exchange": body.get("exchange", ""), "write": body.get("write", ""), "read": body.get("read", "")}
+    )
+    return _no_content()
+
+
+async def _delete_topic_permissions(
+    fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]
+) -> web.Response:
+    if fake.topic_permissions.pop((params["vhost"], params["user"]), None) is None:
+        return _not_found()
+    return _no_content()
+
+
+async def _list_exchanges(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    vhost = fake.vhosts.get(params["vhost"])
+    return web.json_response(list(vhost.exchanges.values())) if vhost is not None else _not_found()
+
+
+async def _put_exchange(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    vhost = fake.vhosts.get(params["vhost"])
+    if vhost is None:
+        return _not_found()
+    body = await _json_body(request)
+    vhost.exchanges[params["name"]] = {
+        "name": params["name"],
+        "vhost": params["vhost"],
+        "type": body.get("type", "direct"),
+        "durable": body.get("durable", True),
+        "auto_delete": body.get("auto_delete", False),
+        "internal": body.get("internal", False),
+        "arguments": body.get("arguments", {}),
+    }
+    return _no_content()
+
+
+async def _delete_exchange(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    vhost = fake.vhosts.get(params["vhost"])
+    if vhost is None or vhost.exchanges.pop(params["name"], None) is None:
+        return _not_found()
+    vhost.bindings = [
+        binding
+        for binding in vhost.bindings
+        if binding["source"] != params["name"]
+        and not (binding["destination_type"] == "exchange" and binding["destination"] == params["name"])
+    ]
+    return _no_content()
+
+
+async def _list_queues(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    vhost = fake.vhosts.get(params["vhost"])
+    return web.json_response(list(vhost.queues.values())) if vhost is not None else _not_found()
+
+
+async def _put_queue(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    vhost = fake.vhosts.get(params["vhost"])
+    if vhost is None:
+        return _not_found()
+    body = await _json_body(request)
+    name = params["name"]
+    error = _queue_type_error(name, params["vhost"], body)
+    if error is not None:
+        return web.json_response({"error": "bad_request", "reason": error}, status=400)
+    queue = {
+        "name": name,
+        "vhost": params["vhost"],
+        "durable": body.get("durable", True),
+        "auto_delete": body.get("auto_delete", False),
+        "exclusive": body.get("exclusive", False),
+        "arguments": body.get("arguments", {}),
+        "messages": 0,
+        "consumers": 0,
+    }
+    existing = vhost.queues.get(name)
+    if existing is not None:
+        # Like the broker, a queue can only be declared again with the same properties
+        if any(existing[key] != queue[key] for key in ("durable", "auto_delete", "exclusive", "arguments")):
+            return web.json_response(
+                {"error": "bad_request", "reason": f"PRECONDITION_FAILED - inequivalent arg for queue '{name}'"},
+                status=400,
+            )
+        return _no_content()
+
+    # Every queue is bound to the default exchange with its own name as routing key
+    vhost.bindings.append(_binding(params["vhost"], "", name, "queue", name, {}))
+    vhost.queues[name] = queue
+    return _no_content()
+
+
+async def _delete_queue(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    vhost = fake.vhosts.get(params["vhost"])
+    queue = vhost.queues.get(params["name"]) if vhost is not None else None
+    if queue is None:
+        return _not_found()
+    for condition, count in (("if-empty", "messages"), ("if-unused", "consumers")):
+        if request.query.get(condition) == "true" and queue[count]:
+            return web.json_response(
+                {"error": "bad_request", "reason": f"PRECONDITION_FAILED - queue '{params['name']}' in use"},
+                status=400,
+            )
+    del vhost.queues[params["name"]]
+    vhost.bindings = [
+        binding
+        for binding in vhost.bindings
+        if not (binding["destination_type"] == "queue" and binding["destination"] == params["name"])
+    ]
+    return _no_content()
+
+
+async def _list_queue_bindings(
+    fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]
+) -> web.Response:
+    vhost = fake.vhosts.get(params["vhost"])
+    if vhost is None or params["name"] not in vhost.queues:
+        return _not_found()
+    return web.json_response(
+        [
+            binding
+            for binding in vhost.bindings
+            if binding["destination_type"] == "queue" and binding["destination"] == params["name"]
+        ]
+    )
+
+
+async def _get_shovel(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    vhost = fake.vhosts.get(params["vhost"])
+    shovel = vhost.shovels.get(params["name"]) if vhost is not None else None
+    return web.json_response(shovel) if shovel is not None else _not_found()
+
+
+async def _put_shovel(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    """Moves the messages at once. A shovel deleting itself after the queue length is gone when this answers."""
+    vhost = fake.vhosts.get(params["vhost"])
+    if vhost is None:
+        return _not_found()
+    value = (await _json_body(request)).get("value") or {}
+    source = vhost.queues.get(value.get("src-queue", ""))
+    destination = vhost.queues.get(value.get("dest-queue", ""))
+    if source is None or destination is None:
+        return web.json_response({"error": "bad_request", "reason": "unknown source or destination queue"}, status=400)
+
+    if not fake.faults.stuck_shovels:
+        destination["messages"] += source["messages"]
+        source["messages"] = 0
+    if fake.faults.stuck_shovels or value.get("src-delete-after") != "queue-length":
+        vhost.shovels[params["name"]] = {
+            "vhost": params["vhost"],
+            "component": "shovel",
+            "name": params["name"],
+            "value": value,
+        }
+    return _no_content()
+
+
+def _queue_type_error(name: str, vhost: str, declared: dict[str, Any]) -> str | None:
+    """Gets the broker's refusal of a replicated queue declared with classic queue properties."""
+    queue_type = (declared.get("arguments") or {}).get("x-queue-type", "classic")
+    if queue_type not in ("quorum", "stream"):
+        return None
+    for flag, refused in (("durable", False), ("exclusive", True), ("auto_delete", True)):
+        if declared.get(flag, flag == "durable") == refused:
+            return f"PRECONDITION_FAILED - invalid property '{flag}' for {queue_type} queue '{name}' in vhost '{vhost}'"
+    return None
+
+
+def _binding(
+    vhost: str, source: str, destination: str, destination_type: str, routing_key: str, arguments: dict
+) -> dict[str, Any]:
+    properties_key = urllib.parse.quote(routing_key, safe="") or "~"
+    if arguments:
+        properties_key += "~" + hashlib.sha1(repr(sorted(arguments.items())).encode()).hexdigest()[:10]
+    return {
+        "source": source,
+        "vhost": vhost,
+        "destination": destination,
+        "destination_type": destination_type,
+        "routing_key": routing_key,
+        "arguments": arguments,
+        "properties_key": properties_key,
+    }
+
+
+async def _list_bindings(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    vhost = fake.vhosts.get(params["vhost"])
+    return web.json_response(vhost.bindings) if vhost is not None else _not_found()
+
+
+def _bindings_between(vhost: _VHost, params: dict[str, str]) -> list[dict[str, Any]]:
+    destination_type = "queue" if params["type"] == "q" else "exchange"
+    return [
+        binding
+        for binding in vhost.bindings
+        if binding["source"] == params["source"]
+        and binding["destination"] == params["destination"]
+        and binding["destination_type"] == destination_type
+    ]
+
+
+async def _list_bindings_between(
+    fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]
+) -> web.Response:
+    vhost = fake.vhosts.get(params["vhost"])
+    return web.json_response(_bindings_between(vhost, params)) if vhost is not None else _not_found()
+
+
+async def _list_exchange_bindings(
+    fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]
+) -> web.Response:
+    vhost = fake.vhosts.get(params["vhost"])
+    if vhost is None or params["name"] not in vhost.exchanges or params["direction"] not in ("source", "destination"):
+        return _not_found()
+    if params["direction"] == "source":
+        return web.json_response([binding for binding in vhost.bindings if binding["source"] == params["name"]])
+    return web.json_response(
+        [
+            binding
+            for binding in vhost.bindings
+            if binding["destination_type"] == "exchange" and binding["destination"] == params["name"]
+        ]
+    )
+
+
+async def _post_binding(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    vhost = fake.vhosts.get(params["vhost"])
+    if vhost is None:
+        return _not_found()
+
+    destination_type = "queue" if params["type"] == "q" else "exchange"
+    destinations = vhost.queues if destination_type == "queue" else vhost.exchanges
+    if params["source"] not in vhost.exchanges or params["destination"] not in destinations:
+        return _not_found()
+
+    body = await _json_body(request)
+    binding = _binding(
+        params["vhost"],
+        params["source"],
+        params["destination"],
+        destination_type,
+        body.get("routing_key", ""),
+        body.get("arguments", {}),
+    )
+    if not any(
+        existing["properties_key"] == binding["properties_key"] for existing in _bindings_between(vhost, params)
+    ):
+        vhost.bindings.append(binding)
+    return web.Response(status=201, headers={"Location": binding["properties_key"]})
+
+
+async def _delete_binding_between(
+    fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]
+) -> web.Response:
+    vhost = fake.vhosts.get(params["vhost"])
+    if vhost is None:
+        return _not_found()
+    matches = [binding for binding in _bindings_between(vhost, params) if binding["properties_key"] == params["props"]]
+    if not matches:
+        return _not_found()
+    vhost.bindings.remove(matches[0])
+    return _no_content()
+
+
+def _policies_of(vhost: _VHost, request: web.Request) -> dict[str, dict[str, Any]]:
+    return vhost.operator_policies if request.path.startswith("/api/operator-policies/") else vhost.policies
+
+
+async def _list_policies(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    vhost = fake.vhosts.get(params["vhost"])
+    return web.json_response(list(_policies_of(vhost, request).values())) if vhost is not None else _not_found()
+
+
+async def _put_policy(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    vhost = fake.vhosts.get(params["vhost"])
+    if vhost is None:
+        return _not_found()
+    body = await _json_body(request)
+    if "pattern" not in body or not isinstance(body.get("definition"), dict):
+        return web.json_response({"error": "bad_request", "reason": "pattern and definition are required"}, status=400)
+    _policies_of(vhost, request)[params["name"]] = {
+        "vhost": params["vhost"],
+        "name": params["name"],
+        "pattern": body["pattern"],
+        "apply-to": body.get("apply-to", "all"),
+        "definition": body["definition"],
+        "priority": body.get("priority", 0),
+    }
+    return _no_content()
+
+
+async def _delete_policy(fake: FakeRabbitMqManagement, request: web.Request, params: dict[str, str]) -> web.Response:
+    vhost = fake.vhosts.get(params["vhost"])
+    if vhost is None or _policies_of(vhost, request).pop(params["name"], None) is None:
+        return _not_found()
+    return _no_content()
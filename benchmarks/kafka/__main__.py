@@ -0,0 +1,60 @@
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.fakes.kafka_admin import KafkaFaultInjection
+from benchmarks.kafka.kafka_benchmark import (
+    CLUSTER_PARTITIONS,
+    quiet_bootstrapper_logging,
+    result_to_dict,
+    run_scenarios,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.kafka",
+        description="Measures topic creation, config reconcile and readiness polling against a fake Kafka cluster.",
+    )
+    parser.add_argument(
+        "--partitions", type=int, nargs="+", default=list(CLUSTER_PARTITIONS), help="Cluster sizes in partitions."
+    )
+    parser.add_argument("--topics", type=int, default=50, help="New topics to create and reconfigure.")
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="Latency added to every admin call.")
+    parser.add_argument(
+        "--metadata-us-per-partition", type=float, default=2.0, help="Extra metadata latency per cluster partition."
+    )
+    parser.add_argument("--ready-after-polls", type=int, default=2, help="Polls before new partitions get a leader.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed of the injected errors.")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    quiet_bootstrapper_logging()
+
+    results = []
+    for cluster_partitions in args.partitions:
+        faults = KafkaFaultInjection(
+            latency_seconds=args.latency_ms / 1000,
+            metadata_latency_per_partition_seconds=args.metadata_us_per_partition / 1_000_000,
+            ready_after_polls=args.ready_after_polls,
+            seed=args.seed,
+        )
+        scenario_results = asyncio.run(run_scenarios(cluster_partitions, args.topics, faults))
+        results.extend(result_to_dict(result) for result in scenario_results)
+
+        print(f"partitions={cluster_partitions} topics={args.topics}")
+        for result in scenario_results:
+            calls = ", ".join(f"{method}={count}" for method, count in result.admin_calls.items())
+            print(f"  {result.operation} {result.mode}: {result.wall_seconds:.3f}s ({calls})")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=4) + "\n")
+        print(f"Results written to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from benchmarks.fakes.kafka_admin import FakeKafkaAdmin, FakeKafkaService, KafkaFaultInjection
+from cezzis_com_bootstrapper.domain.config import KafkaOptions
+
+CLUSTER_PARTITIONS: tuple[int, ...] = (10, 1000, 10000, 50000)
+MODES: tuple[str, ...] = ("per_topic", "batched")
+
+_PARTITIONS_PER_EXISTING_TOPIC = 10
+_PARTITIONS_PER_NEW_TOPIC = 4
+_TOPIC_CONFIGS = {"retention.ms": "86400000", "cleanup.policy": "compact,delete", "min.insync.replicas": "2"}
+
+
+@dataclass
+class KafkaScenarioResult:
+    """Wall time and admin calls of one operation against one cluster size.
+
+    Attributes:
+        cluster_partitions (int): Partitions in the cluster before the run.
+        topics (int): Topics the operation works on.
+        operation (str): One of "create_topics", "alter_topic_configs" or "wait_for_topics_ready".
+        mode (str): "per_topic" for one service call per topic, "batched" for a single call.
+        wall_seconds (float): Time spent in the service calls.
+        admin_calls (dict[str, int]): Admin calls per method.
+    """
+
+    cluster_partitions: int
+    topics: int
+    operation: str
+    mode: str
+    wall_seconds: float
+    admin_calls: dict[str, int] = field(default_factory=dict)
+
+
+def build_cluster(cluster_partitions: int, faults: KafkaFaultInjection | None = None) -> FakeKafkaAdmin:
+    """Builds a fake cluster holding ``cluster_partitions`` partitions, in topics of 10 partitions.
+
+    Args:
+        cluster_partitions (int): Partitions in the cluster.
+        faults (KafkaFaultInjection | None, optional): Latency and errors simulated by the fake.
+
+    Returns:
+        FakeKafkaAdmin: The fake admin backend.
+    """
+    admin = FakeKafkaAdmin(faults=faults)
+    topic_count, remainder = divmod(cluster_partitions, _PARTITIONS_PER_EXISTING_TOPIC)
+    admin.add_topics(topic_count, _PARTITIONS_PER_EXISTING_TOPIC)
+    if remainder:
+        admin.add_topics(1, remainder, prefix="existing-remainder")
+    return admin
+
+
+async def run_scenarios(
+    cluster_partitions: int,
+    topics: int,
+    faults: KafkaFaultInjection | None = None,
+    poll_interval_seconds: float = 0.01,
+) -> list[KafkaScenarioResult]:
+    """Creates, reconfigures and waits for ``topics`` new topics, once per topic and once batched.
+
+    Each mode runs against its own fresh cluster so both start from the same metadata size.
+
+    Args:
+        cluster_partitions (int): Partitions in the cluster before the run.
+        topics (int): New topics to create.
+        faults (KafkaFaultInjection | None, optional): Latency and errors simulated by the fake.
+        poll_interval_seconds (float, optional): Delay between readiness polls. Defaults to 0.01.
+
+    Returns:
+        list[KafkaScenarioResult]: One result per operation and mode.
+    """
+    options = KafkaOptions(_env_file=None, KAFKA_BOOTSTRAP_SERVERS="fake:9092")
+    topic_names = [f"benchmark-{index:05d}" for index in range(topics)]
+    results: list[KafkaScenarioResult] = []
+
+    for mode in MODES:
+        admin = build_cluster(cluster_partitions, faults)
+        service = FakeKafkaService(options, admin)
+        batched = mode == "batched"
+
+        async def create_topics() -> None:
+            if batched:
+                await service.create_topics({name: _PARTITIONS_PER_NEW_TOPIC for name in topic_names})
+            else:
+                for name in topic_names:
+                    await service.create_topic(name, _PARTITIONS_PER_NEW_TOPIC)
+
+        async def alter_topic_configs() -> None:
+            if batched:
+                await service.alter_topic_configs({name: _TOPIC_CONFIGS for name in topic_names})
+            else:
+                for name in topic_names:
+                    await service.alter_topic_configs({name: _TOPIC_CONFIGS})
+
+        async def wait_for_topics_ready() -> None:
+            if batched:
+                await service.wait_for_topics_ready(topic_names, 60, poll_interval_seconds)
+            else:
+                for name in topic_names:
+                    await service.wait_for_topics_ready([name], 60, poll_interval_seconds)
+
+        try:
+            for operation in (create_topics, alter_topic_configs, wait_for_topics_ready):
+                admin.reset_counts()
+                started = time.perf_counter()
+                await operation()
+                results.append(
+                    KafkaScenarioResult(
+                        cluster_partitions=cluster_partitions,
+                        topics=topics,
+                        operation=operation.__name__,
+                        mode=mode,
+                        wall_seconds=time.perf_counter() - started,
+                        admin_calls=dict(admin.call_counts.most_common()),
+                    )
+                )
+        finally:
+            await service.close()
+
+    return results
+
+
+def result_to_dict(result: KafkaScenarioResult) -> dict[str, Any]:
+    return asdict(result)
+
+
+def quiet_bootstrapper_logging() -> None:
+    """Silences the per-topic info logs so they do not dominate the measured time."""
+    logging.disable(logging.INFO)
@@ -0,0 +1,84 @@
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.fakes.rabbitmq_management import FaultInjection
+from benchmarks.reconcile.rabbitmq_benchmark import (
+    BACKENDS,
+    SIZES,
+    build_topology,
+    count_entities,
+    quiet_bootstrapper_logging,
+    result_to_dict,
+    run_reconcile,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.reconcile",
+        description="Measures how RabbitMQ reconcile time scales with the topology size, against a fake broker.",
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="Entity counts to reconcile.")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latency added to every request.")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra latency per request.")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of requests answered with a 503.")
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        choices=BACKENDS,
+        default=["management"],
+        help="Topology backends to compare, each size is reconciled once per backend.",
+    )
+    parser.add_argument("--retry-attempts", type=int, default=1, help="Attempts per pass through the retry behavior.")
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed of the generated topologies and of the injected latency and failures.",
+    )
+    parser.add_argument("--topology", type=Path, help="Reconcile this rabbitmq.json instead of generated sizes.")
+    parser.add_argument("--output", type=Path, help="Write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    quiet_bootstrapper_logging()
+
+    if args.topology:
+        topology = json.loads(args.topology.read_text())
+        workloads = [(sum(count_entities(topology).values()), topology)]
+    else:
+        workloads = [(size, build_topology(size, seed=args.seed or 0)) for size in args.sizes]
+
+    results = []
+    for size, topology in workloads:
+        for backend in args.backends:
+            faults = FaultInjection(
+                latency_seconds=args.latency_ms / 1000,
+                jitter_seconds=args.jitter_ms / 1000,
+                failure_rate=args.failure_rate,
+                seed=args.seed,
+            )
+            result = asyncio.run(run_reconcile(topology, size, faults, args.retry_attempts, backend))
+            results.append(result_to_dict(result))
+
+            entities = ", ".join(f"{kind}={count}" for kind, count in result.entities.items())
+            print(f"size={size} backend={backend} ({entities})")
+            for name, run in (("cold", result.cold), ("warm", result.warm)):
+                print(
+                    f"  {name}: {run.wall_seconds:.3f}s, {run.requests} requests, "
+                    f"{run.amqp_round_trips} AMQP round trips"
+                )
+                for route, count in list(run.requests_by_route.items())[:3]:
+                    print(f"    {route}: {count}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=4) + "\n")
+        print(f"Results written to {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+import json
+import logging
+import tempfile
+import time
+from contextlib import AsyncExitStack
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from benchmarks.fakes.amqp_broker import FakeAmqpServer
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement, FakeRabbitMqServer, FaultInjection
+from benchmarks.topology.topology_generator import TopologySpec, generate_topology, to_document
+from cezzis_com_bootstrapper.application.behaviors.pipeline import RetryBehavior
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.create_rabbitmq_command import (
+    CreateRabbitMqCommand,
+    CreateRabbitMqCommandHandler,
+)
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions, RabbitMqOptions
+from cezzis_com_bootstrapper.infrastructure.services.rabbitmq_admin_service import RabbitMqAdminService
+from cezzis_com_bootstrapper.infrastructure.services.rabbitmq_amqp_service import RabbitMqAmqpService
+
+SIZES: tuple[int, ...] = (10, 100, 1000, 10000)
+BACKENDS: tuple[str, ...] = ("management", "amqp")
+
+_VHOST = "cezzis-benchmark"
+
+
+@dataclass
+class ReconcileRun:
+    """Wall time, management API requests and AMQP methods of one reconcile pass.
+
+    Attributes:
+        wall_seconds (float): Time spent in ``CreateRabbitMqCommandHandler.handle``.
+        requests (int): Management API requests served by the fake.
+        requests_by_route (dict[str, int]): Requests per route template.
+        amqp_round_trips (int): AMQP methods the fake broker replied to, zero with the management backend.
+        amqp_methods (dict[str, int]): AMQP methods received per method name, pipelined ones included.
+    """
+
+    wall_seconds: float
+    requests: int
+    requests_by_route: dict[str, int] = field(default_factory=dict)
+    amqp_round_trips: int = 0
+    amqp_methods: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class ReconcileResult:
+    """Results of reconciling one synthetic topology.
+
+    Attributes:
+        size (int): The requested number of entities.
+        entities (dict[str, int]): Entities in the topology, per kind.
+        cold (ReconcileRun): First pass against an empty broker, everything is created.
+        warm (ReconcileRun): Second pass against the reconciled broker, nothing changes.
+        backend (str): The topology backend, "management" or "amqp".
+    """
+
+    size: int
+    entities: dict[str, int]
+    cold: ReconcileRun
+    warm: ReconcileRun
+    backend: str = "management"
+
+
+def build_topology(size: int, seed: int = 0) -> dict[str, Any]:
+    """Builds a rabbitmq.json document holding ``size`` exchanges, queues and bindings.
+
+    Args:
+        size (int): The total number of entities, spread with ``TopologySpec.for_size``.
+        seed (int, optional): Seed of the topology generator. Defaults to 0.
+
+    Returns:
+        dict[str, Any]: The topology, in the rabbitmq.json format.
+    """
+    return to_document(generate_topology(TopologySpec.for_size(size, seed=seed)))
+
+
+def count_entities(topology: dict[str, Any]) -> dict[str, int]:
+    return {kind: len(topology.get(kind, [])) for kind in ("exchanges", "queues", "bindings")}
+
+
+async def run_reconcile(
+    topology: dict[str, Any],
+    size: int,
+    faults: FaultInjection | None = None,
+    retry_attempts: int = 1,
+    backend: str = "management",
+    management: FakeRabbitMqManagement | None = None,
+) -> ReconcileResult:
+    """Reconciles a topology twice against a fresh fake broker, first cold then warm.
+
+    Args:
+        topology (dict[str, Any]): The rabbitmq.json document to apply.
+        size (int): The requested number of entities, reported as is.
+        faults (FaultInjection | None, optional): Latency and failures injected by the fake. The fake AMQP
+            broker adds the same fixed latency before each of its replies.
+        retry_attempts (int, optional): Attempts per pass, through the RetryBehavior. Defaults to 1.
+        backend (str, optional): The topology backend, "management" or "amqp". Defaults to "management".
+        management (FakeRabbitMqManagement | None, optional): The fake to reconcile against, so its state can be
+            inspected afterwards. Defaults to a new empty fake using ``faults``.
+
+    Returns:
+        ReconcileResult: The cold and warm pass timings.
+    """
+    management = management or FakeRabbitMqManagement(admin_username="admin", faults=faults)
+
+    with tempfile.TemporaryDirectory() as directory:
+        config_path = Path(directory) / "rabbitmq.json"
+        config_path.write_text(json.dumps(topology))
+
+        async with AsyncExitStack() as stack:
+            server = await stack.enter_async_context(FakeRabbitMqServer(management))
+            broker = await stack.enter_async_context(
+                FakeAmqpServer(management, latency_seconds=faults.latency_seconds if faults else 0.0)
+            )
+            rabbitmq_options = RabbitMqOptions(
+                _env_file=None,
+                RABBITMQ_VHOST=_VHOST,
+                RABBITMQ_HOST=server.host,
+                RABBITMQ_ADMIN_PORT=server.port,
+                RABBITMQ_ADMIN_USERNAME="admin",
+                RABBITMQ_ADMIN_PASSWORD="admin",
+                RABBITMQ_APP_USERNAME="app",
+                RABBITMQ_APP_PASSWORD="app",
+                RABBITMQ_APP_CONFIG_FILE_PATH=str(config_path),
+                RABBITMQ_TOPOLOGY_BACKEND=backend,
+                RABBITMQ_AMQP_PORT=broker.port,
+            )
+            bootstrapper_options = BootstrapperOptions(
+                _env_file=None,
+                BOOTSTRAPPER_RETRY_MAX_ATTEMPTS=retry_attempts,
+                BOOTSTRAPPER_RETRY_BASE_DELAY_SECONDS=0.01,
+                BOOTSTRAPPER_RETRY_MAX_DELAY_SECONDS=0.1,
+            )
+            retry = RetryBehavior(bootstrapper_options)
+            service = (
+                RabbitMqAmqpService(rabbitmq_options) if backend == "amqp" else RabbitMqAdminService(rabbitmq_options)
+            )
+            handler = CreateRabbitMqCommandHandler(service, rabbitmq_options, bootstrapper_options)
+
+            try:
+                runs: list[ReconcileRun] = []
+                for _ in ("cold", "warm"):
+                    management.reset_counts()
+                    broker.reset_counts()
+                    command = CreateRabbitMqCommand()
+                    started = time.perf_counter()
+                    await retry.handle(command, lambda: handler.handle(command))
+                    runs.append(
+                        ReconcileRun(
+                            wall_seconds=time.perf_counter() - started,
+                            requests=management.total_requests,
+                            requests_by_route=dict(management.request_counts.most_common()),
+                            amqp_round_trips=broker.round_trips,
+                            amqp_methods=dict(broker.method_counts.most_common()),
+                        )
+                    )
+            finally:
+                await service.close()
+
+    return ReconcileResult(size=size, entities=count_entities(topology), cold=runs[0], warm=runs[1], backend=backend)
+
+
+def result_to_dict(result: ReconcileResult) -> dict[str, Any]:
+    return asdict(result)
+
+
+def quiet_bootstrapper_logging() -> None:
+    """Silences the per-entity info logs so they do not dominate the measured time."""
+    logging.disable(logging.INFO)
@@ -0,0 +1,60 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.startup.startup_benchmark import (
+    SCENARIOS,
+    check_budgets,
+    compare_to_baseline,
+    result_to_dict,
+    run_scenario,
+)
+
+_HERE = Path(__file__).resolve().parent
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.startup",
+        description="Measures the bootstrapper cold start before its first network call.",
+    )
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Scenario(s) to run.")
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts per scenario, the median is reported.")
+    parser.add_argument("--budgets", type=Path, default=_HERE / "budgets.json", help="Budget file to enforce.")
+    parser.add_argument("--baseline", type=Path, default=_HERE / "baseline.json", help="Baseline file.")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline.")
+    args = parser.parse_args()
+
+    budgets = json.loads(args.budgets.read_text()) if args.budgets.exists() else {}
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+
+    results = {}
+    violations: list[str] = []
+
+    for scenario in args.scenario or list(SCENARIOS):
+        result = run_scenario(scenario, runs=args.runs)
+        results[scenario] = result_to_dict(result)
+        violations.extend(check_budgets(result, budgets))
+
+        phases = ", ".join(f"{name}={value:.1f}ms" for name, value in result.phases_ms.items())
+        print(f"{scenario}: total={result.total_ms:.1f}ms ({phases}), imports_total={result.import_total_ms:.1f}ms")
+
+        for name, delta in compare_to_baseline(result, baseline).items():
+            print(f"  {name}: {delta:+.1f}ms vs baseline")
+
+        for item in result.slowest_imports[:5]:
+            print(f"  import {item['package']}: {item['cumulative_ms']:.1f}ms")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps({**baseline, **results}, indent=4, sort_keys=True) + "\n")
+        print(f"Baseline written to {args.baseline}")
+
+    for violation in violations:
+        print(f"BUDGET EXCEEDED {violation}", file=sys.stderr)
+
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Child process driver that replays the bootstrapper's startup up to its first network call.
+
+Run by the startup benchmark as ``python -X importtime -m benchmarks.startup.phase_driver``.
+Each phase is timed in-process and the results are printed as a single JSON line on stdout.
+"""
+
+import json
+import os
+import sys
+import time
+
+
+def _timed(phases: dict[str, float], name: str, func) -> None:
+    started = time.perf_counter()
+    func()
+    phases[name] = (time.perf_counter() - started) * 1000
+
+
+def _import_modules() -> None:
+    from cezzis_com_bootstrapper.application.behaviors.otel import initialize_opentelemetry  # noqa: F401
+    from cezzis_com_bootstrapper.concern_registry import get_enabled_concerns, import_target
+    from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+
+    for concern in get_enabled_concerns(BootstrapperOptions()):
+        import_target(concern.service)
+        import_target(concern.handler)
+
+
+def _load_settings() -> None:
+    from cezzis_com_bootstrapper.domain.config import get_bootstrapper_settings
+
+    get_bootstrapper_settings()
+
+
+def _wire_injector() -> None:
+    from cezzis_com_bootstrapper.app_module import injector
+    from cezzis_com_bootstrapper.concern_registry import get_enabled_concerns, import_target
+    from cezzis_com_bootstrapper.domain.config import get_bootstrapper_options
+
+    for concern in get_enabled_concerns(get_bootstrapper_options()):
+        injector.get(import_target(concern.handler))
+
+
+def _initialize_otel() -> None:
+    from cezzis_com_bootstrapper.application.behaviors.otel import initialize_opentelemetry
+
+    initialize_opentelemetry()
+
+
+def main() -> None:
+    phases: dict[str, float] = {}
+
+    _timed(phases, "imports", _import_modules)
+    _timed(phases, "settings", _load_settings)
+    _timed(phases, "injector", _wire_injector)
+    _timed(phases, "otel", _initialize_otel)
+
+    sys.stdout.write(json.dumps({"phases_ms": phases}) + "\n")
+    sys.stdout.flush()
+
+    # Skip the atexit telemetry flush, it would try to reach the (unavailable) collector.
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+_REQUIRED_SETTINGS = {
+    "OTEL_EXPORTER_OTLP_ENDPOINT": "http://127.0.0.1:9",
+    "OTEL_SERVICE_NAME": "cezzis-com-bootstrapper-benchmark",
+    "OTEL_SERVICE_NAMESPACE": "cezzis",
+    "OTEL_OTLP_AUTH_HEADER": "benchmark",
+    "OTEL_ENABLE_CONSOLE_LOGGING": "false",
+    "AZURE_STORAGE_CONNECTION_STRING": "UseDevelopmentStorage=true",
+    "ACCOUNT_AVATARS_CONTAINER_NAME": "account-avatars-benchmark",
+    "KAFKA_BOOTSTRAP_SERVERS": "127.0.0.1:9",
+    "KAFKA_COCKTAILS_TOPIC_DEFS": "benchmark-topic:4",
+    "RABBITMQ_VHOST": "cezzis-benchmark",
+    "RABBITMQ_HOST": "http://127.0.0.1",
+    "RABBITMQ_ADMIN_PORT": "9",
+    "RABBITMQ_ADMIN_USERNAME": "admin",
+    "RABBITMQ_ADMIN_PASSWORD": "admin",
+    "RABBITMQ_APP_USERNAME": "app",
+    "RABBITMQ_APP_PASSWORD": "app",
+}
+
+SCENARIOS: dict[str, dict[str, str]] = {
+    "all_disabled": {"ENABLE_RABBITMQ": "false", "ENABLE_BLOB_STORAGE": "false", "ENABLE_KAFKA": "false"},
+    "rabbitmq_only": {"ENABLE_RABBITMQ": "true", "ENABLE_BLOB_STORAGE": "false", "ENABLE_KAFKA": "false"},
+    "blob_storage_only": {"ENABLE_RABBITMQ": "false", "ENABLE_BLOB_STORAGE": "true", "ENABLE_KAFKA": "false"},
+    "kafka_only": {"ENABLE_RABBITMQ": "false", "ENABLE_BLOB_STORAGE": "false", "ENABLE_KAFKA": "true"},
+    "all_enabled": {"ENABLE_RABBITMQ": "true", "ENABLE_BLOB_STORAGE": "true", "ENABLE_KAFKA": "true"},
+}
+
+
+@dataclass
+class ImportTiming:
+    """A single line of ``python -X importtime`` output.
+
+    Attributes:
+        module (str): The imported module name.
+        self_us (int): Time spent importing the module itself, in microseconds.
+        cumulative_us (int): Time including the module's own imports, in microseconds.
+        depth (int): Nesting level of the import, 0 for top level imports.
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class ScenarioResult:
+    """Median startup timings of a scenario over several runs.
+
+    Attributes:
+        scenario (str): The scenario name.
+        runs (int): Number of cold starts measured.
+        phases_ms (dict[str, float]): Median in-process time per startup phase.
+        import_total_ms (float): Median total import time reported by ``-X importtime``.
+        slowest_imports (list[dict]): The top level packages with the highest cumulative import time.
+    """
+
+    scenario: str
+    runs: int
+    phases_ms: dict[str, float]
+    import_total_ms: float
+    slowest_imports: list[dict] = field(default_factory=list)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(self.phases_ms.values())
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    """Parses the output of ``python -X importtime``.
+
+    Args:
+        stderr (str): The stderr of the child process.
+
+    Returns:
+        list[ImportTiming]: One entry per imported module, in output order.
+    """
+    timings: list[ImportTiming] = []
+
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            # Skips the "self [us] | cumulative | imported package" header
+            continue
+
+        name = parts[2].rstrip()
+        module = name.lstrip()
+        timings.append(
+            ImportTiming(
+                module=module,
+                self_us=int(parts[0]),
+                cumulative_us=int(parts[1]),
+                depth=(len(name) - len(module) - 1) // 2,
+            )
+        )
+
+    return timings
+
+
+def _run_once(env: dict[str, str], cwd: str) -> tuple[dict[str, float], list[ImportTiming]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "benchmarks.startup.phase_driver"],
+        env=env,
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Startup driver failed with exit code {result.returncode}:\n{result.stderr[-4000:]}")
+
+    phases = json.loads(result.stdout.strip().splitlines()[-1])["phases_ms"]
+    return phases, parse_importtime(result.stderr)
+
+
+def run_scenario(scenario: str, runs: int = 5, top: int = 10) -> ScenarioResult:
+    """Measures the cold start of the bootstrapper for a scenario.
+
+    Each run starts a fresh interpreter in an empty working directory so no .env file is read.
+
+    Args:
+        scenario (str): The name of the scenario in SCENARIOS.
+        runs (int, optional): Number of cold starts to measure. Defaults to 5.
+        top (int, optional): Number of slowest top level imports to report. Defaults to 10.
+
+    Returns:
+        ScenarioResult: The median timings of the scenario.
+    """
+    repo_root = str(Path(__file__).resolve().parents[2])
+    env = {key: value for key, value in os.environ.items() if key != "ENV"}
+    env.update(_REQUIRED_SETTINGS)
+    env.update(SCENARIOS[scenario])
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [repo_root, env.get("PYTHONPATH", "")]))
+
+    phase_runs: list[dict[str, float]] = []
+    import_totals: list[float] = []
+    top_level: dict[str, list[int]] = {}
+
+    with tempfile.TemporaryDirectory() as cwd:
+        for _ in range(runs):
+            phases, imports = _run_once(env, cwd)
+            phase_runs.append(phases)
+
+            # The benchmark driver's own package is not part of the bootstrapper's startup
+            roots = [timing for timing in imports if timing.depth == 0 and not timing.module.startswith("benchmarks")]
+            import_totals.append(sum(timing.cumulative_us for timing in roots) / 1000)
+            for timing in roots:
+                top_level.setdefault(timing.module.split(".")[0], []).append(timing.cumulative_us)
+
+    slowest = sorted(
+        ({"package": name, "cumulative_ms": sum(values) / 1000 / runs} for name, values in top_level.items()),
+        key=lambda item: item["cumulative_ms"],
+        reverse=True,
+    )[:top]
+
+    return ScenarioResult(
+        scenario=scenario,
+        runs=runs,
+        phases_ms={name: statistics.median(run[name] for run in phase_runs) for name in phase_runs[0]},
+        import_total_ms=statistics.median(import_totals),
+        slowest_imports=slowest,
+    )
+
+
+def check_budgets(result: ScenarioResult, budgets: dict) -> list[str]:
+    """Compares a scenario's timings against the configured budgets.
+
+    Budgets are read from the "default" section and overridden per scenario. Every phase
+    plus "total" and "imports_total" may be budgeted, in milliseconds.
+
+    Args:
+        result (ScenarioResult): The measured scenario.
+        budgets (dict): The parsed budgets file.
+
+    Returns:
+        list[str]: A message for every budget that was exceeded.
+    """
+    limits = {**budgets.get("default", {}), **budgets.get("scenarios", {}).get(result.scenario, {})}
+    measured = {**result.phases_ms, "total": result.total_ms, "imports_total": result.import_total_ms}
+
+    violations: list[str] = []
+    for name, limit in limits.items():
+        if name in measured and measured[name] > limit:
+            violations.append(f"{result.scenario}: {name} took {measured[name]:.1f}ms, budget is {limit:.1f}ms")
+
+    return violations
+
+
+def compare_to_baseline(result: ScenarioResult, baseline: dict) -> dict[str, float]:
+    """Computes the change of every phase against a stored baseline.
+
+    Args:
+        result (ScenarioResult): The measured scenario.
+        baseline (dict): The stored baseline document.
+
+    Returns:
+        dict[str, float]: The difference in milliseconds per phase, positive when slower.
+    """
+    previous = baseline.get(result.scenario)
+    if not previous:
+        return {}
+
+    return {
+        name: value - previous["phases_ms"][name]
+        for name, value in result.phases_ms.items()
+        if name in previous.get("phases_ms", {})
+    }
+
+
+def result_to_dict(result: ScenarioResult) -> dict:
+    return {**asdict(result), "total_ms": result.total_ms}
@@ -0,0 +1,56 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.topology.topology_generator import TopologySpec, generate_topology, to_document, write_topology
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.topology",
+        description="Generates a seeded synthetic rabbitmq.json for scale testing.",
+    )
+    parser.add_argument("--size", type=int, help="Spread this many entities like rabbitmq.json, overrides counts.")
+    parser.add_argument("--exchanges", type=int, default=100, help="Number of exchanges.")
+    parser.add_argument("--queues", type=int, default=200, help="Number of queues.")
+    parser.add_argument("--bindings", type=int, default=200, help="Number of exchange to queue bindings.")
+    parser.add_argument("--argument-queues", type=int, default=20, help="Queues declared with arguments.")
+    parser.add_argument("--exchange-bindings", type=int, default=20, help="Exchange to exchange bindings.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generator.")
+    parser.add_argument("--output", type=Path, help="Write the topology to this file instead of stdout.")
+    args = parser.parse_args()
+
+    spec = (
+        TopologySpec.for_size(args.size, seed=args.seed)
+        if args.size is not None
+        else TopologySpec(
+            exchanges=args.exchanges,
+            queues=args.queues,
+            bindings=args.bindings,
+            argument_queues=args.argument_queues,
+            exchange_bindings=args.exchange_bindings,
+            seed=args.seed,
+        )
+    )
+
+    try:
+        configuration = generate_topology(spec)
+    except ValueError as error:
+        parser.error(str(error))
+
+    if args.output:
+        write_topology(configuration, args.output)
+        print(
+            f"Wrote {len(configuration.exchanges)} exchanges, {len(configuration.queues)} queues and "
+            f"{len(configuration.bindings)} bindings to {args.output}",
+            file=sys.stderr,
+        )
+    else:
+        print(json.dumps(to_document(configuration), indent=4))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
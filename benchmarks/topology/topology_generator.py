@@ -0,0 +1,184 @@
+import dataclasses
+import json
+import random
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from cezzis_com_bootstrapper.domain.messaging import (
+    RabbitMqBinding,
+    RabbitMqBindingType,
+    RabbitMqConfiguration,
+    RabbitMqExchange,
+    RabbitMqExchangeType,
+    RabbitMqQueue,
+)
+
+_REGIONS = ("us-east", "us-west", "eu-west", "eu-central", "ap-south")
+_DOMAINS = ("cocktail", "ingredient", "account", "rating", "search", "notification")
+_EVENTS = ("updates", "user-actions", "deletes", "schedule", "sync", "audit")
+_EXCHANGE_TYPES = (
+    RabbitMqExchangeType.TOPIC,
+    RabbitMqExchangeType.TOPIC,
+    RabbitMqExchangeType.DIRECT,
+    RabbitMqExchangeType.FANOUT,
+)
+
+
+@dataclass
+class TopologySpec:
+    """The shape of a generated RabbitMQ topology.
+
+    Attributes:
+        exchanges (int): Number of exchanges.
+        queues (int): Number of queues, including the arguments heavy ones.
+        bindings (int): Number of exchange to queue bindings.
+        argument_queues (int): Number of queues declared with dead lettering, TTL, length limits and a queue type.
+        exchange_bindings (int): Number of exchange to exchange bindings, always from a lower to a higher
+            exchange index so the exchange graph stays acyclic.
+        seed (int): Seed of the random source, the same spec always generates the same topology.
+    """
+
+    exchanges: int
+    queues: int
+    bindings: int
+    argument_queues: int = 0
+    exchange_bindings: int = 0
+    seed: int = 0
+
+    @classmethod
+    def for_size(cls, size: int, seed: int = 0) -> "TopologySpec":
+        """Spreads ``size`` entities like the checked in rabbitmq.json does.
+
+        A quarter of the entities are exchanges and the rest is split between queues and bindings, one in ten
+        queues carries arguments and one in ten bindings is an exchange to exchange binding.
+
+        Args:
+            size (int): The total number of entities.
+            seed (int, optional): Seed of the random source. Defaults to 0.
+
+        Returns:
+            TopologySpec: The topology spec.
+        """
+        exchanges = max(1, size // 4)
+        queues = max(1, (size - exchanges) // 2)
+        all_bindings = max(0, size - exchanges - queues)
+        exchange_bindings = all_bindings // 10 if exchanges > 1 else 0
+        return cls(
+            exchanges=exchanges,
+            queues=queues,
+            bindings=all_bindings - exchange_bindings,
+            argument_queues=queues // 10,
+            exchange_bindings=exchange_bindings,
+            seed=seed,
+        )
+
+
+def generate_topology(spec: TopologySpec) -> RabbitMqConfiguration:
+    """Generates a valid RabbitMQ configuration from a topology spec.
+
+    Entity names fan out per tenant and per region like ``tenant-0003.eu-west.cocktail-updates-topic``, every
+    binding references declared entities and the dead letter exchange of arguments heavy queues is one of the
+    generated exchanges.
+
+    Args:
+        spec (TopologySpec): The shape of the topology.
+
+    Returns:
+        RabbitMqConfiguration: The generated configuration.
+
+    Raises:
+        ValueError: If the spec asks for an impossible topology.
+    """
+    _validate_spec(spec)
+    rng = random.Random(spec.seed)
+
+    exchanges = [
+        RabbitMqExchange(name=f"{_entity_name(rng, index)}-exchange", type=rng.choice(_EXCHANGE_TYPES))
+        for index in range(spec.exchanges)
+    ]
+    queues = [RabbitMqQueue(name=f"{_entity_name(rng, index)}-queue") for index in range(spec.queues)]
+    for queue in rng.sample(queues, spec.argument_queues):
+        queue.arguments = _queue_arguments(rng, rng.choice(exchanges).name)
+
+    bindings = [
+        RabbitMqBinding(
+            source=rng.choice(exchanges).name,
+            destination=rng.choice(queues).name,
+            destination_type=RabbitMqBindingType.QUEUE,
+            routing_key=f"{rng.choice(_DOMAINS)}.{rng.choice(_EVENTS)}.{index}.#",
+        )
+        for index in range(spec.bindings)
+    ]
+    for index in range(spec.exchange_bindings):
+        source, destination = sorted(rng.sample(range(spec.exchanges), 2))
+        bindings.append(
+            RabbitMqBinding(
+                source=exchanges[source].name,
+                destination=exchanges[destination].name,
+                destination_type=RabbitMqBindingType.EXCHANGE,
+                routing_key=f"forward.{index}.#",
+            )
+        )
+
+    return RabbitMqConfiguration(exchanges=exchanges, queues=queues, bindings=bindings)
+
+
+def to_document(configuration: RabbitMqConfiguration) -> dict[str, Any]:
+    """Converts a configuration to a rabbitmq.json document.
+
+    Args:
+        configuration (RabbitMqConfiguration): The configuration to convert.
+
+    Returns:
+        dict[str, Any]: The document, enums are replaced by their values.
+    """
+    return dataclasses.asdict(
+        configuration,
+        dict_factory=lambda items: {key: value.value if isinstance(value, Enum) else value for key, value in items},
+    )
+
+
+def write_topology(configuration: RabbitMqConfiguration, file_path: Path) -> None:
+    """Writes a configuration as a rabbitmq.json file.
+
+    Args:
+        configuration (RabbitMqConfiguration): The configuration to write.
+        file_path (Path): The file to write.
+    """
+    file_path.write_text(json.dumps(to_document(configuration), indent=4) + "\n")
+
+
+def _validate_spec(spec: TopologySpec) -> None:
+    counts = {name: value for name, value in dataclasses.asdict(spec).items() if name != "seed"}
+    negative = [name for name, value in counts.items() if value < 0]
+    if negative:
+        raise ValueError(f"Topology counts must not be negative: {', '.join(negative)}")
+    if spec.argument_queues > spec.queues:
+        raise ValueError("Topology argument_queues must not exceed queues")
+    if (spec.bindings or spec.argument_queues) and not spec.exchanges:
+        raise ValueError("Topology bindings and argument_queues require at least one exchange")
+    if spec.bindings and not spec.queues:
+        raise ValueError("Topology bindings require at least one queue")
+    if spec.exchange_bindings and spec.exchanges < 2:
+        raise ValueError("Topology exchange_bindings require at least two exchanges")
+
+
+def _entity_name(rng: random.Random, index: int) -> str:
+    # The index keeps names unique, the tenant and region give them the shape of a fanned out deployment
+    return f"tenant-{index:04d}.{rng.choice(_REGIONS)}.{rng.choice(_DOMAINS)}-{rng.choice(_EVENTS)}"
+
+
+def _queue_arguments(rng: random.Random, dead_letter_exchange: str) -> dict[str, Any]:
+    arguments: dict[str, Any] = {
+        "x-queue-type": rng.choice(("classic", "quorum")),
+        "x-dead-letter-exchange": dead_letter_exchange,
+        "x-dead-letter-routing-key": f"deadletter.{rng.choice(_DOMAINS)}",
+        "x-message-ttl": rng.choice((60_000, 300_000, 3_600_000, 86_400_000)),
+        "x-max-length": rng.choice((1_000, 10_000, 100_000)),
+        "x-overflow": rng.choice(("drop-head", "reject-publish")),
+    }
+    if arguments["x-queue-type"] == "quorum":
+        arguments["x-delivery-limit"] = rng.choice((5, 10, 20))
+    return arguments
@@ -1,29 +1,9 @@
 from injector import Binder, Injector, Module, noscope, singleton
 from mediatr import Mediator
 
-from cezzis_com_bootstrapper.application.concerns import (
-    CreateBlobStorageCommandHandler,
-    CreateKafkaCommandHandler,
-    CreateRabbitMqCommandHandler,
-)
-from cezzis_com_bootstrapper.domain.config import (
-    AzureStorageOptions,
-    BootstrapperOptions,
-    KafkaOptions,
-    RabbitMqOptions,
-    get_azure_storage_options,
-    get_bootstrapper_options,
-    get_kafka_options,
-    get_rabbitmq_options,
-)
-from cezzis_com_bootstrapper.infrastructure.services import (
-    AzureBlobService,
-    IAzureBlobService,
-    IKafkaService,
-    IRabbitMqAdminService,
-    KafkaService,
-    RabbitMqAdminService,
-)
+from cezzis_com_bootstrapper.application.behaviors.pipeline import PIPELINE_BEHAVIORS
+from cezzis_com_bootstrapper.concern_registry import get_enabled_concerns, import_target
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions, BootstrapperSettings, get_bootstrapper_settings
 
 
 def create_injector() -> Injector:
@@ -31,34 +11,38 @@ def create_injector() -> Injector:
 
 
 def my_class_handler_manager(handler_class, is_behavior=False):
-    if is_behavior:
-        # custom logic
-        pass
-
+    # Pipeline behaviors are bound as singletons so their options are read once,
+    # handlers are bound with noscope and built for every command
     return injector.get(handler_class)
 
 
 class AppModule(Module):
     def configure(self, binder: Binder):
         binder.bind(Mediator, Mediator(handler_class_manager=my_class_handler_manager), scope=singleton)
+        # Pipeline behaviors wrap every command in the order they are registered
+        for behavior in PIPELINE_BEHAVIORS:
+            Mediator.register_behavior(behavior)
+            binder.bind(behavior, behavior, scope=singleton)
+        # All settings are read and validated in one pass before anything else is wired
+        bootstrapper_settings = get_bootstrapper_settings()
+        binder.bind(BootstrapperSettings, bootstrapper_settings, scope=singleton)
         # Bootstrapper feature flags
-        bootstrapper_options = get_bootstrapper_options()
+        bootstrapper_options = bootstrapper_settings.bootstrapper
         binder.bind(BootstrapperOptions, bootstrapper_options, scope=singleton)
-        # For azure blob storage setup
-        if bootstrapper_options.enable_blob_storage:
-            binder.bind(AzureStorageOptions, get_azure_storage_options(), scope=singleton)
-            binder.bind(IAzureBlobService, AzureBlobService, scope=singleton)
-            binder.bind(CreateBlobStorageCommandHandler, CreateBlobStorageCommandHandler, scope=noscope)
-        # for kafka setup
-        if bootstrapper_options.enable_kafka:
-            binder.bind(KafkaOptions, get_kafka_options(), scope=singleton)
-            binder.bind(IKafkaService, KafkaService, scope=singleton)
-            binder.bind(CreateKafkaCommandHandler, CreateKafkaCommandHandler, scope=noscope)
-        # For RabbitMQ Setup
-        if bootstrapper_options.enable_rabbitmq:
-            binder.bind(RabbitMqOptions, get_rabbitmq_options(), scope=singleton)
-            binder.bind(IRabbitMqAdminService, RabbitMqAdminService, scope=singleton)
-            binder.bind(CreateRabbitMqCommandHandler, CreateRabbitMqCommandHandler, scope=noscope)
+        # Concern options, services and handlers are only imported once their feature flag is on
+        for concern in get_enabled_concerns(bootstrapper_options):
+            concern_options = import_target(concern.options_factory)()
+            binder.bind(import_target(concern.options), concern_options, scope=singleton)
+            binder.bind(
+                import_target(concern.service_interface),
+                import_target(concern.get_service(concern_options)),
+                scope=singleton,
+            )
+            handlers = [concern.handler, concern.plan_handler]
+            if concern.export_handler:
+                handlers.append(concern.export_handler)
+            for handler in map(import_target, handlers):
+                binder.bind(handler, handler, scope=noscope)
 
 
 injector = create_injector()
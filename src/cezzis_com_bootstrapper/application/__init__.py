@@ -1,19 +1,62 @@
-from cezzis_com_bootstrapper.application.behaviors import initialize_opentelemetry
-from cezzis_com_bootstrapper.application.concerns import (
-    CreateBlobStorageCommand,
-    CreateBlobStorageCommandHandler,
-    CreateKafkaCommand,
-    CreateKafkaCommandHandler,
-    CreateRabbitMqCommand,
-    CreateRabbitMqCommandHandler,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cezzis_com_bootstrapper.application.behaviors import initialize_opentelemetry
+    from cezzis_com_bootstrapper.application.concerns import (
+        CreateBlobStorageCommand,
+        CreateBlobStorageCommandHandler,
+        CreateKafkaCommand,
+        CreateKafkaCommandHandler,
+        CreateRabbitMqCommand,
+        CreateRabbitMqCommandHandler,
+        PlanBlobStorageCommand,
+        PlanBlobStorageCommandHandler,
+        PlanKafkaCommand,
+        PlanKafkaCommandHandler,
+        PlanRabbitMqCommand,
+        PlanRabbitMqCommandHandler,
+    )
+
+# Resolved on first access so importing a single concern does not pull in every other one.
+_LAZY_EXPORTS = {
+    "initialize_opentelemetry": f"{__name__}.behaviors",
+    "CreateBlobStorageCommand": f"{__name__}.concerns",
+    "CreateBlobStorageCommandHandler": f"{__name__}.concerns",
+    "PlanBlobStorageCommand": f"{__name__}.concerns",
+    "PlanBlobStorageCommandHandler": f"{__name__}.concerns",
+    "CreateKafkaCommand": f"{__name__}.concerns",
+    "CreateKafkaCommandHandler": f"{__name__}.concerns",
+    "PlanKafkaCommand": f"{__name__}.concerns",
+    "PlanKafkaCommandHandler": f"{__name__}.concerns",
+    "CreateRabbitMqCommand": f"{__name__}.concerns",
+    "CreateRabbitMqCommandHandler": f"{__name__}.concerns",
+    "PlanRabbitMqCommand": f"{__name__}.concerns",
+    "PlanRabbitMqCommandHandler": f"{__name__}.concerns",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "initialize_opentelemetry",
     "CreateBlobStorageCommand",
     "CreateBlobStorageCommandHandler",
+    "PlanBlobStorageCommand",
+    "PlanBlobStorageCommandHandler",
     "CreateKafkaCommand",
     "CreateKafkaCommandHandler",
+    "PlanKafkaCommand",
+    "PlanKafkaCommandHandler",
     "CreateRabbitMqCommand",
     "CreateRabbitMqCommandHandler",
+    "PlanRabbitMqCommand",
+    "PlanRabbitMqCommandHandler",
 ]
@@ -1,3 +1,5 @@
 from cezzis_com_bootstrapper.application.behaviors.otel import initialize_opentelemetry
+from cezzis_com_bootstrapper.application.behaviors.readiness import ReadinessGate
+from cezzis_com_bootstrapper.application.behaviors.reconcile import ReconcileDaemon
 
-__all__ = ["initialize_opentelemetry"]
+__all__ = ["initialize_opentelemetry", "ReadinessGate", "ReconcileDaemon"]
@@ -0,0 +1,3 @@
+from cezzis_com_bootstrapper.application.behaviors.health.health_server import HealthServer
+
+__all__ = ["HealthServer"]
@@ -0,0 +1,66 @@
+import logging
+
+from aiohttp import web
+
+from cezzis_com_bootstrapper.infrastructure.telemetry import BootstrapperMetrics
+
+
+class HealthServer:
+    """Serves the liveness, readiness and Prometheus metrics endpoints.
+
+    The process is live while the server answers. It is ready once every enabled concern has
+    completed a successful reconcile, so a daemon that cannot reach a broker stays unready.
+    """
+
+    def __init__(self, port: int, concerns: list[str], metrics: BootstrapperMetrics, host: str = "0.0.0.0"):
+        self.port = port
+        self.host = host
+        self.concerns = concerns
+        self.metrics = metrics
+        self.logger = logging.getLogger("health_server")
+        self._runner: web.AppRunner | None = None
+
+        self.app = web.Application()
+        self.app.router.add_get("/health/live", self.live)
+        self.app.router.add_get("/health/ready", self.ready)
+        self.app.router.add_get("/metrics", self.render_metrics)
+
+    async def start(self) -> None:
+        """Starts listening on the configured port."""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        self.logger.info(f"Health server listening on port {self.port}", extra={"health_server_port": self.port})
+
+    async def stop(self) -> None:
+        """Stops listening and closes open connections."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+        self._runner = None
+
+    def pending_concerns(self) -> list[str]:
+        """Gets the enabled concerns that have not reconciled successfully yet.
+
+        Returns:
+            list[str]: The names of the pending concerns, empty when the bootstrapper is ready.
+        """
+        return [
+            concern
+            for concern in self.concerns
+            if self.metrics.last_success_timestamp_seconds.value(concern=concern) is None
+        ]
+
+    async def live(self, request: web.Request) -> web.Response:
+        return web.json_response({"status": "ok"})
+
+    async def ready(self, request: web.Request) -> web.Response:
+        pending = self.pending_concerns()
+        if pending:
+            return web.json_response({"status": "not ready", "pending_concerns": pending}, status=503)
+        return web.json_response({"status": "ready"})
+
+    async def render_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(
+            body=self.metrics.registry.render().encode("utf-8"),
+            headers={"Content-Type": self.metrics.registry.content_type},
+        )
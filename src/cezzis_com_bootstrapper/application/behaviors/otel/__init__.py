@@ -1,3 +1,6 @@
-from cezzis_com_bootstrapper.application.behaviors.otel.initialize_otel import initialize_opentelemetry
+from cezzis_com_bootstrapper.application.behaviors.otel.initialize_otel import (
+    initialize_opentelemetry,
+    shutdown_opentelemetry,
+)
 
-__all__ = ["initialize_opentelemetry"]
+__all__ = ["initialize_opentelemetry", "shutdown_opentelemetry"]
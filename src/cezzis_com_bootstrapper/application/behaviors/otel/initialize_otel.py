@@ -2,60 +2,159 @@ import atexit
 import logging
 import os
 import socket
+import threading
 from importlib.metadata import version
 
 from cezzis_otel import OTelSettings, initialize_otel, shutdown_otel
-from opentelemetry.instrumentation.aiohttp_client import AioHttpClientInstrumentor
-from opentelemetry.instrumentation.confluent_kafka import (  # type: ignore
-    ConfluentKafkaInstrumentor,
-)
-from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
-from opentelemetry.instrumentation.requests import RequestsInstrumentor
+from opentelemetry import metrics, trace
+from opentelemetry._logs import get_logger_provider
 
 from cezzis_com_bootstrapper.domain import get_otel_options
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions, get_bootstrapper_options
 
 
 def initialize_opentelemetry() -> None:
     """Initialize OpenTelemetry tracing and logging for the application."""
 
-    # Make sure toshutdown and gracefully flush the telemetry data on exit
-    atexit.register(shutdown_otel)
-
     # Suppress urllib3 debug logs (used by OTLP exporter) to prevent self-logging
     logging.getLogger("urllib3").setLevel(logging.INFO)
     logging.getLogger("urllib3.connectionpool").setLevel(logging.WARNING)
 
     otel_options = get_otel_options()
 
+    settings = OTelSettings(
+        service_name=otel_options.otel_service_name,
+        service_namespace=otel_options.otel_service_namespace,
+        otlp_exporter_endpoint=otel_options.otel_exporter_otlp_endpoint,
+        otlp_exporter_auth_header=otel_options.otel_otlp_exporter_auth_header,
+        service_version=version("cezzis_com_bootstrapper"),
+        environment=os.environ.get("ENV", "unknown"),
+        instance_id=socket.gethostname(),
+        enable_logging=otel_options.enable_logging,
+        enable_tracing=otel_options.enable_tracing,
+        enable_console_logging=otel_options.enable_console_logging,
+    )
+    resource_attributes = {
+        "app_name": otel_options.otel_service_name,
+        "app_class": "loader",
+        "app_product": "cezzis.com",
+        "app_product_segment": "backend",
+        "app_unit": "cocktails",
+        "app_env": os.environ.get("ENV", "unknown"),
+    }
+
     initialize_otel(
-        settings=OTelSettings(
-            service_name=otel_options.otel_service_name,
-            service_namespace=otel_options.otel_service_namespace,
-            otlp_exporter_endpoint=otel_options.otel_exporter_otlp_endpoint,
-            otlp_exporter_auth_header=otel_options.otel_otlp_exporter_auth_header,
-            service_version=version("cezzis_com_bootstrapper"),
-            environment=os.environ.get("ENV", "unknown"),
-            instance_id=socket.gethostname(),
-            enable_logging=otel_options.enable_logging,
-            enable_tracing=otel_options.enable_tracing,
-            enable_console_logging=otel_options.enable_console_logging,
-        ),
-        resource_attributes={
-            "app_name": otel_options.otel_service_name,
-            "app_class": "loader",
-            "app_product": "cezzis.com",
-            "app_product_segment": "backend",
-            "app_unit": "cocktails",
-            "app_env": os.environ.get("ENV", "unknown"),
-        },
-        configure_tracing=lambda _: (
-            ConfluentKafkaInstrumentor().instrument(),
-            RequestsInstrumentor().instrument(),
-            HTTPXClientInstrumentor().instrument(),
-            AioHttpClientInstrumentor().instrument(),
-            None,
-        )[-1],
+        settings=settings,
+        resource_attributes=resource_attributes,
+        configure_tracing=lambda _: _instrument_libraries(get_bootstrapper_options()),
     )
 
+    if otel_options.enable_metrics:
+        _initialize_metrics(settings, resource_attributes)
+
     logger = logging.getLogger("initialize_otel")
     logger.info("OpenTelemetry initialized successfully")
+
+
+def shutdown_opentelemetry(timeout_seconds: float) -> bool:
+    """Flushes and shuts down the telemetry providers, giving up once the budget is spent.
+
+    The providers flush from a daemon thread, so an unreachable collector cannot delay the exit
+    past the budget. Their own exit handlers are unregistered first, they would otherwise flush
+    again without a time limit when the interpreter exits.
+
+    Args:
+        timeout_seconds (float): How long the flush may take.
+
+    Returns:
+        bool: True when every provider was flushed within the budget.
+    """
+    meter_provider = metrics.get_meter_provider()
+    for provider in (trace.get_tracer_provider(), get_logger_provider(), meter_provider):
+        if hasattr(provider, "shutdown"):
+            atexit.unregister(provider.shutdown)
+
+    def flush() -> None:
+        shutdown_otel()
+        if hasattr(meter_provider, "shutdown"):
+            meter_provider.shutdown(timeout_millis=timeout_seconds * 1000)
+
+    thread = threading.Thread(target=flush, name="otel-shutdown", daemon=True)
+    thread.start()
+    thread.join(timeout_seconds)
+
+    if thread.is_alive():
+        logging.getLogger("initialize_otel").warning(
+            f"Flushing telemetry did not finish within {timeout_seconds} seconds, dropping the rest"
+        )
+        return False
+    return True
+
+
+def _instrument_libraries(bootstrapper_options: BootstrapperOptions) -> None:
+    """Instruments the client libraries used by the enabled concerns.
+
+    The instrumentors import the library they patch, so they are imported here rather than
+    at module level to keep disabled concerns' SDKs out of the process.
+
+    Args:
+        bootstrapper_options (BootstrapperOptions): The bootstrapper feature flags.
+    """
+    from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+    from opentelemetry.instrumentation.requests import RequestsInstrumentor
+
+    RequestsInstrumentor().instrument()
+    HTTPXClientInstrumentor().instrument()
+
+    if bootstrapper_options.enable_kafka:
+        from opentelemetry.instrumentation.confluent_kafka import (  # type: ignore
+            ConfluentKafkaInstrumentor,
+        )
+
+        ConfluentKafkaInstrumentor().instrument()
+
+    if bootstrapper_options.enable_rabbitmq:
+        from opentelemetry.instrumentation.aiohttp_client import AioHttpClientInstrumentor
+
+        AioHttpClientInstrumentor().instrument()
+
+
+def _initialize_metrics(settings: OTelSettings, resource_attributes: dict[str, str]) -> None:
+    """Sets up the meter provider exporting the bootstrapper's operation metrics over OTLP.
+
+    cezzis_otel only configures tracing and logging, so the meter provider is set up here with
+    the same resource and exporter settings.
+
+    Args:
+        settings (OTelSettings): The OpenTelemetry settings for configuration.
+        resource_attributes (dict[str, str]): Additional resource attributes to include.
+    """
+    from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+    from opentelemetry.sdk.resources import Resource
+
+    resource = Resource(
+        attributes={
+            "service.name": settings.service_name,
+            "service.namespace": settings.service_namespace,
+            "service.instance.id": socket.gethostname(),
+            "service.version": settings.service_version,
+            "deployment.environment": settings.environment,
+            **resource_attributes,
+        }
+    )
+
+    metric_readers = []
+    if settings.otlp_exporter_endpoint:
+        metric_readers.append(
+            PeriodicExportingMetricReader(
+                OTLPMetricExporter(
+                    endpoint=f"{settings.otlp_exporter_endpoint}/v1/metrics",
+                    headers={"authorization": settings.otlp_exporter_auth_header},
+                )
+            )
+        )
+
+    # The provider flushes its last collection cycle on exit, a job run is usually shorter than the export interval
+    metrics.set_meter_provider(MeterProvider(resource=resource, metric_readers=metric_readers, shutdown_on_exit=True))
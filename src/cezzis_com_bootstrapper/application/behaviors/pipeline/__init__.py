@@ -0,0 +1,10 @@
+from cezzis_com_bootstrapper.application.behaviors.pipeline.deadline_behavior import DeadlineBehavior
+from cezzis_com_bootstrapper.application.behaviors.pipeline.retry_behavior import RetryBehavior
+from cezzis_com_bootstrapper.application.behaviors.pipeline.timing_behavior import TimingBehavior
+from cezzis_com_bootstrapper.application.behaviors.pipeline.transient_errors import is_transient_error
+
+# Behaviors wrap every command in registration order: timing is outermost and the deadline
+# covers every retry of the handler.
+PIPELINE_BEHAVIORS = (TimingBehavior, DeadlineBehavior, RetryBehavior)
+
+__all__ = ["PIPELINE_BEHAVIORS", "TimingBehavior", "DeadlineBehavior", "RetryBehavior", "is_transient_error"]
@@ -0,0 +1,32 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from injector import inject
+from mediatr import GenericQuery
+
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+
+
+class DeadlineBehavior:
+    """Pipeline behavior failing a command that runs longer than its deadline, retries included.
+
+    A dependency that accepts connections but never answers would otherwise hang the job until
+    Kubernetes kills it.
+    """
+
+    @inject
+    def __init__(self, bootstrapper_options: BootstrapperOptions):
+        self.timeout_seconds = bootstrapper_options.command_timeout_seconds
+
+    async def handle(self, request: GenericQuery, next: Callable[[], Awaitable[Any]]) -> Any:
+        deadline = asyncio.timeout(self.timeout_seconds)
+        try:
+            async with deadline:
+                return await next()
+        except TimeoutError as e:
+            if not deadline.expired():
+                # A timeout raised by the handler itself, not by the deadline
+                raise
+            raise TimeoutError(
+                f"{type(request).__name__} did not complete within {self.timeout_seconds} seconds"
+            ) from e
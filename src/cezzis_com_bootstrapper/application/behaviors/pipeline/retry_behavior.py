@@ -0,0 +1,61 @@
+import asyncio
+import logging
+import random
+from typing import Any, Awaitable, Callable
+
+from injector import inject
+from mediatr import GenericQuery
+
+from cezzis_com_bootstrapper.application.behaviors.pipeline.transient_errors import is_transient_error
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+from cezzis_com_bootstrapper.infrastructure.telemetry import get_bootstrapper_metrics
+
+
+class RetryBehavior:
+    """Pipeline behavior retrying a command that failed with a transient error.
+
+    The backoff grows exponentially from the base delay up to the max delay, and each wait is
+    drawn at random below it (full jitter) so concurrent bootstrappers do not retry in lockstep.
+    Every handler is idempotent, so the whole command is replayed.
+    """
+
+    @inject
+    def __init__(self, bootstrapper_options: BootstrapperOptions):
+        self.max_attempts = bootstrapper_options.retry_max_attempts
+        self.base_delay_seconds = bootstrapper_options.retry_base_delay_seconds
+        self.max_delay_seconds = bootstrapper_options.retry_max_delay_seconds
+        self.logger = logging.getLogger("retry_behavior")
+        self.metrics = get_bootstrapper_metrics()
+
+    async def handle(self, request: GenericQuery, next: Callable[[], Awaitable[Any]]) -> Any:
+        command = type(request).__name__
+        attempt = 1
+
+        while True:
+            try:
+                return await next()
+            except Exception as e:
+                if attempt >= self.max_attempts or not is_transient_error(e):
+                    raise
+
+                delay_seconds = self.get_backoff_seconds(attempt)
+                self.logger.warning(
+                    f"{command} failed with a transient error on attempt {attempt}/{self.max_attempts}, "
+                    f"retrying in {delay_seconds:.2f}s: {e!r}",
+                    extra={"command": command, "retry_attempt": attempt, "retry_delay_seconds": delay_seconds},
+                )
+                self.metrics.command_retries_total.inc(command=command)
+
+            await asyncio.sleep(delay_seconds)
+            attempt += 1
+
+    def get_backoff_seconds(self, attempt: int) -> float:
+        """Gets the jittered wait before the next attempt.
+
+        Args:
+            attempt (int): The attempt that just failed, starting at 1.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        return random.uniform(0, min(self.max_delay_seconds, self.base_delay_seconds * 2 ** (attempt - 1)))
@@ -0,0 +1,51 @@
+import logging
+import resource
+import sys
+import time
+from typing import Any, Awaitable, Callable
+
+from mediatr import GenericQuery
+
+from cezzis_com_bootstrapper.infrastructure.telemetry import get_bootstrapper_metrics
+
+
+def get_peak_rss_bytes() -> int:
+    """Gets the peak resident set size of the process.
+
+    Returns:
+        int: The peak RSS in bytes.
+    """
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports the peak RSS in kilobytes, macOS in bytes
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+class TimingBehavior:
+    """Pipeline behavior recording the wall-clock time of every command and the peak RSS of the process."""
+
+    def __init__(self):
+        self.logger = logging.getLogger("timing_behavior")
+        self.metrics = get_bootstrapper_metrics()
+
+    async def handle(self, request: GenericQuery, next: Callable[[], Awaitable[Any]]) -> Any:
+        command = type(request).__name__
+        started = time.perf_counter()
+        outcome = "failure"
+        try:
+            response = await next()
+            outcome = "success"
+            return response
+        finally:
+            duration_seconds = time.perf_counter() - started
+            peak_rss_bytes = get_peak_rss_bytes()
+            self.metrics.command_duration_seconds.observe(duration_seconds, command=command, outcome=outcome)
+            self.metrics.peak_rss_bytes.set(peak_rss_bytes)
+            self.logger.info(
+                f"{command} finished in {duration_seconds:.3f}s ({outcome}), peak RSS {peak_rss_bytes / 1048576:.1f} MiB",
+                extra={
+                    "command": command,
+                    "command_outcome": outcome,
+                    "command_duration_seconds": duration_seconds,
+                    "peak_rss_bytes": peak_rss_bytes,
+                },
+            )
@@ -0,0 +1,53 @@
+import asyncio
+import sys
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Checks whether an error is worth retrying: a refused or dropped connection, a 5xx or 429 answer or a Kafka transport error.
+
+    The Kafka, Azure and AMQP clients are looked up in sys.modules rather than imported, an error
+    can only come from a client that a running concern has already loaded. A refused AMQP login is
+    a connection error too, but retrying it cannot succeed.
+
+    A group of errors, raised by a command reconciling several targets concurrently, is transient
+    when every error in it is.
+
+    Args:
+        error (BaseException): The error raised by a command handler.
+
+    Returns:
+        bool: True when the error is transient.
+    """
+    if isinstance(error, BaseExceptionGroup):
+        return all(is_transient_error(inner) for inner in error.exceptions)
+
+    aiormq_exceptions = sys.modules.get("aiormq.exceptions")
+    if aiormq_exceptions is not None and isinstance(
+        error, (aiormq_exceptions.AuthenticationError, aiormq_exceptions.ProbableAuthenticationError)
+    ):
+        return False
+
+    if isinstance(error, (ConnectionError, asyncio.TimeoutError)):
+        return True
+
+    aiohttp = sys.modules.get("aiohttp")
+    if aiohttp is not None:
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status >= 500 or error.status == 429
+        if isinstance(error, aiohttp.ClientConnectionError):
+            return True
+
+    confluent_kafka = sys.modules.get("confluent_kafka")
+    if confluent_kafka is not None and isinstance(error, confluent_kafka.KafkaException) and error.args:
+        kafka_error = error.args[0]
+        if isinstance(kafka_error, confluent_kafka.KafkaError):
+            return kafka_error.code() == confluent_kafka.KafkaError._TRANSPORT or kafka_error.retriable()
+
+    azure_exceptions = sys.modules.get("azure.core.exceptions")
+    if azure_exceptions is not None:
+        if isinstance(error, azure_exceptions.ServiceRequestError):
+            return True
+        if isinstance(error, azure_exceptions.HttpResponseError):
+            return (error.status_code or 0) >= 500
+
+    return False
@@ -0,0 +1,4 @@
+from cezzis_com_bootstrapper.application.behaviors.planning.export_when_ready import export_when_ready
+from cezzis_com_bootstrapper.application.behaviors.planning.plan_when_ready import plan_when_ready
+
+__all__ = ["export_when_ready", "plan_when_ready"]
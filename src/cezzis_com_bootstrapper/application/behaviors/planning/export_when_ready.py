@@ -0,0 +1,31 @@
+from typing import Any, Awaitable, Callable
+
+from mediatr import Mediator
+
+from cezzis_com_bootstrapper.application.behaviors.readiness import ReadinessGate
+from cezzis_com_bootstrapper.concern_registry import ConcernRegistration, import_target
+from cezzis_com_bootstrapper.infrastructure.telemetry import trace_operation
+
+
+async def export_when_ready(
+    mediator: Mediator,
+    concern: ConcernRegistration,
+    gate: ReadinessGate,
+    probe: Callable[[], Awaitable[None]],
+) -> Any:
+    """Reads the live state of a concern back as a spec as soon as its target service answers.
+
+    The export command only reads from the target, in a "<concern>.export" span.
+
+    Args:
+        mediator (Mediator): The mediator dispatching the command.
+        concern (ConcernRegistration): The concern to export, it must have an export command.
+        gate (ReadinessGate): The gate holding the shared readiness deadline.
+        probe (Callable[[], Awaitable[None]]): Checks the concern's target once, raising when it is not ready.
+
+    Returns:
+        Any: The spec returned by the concern's export command, which can write itself to a file.
+    """
+    await gate.wait_until_ready(concern.name, probe)
+    with trace_operation(concern.name, "export"):
+        return await mediator.send_async(import_target(concern.export_command)())
@@ -0,0 +1,34 @@
+from typing import Awaitable, Callable
+
+from mediatr import Mediator
+
+from cezzis_com_bootstrapper.application.behaviors.readiness import ReadinessGate
+from cezzis_com_bootstrapper.concern_registry import ConcernRegistration, import_target
+from cezzis_com_bootstrapper.domain.planning import PlannedChange
+from cezzis_com_bootstrapper.infrastructure.telemetry import trace_operation
+
+
+async def plan_when_ready(
+    mediator: Mediator,
+    concern: ConcernRegistration,
+    gate: ReadinessGate,
+    probe: Callable[[], Awaitable[None]],
+) -> list[PlannedChange]:
+    """Computes the changes a concern would make as soon as its target service answers.
+
+    The plan command only reads from the target, in a "<concern>.plan" span.
+
+    Args:
+        mediator (Mediator): The mediator dispatching the command.
+        concern (ConcernRegistration): The concern to plan.
+        gate (ReadinessGate): The gate holding the shared readiness deadline.
+        probe (Callable[[], Awaitable[None]]): Checks the concern's target once, raising when it is not ready.
+
+    Returns:
+        list[PlannedChange]: The changes the concern's command would make.
+    """
+    await gate.wait_until_ready(concern.name, probe)
+    with trace_operation(concern.name, "plan") as operation:
+        changes = await mediator.send_async(import_target(concern.plan_command)())
+        operation.span.set_attribute("bootstrapper.plan.changes", len(changes))
+        return changes
@@ -0,0 +1,4 @@
+from cezzis_com_bootstrapper.application.behaviors.readiness.readiness_gate import ReadinessGate
+from cezzis_com_bootstrapper.application.behaviors.readiness.reconcile_when_ready import reconcile_when_ready
+
+__all__ = ["ReadinessGate", "reconcile_when_ready"]
@@ -0,0 +1,85 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable
+
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+from cezzis_com_bootstrapper.infrastructure.telemetry import trace_operation
+
+
+class ReadinessGate:
+    """Waits for target services to answer before their concerns reconcile.
+
+    Every service is probed until it answers, with a full-jitter exponential backoff between two
+    probes. All waits share one deadline, started when the gate is created, so a job cannot wait
+    longer than ``BOOTSTRAPPER_READINESS_TIMEOUT_SECONDS`` however many targets are down. Probes
+    for different targets run concurrently, so each concern starts as soon as its own target answers.
+    """
+
+    def __init__(self, options: BootstrapperOptions):
+        self.timeout_seconds = options.readiness_timeout_seconds
+        self.base_delay_seconds = options.readiness_base_delay_seconds
+        self.max_delay_seconds = options.readiness_max_delay_seconds
+        self.deadline = time.monotonic() + self.timeout_seconds
+        self.logger = logging.getLogger("readiness_gate")
+
+    @property
+    def enabled(self) -> bool:
+        return self.timeout_seconds > 0
+
+    async def wait_until_ready(self, concern: str, probe: Callable[[], Awaitable[None]]) -> None:
+        """Probes a concern's target until it answers.
+
+        Args:
+            concern (str): The concern the target belongs to, used in spans and log messages.
+            probe (Callable[[], Awaitable[None]]): Checks the target once, raising when it is not ready.
+
+        Raises:
+            TimeoutError: If the target did not answer before the deadline, chained to the last probe error.
+        """
+        if not self.enabled:
+            return
+
+        with trace_operation(concern, "wait_until_ready") as operation:
+            attempt = 1
+            while True:
+                remaining_seconds = self.deadline - time.monotonic()
+                try:
+                    async with asyncio.timeout(max(remaining_seconds, 0)):
+                        await probe()
+                except Exception as e:
+                    delay_seconds = self.get_backoff_seconds(attempt)
+                    remaining_seconds = self.deadline - time.monotonic()
+                    if remaining_seconds <= 0:
+                        operation.span.set_attribute("bootstrapper.readiness.attempts", attempt)
+                        raise TimeoutError(
+                            f"{concern} was not ready within {self.timeout_seconds} seconds "
+                            f"after {attempt} probes, last error: {e!r}"
+                        ) from e
+
+                    self.logger.info(
+                        f"{concern} is not ready yet on probe {attempt}, probing again in {delay_seconds:.2f}s",
+                        extra={"concern": concern, "readiness_attempt": attempt, "error": repr(e)},
+                    )
+                    await asyncio.sleep(min(delay_seconds, remaining_seconds))
+                    attempt += 1
+                    continue
+
+                operation.span.set_attribute("bootstrapper.readiness.attempts", attempt)
+                self.logger.info(
+                    f"{concern} is ready after {attempt} probes",
+                    extra={"concern": concern, "readiness_attempt": attempt},
+                )
+                return
+
+    def get_backoff_seconds(self, attempt: int) -> float:
+        """Gets the jittered wait before the next probe.
+
+        Args:
+            attempt (int): The probe that just failed, starting at 1.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        return random.uniform(0, min(self.max_delay_seconds, self.base_delay_seconds * 2 ** (attempt - 1)))
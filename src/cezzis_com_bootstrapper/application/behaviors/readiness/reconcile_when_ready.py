@@ -0,0 +1,25 @@
+from typing import Awaitable, Callable
+
+from mediatr import Mediator
+
+from cezzis_com_bootstrapper.application.behaviors.readiness.readiness_gate import ReadinessGate
+from cezzis_com_bootstrapper.application.behaviors.reconcile import reconcile_concern
+from cezzis_com_bootstrapper.concern_registry import ConcernRegistration
+
+
+async def reconcile_when_ready(
+    mediator: Mediator,
+    concern: ConcernRegistration,
+    gate: ReadinessGate,
+    probe: Callable[[], Awaitable[None]],
+) -> None:
+    """Reconciles a concern as soon as its target service answers.
+
+    Args:
+        mediator (Mediator): The mediator dispatching the command.
+        concern (ConcernRegistration): The concern to reconcile.
+        gate (ReadinessGate): The gate holding the shared readiness deadline.
+        probe (Callable[[], Awaitable[None]]): Checks the concern's target once, raising when it is not ready.
+    """
+    await gate.wait_until_ready(concern.name, probe)
+    await reconcile_concern(mediator, concern)
@@ -0,0 +1,5 @@
+from cezzis_com_bootstrapper.application.behaviors.reconcile.reconcile_concern import reconcile_concern
+from cezzis_com_bootstrapper.application.behaviors.reconcile.reconcile_daemon import ReconcileDaemon
+from cezzis_com_bootstrapper.application.behaviors.reconcile.spec_file_watcher import SpecFileWatcher
+
+__all__ = ["reconcile_concern", "ReconcileDaemon", "SpecFileWatcher"]
@@ -0,0 +1,32 @@
+import time
+
+from mediatr import Mediator
+
+from cezzis_com_bootstrapper.concern_registry import ConcernRegistration, import_target
+from cezzis_com_bootstrapper.infrastructure.telemetry import get_bootstrapper_metrics, get_run_report, trace_operation
+
+
+async def reconcile_concern(mediator: Mediator, concern: ConcernRegistration) -> None:
+    """Sends a concern's command in a "<concern>.reconcile" span and records its duration and outcome.
+
+    The outcome, duration and API calls are also recorded on the run report.
+
+    A cancelled reconcile is not recorded, it neither succeeded nor failed.
+
+    Args:
+        mediator (Mediator): The mediator dispatching the command.
+        concern (ConcernRegistration): The concern to reconcile.
+    """
+    metrics = get_bootstrapper_metrics()
+    report = get_run_report()
+    started = time.perf_counter()
+    try:
+        with trace_operation(concern.name, "reconcile") as operation:
+            await mediator.send_async(import_target(concern.command)())
+    except Exception:
+        metrics.record_reconcile(concern.name, time.perf_counter() - started, succeeded=False)
+        report.record_concern(concern.name, time.perf_counter() - started, False, operation.api_calls)
+        raise
+
+    metrics.record_reconcile(concern.name, time.perf_counter() - started, succeeded=True)
+    report.record_concern(concern.name, time.perf_counter() - started, True, operation.api_calls)
@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import time
+
+from mediatr import Mediator
+
+from cezzis_com_bootstrapper.application.behaviors.reconcile.reconcile_concern import reconcile_concern
+from cezzis_com_bootstrapper.application.behaviors.reconcile.spec_file_watcher import SpecFileWatcher
+from cezzis_com_bootstrapper.concern_registry import ConcernRegistration, get_spec_files
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+from cezzis_com_bootstrapper.infrastructure.telemetry import reset_run_report
+
+
+class ReconcileDaemon:
+    """Keeps the enabled concerns reconciled from a long running process.
+
+    The concerns run once at startup, again when one of their spec files changes, and all
+    of them on every drift-correction interval. Spec changes do not push the drift correction
+    back, and the watcher keeps running across cycles so no change is lost mid-debounce.
+    Services are injector singletons, so their clients stay warm between cycles.
+    """
+
+    def __init__(self, mediator: Mediator, options: BootstrapperOptions, concerns: list[ConcernRegistration]):
+        self.mediator = mediator
+        self.options = options
+        self.concerns = concerns
+        self.logger = logging.getLogger("reconcile_daemon")
+        self._concerns_by_spec_file: dict[str, list[ConcernRegistration]] = {}
+
+        for concern in concerns:
+            for path in get_spec_files(concern):
+                self._concerns_by_spec_file.setdefault(path, []).append(concern)
+
+    async def run(self) -> None:
+        """Runs the reconcile loop until cancelled."""
+        watcher = SpecFileWatcher(
+            paths=list(self._concerns_by_spec_file),
+            poll_interval_seconds=self.options.watch_poll_interval_seconds,
+            debounce_seconds=self.options.watch_debounce_seconds,
+        )
+
+        self.logger.info(
+            "Reconcile daemon started",
+            extra={
+                "spec_files": watcher.paths,
+                "reconcile_interval_seconds": self.options.reconcile_interval_seconds,
+            },
+        )
+
+        await self.reconcile(self.concerns, reason="startup")
+
+        next_drift_at = time.monotonic() + self.options.reconcile_interval_seconds
+        watch: asyncio.Task[set[str]] | None = None
+        try:
+            while True:
+                if watch is None:
+                    watch = asyncio.create_task(watcher.wait_for_changes())
+
+                done, _ = await asyncio.wait({watch}, timeout=max(0.0, next_drift_at - time.monotonic()))
+                if not done:
+                    await self.reconcile(self.concerns, reason="drift-correction")
+                    next_drift_at = time.monotonic() + self.options.reconcile_interval_seconds
+                    continue
+
+                changed = watch.result()
+                watch = None
+                affected = {
+                    concern.name: concern for path in changed for concern in self._concerns_by_spec_file.get(path, [])
+                }
+                await self.reconcile(
+                    [concern for concern in self.concerns if concern.name in affected], reason="spec-change"
+                )
+        finally:
+            if watch is not None:
+                watch.cancel()
+
+    async def reconcile(self, concerns: list[ConcernRegistration], reason: str) -> None:
+        """Runs each concern once. A failing concern is logged and does not stop the others or the daemon.
+
+        Each cycle starts a new run report, written when the cycle ends if a report path is configured.
+
+        Args:
+            concerns (list[ConcernRegistration]): The concerns to run.
+            reason (str): Why the cycle runs, used in log messages.
+        """
+        report = reset_run_report()
+        for concern in concerns:
+            self.logger.info(
+                f"Reconciling {concern.display_name} ({reason})",
+                extra={"concern": concern.name, "reconcile_reason": reason},
+            )
+            try:
+                await reconcile_concern(self.mediator, concern)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger.exception(
+                    f"Reconciling {concern.display_name} failed, retrying on the next cycle",
+                    extra={"concern": concern.name, "reconcile_reason": reason},
+                )
+
+        if self.options.run_report_path:
+            report.write(self.options.run_report_path)
@@ -0,0 +1,52 @@
+import asyncio
+import hashlib
+import logging
+import os
+
+
+class SpecFileWatcher:
+    """Polls spec files for content changes and reports them once they have settled.
+
+    Polling is used instead of inotify because ConfigMap volumes are updated by swapping a
+    symlinked directory, which inotify watches on the file itself do not follow.
+    """
+
+    def __init__(self, paths: list[str], poll_interval_seconds: float, debounce_seconds: float):
+        self.paths = list(dict.fromkeys(paths))
+        self.poll_interval_seconds = poll_interval_seconds
+        self.debounce_seconds = debounce_seconds
+        self.logger = logging.getLogger("spec_file_watcher")
+        self._fingerprints = {path: self._fingerprint(path) for path in self.paths}
+
+    async def wait_for_changes(self) -> set[str]:
+        """Waits until at least one spec file changed and no file changed for the debounce period.
+
+        Returns:
+            set[str]: The paths of the files whose content changed.
+        """
+        changed: set[str] = set()
+        last_change = 0.0
+        loop = asyncio.get_running_loop()
+
+        while True:
+            await asyncio.sleep(self.poll_interval_seconds)
+
+            for path in self.paths:
+                fingerprint = self._fingerprint(path)
+                if fingerprint != self._fingerprints[path]:
+                    self._fingerprints[path] = fingerprint
+                    changed.add(path)
+                    last_change = loop.time()
+                    self.logger.info(f"Spec file '{path}' changed", extra={"spec_file": path})
+
+            if changed and loop.time() - last_change >= self.debounce_seconds:
+                return changed
+
+    @staticmethod
+    def _fingerprint(path: str) -> str | None:
+        """Hashes the content of a file, None when the file cannot be read."""
+        try:
+            with open(os.path.realpath(path), "rb") as file:
+                return hashlib.sha256(file.read()).hexdigest()
+        except OSError:
+            return None
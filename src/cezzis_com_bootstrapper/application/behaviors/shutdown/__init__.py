@@ -0,0 +1,3 @@
+from cezzis_com_bootstrapper.application.behaviors.shutdown.graceful_shutdown import GracefulShutdown
+
+__all__ = ["GracefulShutdown"]
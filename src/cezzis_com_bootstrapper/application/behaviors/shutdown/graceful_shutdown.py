@@ -0,0 +1,81 @@
+import asyncio
+import logging
+import signal
+from typing import Awaitable, Callable
+
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+
+_SHUTDOWN_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+
+
+class GracefulShutdown:
+    """Turns SIGTERM and SIGINT into a cooperative cancellation of the running task.
+
+    The task is cancelled instead of the process being killed, so in-flight calls unwind through
+    their ``finally`` blocks and the pooled clients can be closed. Closing is bounded by
+    ``BOOTSTRAPPER_SHUTDOWN_TIMEOUT_SECONDS`` so a hanging connection cannot hold the pod past its grace period.
+
+    Attributes:
+        received_signal (signal.Signals | None): The first shutdown signal received, None while running.
+    """
+
+    def __init__(self, options: BootstrapperOptions):
+        self.timeout_seconds = options.shutdown_timeout_seconds
+        self.received_signal: signal.Signals | None = None
+        self.logger = logging.getLogger("graceful_shutdown")
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def exit_code(self) -> int:
+        """The conventional exit code of a process stopped by the received signal, e.g. 143 for SIGTERM."""
+        return 128 + self.received_signal if self.received_signal is not None else 0
+
+    def install(self, task: asyncio.Task) -> None:
+        """Cancels a task on the first SIGTERM or SIGINT.
+
+        Args:
+            task (asyncio.Task): The task running the bootstrapper.
+        """
+        self._loop = asyncio.get_running_loop()
+        for shutdown_signal in _SHUTDOWN_SIGNALS:
+            self._loop.add_signal_handler(shutdown_signal, self._on_signal, shutdown_signal, task)
+
+    def uninstall(self) -> None:
+        """Restores the default signal handlers."""
+        if self._loop is None:
+            return
+
+        for shutdown_signal in _SHUTDOWN_SIGNALS:
+            self._loop.remove_signal_handler(shutdown_signal)
+        self._loop = None
+
+    async def close_all(self, closers: list[Callable[[], Awaitable[None]]]) -> None:
+        """Runs the closers concurrently, giving up on those still running when the shutdown budget is spent.
+
+        A failing closer is logged and does not stop the others.
+
+        Args:
+            closers (list[Callable[[], Awaitable[None]]]): Closes one client or server each.
+        """
+        if not closers:
+            return
+
+        try:
+            async with asyncio.timeout(self.timeout_seconds):
+                results = await asyncio.gather(*(closer() for closer in closers), return_exceptions=True)
+        except TimeoutError:
+            self.logger.warning(f"Closing clients did not finish within {self.timeout_seconds} seconds, giving up")
+            return
+
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.warning("Closing a client failed", exc_info=result)
+
+    def _on_signal(self, shutdown_signal: signal.Signals, task: asyncio.Task) -> None:
+        if self.received_signal is not None:
+            self.logger.info(f"Received {shutdown_signal.name}, already shutting down")
+            return
+
+        self.received_signal = shutdown_signal
+        self.logger.info(f"Received {shutdown_signal.name}, shutting down", extra={"signal": shutdown_signal.name})
+        task.cancel()
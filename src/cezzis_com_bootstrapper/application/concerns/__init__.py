@@ -1,15 +1,63 @@
-from cezzis_com_bootstrapper.application.concerns.eventing import CreateKafkaCommand, CreateKafkaCommandHandler
-from cezzis_com_bootstrapper.application.concerns.messaging import CreateRabbitMqCommand, CreateRabbitMqCommandHandler
-from cezzis_com_bootstrapper.application.concerns.storage import (
-    CreateBlobStorageCommand,
-    CreateBlobStorageCommandHandler,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cezzis_com_bootstrapper.application.concerns.eventing import (
+        CreateKafkaCommand,
+        CreateKafkaCommandHandler,
+        PlanKafkaCommand,
+        PlanKafkaCommandHandler,
+    )
+    from cezzis_com_bootstrapper.application.concerns.messaging import (
+        CreateRabbitMqCommand,
+        CreateRabbitMqCommandHandler,
+        PlanRabbitMqCommand,
+        PlanRabbitMqCommandHandler,
+    )
+    from cezzis_com_bootstrapper.application.concerns.storage import (
+        CreateBlobStorageCommand,
+        CreateBlobStorageCommandHandler,
+        PlanBlobStorageCommand,
+        PlanBlobStorageCommandHandler,
+    )
+
+# Concerns are resolved on first access so disabled concerns are never imported.
+_LAZY_EXPORTS = {
+    "CreateBlobStorageCommand": f"{__name__}.storage",
+    "CreateBlobStorageCommandHandler": f"{__name__}.storage",
+    "PlanBlobStorageCommand": f"{__name__}.storage",
+    "PlanBlobStorageCommandHandler": f"{__name__}.storage",
+    "CreateKafkaCommand": f"{__name__}.eventing",
+    "CreateKafkaCommandHandler": f"{__name__}.eventing",
+    "PlanKafkaCommand": f"{__name__}.eventing",
+    "PlanKafkaCommandHandler": f"{__name__}.eventing",
+    "CreateRabbitMqCommand": f"{__name__}.messaging",
+    "CreateRabbitMqCommandHandler": f"{__name__}.messaging",
+    "PlanRabbitMqCommand": f"{__name__}.messaging",
+    "PlanRabbitMqCommandHandler": f"{__name__}.messaging",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "CreateBlobStorageCommand",
     "CreateBlobStorageCommandHandler",
+    "PlanBlobStorageCommand",
+    "PlanBlobStorageCommandHandler",
     "CreateKafkaCommand",
     "CreateKafkaCommandHandler",
+    "PlanKafkaCommand",
+    "PlanKafkaCommandHandler",
     "CreateRabbitMqCommand",
     "CreateRabbitMqCommandHandler",
+    "PlanRabbitMqCommand",
+    "PlanRabbitMqCommandHandler",
 ]
@@ -1,3 +1,8 @@
-from cezzis_com_bootstrapper.application.concerns.eventing.commands import CreateKafkaCommand, CreateKafkaCommandHandler
+from cezzis_com_bootstrapper.application.concerns.eventing.commands import (
+    CreateKafkaCommand,
+    CreateKafkaCommandHandler,
+    PlanKafkaCommand,
+    PlanKafkaCommandHandler,
+)
 
-__all__ = ["CreateKafkaCommand", "CreateKafkaCommandHandler"]
+__all__ = ["CreateKafkaCommand", "CreateKafkaCommandHandler", "PlanKafkaCommand", "PlanKafkaCommandHandler"]
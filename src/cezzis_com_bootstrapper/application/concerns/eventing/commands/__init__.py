@@ -2,5 +2,9 @@ from cezzis_com_bootstrapper.application.concerns.eventing.commands.create_kafka
     CreateKafkaCommand,
     CreateKafkaCommandHandler,
 )
+from cezzis_com_bootstrapper.application.concerns.eventing.commands.plan_kafka_command import (
+    PlanKafkaCommand,
+    PlanKafkaCommandHandler,
+)
 
-__all__ = ["CreateKafkaCommand", "CreateKafkaCommandHandler"]
+__all__ = ["CreateKafkaCommand", "CreateKafkaCommandHandler", "PlanKafkaCommand", "PlanKafkaCommandHandler"]
@@ -0,0 +1,44 @@
+from injector import inject
+from mediatr import GenericQuery, Mediator
+
+from cezzis_com_bootstrapper.application.concerns.eventing.commands.create_kafka_command import get_topic_partitions
+from cezzis_com_bootstrapper.domain.config import KafkaOptions
+from cezzis_com_bootstrapper.domain.planning import PlannedChange
+from cezzis_com_bootstrapper.infrastructure.services import IKafkaService
+
+
+class PlanKafkaCommand(GenericQuery[list[PlannedChange]]):
+    """Command to compute the changes CreateKafkaCommand would make, without making them."""
+
+    pass
+
+
+@Mediator.handler
+class PlanKafkaCommandHandler:
+    """Command handler for the PlanKafkaCommand."""
+
+    @inject
+    def __init__(self, kafka_service: IKafkaService, kafka_options: KafkaOptions):
+        self.kafka_service = kafka_service
+        self.kafka_options = kafka_options
+
+    async def handle(self, request: PlanKafkaCommand) -> list[PlannedChange]:
+        existing_topics = await self.kafka_service.list_topic_partitions()
+        return plan_kafka_changes(get_topic_partitions(self.kafka_options), existing_topics)
+
+
+def plan_kafka_changes(topics: dict[str, int | None], existing_topics: dict[str, int]) -> list[PlannedChange]:
+    """Diffs the desired topics against the cluster, existing topics are never altered.
+
+    Args:
+        topics (dict[str, int | None]): The desired partition count per topic name.
+        existing_topics (dict[str, int]): The partition count per topic name of the cluster.
+
+    Returns:
+        list[PlannedChange]: The topics that would be created.
+    """
+    return [
+        PlannedChange(kind="topic", name=topic_name, action="create", details={"partitions": partitions})
+        for topic_name, partitions in topics.items()
+        if topic_name not in existing_topics
+    ]
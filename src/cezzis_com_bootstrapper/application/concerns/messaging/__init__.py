@@ -1,9 +1,13 @@
 from cezzis_com_bootstrapper.application.concerns.messaging.commands import (
     CreateRabbitMqCommand,
     CreateRabbitMqCommandHandler,
+    PlanRabbitMqCommand,
+    PlanRabbitMqCommandHandler,
 )
 
 __all__ = [
     "CreateRabbitMqCommand",
     "CreateRabbitMqCommandHandler",
+    "PlanRabbitMqCommand",
+    "PlanRabbitMqCommandHandler",
 ]
@@ -2,8 +2,20 @@ from cezzis_com_bootstrapper.application.concerns.messaging.commands.create_rabb
     CreateRabbitMqCommand,
     CreateRabbitMqCommandHandler,
 )
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.export_rabbitmq_command import (
+    ExportRabbitMqCommand,
+    ExportRabbitMqCommandHandler,
+)
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.plan_rabbitmq_command import (
+    PlanRabbitMqCommand,
+    PlanRabbitMqCommandHandler,
+)
 
 __all__ = [
     "CreateRabbitMqCommand",
     "CreateRabbitMqCommandHandler",
+    "ExportRabbitMqCommand",
+    "ExportRabbitMqCommandHandler",
+    "PlanRabbitMqCommand",
+    "PlanRabbitMqCommandHandler",
 ]
@@ -1,11 +1,25 @@
+import asyncio
 import logging
+import os
+import time
 
 from injector import inject
 from mediatr import GenericQuery, Mediator
 
+from cezzis_com_bootstrapper.domain.config.bootstrapper_options import BootstrapperOptions
 from cezzis_com_bootstrapper.domain.config.rabbitmq_options import RabbitMqOptions
+from cezzis_com_bootstrapper.domain.config.settings_snapshot import format_settings_errors, get_settings_snapshot
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding import RabbitMqBinding
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_configuration import RabbitMqConfiguration
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_drift import RabbitMqDriftStrategy, is_migration_queue_of
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_user import RabbitMqUser
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_vhost import RabbitMqVhost
+from cezzis_com_bootstrapper.infrastructure.checkpoints import CheckpointJournal, compute_spec_hash
 from cezzis_com_bootstrapper.infrastructure.services.irabbitmq_admin_service import IRabbitMqAdminService
+from cezzis_com_bootstrapper.infrastructure.telemetry import get_run_report
+
+_JOURNAL_FILE_NAME = "rabbitmq.journal"
+_CONCERN = "rabbitmq"
 
 
 class CreateRabbitMqCommand(GenericQuery[bool]):
@@ -19,9 +33,15 @@ class CreateRabbitMqCommandHandler:
     """Command handler for the CreateRabbitMqCommand."""
 
     @inject
-    def __init__(self, rabbitmq_admin_service: IRabbitMqAdminService, rabbitmq_options: RabbitMqOptions):
+    def __init__(
+        self,
+        rabbitmq_admin_service: IRabbitMqAdminService,
+        rabbitmq_options: RabbitMqOptions,
+        bootstrapper_options: BootstrapperOptions,
+    ):
         self.rabbitmq_admin_service = rabbitmq_admin_service
         self.rabbitmq_options = rabbitmq_options
+        self.bootstrapper_options = bootstrapper_options
         self.logger = logging.getLogger("create_rabbitmq_command_handler")
 
     async def handle(self, request: CreateRabbitMqCommand) -> bool:
@@ -35,81 +55,294 @@ class CreateRabbitMqCommandHandler:
         )
 
         # --------------------------------------------------------
-        # Create the vhost
+        # Read the password of every vhost user from the settings before any request is made,
+        # so a missing one is reported with the other configuration errors instead of mid-reconcile
         # --------------------------------------------------------
-        await self.rabbitmq_admin_service.create_vhost_if_not_exists(self.rabbitmq_options.vhost)
+        passwords = _read_passwords(rabbitmq_configuration)
 
         # --------------------------------------------------------
-        # Create the application user and assign permissions
-        # Removing existing users not matching the application user
+        # Resume from the steps a failed run completed for the same desired state.
+        # The drift strategy decides what a completed exchange or queue step did, so it is part of the hash.
+        # The password is left out of the hash so it is never written to disk, even hashed
         # --------------------------------------------------------
-        await self.rabbitmq_admin_service.create_user_if_not_exists(
-            username=self.rabbitmq_options.app_username,
-            password=self.rabbitmq_options.app_password,
+        journal = CheckpointJournal(
+            os.path.join(self.bootstrapper_options.checkpoint_dir, _JOURNAL_FILE_NAME)
+            if self.bootstrapper_options.checkpoint_dir
+            else None
+        )
+        journal.open(
+            compute_spec_hash(
+                self.rabbitmq_options.vhost,
+                self.rabbitmq_options.app_username,
+                self.rabbitmq_options.drift_strategy,
+                rabbitmq_configuration,
+            )
         )
-        await self.rabbitmq_admin_service.assign_vhost_permissions(
-            vhost=self.rabbitmq_options.vhost,
-            username=self.rabbitmq_options.app_username,
-            configure=".*",
-            write=".*",
-            read=".*",
+
+        # --------------------------------------------------------
+        # Reconcile the default vhost and every listed vhost concurrently.
+        # A failing vhost does not stop the others, the command fails once they have all finished
+        # --------------------------------------------------------
+        app_user = RabbitMqUser(username=self.rabbitmq_options.app_username, password_env="")
+        managed_users = {app_user.username} | {
+            user_def.username for vhost_def in rabbitmq_configuration.vhosts for user_def in vhost_def.users
+        }
+        limiter = asyncio.Semaphore(self.rabbitmq_options.max_concurrent_vhosts)
+
+        async def reconcile(vhost: str, topology: RabbitMqConfiguration | RabbitMqVhost) -> BaseException | None:
+            async with limiter:
+                started = time.perf_counter()
+                try:
+                    if isinstance(topology, RabbitMqVhost):
+                        users = [(user_def, passwords[(vhost, user_def.username)]) for user_def in topology.users]
+                    else:
+                        users = [(app_user, self.rabbitmq_options.app_password)]
+                    await self._reconcile_vhost(vhost, users, topology, journal, managed_users)
+                except Exception as error:
+                    self.logger.error(f"Reconciling vhost '{vhost}' failed: {error}", extra={"rabbitmq_vhost": vhost})
+                    get_run_report().record_target(_CONCERN, vhost, time.perf_counter() - started, False, str(error))
+                    return error
+
+                self.logger.info(f"Reconciled vhost '{vhost}'", extra={"rabbitmq_vhost": vhost})
+                get_run_report().record_target(_CONCERN, vhost, time.perf_counter() - started, True)
+                return None
+
+        targets: list[tuple[str, RabbitMqConfiguration | RabbitMqVhost]] = [
+            (self.rabbitmq_options.vhost, rabbitmq_configuration),
+            *((vhost_def.name, vhost_def) for vhost_def in rabbitmq_configuration.vhosts),
+        ]
+        outcomes = await asyncio.gather(*(reconcile(vhost, topology) for vhost, topology in targets))
+        failures = {vhost: error for (vhost, _), error in zip(targets, outcomes) if error is not None}
+
+        self.logger.info(
+            f"Reconciled {len(targets) - len(failures)} of {len(targets)} RabbitMQ vhosts",
+            extra={"rabbitmq_vhosts_failed": sorted(failures)},
         )
+        if len(failures) == 1:
+            raise next(iter(failures.values()))
+        if failures:
+            raise ExceptionGroup(
+                "Reconciling RabbitMQ vhosts {0} failed".format(", ".join(f"'{vhost}'" for vhost in failures)),
+                list(failures.values()),
+            )
 
-        vhost_users = await self.rabbitmq_admin_service.list_vhost_users(self.rabbitmq_options.vhost)
-        for user in vhost_users:
-            if user != self.rabbitmq_options.app_username:
-                self.logger.info(f"Deleting extraneous user '{user}' from vhost '{self.rabbitmq_options.vhost}'")
-                await self.rabbitmq_admin_service.delete_user(username=user)
+        # --------------------------------------------------------
+        # Every step completed, the next run checks everything again
+        # --------------------------------------------------------
+        journal.clear()
+
+        return True
+
+    async def _reconcile_vhost(
+        self,
+        vhost: str,
+        users: list[tuple[RabbitMqUser, str]],
+        topology: RabbitMqConfiguration | RabbitMqVhost,
+        journal: CheckpointJournal,
+        managed_users: set[str],
+    ) -> None:
+        """Brings one vhost, its users and its topology to the desired state.
+
+        Args:
+            vhost (str): The name of the virtual host.
+            users (list[tuple[RabbitMqUser, str]]): The users of the vhost, with their passwords.
+            topology (RabbitMqConfiguration | RabbitMqVhost): The exchanges, queues, bindings and policies of the vhost.
+            journal (CheckpointJournal): The journal steps are checked against and recorded in.
+            managed_users (set[str]): Every user of every vhost, which pruning never deletes.
+        """
+
+        def step(name: str) -> str:
+            return f"{vhost}/{name}"
+
+        # --------------------------------------------------------
+        # Create the vhost
+        # --------------------------------------------------------
+        if not journal.is_completed(step("vhost")):
+            await self.rabbitmq_admin_service.create_vhost_if_not_exists(vhost)
+            journal.complete(step("vhost"))
+
+        # --------------------------------------------------------
+        # Remove existing users of the vhost no vhost declares, all in one request
+        # --------------------------------------------------------
+        if not journal.is_completed(step("prune:users")):
+            stale_users = [
+                user for user in await self.rabbitmq_admin_service.list_vhost_users(vhost) if user not in managed_users
+            ]
+            if stale_users:
+                self.logger.info(f"Deleting extraneous users {', '.join(stale_users)} from vhost '{vhost}'")
+                await self.rabbitmq_admin_service.delete_users(stale_users)
+            journal.complete(step("prune:users"))
+
+        # --------------------------------------------------------
+        # Create the users and bring their permissions and topic permissions on the vhost up to date.
+        # Users managed on other vhosts lose the permissions they have on this one
+        # --------------------------------------------------------
+        if not journal.is_completed(step("users")):
+            await self.rabbitmq_admin_service.create_users_if_not_exist(
+                user_defs=[user_def for user_def, _ in users],
+                passwords={user_def.username: password for user_def, password in users},
+            )
+            await self.rabbitmq_admin_service.reconcile_vhost_permissions(
+                vhost=vhost,
+                user_defs=[user_def for user_def, _ in users],
+            )
+            journal.complete(step("users"))
+
+        # --------------------------------------------------------
+        # Apply policies and operator policies and remove any not in the configuration
+        # Policies go first so new queues start with their profile instead of picking it up later
+        # --------------------------------------------------------
+        for operator, policy_defs in (
+            (False, topology.policies),
+            (True, topology.operator_policies),
+        ):
+            policies_step = "operator_policies" if operator else "policies"
+            if not journal.is_completed(step(policies_step)):
+                await self.rabbitmq_admin_service.create_or_update_policies(
+                    vhost=vhost,
+                    policy_defs=policy_defs,
+                    operator=operator,
+                )
+                journal.complete(step(policies_step))
+
+            if not journal.is_completed(step(f"prune:{policies_step}")):
+                desired_policies = {policy_def.name for policy_def in policy_defs}
+                for policy in await self.rabbitmq_admin_service.list_policies(vhost, operator=operator):
+                    if policy.name not in desired_policies:
+                        await self.rabbitmq_admin_service.delete_policy(
+                            vhost=vhost,
+                            policy_name=policy.name,
+                            operator=operator,
+                        )
+                journal.complete(step(f"prune:{policies_step}"))
 
         # --------------------------------------------------------
         # Create exchanges and remove any not in the configuration
+        # Each entity kind is created in one batch, the vhost is listed once per batch.
+        # Listings are streamed and only the entities to remove are kept.
+        # Existing exchanges and queues differing from their definition are handled by the drift strategy
         # --------------------------------------------------------
-        for exchange_def in rabbitmq_configuration.exchanges:
-            await self.rabbitmq_admin_service.create_exchange_if_not_exists(
-                vhost=self.rabbitmq_options.vhost,
-                exchange_def=exchange_def,
+        drift_strategy = RabbitMqDriftStrategy(self.rabbitmq_options.drift_strategy)
+        pending_exchanges = [
+            exchange_def
+            for exchange_def in topology.exchanges
+            if not journal.is_completed(step(f"exchange:{exchange_def.name}"))
+        ]
+        if pending_exchanges:
+            await self.rabbitmq_admin_service.create_exchanges_if_not_exist(
+                vhost=vhost,
+                exchange_defs=pending_exchanges,
+                drift_strategy=drift_strategy,
             )
+            for exchange_def in pending_exchanges:
+                journal.complete(step(f"exchange:{exchange_def.name}"))
 
-        all_exchanges = await self.rabbitmq_admin_service.list_exchanges_in_vhost(self.rabbitmq_options.vhost)
-        for exchange in all_exchanges:
-            if exchange not in [ex.name for ex in rabbitmq_configuration.exchanges]:
+        if not journal.is_completed(step("prune:exchanges")):
+            desired_exchanges = {exchange_def.name for exchange_def in topology.exchanges}
+            stale_exchanges = [
+                exchange
+                async for exchange in self.rabbitmq_admin_service.iter_exchanges_in_vhost(vhost)
+                if exchange not in desired_exchanges
+            ]
+            for exchange in stale_exchanges:
                 await self.rabbitmq_admin_service.delete_exchange_from_vhost(
-                    vhost=self.rabbitmq_options.vhost,
+                    vhost=vhost,
                     exchange_name=exchange,
                 )
+            journal.complete(step("prune:exchanges"))
 
         # --------------------------------------------------------
         # Create queues and remove any not in the configuration
         # --------------------------------------------------------
-        for queue_def in rabbitmq_configuration.queues:
-            await self.rabbitmq_admin_service.create_queue_if_not_exists(
-                vhost=self.rabbitmq_options.vhost,
-                queue_def=queue_def,
+        pending_queues = [
+            queue_def for queue_def in topology.queues if not journal.is_completed(step(f"queue:{queue_def.name}"))
+        ]
+        if pending_queues:
+            await self.rabbitmq_admin_service.create_queues_if_not_exist(
+                vhost=vhost,
+                queue_defs=pending_queues,
+                drift_strategy=drift_strategy,
             )
+            for queue_def in pending_queues:
+                journal.complete(step(f"queue:{queue_def.name}"))
 
-        all_queues = await self.rabbitmq_admin_service.list_queues_in_vhost(self.rabbitmq_options.vhost)
-        for queue in all_queues:
-            if queue not in [q.name for q in rabbitmq_configuration.queues]:
+        if not journal.is_completed(step("prune:queues")):
+            desired_queues = {queue_def.name for queue_def in topology.queues}
+            stale_queues = [
+                queue
+                async for queue in self.rabbitmq_admin_service.iter_queues_in_vhost(vhost)
+                if queue not in desired_queues and not is_migration_queue_of(queue, desired_queues)
+            ]
+            for queue in stale_queues:
                 await self.rabbitmq_admin_service.delete_queue_for_vhost(
-                    vhost=self.rabbitmq_options.vhost,
+                    vhost=vhost,
                     queue_name=queue,
                 )
+            journal.complete(step("prune:queues"))
 
         # --------------------------------------------------------
         # Create bindings and remove any not in the configuration
         # --------------------------------------------------------
-        for binding_def in rabbitmq_configuration.bindings:
-            await self.rabbitmq_admin_service.create_binding_if_not_exists(
-                vhost=self.rabbitmq_options.vhost,
-                binding_def=binding_def,
+        pending_bindings = [
+            binding_def
+            for binding_def in topology.bindings
+            if not journal.is_completed(step(_binding_step(binding_def)))
+        ]
+        if pending_bindings:
+            await self.rabbitmq_admin_service.create_bindings_if_not_exist(
+                vhost=vhost,
+                binding_defs=pending_bindings,
             )
+            for binding_def in pending_bindings:
+                journal.complete(step(_binding_step(binding_def)))
 
-        all_bindings = await self.rabbitmq_admin_service.list_bindings_in_vhost(self.rabbitmq_options.vhost)
-        for binding in all_bindings:
-            if binding not in rabbitmq_configuration.bindings:
-                await self.rabbitmq_admin_service.delete_binding_from_vhost(
-                    vhost=self.rabbitmq_options.vhost,
-                    binding_def=binding,
+        desired_bindings = {binding_def.key() for binding_def in topology.bindings}
+        stale_bindings = [
+            binding
+            async for binding in self.rabbitmq_admin_service.iter_bindings_in_vhost(vhost)
+            if binding.key() not in desired_bindings
+        ]
+        for binding in stale_bindings:
+            await self.rabbitmq_admin_service.delete_binding_from_vhost(
+                vhost=vhost,
+                binding_def=binding,
+            )
+
+
+def _read_passwords(rabbitmq_configuration: RabbitMqConfiguration) -> dict[tuple[str, str], str]:
+    """Reads the password of every vhost user from the settings snapshot.
+
+    Args:
+        rabbitmq_configuration (RabbitMqConfiguration): The loaded configuration.
+
+    Raises:
+        ValueError: When a password is not set, listing every missing one.
+
+    Returns:
+        dict[tuple[str, str], str]: The passwords, keyed by vhost and username.
+    """
+    snapshot = get_settings_snapshot()
+    passwords: dict[tuple[str, str], str] = {}
+    errors: list[str] = []
+
+    for vhost_def in rabbitmq_configuration.vhosts:
+        for user_def in vhost_def.users:
+            password = snapshot.get(user_def.password_env)
+            if password:
+                passwords[(vhost_def.name, user_def.username)] = password
+            else:
+                errors.append(
+                    f"The password of user '{user_def.username}' of vhost '{vhost_def.name}' is not set, "
+                    f"expected it in the {user_def.password_env} setting."
                 )
 
-        return True
+    if errors:
+        raise ValueError(format_settings_errors(errors))
+
+    return passwords
+
+
+def _binding_step(binding_def: RabbitMqBinding) -> str:
+    # Built from the binding key, so bindings differing only by their arguments are separate steps
+    source, destination_type, destination, routing_key, arguments = binding_def.key()
+    return f"binding:{source}:{destination_type.value}:{destination}:{routing_key}:{arguments}"
@@ -0,0 +1,25 @@
+from injector import inject
+from mediatr import GenericQuery, Mediator
+
+from cezzis_com_bootstrapper.domain.config.rabbitmq_options import RabbitMqOptions
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_configuration import RabbitMqConfiguration
+from cezzis_com_bootstrapper.infrastructure.services.irabbitmq_admin_service import IRabbitMqAdminService
+
+
+class ExportRabbitMqCommand(GenericQuery[RabbitMqConfiguration]):
+    """Command to read the live topology of the vhost as a rabbitmq.json configuration."""
+
+    pass
+
+
+@Mediator.handler
+class ExportRabbitMqCommandHandler:
+    """Command handler for the ExportRabbitMqCommand."""
+
+    @inject
+    def __init__(self, rabbitmq_admin_service: IRabbitMqAdminService, rabbitmq_options: RabbitMqOptions):
+        self.rabbitmq_admin_service = rabbitmq_admin_service
+        self.rabbitmq_options = rabbitmq_options
+
+    async def handle(self, request: ExportRabbitMqCommand) -> RabbitMqConfiguration:
+        return await self.rabbitmq_admin_service.export_configuration(self.rabbitmq_options.vhost)
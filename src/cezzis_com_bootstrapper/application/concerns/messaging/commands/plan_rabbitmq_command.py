@@ -0,0 +1,311 @@
+import asyncio
+from collections.abc import Collection
+from typing import Any
+
+from injector import inject
+from mediatr import GenericQuery, Mediator
+
+from cezzis_com_bootstrapper.domain.config.rabbitmq_options import RabbitMqOptions
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding import RabbitMqBinding
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding_type import RabbitMqBindingType
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_configuration import RabbitMqConfiguration
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_drift import (
+    RabbitMqDriftStrategy,
+    exchange_drift,
+    is_migration_queue_of,
+    queue_drift,
+)
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_snapshot import RabbitMqSnapshot
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_user import RabbitMqUser
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_vhost import RabbitMqVhost
+from cezzis_com_bootstrapper.domain.planning import PlannedChange
+from cezzis_com_bootstrapper.infrastructure.services.irabbitmq_admin_service import IRabbitMqAdminService
+
+
+class PlanRabbitMqCommand(GenericQuery[list[PlannedChange]]):
+    """Command to compute the changes CreateRabbitMqCommand would make, without making them."""
+
+    pass
+
+
+@Mediator.handler
+class PlanRabbitMqCommandHandler:
+    """Command handler for the PlanRabbitMqCommand."""
+
+    @inject
+    def __init__(self, rabbitmq_admin_service: IRabbitMqAdminService, rabbitmq_options: RabbitMqOptions):
+        self.rabbitmq_admin_service = rabbitmq_admin_service
+        self.rabbitmq_options = rabbitmq_options
+
+    async def handle(self, request: PlanRabbitMqCommand) -> list[PlannedChange]:
+        rabbitmq_configuration = (
+            await self.rabbitmq_admin_service.load_from_file(self.rabbitmq_options.app_config_file_path)
+            if self.rabbitmq_options.app_config_file_path
+            else RabbitMqConfiguration(queues=[], exchanges=[], bindings=[])
+        )
+        vhost_defs = rabbitmq_configuration.vhosts
+        snapshots = await asyncio.gather(
+            self.rabbitmq_admin_service.get_snapshot(self.rabbitmq_options.vhost),
+            *(self.rabbitmq_admin_service.get_snapshot(vhost_def.name) for vhost_def in vhost_defs),
+        )
+        managed_users = {self.rabbitmq_options.app_username} | {
+            user_def.username for vhost_def in vhost_defs for user_def in vhost_def.users
+        }
+
+        drift_strategy = RabbitMqDriftStrategy(self.rabbitmq_options.drift_strategy)
+
+        changes = plan_rabbitmq_changes(
+            rabbitmq_configuration,
+            snapshots[0],
+            vhost=self.rabbitmq_options.vhost,
+            app_username=self.rabbitmq_options.app_username,
+            managed_users=managed_users,
+            drift_strategy=drift_strategy,
+        )
+        for vhost_def, snapshot in zip(vhost_defs, snapshots[1:]):
+            # Changes to a listed vhost name it, the default vhost is implied
+            for change in plan_rabbitmq_changes(
+                vhost_def,
+                snapshot,
+                vhost=vhost_def.name,
+                users=vhost_def.users,
+                managed_users=managed_users,
+                drift_strategy=drift_strategy,
+            ):
+                change.details = {"vhost": vhost_def.name, **change.details}
+                changes.append(change)
+
+        return changes
+
+
+def plan_rabbitmq_changes(
+    configuration: RabbitMqConfiguration | RabbitMqVhost,
+    snapshot: RabbitMqSnapshot,
+    vhost: str,
+    app_username: str = "",
+    users: list[RabbitMqUser] | None = None,
+    managed_users: Collection[str] = (),
+    drift_strategy: RabbitMqDriftStrategy = RabbitMqDriftStrategy.REPORT,
+) -> list[PlannedChange]:
+    """Diffs the desired topology against a vhost snapshot, following the same rules as CreateRabbitMqCommand.
+
+    Existing exchanges and queues differing from their definition are listed as "drift" when the
+    strategy only reports them, or as "recreate" with the strategy that recreates them. The snapshot
+    holds no message counts, a queue planned for "recreate_empty" is only recreated if it is empty
+    at run time. Policies are updated in place. Bindings removed by the
+    broker along with a deleted exchange or queue are not listed as deletions of their own.
+
+    Args:
+        configuration (RabbitMqConfiguration | RabbitMqVhost): The desired topology.
+        snapshot (RabbitMqSnapshot): The vhost state read from the broker.
+        vhost (str): The name of the virtual host.
+        app_username (str, optional): The application user given full permissions on the vhost, when no
+            users are given.
+        users (list[RabbitMqUser] | None, optional): The users given permissions on the vhost.
+        managed_users (Collection[str], optional): The users of other vhosts, which are never deleted.
+        drift_strategy (RabbitMqDriftStrategy, optional): What CreateRabbitMqCommand does with existing exchanges
+            and queues differing from their definition. Defaults to reporting them.
+
+    Returns:
+        list[PlannedChange]: The changes in the order CreateRabbitMqCommand would make them.
+
+    Raises:
+        ValueError: If the configuration declares an exchange with a reserved "amq." name.
+    """
+    changes: list[PlannedChange] = []
+
+    # --------------------------------------------------------
+    # Vhost, users and permissions
+    # --------------------------------------------------------
+    if not snapshot.vhost_exists:
+        changes.append(PlannedChange(kind="vhost", name=vhost, action="create"))
+
+    user_defs = users if users is not None else [RabbitMqUser(username=app_username, password_env="")]
+    desired_users = {user_def.username for user_def in user_defs}
+    kept_users = desired_users | set(managed_users)
+    for user in snapshot.permissions:
+        if user not in kept_users and user in snapshot.users:
+            changes.append(PlannedChange(kind="user", name=user, action="delete"))
+
+    for user_def in user_defs:
+        if user_def.username not in snapshot.users:
+            changes.append(PlannedChange(kind="user", name=user_def.username, action="create"))
+
+        existing_permissions = snapshot.permissions.get(user_def.username)
+        if existing_permissions != user_def.permissions():
+            changes.append(
+                PlannedChange(
+                    kind="permission",
+                    name=user_def.username,
+                    action="create" if existing_permissions is None else "update",
+                    details={"vhost": vhost, **user_def.permissions()},
+                )
+            )
+
+        existing_topic_permissions = {
+            permission.exchange: permission for permission in snapshot.topic_permissions.get(user_def.username, [])
+        }
+        desired_topic_permissions = {permission.exchange: permission for permission in user_def.topic_permissions}
+        for exchange, permission in desired_topic_permissions.items():
+            if existing_topic_permissions.get(exchange) != permission:
+                changes.append(
+                    PlannedChange(
+                        kind="topic_permission",
+                        name=f"{user_def.username}:{exchange}",
+                        action="create" if exchange not in existing_topic_permissions else "update",
+                        details={"vhost": vhost, "write": permission.write, "read": permission.read},
+                    )
+                )
+        for exchange in existing_topic_permissions.keys() - desired_topic_permissions.keys():
+            changes.append(
+                PlannedChange(kind="topic_permission", name=f"{user_def.username}:{exchange}", action="delete")
+            )
+
+    # Users managed on other vhosts keep their accounts but lose their permissions on this one
+    for user in sorted((snapshot.permissions.keys() | snapshot.topic_permissions.keys()) - desired_users):
+        if user in managed_users and user in snapshot.users:
+            changes.append(PlannedChange(kind="permission", name=user, action="delete", details={"vhost": vhost}))
+
+    # --------------------------------------------------------
+    # Policies and operator policies, updated in place
+    # --------------------------------------------------------
+    for kind, policy_defs, existing_policies in (
+        ("policy", configuration.policies, snapshot.policies),
+        ("operator_policy", configuration.operator_policies, snapshot.operator_policies),
+    ):
+        existing_by_name = {policy.name: policy for policy in existing_policies}
+        for policy_def in policy_defs:
+            existing_policy = existing_by_name.get(policy_def.name)
+            if existing_policy != policy_def:
+                changes.append(
+                    PlannedChange(
+                        kind=kind,
+                        name=policy_def.name,
+                        action="create" if existing_policy is None else "update",
+                        details={
+                            "pattern": policy_def.pattern,
+                            "apply_to": policy_def.apply_to.value,
+                            "priority": policy_def.priority,
+                            "definition": policy_def.definition,
+                        },
+                    )
+                )
+
+        desired_policies = {policy_def.name for policy_def in policy_defs}
+        changes.extend(
+            PlannedChange(kind=kind, name=policy.name, action="delete")
+            for policy in existing_policies
+            if policy.name not in desired_policies
+        )
+
+    # --------------------------------------------------------
+    # Exchanges
+    # --------------------------------------------------------
+    desired_exchanges = {exchange_def.name for exchange_def in configuration.exchanges}
+    for exchange_def in configuration.exchanges:
+        if exchange_def.name.startswith("amq."):
+            raise ValueError(f"Cannot create exchange with reserved name '{exchange_def.name}'.")
+        existing_exchange = snapshot.exchange_definitions.get(exchange_def.name)
+        if existing_exchange is not None:
+            drift = exchange_drift(exchange_def, existing_exchange)
+            if drift:
+                changes.append(_drift_change("exchange", exchange_def.name, drift, drift_strategy))
+        elif exchange_def.name not in snapshot.exchanges:
+            changes.append(
+                PlannedChange(
+                    kind="exchange",
+                    name=exchange_def.name,
+                    action="create",
+                    details={
+                        "type": exchange_def.type.value,
+                        "durable": exchange_def.durable,
+                        "auto_delete": exchange_def.auto_delete,
+                        "internal": exchange_def.internal,
+                        "arguments": exchange_def.arguments,
+                    },
+                )
+            )
+
+    deleted_exchanges = [exchange for exchange in snapshot.exchanges if exchange not in desired_exchanges]
+    changes.extend(PlannedChange(kind="exchange", name=exchange, action="delete") for exchange in deleted_exchanges)
+
+    # --------------------------------------------------------
+    # Queues
+    # --------------------------------------------------------
+    desired_queues = {queue_def.name for queue_def in configuration.queues}
+    for queue_def in configuration.queues:
+        existing_queue = snapshot.queue_definitions.get(queue_def.name)
+        if existing_queue is not None:
+            drift = queue_drift(queue_def, existing_queue)
+            if drift:
+                changes.append(_drift_change("queue", queue_def.name, drift, drift_strategy))
+        elif queue_def.name not in snapshot.queues:
+            changes.append(
+                PlannedChange(
+                    kind="queue",
+                    name=queue_def.name,
+                    action="create",
+                    details={
+                        "durable": queue_def.durable,
+                        "auto_delete": queue_def.auto_delete,
+                        "exclusive": queue_def.exclusive,
+                        "arguments": queue_def.declared_arguments(),
+                    },
+                )
+            )
+
+    deleted_queues = [
+        queue
+        for queue in snapshot.queues
+        if queue not in desired_queues and not is_migration_queue_of(queue, desired_queues)
+    ]
+    changes.extend(PlannedChange(kind="queue", name=queue, action="delete") for queue in deleted_queues)
+
+    # --------------------------------------------------------
+    # Bindings
+    # --------------------------------------------------------
+    existing_keys = {binding.key() for binding in snapshot.bindings}
+    for binding_def in configuration.bindings:
+        if binding_def.key() not in existing_keys:
+            changes.append(_binding_change(binding_def, "create"))
+
+    removed_with_source = set(deleted_exchanges)
+    removed_destinations = {(RabbitMqBindingType.EXCHANGE, name) for name in deleted_exchanges} | {
+        (RabbitMqBindingType.QUEUE, name) for name in deleted_queues
+    }
+    desired_keys = {binding_def.key() for binding_def in configuration.bindings}
+    for binding in snapshot.bindings:
+        if binding.key() in desired_keys:
+            continue
+        if binding.source in removed_with_source or (binding.destination_type, binding.destination) in (
+            removed_destinations
+        ):
+            # The broker removes the binding along with its exchange or queue
+            continue
+        changes.append(_binding_change(binding, "delete"))
+
+    return changes
+
+
+def _binding_change(binding: RabbitMqBinding, action: str) -> PlannedChange:
+    return PlannedChange(
+        kind="binding",
+        name=f"{binding.source}->{binding.destination}",
+        action=action,
+        details={
+            "destination_type": binding.destination_type.value,
+            "routing_key": binding.routing_key,
+            "arguments": binding.arguments,
+        },
+    )
+
+
+def _drift_change(
+    kind: str, name: str, drift: dict[str, dict[str, Any]], drift_strategy: RabbitMqDriftStrategy
+) -> PlannedChange:
+    return PlannedChange(
+        kind=kind,
+        name=name,
+        action="drift" if drift_strategy == RabbitMqDriftStrategy.REPORT else "recreate",
+        details={"strategy": drift_strategy.value, "drift": drift},
+    )
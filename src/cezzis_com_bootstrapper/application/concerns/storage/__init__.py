@@ -1,6 +1,13 @@
 from cezzis_com_bootstrapper.application.concerns.storage.commands import (
     CreateBlobStorageCommand,
     CreateBlobStorageCommandHandler,
+    PlanBlobStorageCommand,
+    PlanBlobStorageCommandHandler,
 )
 
-__all__ = ["CreateBlobStorageCommand", "CreateBlobStorageCommandHandler"]
+__all__ = [
+    "CreateBlobStorageCommand",
+    "CreateBlobStorageCommandHandler",
+    "PlanBlobStorageCommand",
+    "PlanBlobStorageCommandHandler",
+]
@@ -2,5 +2,14 @@ from cezzis_com_bootstrapper.application.concerns.storage.commands.create_blobst
     CreateBlobStorageCommand,
     CreateBlobStorageCommandHandler,
 )
+from cezzis_com_bootstrapper.application.concerns.storage.commands.plan_blobstorage_command import (
+    PlanBlobStorageCommand,
+    PlanBlobStorageCommandHandler,
+)
 
-__all__ = ["CreateBlobStorageCommand", "CreateBlobStorageCommandHandler"]
+__all__ = [
+    "CreateBlobStorageCommand",
+    "CreateBlobStorageCommandHandler",
+    "PlanBlobStorageCommand",
+    "PlanBlobStorageCommandHandler",
+]
@@ -0,0 +1,47 @@
+from azure.storage.blob import PublicAccess
+from injector import inject
+from mediatr import GenericQuery, Mediator
+
+from cezzis_com_bootstrapper.domain.config import AzureStorageOptions
+from cezzis_com_bootstrapper.domain.planning import PlannedChange
+from cezzis_com_bootstrapper.infrastructure.services import IAzureBlobService
+
+
+class PlanBlobStorageCommand(GenericQuery[list[PlannedChange]]):
+    """Command to compute the changes CreateBlobStorageCommand would make, without making them."""
+
+    pass
+
+
+@Mediator.handler
+class PlanBlobStorageCommandHandler:
+    """Command handler for the PlanBlobStorageCommand."""
+
+    @inject
+    def __init__(self, azure_blob_service: IAzureBlobService, azure_storage_options: AzureStorageOptions):
+        self.azure_blob_service = azure_blob_service
+        self.azure_storage_options = azure_storage_options
+
+    async def handle(self, request: PlanBlobStorageCommand) -> list[PlannedChange]:
+        containers = await self.azure_blob_service.list_containers()
+        return plan_blob_storage_changes([self.azure_storage_options.account_avatars_container_name], containers)
+
+
+def plan_blob_storage_changes(container_names: list[str], containers: dict[str, str | None]) -> list[PlannedChange]:
+    """Diffs the desired containers against the storage account, every container gets public container access.
+
+    Args:
+        container_names (list[str]): The desired container names.
+        containers (dict[str, str | None]): The public access level per container name of the account.
+
+    Returns:
+        list[PlannedChange]: The containers that would be created or have their access level updated.
+    """
+    changes: list[PlannedChange] = []
+    for container_name in container_names:
+        details = {"public_access": PublicAccess.CONTAINER.value}
+        if container_name not in containers:
+            changes.append(PlannedChange(kind="container", name=container_name, action="create", details=details))
+        elif containers[container_name] != PublicAccess.CONTAINER:
+            changes.append(PlannedChange(kind="container", name=container_name, action="update", details=details))
+    return changes
@@ -0,0 +1,167 @@
+import importlib
+from dataclasses import dataclass
+from typing import Any
+
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+
+
+@dataclass(frozen=True)
+class ConcernRegistration:
+    """Describes how a bootstrapper concern is wired without importing it.
+
+    Every target is a "module:attribute" reference so a concern's handler, service and
+    SDK are only imported once its feature flag has been confirmed on.
+
+    Attributes:
+        name (str): Short name of the concern.
+        display_name (str): Human friendly name used in log messages.
+        feature_flag (str): Name of the BootstrapperOptions attribute that enables the concern.
+        options (str): Reference to the concern's options class.
+        options_factory (str): Reference to the function returning the validated options instance.
+        service_interface (str): Reference to the service interface the handler depends on.
+        service (str): Reference to the service implementation bound to the interface.
+        service_backend_option (str): Name of the options attribute selecting another service implementation,
+            empty when the concern has a single one.
+        service_backends (tuple[tuple[str, str], ...]): Service implementation references per option value,
+            the ``service`` reference is used for any other value.
+        command (str): Reference to the command dispatched through the mediator.
+        handler (str): Reference to the command handler.
+        plan_command (str): Reference to the command computing the changes the command would make.
+        plan_handler (str): Reference to the plan command handler.
+        export_command (str): Reference to the command reading the live state back as a spec, empty when the
+            concern cannot be exported.
+        export_handler (str): Reference to the export command handler, empty when the concern cannot be exported.
+        spec_files (tuple[str, ...]): Names of the options attributes holding paths of spec files the concern applies.
+    """
+
+    name: str
+    display_name: str
+    feature_flag: str
+    options: str
+    options_factory: str
+    service_interface: str
+    service: str
+    command: str
+    handler: str
+    plan_command: str
+    plan_handler: str
+    spec_files: tuple[str, ...] = ()
+    export_command: str = ""
+    export_handler: str = ""
+    service_backend_option: str = ""
+    service_backends: tuple[tuple[str, str], ...] = ()
+
+    def is_enabled(self, bootstrapper_options: BootstrapperOptions) -> bool:
+        """Checks whether the concern's feature flag is turned on.
+
+        Args:
+            bootstrapper_options (BootstrapperOptions): The bootstrapper feature flags.
+
+        Returns:
+            bool: True when the concern should run.
+        """
+        return bool(getattr(bootstrapper_options, self.feature_flag))
+
+    def get_service(self, options: Any) -> str:
+        """Gets the reference of the service implementation selected by the concern's options.
+
+        Args:
+            options (Any): The concern's options instance.
+
+        Returns:
+            str: The service implementation reference.
+        """
+        if not self.service_backend_option:
+            return self.service
+        return dict(self.service_backends).get(getattr(options, self.service_backend_option), self.service)
+
+
+def import_target(target: str) -> Any:
+    """Imports the attribute referenced by a "module:attribute" string.
+
+    Args:
+        target (str): The reference to import.
+
+    Returns:
+        Any: The referenced attribute.
+    """
+    module_name, _, attribute = target.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+_PACKAGE = "cezzis_com_bootstrapper"
+
+CONCERN_REGISTRY: tuple[ConcernRegistration, ...] = (
+    ConcernRegistration(
+        name="rabbitmq",
+        display_name="RabbitMQ",
+        feature_flag="enable_rabbitmq",
+        options=f"{_PACKAGE}.domain.config.rabbitmq_options:RabbitMqOptions",
+        options_factory=f"{_PACKAGE}.domain.config.rabbitmq_options:get_rabbitmq_options",
+        service_interface=f"{_PACKAGE}.infrastructure.services.irabbitmq_admin_service:IRabbitMqAdminService",
+        service=f"{_PACKAGE}.infrastructure.services.rabbitmq_admin_service:RabbitMqAdminService",
+        command=f"{_PACKAGE}.application.concerns.messaging.commands.create_rabbitmq_command:CreateRabbitMqCommand",
+        handler=f"{_PACKAGE}.application.concerns.messaging.commands.create_rabbitmq_command:CreateRabbitMqCommandHandler",
+        plan_command=f"{_PACKAGE}.application.concerns.messaging.commands.plan_rabbitmq_command:PlanRabbitMqCommand",
+        plan_handler=f"{_PACKAGE}.application.concerns.messaging.commands.plan_rabbitmq_command:PlanRabbitMqCommandHandler",
+        spec_files=("app_config_file_path",),
+        export_command=f"{_PACKAGE}.application.concerns.messaging.commands.export_rabbitmq_command:ExportRabbitMqCommand",
+        export_handler=f"{_PACKAGE}.application.concerns.messaging.commands.export_rabbitmq_command:ExportRabbitMqCommandHandler",
+        service_backend_option="topology_backend",
+        service_backends=(("amqp", f"{_PACKAGE}.infrastructure.services.rabbitmq_amqp_service:RabbitMqAmqpService"),),
+    ),
+    ConcernRegistration(
+        name="blob_storage",
+        display_name="Blob Storage",
+        feature_flag="enable_blob_storage",
+        options=f"{_PACKAGE}.domain.config.azure_storage_options:AzureStorageOptions",
+        options_factory=f"{_PACKAGE}.domain.config.azure_storage_options:get_azure_storage_options",
+        service_interface=f"{_PACKAGE}.infrastructure.services.iazure_blob_service:IAzureBlobService",
+        service=f"{_PACKAGE}.infrastructure.services.azure_blob_service:AzureBlobService",
+        command=f"{_PACKAGE}.application.concerns.storage.commands.create_blobstorage_command:CreateBlobStorageCommand",
+        handler=f"{_PACKAGE}.application.concerns.storage.commands.create_blobstorage_command:CreateBlobStorageCommandHandler",
+        plan_command=f"{_PACKAGE}.application.concerns.storage.commands.plan_blobstorage_command:PlanBlobStorageCommand",
+        plan_handler=f"{_PACKAGE}.application.concerns.storage.commands.plan_blobstorage_command:PlanBlobStorageCommandHandler",
+    ),
+    ConcernRegistration(
+        name="kafka",
+        display_name="Kafka",
+        feature_flag="enable_kafka",
+        options=f"{_PACKAGE}.domain.config.kafka_options:KafkaOptions",
+        options_factory=f"{_PACKAGE}.domain.config.kafka_options:get_kafka_options",
+        service_interface=f"{_PACKAGE}.infrastructure.services.ikafka_service:IKafkaService",
+        service=f"{_PACKAGE}.infrastructure.services.kafka_service:KafkaService",
+        command=f"{_PACKAGE}.application.concerns.eventing.commands.create_kafka_command:CreateKafkaCommand",
+        handler=f"{_PACKAGE}.application.concerns.eventing.commands.create_kafka_command:CreateKafkaCommandHandler",
+        plan_command=f"{_PACKAGE}.application.concerns.eventing.commands.plan_kafka_command:PlanKafkaCommand",
+        plan_handler=f"{_PACKAGE}.application.concerns.eventing.commands.plan_kafka_command:PlanKafkaCommandHandler",
+    ),
+)
+
+
+def get_enabled_concerns(bootstrapper_options: BootstrapperOptions) -> list[ConcernRegistration]:
+    """Gets the registered concerns whose feature flag is turned on, in registration order.
+
+    Args:
+        bootstrapper_options (BootstrapperOptions): The bootstrapper feature flags.
+
+    Returns:
+        list[ConcernRegistration]: The enabled concerns.
+    """
+    return [concern for concern in CONCERN_REGISTRY if concern.is_enabled(bootstrapper_options)]
+
+
+def get_spec_files(concern: ConcernRegistration) -> list[str]:
+    """Gets the paths of the spec files a concern applies, read from its options.
+
+    Args:
+        concern (ConcernRegistration): The concern.
+
+    Returns:
+        list[str]: The configured spec file paths, empty when the concern has none.
+    """
+    if not concern.spec_files:
+        return []
+
+    options = import_target(concern.options_factory)()
+    return [path for path in (getattr(options, attribute) for attribute in concern.spec_files) if path]
@@ -12,10 +12,21 @@ from cezzis_com_bootstrapper.domain.messaging import (
     RabbitMqBinding,
     RabbitMqBindingType,
     RabbitMqConfiguration,
+    RabbitMqDriftStrategy,
     RabbitMqExchange,
     RabbitMqExchangeType,
+    RabbitMqMigrationError,
+    RabbitMqPolicy,
+    RabbitMqPolicyApplyTo,
     RabbitMqQueue,
+    RabbitMqQueueType,
+    RabbitMqSnapshot,
+    RabbitMqSuperStream,
+    RabbitMqTopicPermission,
+    RabbitMqUser,
+    RabbitMqVhost,
 )
+from cezzis_com_bootstrapper.domain.planning import ChangeSet, PlannedChange
 
 __all__ = [
     "KafkaOptions",
@@ -29,7 +40,19 @@ __all__ = [
     "RabbitMqBinding",
     "RabbitMqExchange",
     "RabbitMqQueue",
+    "RabbitMqSuperStream",
+    "RabbitMqTopicPermission",
+    "RabbitMqUser",
+    "RabbitMqVhost",
+    "RabbitMqPolicy",
     "RabbitMqConfiguration",
     "RabbitMqBindingType",
     "RabbitMqExchangeType",
+    "RabbitMqPolicyApplyTo",
+    "RabbitMqQueueType",
+    "RabbitMqDriftStrategy",
+    "RabbitMqSnapshot",
+    "RabbitMqMigrationError",
+    "ChangeSet",
+    "PlannedChange",
 ]
@@ -1,10 +1,13 @@
 from cezzis_com_bootstrapper.domain.config.azure_storage_options import AzureStorageOptions, get_azure_storage_options
 from cezzis_com_bootstrapper.domain.config.bootstrapper_options import BootstrapperOptions, get_bootstrapper_options
+from cezzis_com_bootstrapper.domain.config.bootstrapper_settings import BootstrapperSettings, get_bootstrapper_settings
 from cezzis_com_bootstrapper.domain.config.kafka_options import KafkaOptions, get_kafka_options
 from cezzis_com_bootstrapper.domain.config.otel_options import OTelOptions, get_otel_options
 from cezzis_com_bootstrapper.domain.config.rabbitmq_options import RabbitMqOptions, get_rabbitmq_options
 
 __all__ = [
+    "BootstrapperSettings",
+    "get_bootstrapper_settings",
     "BootstrapperOptions",
     "get_bootstrapper_options",
     "KafkaOptions",
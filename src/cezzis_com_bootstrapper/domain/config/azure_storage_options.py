@@ -1,9 +1,10 @@
-import logging
 import os
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from cezzis_com_bootstrapper.domain.config.settings_snapshot import clear_options_cache, get_options
+
 
 class AzureStorageOptions(BaseSettings):
     """Azure storage configuration options loaded from environment variables and .env files.
@@ -21,9 +22,21 @@ class AzureStorageOptions(BaseSettings):
     account_avatars_container_name: str = Field(default="", validation_alias="ACCOUNT_AVATARS_CONTAINER_NAME")
 
 
-_logger: logging.Logger = logging.getLogger("azure_storage_options")
+def validate_azure_storage_options(options: AzureStorageOptions) -> list[str]:
+    """Validate the required Azure storage configuration.
+
+    Args:
+        options (AzureStorageOptions): The options to validate.
 
-_azure_storage_options: AzureStorageOptions | None = None
+    Returns:
+        list[str]: Every configuration error found, empty when the options are valid.
+    """
+    errors: list[str] = []
+    if not options.connection_string:
+        errors.append("AZURE_STORAGE_CONNECTION_STRING environment variable is required")
+    if not options.account_avatars_container_name:
+        errors.append("ACCOUNT_AVATARS_CONTAINER_NAME environment variable is required")
+    return errors
 
 
 def get_azure_storage_options() -> AzureStorageOptions:
@@ -32,22 +45,9 @@ def get_azure_storage_options() -> AzureStorageOptions:
     Returns:
         AzureStorageOptions: The Azure storage options instance.
     """
-    global _azure_storage_options
-    if _azure_storage_options is None:
-        _azure_storage_options = AzureStorageOptions()
-
-        # Validate required configuration
-        if not _azure_storage_options.connection_string:
-            raise ValueError("AZURE_STORAGE_CONNECTION_STRING environment variable is required")
-        if not _azure_storage_options.account_avatars_container_name:
-            raise ValueError("ACCOUNT_AVATARS_CONTAINER_NAME environment variable is required")
-
-        _logger.info("Azure storage options loaded successfully.")
-
-    return _azure_storage_options
+    return get_options(AzureStorageOptions, validate_azure_storage_options)
 
 
 def clear_azure_storage_options_cache() -> None:
     """Clear the cached AzureStorageOptions instance."""
-    global _azure_storage_options
-    _azure_storage_options = None
+    clear_options_cache(AzureStorageOptions)
@@ -1,9 +1,10 @@
-import logging
 import os
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from cezzis_com_bootstrapper.domain.config.settings_snapshot import get_options
+
 
 class BootstrapperOptions(BaseSettings):
     """Bootstrapper feature flag options loaded from environment variables and .env files.
@@ -12,6 +13,27 @@ class BootstrapperOptions(BaseSettings):
         enable_rabbitmq (bool): Flag to enable RabbitMQ bootstrapping.
         enable_blob_storage (bool): Flag to enable Azure Blob Storage bootstrapping.
         enable_kafka (bool): Flag to enable Kafka bootstrapping.
+        run_mode (str): "job" to bootstrap once and exit, "daemon" to keep reconciling, "plan" to print the
+            changes a job would make without making them, or "export" to write the live RabbitMQ topology as a
+            rabbitmq.json file.
+        reconcile_interval_seconds (float): Interval of the daemon's periodic drift-correction cycle.
+        watch_poll_interval_seconds (float): How often the daemon checks the spec files for changes.
+        watch_debounce_seconds (float): How long spec files must stay unchanged before the daemon reconciles.
+        enable_health_server (bool): Flag to serve the liveness, readiness and metrics endpoints.
+        health_server_port (int): Port the health and metrics endpoints listen on.
+        command_timeout_seconds (float): Deadline of each command, retries included.
+        retry_max_attempts (int): How many times a command is attempted when it fails with a transient error.
+        retry_base_delay_seconds (float): Backoff before the first retry, doubled on every following one.
+        retry_max_delay_seconds (float): Upper bound of the backoff between two attempts.
+        run_report_path (str): File the JSON run report is written to, "-" for stdout or empty to skip it.
+        readiness_timeout_seconds (float): Deadline shared by the readiness probes of every target, 0 to skip them.
+        readiness_base_delay_seconds (float): Backoff before the second probe of a target, doubled on every following one.
+        readiness_max_delay_seconds (float): Upper bound of the backoff between two probes.
+        plan_output_path (str): File the plan mode change set is written to, "-" for stdout.
+        export_output_path (str): File the export mode rabbitmq.json is written to, "-" for stdout.
+        shutdown_timeout_seconds (float): Budget for closing the clients once a shutdown signal was received.
+        telemetry_flush_timeout_seconds (float): Budget for flushing the telemetry on exit.
+        checkpoint_dir (str): Writable directory the checkpoint journals are kept in, empty to turn checkpoints off.
     """
 
     model_config = SettingsConfigDict(
@@ -21,11 +43,81 @@ class BootstrapperOptions(BaseSettings):
     enable_rabbitmq: bool = Field(default=True, validation_alias="ENABLE_RABBITMQ")
     enable_blob_storage: bool = Field(default=True, validation_alias="ENABLE_BLOB_STORAGE")
     enable_kafka: bool = Field(default=True, validation_alias="ENABLE_KAFKA")
+    run_mode: str = Field(default="job", validation_alias="BOOTSTRAPPER_RUN_MODE")
+    reconcile_interval_seconds: float = Field(default=300, validation_alias="BOOTSTRAPPER_RECONCILE_INTERVAL_SECONDS")
+    watch_poll_interval_seconds: float = Field(default=1, validation_alias="BOOTSTRAPPER_WATCH_POLL_INTERVAL_SECONDS")
+    watch_debounce_seconds: float = Field(default=2, validation_alias="BOOTSTRAPPER_WATCH_DEBOUNCE_SECONDS")
+    enable_health_server: bool = Field(default=False, validation_alias="BOOTSTRAPPER_ENABLE_HEALTH_SERVER")
+    health_server_port: int = Field(default=8000, validation_alias="BOOTSTRAPPER_HEALTH_SERVER_PORT")
+    command_timeout_seconds: float = Field(default=600, validation_alias="BOOTSTRAPPER_COMMAND_TIMEOUT_SECONDS")
+    retry_max_attempts: int = Field(default=5, validation_alias="BOOTSTRAPPER_RETRY_MAX_ATTEMPTS")
+    retry_base_delay_seconds: float = Field(default=0.5, validation_alias="BOOTSTRAPPER_RETRY_BASE_DELAY_SECONDS")
+    retry_max_delay_seconds: float = Field(default=30, validation_alias="BOOTSTRAPPER_RETRY_MAX_DELAY_SECONDS")
+    run_report_path: str = Field(default="", validation_alias="BOOTSTRAPPER_RUN_REPORT_PATH")
+    readiness_timeout_seconds: float = Field(default=300, validation_alias="BOOTSTRAPPER_READINESS_TIMEOUT_SECONDS")
+    readiness_base_delay_seconds: float = Field(
+        default=0.25, validation_alias="BOOTSTRAPPER_READINESS_BASE_DELAY_SECONDS"
+    )
+    readiness_max_delay_seconds: float = Field(default=5, validation_alias="BOOTSTRAPPER_READINESS_MAX_DELAY_SECONDS")
+    plan_output_path: str = Field(default="-", validation_alias="BOOTSTRAPPER_PLAN_OUTPUT_PATH")
+    export_output_path: str = Field(default="-", validation_alias="BOOTSTRAPPER_EXPORT_OUTPUT_PATH")
+    shutdown_timeout_seconds: float = Field(default=10, validation_alias="BOOTSTRAPPER_SHUTDOWN_TIMEOUT_SECONDS")
+    telemetry_flush_timeout_seconds: float = Field(
+        default=5, validation_alias="BOOTSTRAPPER_TELEMETRY_FLUSH_TIMEOUT_SECONDS"
+    )
+    checkpoint_dir: str = Field(default="", validation_alias="BOOTSTRAPPER_CHECKPOINT_DIR")
 
 
-_logger: logging.Logger = logging.getLogger("bootstrapper_options")
+def validate_bootstrapper_options(options: BootstrapperOptions) -> list[str]:
+    """Validate the bootstrapper runtime configuration.
 
-_bootstrapper_options: BootstrapperOptions | None = None
+    Args:
+        options (BootstrapperOptions): The options to validate.
+
+    Returns:
+        list[str]: Every configuration error found, empty when the options are valid.
+    """
+    errors: list[str] = []
+    if options.run_mode not in {"job", "daemon", "plan", "export"}:
+        errors.append("BOOTSTRAPPER_RUN_MODE must be one of job, daemon, plan, export")
+    if options.reconcile_interval_seconds <= 0:
+        errors.append("BOOTSTRAPPER_RECONCILE_INTERVAL_SECONDS must be greater than 0")
+    if options.watch_poll_interval_seconds <= 0:
+        errors.append("BOOTSTRAPPER_WATCH_POLL_INTERVAL_SECONDS must be greater than 0")
+    if options.watch_debounce_seconds < 0:
+        errors.append("BOOTSTRAPPER_WATCH_DEBOUNCE_SECONDS must not be negative")
+    if not 0 < options.health_server_port < 65536:
+        errors.append("BOOTSTRAPPER_HEALTH_SERVER_PORT must be between 1 and 65535")
+    if options.command_timeout_seconds <= 0:
+        errors.append("BOOTSTRAPPER_COMMAND_TIMEOUT_SECONDS must be greater than 0")
+    if options.retry_max_attempts < 1:
+        errors.append("BOOTSTRAPPER_RETRY_MAX_ATTEMPTS must be at least 1")
+    if options.retry_base_delay_seconds < 0:
+        errors.append("BOOTSTRAPPER_RETRY_BASE_DELAY_SECONDS must not be negative")
+    if options.retry_max_delay_seconds < options.retry_base_delay_seconds:
+        errors.append(
+            "BOOTSTRAPPER_RETRY_MAX_DELAY_SECONDS must not be less than BOOTSTRAPPER_RETRY_BASE_DELAY_SECONDS"
+        )
+    if options.readiness_timeout_seconds < 0:
+        errors.append("BOOTSTRAPPER_READINESS_TIMEOUT_SECONDS must not be negative")
+    if options.readiness_base_delay_seconds <= 0:
+        errors.append("BOOTSTRAPPER_READINESS_BASE_DELAY_SECONDS must be greater than 0")
+    if options.readiness_max_delay_seconds < options.readiness_base_delay_seconds:
+        errors.append(
+            "BOOTSTRAPPER_READINESS_MAX_DELAY_SECONDS must not be less than BOOTSTRAPPER_READINESS_BASE_DELAY_SECONDS"
+        )
+    if options.shutdown_timeout_seconds <= 0:
+        errors.append("BOOTSTRAPPER_SHUTDOWN_TIMEOUT_SECONDS must be greater than 0")
+    if options.telemetry_flush_timeout_seconds <= 0:
+        errors.append("BOOTSTRAPPER_TELEMETRY_FLUSH_TIMEOUT_SECONDS must be greater than 0")
+    if options.run_mode == "plan" and not options.plan_output_path:
+        errors.append("BOOTSTRAPPER_PLAN_OUTPUT_PATH must not be empty")
+    if options.run_mode == "export":
+        if not options.export_output_path:
+            errors.append("BOOTSTRAPPER_EXPORT_OUTPUT_PATH must not be empty")
+        if not options.enable_rabbitmq:
+            errors.append("BOOTSTRAPPER_RUN_MODE=export requires ENABLE_RABBITMQ, only RabbitMQ can be exported")
+    return errors
 
 
 def get_bootstrapper_options() -> BootstrapperOptions:
@@ -34,13 +126,4 @@ def get_bootstrapper_options() -> BootstrapperOptions:
     Returns:
         BootstrapperOptions: The bootstrapper options instance.
     """
-    global _bootstrapper_options
-    if _bootstrapper_options is None:
-        _bootstrapper_options = BootstrapperOptions()
-        _logger.info(
-            "Bootstrapper options loaded: enable_rabbitmq=%s, enable_blob_storage=%s, enable_kafka=%s",
-            _bootstrapper_options.enable_rabbitmq,
-            _bootstrapper_options.enable_blob_storage,
-            _bootstrapper_options.enable_kafka,
-        )
-    return _bootstrapper_options
+    return get_options(BootstrapperOptions, validate_bootstrapper_options)
@@ -0,0 +1,104 @@
+import logging
+
+from pydantic import BaseModel
+
+from cezzis_com_bootstrapper.domain.config.azure_storage_options import (
+    AzureStorageOptions,
+    validate_azure_storage_options,
+)
+from cezzis_com_bootstrapper.domain.config.bootstrapper_options import (
+    BootstrapperOptions,
+    validate_bootstrapper_options,
+)
+from cezzis_com_bootstrapper.domain.config.kafka_options import KafkaOptions, validate_kafka_options
+from cezzis_com_bootstrapper.domain.config.otel_options import OTelOptions, validate_otel_options
+from cezzis_com_bootstrapper.domain.config.rabbitmq_options import RabbitMqOptions, validate_rabbitmq_options
+from cezzis_com_bootstrapper.domain.config.settings_snapshot import (
+    build_options,
+    cache_options,
+    format_settings_errors,
+)
+
+
+class BootstrapperSettings(BaseModel):
+    """Root settings object holding every options section, loaded from one read of the environment and .env files.
+
+    Sections of disabled concerns are not loaded and are left as None.
+
+    Attributes:
+        bootstrapper (BootstrapperOptions): The bootstrapper feature flags.
+        otel (OTelOptions): The OpenTelemetry options.
+        rabbitmq (RabbitMqOptions | None): The RabbitMQ options when RabbitMQ bootstrapping is enabled.
+        azure_storage (AzureStorageOptions | None): The Azure storage options when blob storage bootstrapping is enabled.
+        kafka (KafkaOptions | None): The Kafka options when Kafka bootstrapping is enabled.
+    """
+
+    bootstrapper: BootstrapperOptions
+    otel: OTelOptions
+    rabbitmq: RabbitMqOptions | None = None
+    azure_storage: AzureStorageOptions | None = None
+    kafka: KafkaOptions | None = None
+
+
+_logger: logging.Logger = logging.getLogger("bootstrapper_settings")
+
+_bootstrapper_settings: BootstrapperSettings | None = None
+
+
+def get_bootstrapper_settings() -> BootstrapperSettings:
+    """Get the singleton instance of BootstrapperSettings.
+
+    Every section is validated in the same pass so all configuration errors are reported
+    together, before any network I/O starts.
+
+    Raises:
+        ValueError: When any section is not valid, listing every configuration error.
+
+    Returns:
+        BootstrapperSettings: The bootstrapper settings instance.
+    """
+    global _bootstrapper_settings
+    if _bootstrapper_settings is None:
+        errors: list[str] = []
+
+        bootstrapper = build_options(BootstrapperOptions, validate_bootstrapper_options, errors)
+        otel = build_options(OTelOptions, validate_otel_options, errors)
+
+        rabbitmq = azure_storage = kafka = None
+        if bootstrapper is not None:
+            if bootstrapper.enable_rabbitmq:
+                rabbitmq = build_options(RabbitMqOptions, validate_rabbitmq_options, errors)
+            if bootstrapper.enable_blob_storage:
+                azure_storage = build_options(AzureStorageOptions, validate_azure_storage_options, errors)
+            if bootstrapper.enable_kafka:
+                kafka = build_options(KafkaOptions, validate_kafka_options, errors)
+
+        if errors or bootstrapper is None or otel is None:
+            raise ValueError(format_settings_errors(errors))
+
+        _bootstrapper_settings = BootstrapperSettings(
+            bootstrapper=bootstrapper,
+            otel=otel,
+            rabbitmq=rabbitmq,
+            azure_storage=azure_storage,
+            kafka=kafka,
+        )
+
+        for section in (bootstrapper, otel, rabbitmq, azure_storage, kafka):
+            if section is not None:
+                cache_options(section)
+
+        _logger.info(
+            "Bootstrapper settings loaded: enable_rabbitmq=%s, enable_blob_storage=%s, enable_kafka=%s",
+            bootstrapper.enable_rabbitmq,
+            bootstrapper.enable_blob_storage,
+            bootstrapper.enable_kafka,
+        )
+
+    return _bootstrapper_settings
+
+
+def clear_bootstrapper_settings_cache() -> None:
+    """Clear the cached BootstrapperSettings instance."""
+    global _bootstrapper_settings
+    _bootstrapper_settings = None
@@ -1,9 +1,10 @@
-import logging
 import os
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from cezzis_com_bootstrapper.domain.config.settings_snapshot import clear_options_cache, get_options
+
 
 class KafkaOptions(BaseSettings):
     """Kafka configuration options loaded from environment variables and .env files.
@@ -24,9 +25,25 @@ class KafkaOptions(BaseSettings):
     security_protocol: str = Field(default="PLAINTEXT", validation_alias="KAFKA_SECURITY_PROTOCOL")
 
 
-_logger: logging.Logger = logging.getLogger("kafka_options")
+def validate_kafka_options(options: KafkaOptions) -> list[str]:
+    """Validate the required Kafka configuration.
+
+    Args:
+        options (KafkaOptions): The options to validate.
 
-_kafka_options: KafkaOptions | None = None
+    Returns:
+        list[str]: Every configuration error found, empty when the options are valid.
+    """
+    errors: list[str] = []
+    if not options.bootstrap_servers:
+        errors.append("KAFKA_BOOTSTRAP_SERVERS environment variable is required")
+    if not options.cocktails_topic_defs:
+        errors.append("KAFKA_COCKTAILS_TOPIC_DEFS environment variable is required")
+    if options.default_topic_partitions <= 1:
+        errors.append("KAFKA_DEFAULT_TOPIC_PARTITIONS must be greater than 1")
+    if options.security_protocol not in {"SSL", "PLAINTEXT", "SASL_SSL", "SASL_PLAINTEXT"}:
+        errors.append("KAFKA_SECURITY_PROTOCOL must be one of SSL, PLAINTEXT, SASL_SSL, SASL_PLAINTEXT")
+    return errors
 
 
 def get_kafka_options() -> KafkaOptions:
@@ -35,26 +52,9 @@ def get_kafka_options() -> KafkaOptions:
     Returns:
         KafkaOptions: The Kafka options instance.
     """
-    global _kafka_options
-    if _kafka_options is None:
-        _kafka_options = KafkaOptions()
-
-        # Validate required configuration
-        if not _kafka_options.bootstrap_servers:
-            raise ValueError("KAFKA_BOOTSTRAP_SERVERS environment variable is required")
-        if not _kafka_options.cocktails_topic_defs:
-            raise ValueError("KAFKA_COCKTAILS_TOPIC_DEFS environment variable is required")
-        if _kafka_options.default_topic_partitions <= 1:
-            raise ValueError("KAFKA_DEFAULT_TOPIC_PARTITIONS must be greater than 1")
-        if _kafka_options.security_protocol not in {"SSL", "PLAINTEXT", "SASL_SSL", "SASL_PLAINTEXT"}:
-            raise ValueError("KAFKA_SECURITY_PROTOCOL must be one of SSL, PLAINTEXT, SASL_SSL, SASL_PLAINTEXT")
-
-        _logger.info("Kafka options loaded successfully.")
-
-    return _kafka_options
+    return get_options(KafkaOptions, validate_kafka_options)
 
 
 def clear_kafka_options_cache() -> None:
     """Clear the cached KafkaOptions instance."""
-    global _kafka_options
-    _kafka_options = None
+    clear_options_cache(KafkaOptions)
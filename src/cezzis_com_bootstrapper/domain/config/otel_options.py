@@ -1,9 +1,10 @@
-import logging
 import os
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from cezzis_com_bootstrapper.domain.config.settings_snapshot import get_options
+
 
 class OTelOptions(BaseSettings):
     """Opentelemetry settings loaded from environment variables and .env files.
@@ -16,6 +17,7 @@ class OTelOptions(BaseSettings):
         enable_console_logging (bool): Flag to enable console logging.
         enable_tracing (bool): Flag to enable tracing.
         enable_logging (bool): Flag to enable logging.
+        enable_metrics (bool): Flag to enable exporting metrics.
     """
 
     model_config = SettingsConfigDict(
@@ -29,11 +31,28 @@ class OTelOptions(BaseSettings):
     enable_console_logging: bool = Field(default=True, validation_alias="OTEL_ENABLE_CONSOLE_LOGGING")
     enable_tracing: bool = Field(default=True, validation_alias="OTEL_ENABLE_TRACING")
     enable_logging: bool = Field(default=True, validation_alias="OTEL_ENABLE_LOGGING")
+    enable_metrics: bool = Field(default=True, validation_alias="OTEL_ENABLE_METRICS")
+
 
+def validate_otel_options(options: OTelOptions) -> list[str]:
+    """Validate the required OpenTelemetry configuration.
 
-_logger: logging.Logger = logging.getLogger("otel_options")
+    Args:
+        options (OTelOptions): The options to validate.
 
-_otel_options: OTelOptions | None = None
+    Returns:
+        list[str]: Every configuration error found, empty when the options are valid.
+    """
+    errors: list[str] = []
+    if not options.otel_exporter_otlp_endpoint:
+        errors.append("OTEL_EXPORTER_OTLP_ENDPOINT environment variable is required")
+    if not options.otel_service_name:
+        errors.append("OTEL_SERVICE_NAME environment variable is required")
+    if not options.otel_service_namespace:
+        errors.append("OTEL_SERVICE_NAMESPACE environment variable is required")
+    if not options.otel_otlp_exporter_auth_header:
+        errors.append("OTEL_OTLP_AUTH_HEADER environment variable is required")
+    return errors
 
 
 def get_otel_options() -> OTelOptions:
@@ -42,21 +61,4 @@ def get_otel_options() -> OTelOptions:
     Returns:
         OTelOptions: The OpenTelemetry options instance.
     """
-
-    global _otel_options
-    if _otel_options is None:
-        _otel_options = OTelOptions()
-
-        # Validate required configuration
-        if not _otel_options.otel_exporter_otlp_endpoint:
-            raise ValueError("OTEL_EXPORTER_OTLP_ENDPOINT environment variable is required")
-        if not _otel_options.otel_service_name:
-            raise ValueError("OTEL_SERVICE_NAME environment variable is required")
-        if not _otel_options.otel_service_namespace:
-            raise ValueError("OTEL_SERVICE_NAMESPACE environment variable is required")
-        if not _otel_options.otel_otlp_exporter_auth_header:
-            raise ValueError("OTEL_OTLP_AUTH_HEADER environment variable is required")
-
-        _logger.info("OpenTelemetry options loaded successfully.")
-
-    return _otel_options
+    return get_options(OTelOptions, validate_otel_options)
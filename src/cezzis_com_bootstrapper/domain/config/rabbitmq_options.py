@@ -1,9 +1,10 @@
-import logging
 import os
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from cezzis_com_bootstrapper.domain.config.settings_snapshot import clear_options_cache, get_options
+
 
 class RabbitMqOptions(BaseSettings):
     """RabbitMQ configuration options loaded from environment variables and .env files.
@@ -17,6 +18,18 @@ class RabbitMqOptions(BaseSettings):
         app_username (str): RabbitMQ application username.
         app_password (str): RabbitMQ application password.
         app_config_file_path (str): Path to the custom rabbit mq configuration file.
+        topology_backend (str): "management" to declare exchanges, queues and bindings through the
+            management API, or "amqp" to pipeline them over an AMQP connection.
+        amqp_port (int): RabbitMQ AMQP port, used by the "amqp" topology backend.
+        max_concurrent_vhosts (int): How many vhosts of the configuration file are reconciled at once.
+        drift_strategy (str): What to do with existing exchanges and queues whose properties differ from
+            the configuration: "report" them, "recreate_empty" to also recreate exchanges and the queues
+            holding no messages, or "migrate" to also move the messages of the others through a temporary
+            queue with the shovel plugin.
+        migration_timeout_seconds (float): How long a shovel moving the messages of a queue may take.
+        max_concurrent_requests (int): The most management API requests in flight. The adaptive limiter
+            lowers the limit when the broker slows down or answers 429 or 503, and raises it back up to this.
+        max_requests_per_second (float): The management API request rate cap, 0 for none.
     """
 
     model_config = SettingsConfigDict(
@@ -31,11 +44,58 @@ class RabbitMqOptions(BaseSettings):
     app_username: str = Field(default="", validation_alias="RABBITMQ_APP_USERNAME")
     app_password: str = Field(default="", validation_alias="RABBITMQ_APP_PASSWORD")
     app_config_file_path: str = Field(default="", validation_alias="RABBITMQ_APP_CONFIG_FILE_PATH")
+    topology_backend: str = Field(default="management", validation_alias="RABBITMQ_TOPOLOGY_BACKEND")
+    amqp_port: int = Field(default=5672, validation_alias="RABBITMQ_AMQP_PORT")
+    max_concurrent_vhosts: int = Field(default=4, validation_alias="RABBITMQ_MAX_CONCURRENT_VHOSTS")
+    drift_strategy: str = Field(default="report", validation_alias="RABBITMQ_DRIFT_STRATEGY")
+    migration_timeout_seconds: float = Field(default=300.0, validation_alias="RABBITMQ_MIGRATION_TIMEOUT_SECONDS")
+    max_concurrent_requests: int = Field(default=32, validation_alias="RABBITMQ_MAX_CONCURRENT_REQUESTS")
+    max_requests_per_second: float = Field(default=0.0, validation_alias="RABBITMQ_MAX_REQUESTS_PER_SECOND")
+
 
+def validate_rabbitmq_options(options: RabbitMqOptions) -> list[str]:
+    """Validate the required RabbitMQ configuration.
 
-_logger: logging.Logger = logging.getLogger("rabbitmq_options")
+    Args:
+        options (RabbitMqOptions): The options to validate.
 
-_rabbitmq_options: RabbitMqOptions | None = None
+    Returns:
+        list[str]: Every configuration error found, empty when the options are valid.
+    """
+    errors: list[str] = []
+    if not options.vhost:
+        errors.append("RABBITMQ_VHOST is required but not set.")
+    if not options.host:
+        errors.append("RABBITMQ_HOST is required but not set.")
+    if not options.admin_port:
+        errors.append("RABBITMQ_ADMIN_PORT is required but not set.")
+    if not options.admin_username:
+        errors.append("RABBITMQ_ADMIN_USERNAME is required but not set.")
+    if not options.admin_password:
+        errors.append("RABBITMQ_ADMIN_PASSWORD is required but not set.")
+    if not options.app_username:
+        errors.append("RABBITMQ_APP_USERNAME is required but not set.")
+    if not options.app_password:
+        errors.append("RABBITMQ_APP_PASSWORD is required but not set.")
+    if options.topology_backend not in {"management", "amqp"}:
+        errors.append(f"RABBITMQ_TOPOLOGY_BACKEND must be 'management' or 'amqp', got '{options.topology_backend}'.")
+    if options.topology_backend == "amqp" and not 0 < options.amqp_port < 65536:
+        errors.append(f"RABBITMQ_AMQP_PORT must be a valid port, got {options.amqp_port}.")
+    if options.max_concurrent_vhosts < 1:
+        errors.append(f"RABBITMQ_MAX_CONCURRENT_VHOSTS must be at least 1, got {options.max_concurrent_vhosts}.")
+    if options.drift_strategy not in {"report", "recreate_empty", "migrate"}:
+        errors.append(
+            f"RABBITMQ_DRIFT_STRATEGY must be 'report', 'recreate_empty' or 'migrate', got '{options.drift_strategy}'."
+        )
+    if options.migration_timeout_seconds <= 0:
+        errors.append(
+            f"RABBITMQ_MIGRATION_TIMEOUT_SECONDS must be greater than 0, got {options.migration_timeout_seconds}."
+        )
+    if options.max_concurrent_requests < 1:
+        errors.append(f"RABBITMQ_MAX_CONCURRENT_REQUESTS must be at least 1, got {options.max_concurrent_requests}.")
+    if options.max_requests_per_second < 0:
+        errors.append(f"RABBITMQ_MAX_REQUESTS_PER_SECOND must be 0 or greater, got {options.max_requests_per_second}.")
+    return errors
 
 
 def get_rabbitmq_options() -> RabbitMqOptions:
@@ -44,32 +104,9 @@ def get_rabbitmq_options() -> RabbitMqOptions:
     Returns:
         RabbitMqOptions: The RabbitMQ options instance.
     """
-    global _rabbitmq_options
-    if _rabbitmq_options is None:
-        _rabbitmq_options = RabbitMqOptions()
-
-        # Validate required configuration
-        if not _rabbitmq_options.vhost:
-            raise ValueError("RABBITMQ_VHOST is required but not set.")
-        if not _rabbitmq_options.host:
-            raise ValueError("RABBITMQ_HOST is required but not set.")
-        if not _rabbitmq_options.admin_port:
-            raise ValueError("RABBITMQ_ADMIN_PORT is required but not set.")
-        if not _rabbitmq_options.admin_username:
-            raise ValueError("RABBITMQ_ADMIN_USERNAME is required but not set.")
-        if not _rabbitmq_options.admin_password:
-            raise ValueError("RABBITMQ_ADMIN_PASSWORD is required but not set.")
-        if not _rabbitmq_options.app_username:
-            raise ValueError("RABBITMQ_APP_USERNAME is required but not set.")
-        if not _rabbitmq_options.app_password:
-            raise ValueError("RABBITMQ_APP_PASSWORD is required but not set.")
-
-        _logger.info("RabbitMQ options loaded successfully.")
-
-    return _rabbitmq_options
+    return get_options(RabbitMqOptions, validate_rabbitmq_options)
 
 
 def clear_rabbitmq_options_cache() -> None:
     """Clear the cached RabbitMqOptions instance."""
-    global _rabbitmq_options
-    _rabbitmq_options = None
+    clear_options_cache(RabbitMqOptions)
@@ -0,0 +1,186 @@
+import logging
+import os
+from typing import Callable, TypeVar
+
+from dotenv import dotenv_values
+from pydantic import ValidationError
+from pydantic_settings import BaseSettings
+
+TOptions = TypeVar("TOptions", bound=BaseSettings)
+
+OptionsValidator = Callable[[TOptions], list[str]]
+
+
+class SettingsSnapshot:
+    """The process environment and dotenv files, read from disk once and shared by every options class.
+
+    Values follow the same precedence as pydantic-settings: environment variables override
+    `.env.{ENV}`, which overrides `.env`. Keys are matched case-insensitively.
+    """
+
+    def __init__(self, values: dict[str, str]):
+        self._values = {key.lower(): value for key, value in values.items()}
+
+    @classmethod
+    def load(cls) -> "SettingsSnapshot":
+        """Reads the dotenv files and the process environment.
+
+        Returns:
+            SettingsSnapshot: The loaded snapshot.
+        """
+        values: dict[str, str] = {}
+
+        for env_file in (".env", f".env.{os.environ.get('ENV')}"):
+            if os.path.isfile(env_file):
+                values.update(
+                    {
+                        key.lower(): value
+                        for key, value in dotenv_values(env_file, encoding="utf-8").items()
+                        if value is not None
+                    }
+                )
+
+        values.update({key.lower(): value for key, value in os.environ.items()})
+
+        return cls(values)
+
+    def get(self, name: str) -> str | None:
+        """Gets a single setting that is not part of an options class, such as a secret named by configuration.
+
+        Args:
+            name (str): The name of the environment variable.
+
+        Returns:
+            str | None: The value, or None when it is not set.
+        """
+        return self._values.get(name.lower())
+
+    def build(self, options_type: type[TOptions]) -> TOptions:
+        """Builds an options instance from the snapshot without reading any file.
+
+        Args:
+            options_type (type[TOptions]): The options class to build.
+
+        Returns:
+            TOptions: The options instance.
+        """
+        values: dict[str, str] = {}
+
+        for field in options_type.model_fields.values():
+            alias = field.validation_alias
+            if isinstance(alias, str) and alias.lower() in self._values:
+                values[alias] = self._values[alias.lower()]
+
+        return options_type(_env_file=None, **values)  # type: ignore[call-arg]
+
+
+_logger: logging.Logger = logging.getLogger("settings_snapshot")
+
+_snapshot: SettingsSnapshot | None = None
+
+_options: dict[type, BaseSettings] = {}
+
+
+def get_settings_snapshot() -> SettingsSnapshot:
+    """Get the singleton instance of SettingsSnapshot.
+
+    Returns:
+        SettingsSnapshot: The settings snapshot instance.
+    """
+    global _snapshot
+    if _snapshot is None:
+        _snapshot = SettingsSnapshot.load()
+    return _snapshot
+
+
+def build_options(
+    options_type: type[TOptions], validate: OptionsValidator | None, errors: list[str]
+) -> TOptions | None:
+    """Builds and validates an options instance, collecting every problem instead of raising.
+
+    Args:
+        options_type (type[TOptions]): The options class to build.
+        validate (OptionsValidator | None): Returns the configuration errors of a built instance.
+        errors (list[str]): Receives the configuration errors that were found.
+
+    Returns:
+        TOptions | None: The options instance, or None when it is not valid.
+    """
+    try:
+        options = get_settings_snapshot().build(options_type)
+    except ValidationError as e:
+        errors.extend(f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}" for error in e.errors())
+        return None
+
+    problems = validate(options) if validate else []
+    if problems:
+        errors.extend(problems)
+        return None
+
+    return options
+
+
+def cache_options(options: BaseSettings) -> None:
+    """Stores a validated options instance so the options getters return it.
+
+    Args:
+        options (BaseSettings): The validated options instance.
+    """
+    _options[type(options)] = options
+
+
+def get_options(options_type: type[TOptions], validate: OptionsValidator | None = None) -> TOptions:
+    """Gets the validated options instance of a type, building it from the shared snapshot on first use.
+
+    Args:
+        options_type (type[TOptions]): The options class to get.
+        validate (OptionsValidator | None, optional): Returns the configuration errors of a built instance.
+
+    Raises:
+        ValueError: When the options are not valid.
+
+    Returns:
+        TOptions: The options instance.
+    """
+    cached = _options.get(options_type)
+    if cached is not None:
+        return cached  # type: ignore[return-value]
+
+    errors: list[str] = []
+    options = build_options(options_type, validate, errors)
+    if options is None:
+        raise ValueError(format_settings_errors(errors))
+
+    cache_options(options)
+    _logger.info(f"{options_type.__name__} loaded successfully.")
+
+    return options
+
+
+def format_settings_errors(errors: list[str]) -> str:
+    """Formats configuration errors into a single message.
+
+    Args:
+        errors (list[str]): The configuration errors.
+
+    Returns:
+        str: The error message.
+    """
+    if len(errors) == 1:
+        return errors[0]
+
+    return "Invalid configuration:\n" + "\n".join(f"  - {error}" for error in errors)
+
+
+def clear_options_cache(options_type: type[BaseSettings] | None = None) -> None:
+    """Clear the cached options instances, and the snapshot when no type is given.
+
+    Args:
+        options_type (type[BaseSettings] | None, optional): The options type to clear. Defaults to all.
+    """
+    global _snapshot
+    if options_type is None:
+        _options.clear()
+        _snapshot = None
+    else:
+        _options.pop(options_type, None)
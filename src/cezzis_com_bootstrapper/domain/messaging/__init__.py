@@ -1,15 +1,56 @@
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding import RabbitMqBinding
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding_type import RabbitMqBindingType
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_configuration import RabbitMqConfiguration
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_drift import (
+    RabbitMqDriftStrategy,
+    exchange_drift,
+    is_migration_queue_of,
+    migration_queue_name,
+    queue_drift,
+)
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_exchange import RabbitMqExchange
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_exchange_type import RabbitMqExchangeType
-from cezzis_com_bootstrapper.domain.messaging.rabbitmq_queue import RabbitMqQueue
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_migration_error import RabbitMqMigrationError
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_policy import RabbitMqPolicy
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_policy_apply_to import RabbitMqPolicyApplyTo
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_queue import RabbitMqQueue, validate_rabbitmq_queue
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_queue_type import RabbitMqQueueType
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_snapshot import RabbitMqSnapshot
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_super_stream import (
+    RabbitMqSuperStream,
+    validate_rabbitmq_super_stream,
+)
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_topic_permission import RabbitMqTopicPermission
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_topology_validation import (
+    duplicate_name_errors,
+    validate_rabbitmq_topology,
+)
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_user import RabbitMqUser
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_vhost import RabbitMqVhost
 
 __all__ = [
     "RabbitMqBinding",
     "RabbitMqExchange",
     "RabbitMqQueue",
+    "RabbitMqSuperStream",
+    "RabbitMqTopicPermission",
+    "RabbitMqUser",
+    "RabbitMqVhost",
+    "RabbitMqPolicy",
     "RabbitMqConfiguration",
     "RabbitMqBindingType",
     "RabbitMqExchangeType",
+    "RabbitMqPolicyApplyTo",
+    "RabbitMqQueueType",
+    "RabbitMqDriftStrategy",
+    "RabbitMqSnapshot",
+    "RabbitMqMigrationError",
+    "validate_rabbitmq_queue",
+    "validate_rabbitmq_super_stream",
+    "validate_rabbitmq_topology",
+    "duplicate_name_errors",
+    "exchange_drift",
+    "queue_drift",
+    "migration_queue_name",
+    "is_migration_queue_of",
 ]
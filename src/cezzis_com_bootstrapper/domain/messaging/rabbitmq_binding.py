@@ -1,4 +1,5 @@
 import dataclasses
+import json
 from dataclasses import dataclass
 
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding_type import RabbitMqBindingType
@@ -11,3 +12,21 @@ class RabbitMqBinding:
     destination_type: RabbitMqBindingType = RabbitMqBindingType.QUEUE
     routing_key: str = ""
     arguments: dict = dataclasses.field(default_factory=dict)
+
+    def key(self) -> tuple[str, RabbitMqBindingType, str, str, str]:
+        """Gets what identifies the binding on the broker, usable as a set member.
+
+        Bindings differing only by their arguments are distinct bindings, the arguments are part of
+        the key as canonical JSON.
+
+        Returns:
+            tuple[str, RabbitMqBindingType, str, str, str]: The source, destination type, destination,
+                routing key and arguments of the binding.
+        """
+        return (
+            self.source,
+            self.destination_type,
+            self.destination,
+            self.routing_key,
+            json.dumps(self.arguments, sort_keys=True),
+        )
@@ -1,8 +1,17 @@
+import dataclasses
+import json
+import sys
 from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
 
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding import RabbitMqBinding
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_exchange import RabbitMqExchange
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_policy import RabbitMqPolicy
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_queue import RabbitMqQueue
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_super_stream import RabbitMqSuperStream
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_vhost import RabbitMqVhost
 
 
 @dataclass
@@ -10,3 +19,73 @@ class RabbitMqConfiguration:
     exchanges: list[RabbitMqExchange]
     queues: list[RabbitMqQueue]
     bindings: list[RabbitMqBinding]
+    policies: list[RabbitMqPolicy] = dataclasses.field(default_factory=list)
+    operator_policies: list[RabbitMqPolicy] = dataclasses.field(default_factory=list)
+    super_streams: list[RabbitMqSuperStream] = dataclasses.field(default_factory=list)
+    vhosts: list[RabbitMqVhost] = dataclasses.field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Builds the rabbitmq.json document of the configuration.
+
+        Every list is sorted, so two documents of the same topology are identical whatever order the
+        entities were declared or listed in. Queue fields left unset are left out.
+
+        Returns:
+            dict[str, Any]: The configuration, ready to be serialized to JSON and loaded back.
+        """
+        document = {
+            "exchanges": [_to_document(exchange) for exchange in sorted(self.exchanges, key=lambda e: e.name)],
+            "queues": [_to_document(queue) for queue in sorted(self.queues, key=lambda q: q.name)],
+            "bindings": [_to_document(binding) for binding in sorted(self.bindings, key=_binding_sort_key)],
+            "policies": [_to_document(policy) for policy in sorted(self.policies, key=lambda p: p.name)],
+            "operator_policies": [
+                _to_document(policy) for policy in sorted(self.operator_policies, key=lambda p: p.name)
+            ],
+        }
+        if self.super_streams:
+            document["super_streams"] = [
+                _to_document(super_stream) for super_stream in sorted(self.super_streams, key=lambda s: s.name)
+            ]
+        if self.vhosts:
+            document["vhosts"] = [_to_document(vhost) for vhost in sorted(self.vhosts, key=lambda v: v.name)]
+        return document
+
+    def write(self, path: str) -> None:
+        """Writes the configuration as a rabbitmq.json document.
+
+        Args:
+            path (str): The file to write, or "-" for stdout.
+        """
+        content = json.dumps(self.to_dict(), indent=4)
+        if path == "-":
+            sys.stdout.write(content + "\n")
+            sys.stdout.flush()
+        else:
+            Path(path).write_text(content + "\n")
+
+
+def _binding_sort_key(binding: RabbitMqBinding) -> tuple[str, str, str, str, str]:
+    return (
+        binding.source,
+        binding.destination_type.value,
+        binding.destination,
+        binding.routing_key,
+        json.dumps(binding.arguments, sort_keys=True),
+    )
+
+
+def _to_document(entity: Any) -> Any:
+    """Converts a dataclass to its rabbitmq.json form, with enum values and without unset optional fields."""
+    if dataclasses.is_dataclass(entity):
+        return {
+            field.name: _to_document(getattr(entity, field.name))
+            for field in dataclasses.fields(entity)
+            if getattr(entity, field.name) is not None
+        }
+    if isinstance(entity, Enum):
+        return entity.value
+    if isinstance(entity, list):
+        return [_to_document(item) for item in entity]
+    if isinstance(entity, dict):
+        return {key: _to_document(value) for key, value in sorted(entity.items())}
+    return entity
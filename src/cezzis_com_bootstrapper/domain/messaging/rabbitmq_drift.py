@@ -0,0 +1,129 @@
+from enum import Enum
+from typing import Any
+
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_exchange import RabbitMqExchange
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_queue import RabbitMqQueue
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_queue_type import RabbitMqQueueType
+
+
+class RabbitMqDriftStrategy(Enum):
+    """What the bootstrapper does with an exchange or queue whose properties differ from its definition.
+
+    The broker refuses to redeclare an exchange or queue with different properties, applying a
+    change means deleting the entity and declaring it again.
+    """
+
+    # Log the differences and leave the entity as it is
+    REPORT = "report"
+    # Recreate exchanges, and the queues holding no messages and having no consumers
+    RECREATE_EMPTY = "recreate_empty"
+    # Recreate exchanges and empty queues, and move the messages of the others through a temporary queue
+    MIGRATE = "migrate"
+
+
+# MIGRATE parks the messages of a queue in a temporary queue named after it with this suffix
+_MIGRATION_QUEUE_SUFFIX = ".migrating"
+
+
+def exchange_drift(exchange_def: RabbitMqExchange, existing: RabbitMqExchange) -> dict[str, dict[str, Any]]:
+    """Compares an existing exchange with its definition.
+
+    Args:
+        exchange_def (RabbitMqExchange): The desired exchange.
+        existing (RabbitMqExchange): The exchange as read from the broker.
+
+    Returns:
+        dict[str, dict[str, Any]]: The existing and desired value of every property that differs, e.g.
+            ``{"type": {"existing": "topic", "desired": "direct"}}``, empty when the exchange matches.
+    """
+    drift = _property_drift(
+        {
+            "type": existing.type.value,
+            "durable": existing.durable,
+            "auto_delete": existing.auto_delete,
+            "internal": existing.internal,
+        },
+        {
+            "type": exchange_def.type.value,
+            "durable": exchange_def.durable,
+            "auto_delete": exchange_def.auto_delete,
+            "internal": exchange_def.internal,
+        },
+    )
+    drift.update(_arguments_drift(existing.arguments, exchange_def.arguments))
+    return drift
+
+
+def queue_drift(queue_def: RabbitMqQueue, existing: RabbitMqQueue) -> dict[str, dict[str, Any]]:
+    """Compares an existing queue with its definition.
+
+    Arguments are compared as declared, the typed queue fields included. A queue declared without
+    ``x-queue-type`` is a classic queue, whether or not the broker reports the argument.
+
+    Args:
+        queue_def (RabbitMqQueue): The desired queue.
+        existing (RabbitMqQueue): The queue as read from the broker.
+
+    Returns:
+        dict[str, dict[str, Any]]: The existing and desired value of every property that differs, e.g.
+            ``{"arguments.x-message-ttl": {"existing": None, "desired": 60000}}``, empty when the queue matches.
+    """
+    drift = _property_drift(
+        {"durable": existing.durable, "exclusive": existing.exclusive, "auto_delete": existing.auto_delete},
+        {"durable": queue_def.durable, "exclusive": queue_def.exclusive, "auto_delete": queue_def.auto_delete},
+    )
+    drift.update(_arguments_drift(_with_queue_type(existing), _with_queue_type(queue_def)))
+    return drift
+
+
+def migration_queue_name(queue_name: str) -> str:
+    """Gets the name of the temporary queue a migration parks the messages of a queue in.
+
+    Args:
+        queue_name (str): The name of the migrated queue.
+
+    Returns:
+        str: The name of the temporary queue, e.g. "orders.migrating".
+    """
+    return queue_name + _MIGRATION_QUEUE_SUFFIX
+
+
+def is_migration_queue_of(queue_name: str, desired_queues: set[str]) -> bool:
+    """Checks whether a queue is the temporary queue of a migration of one of the desired queues.
+
+    Such a queue may hold the only copy of the messages of an interrupted migration, it is kept
+    until the next run finishes the migration.
+
+    Args:
+        queue_name (str): The name of an existing queue.
+        desired_queues (set[str]): The names of the queues of the configuration.
+
+    Returns:
+        bool: True when the queue must not be pruned.
+    """
+    return queue_name.endswith(_MIGRATION_QUEUE_SUFFIX) and (
+        queue_name.removesuffix(_MIGRATION_QUEUE_SUFFIX) in desired_queues
+    )
+
+
+def _with_queue_type(queue: RabbitMqQueue) -> dict:
+    arguments = queue.declared_arguments()
+    arguments.setdefault("x-queue-type", RabbitMqQueueType.CLASSIC.value)
+    return arguments
+
+
+def _property_drift(existing: dict[str, Any], desired: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    return {
+        name: {"existing": existing[name], "desired": value}
+        for name, value in desired.items()
+        if existing[name] != value
+    }
+
+
+def _arguments_drift(existing: dict, desired: dict) -> dict[str, dict[str, Any]]:
+    # A missing argument is reported as None
+    return {
+        f"arguments.{name}": {"existing": existing.get(name), "desired": desired.get(name)}
+        for name in sorted(existing.keys() | desired.keys())
+        if existing.get(name) != desired.get(name)
+    }
@@ -0,0 +1,17 @@
+class RabbitMqMigrationError(Exception):
+    """A queue migration that did not finish, leaving messages in its temporary queue.
+
+    Waiting for the shovel again cannot make it faster, so the error is not transient: the
+    command is not replayed and the migration is finished by the next run.
+
+    Attributes:
+        vhost (str): The name of the virtual host.
+        queue (str): The queue being migrated.
+        migration_queue (str): The temporary queue left in place, holding the messages moved so far.
+    """
+
+    def __init__(self, message: str, vhost: str, queue: str, migration_queue: str):
+        super().__init__(message)
+        self.vhost = vhost
+        self.queue = queue
+        self.migration_queue = migration_queue
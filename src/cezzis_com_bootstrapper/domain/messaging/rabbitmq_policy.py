@@ -0,0 +1,13 @@
+import dataclasses
+from dataclasses import dataclass
+
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_policy_apply_to import RabbitMqPolicyApplyTo
+
+
+@dataclass
+class RabbitMqPolicy:
+    name: str
+    pattern: str
+    definition: dict = dataclasses.field(default_factory=dict)
+    apply_to: RabbitMqPolicyApplyTo = RabbitMqPolicyApplyTo.QUEUES
+    priority: int = 0
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class RabbitMqPolicyApplyTo(Enum):
+    QUEUES = "queues"
+    CLASSIC_QUEUES = "classic_queues"
+    QUORUM_QUEUES = "quorum_queues"
+    STREAMS = "streams"
+    EXCHANGES = "exchanges"
+    ALL = "all"
@@ -1,6 +1,8 @@
 import dataclasses
 from dataclasses import dataclass
 
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_queue_type import RabbitMqQueueType
+
 
 @dataclass
 class RabbitMqQueue:
@@ -9,3 +11,56 @@ class RabbitMqQueue:
     exclusive: bool = False
     auto_delete: bool = False
     arguments: dict = dataclasses.field(default_factory=dict)
+    type: RabbitMqQueueType | None = None
+    initial_group_size: int | None = None
+    max_length_bytes: int | None = None
+    stream_max_segment_size_bytes: int | None = None
+
+    def declared_arguments(self) -> dict:
+        """Gets the arguments the queue is declared with, the typed fields overriding ``arguments``.
+
+        Returns:
+            dict: The queue arguments, e.g. ``{"x-queue-type": "quorum"}``.
+        """
+        arguments = dict(self.arguments)
+        if self.type is not None:
+            arguments["x-queue-type"] = self.type.value
+        if self.initial_group_size is not None:
+            arguments["x-quorum-initial-group-size"] = self.initial_group_size
+        if self.max_length_bytes is not None:
+            arguments["x-max-length-bytes"] = self.max_length_bytes
+        if self.stream_max_segment_size_bytes is not None:
+            arguments["x-stream-max-segment-size-bytes"] = self.stream_max_segment_size_bytes
+        return arguments
+
+
+def validate_rabbitmq_queue(queue: RabbitMqQueue) -> list[str]:
+    """Validates the combination of properties a queue type accepts.
+
+    Args:
+        queue (RabbitMqQueue): The queue definition to validate.
+
+    Returns:
+        list[str]: A list of validation error messages, empty when the queue is valid.
+    """
+    errors: list[str] = []
+    queue_type = queue.declared_arguments().get("x-queue-type", RabbitMqQueueType.CLASSIC.value)
+
+    if queue.type is not None and queue.arguments.get("x-queue-type", queue.type.value) != queue.type.value:
+        errors.append(
+            f"Queue '{queue.name}' has type '{queue.type.value}' but its x-queue-type argument is "
+            f"'{queue.arguments['x-queue-type']}'."
+        )
+    if queue_type in (RabbitMqQueueType.QUORUM.value, RabbitMqQueueType.STREAM.value):
+        if not queue.durable or queue.exclusive or queue.auto_delete:
+            errors.append(
+                f"Queue '{queue.name}' of type '{queue_type}' must be durable, not exclusive nor auto delete."
+            )
+    elif queue.initial_group_size is not None:
+        errors.append(f"Queue '{queue.name}' sets initial_group_size, which only quorum queues and streams accept.")
+    if queue.initial_group_size is not None and queue.initial_group_size < 1:
+        errors.append(f"Queue '{queue.name}' initial_group_size must be at least 1, got {queue.initial_group_size}.")
+    if queue.stream_max_segment_size_bytes is not None and queue_type != RabbitMqQueueType.STREAM.value:
+        errors.append(f"Queue '{queue.name}' sets stream_max_segment_size_bytes, which only streams accept.")
+
+    return errors
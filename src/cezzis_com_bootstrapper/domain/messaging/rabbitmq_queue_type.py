@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class RabbitMqQueueType(Enum):
+    CLASSIC = "classic"
+    QUORUM = "quorum"
+    STREAM = "stream"
@@ -0,0 +1,41 @@
+import dataclasses
+from dataclasses import dataclass
+
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding import RabbitMqBinding
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_exchange import RabbitMqExchange
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_policy import RabbitMqPolicy
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_queue import RabbitMqQueue
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_topic_permission import RabbitMqTopicPermission
+
+
+@dataclass
+class RabbitMqSnapshot:
+    """The state of a vhost as read from the broker, filtered like the reconcile filters it.
+
+    Attributes:
+        vhost_exists (bool): Whether the vhost exists.
+        users (list[str]): Every user except the administrator.
+        permissions (dict[str, dict[str, str]]): The configure, write and read permissions per user on the vhost.
+        exchanges (list[str]): The exchanges of the vhost, without the default and "amq." exchanges.
+        queues (list[str]): The queues of the vhost.
+        bindings (list[RabbitMqBinding]): The bindings of the vhost, without the default queue bindings.
+        policies (list[RabbitMqPolicy]): The policies of the vhost.
+        operator_policies (list[RabbitMqPolicy]): The operator policies of the vhost.
+        topic_permissions (dict[str, list[RabbitMqTopicPermission]]): The topic permissions per user.
+        exchange_definitions (dict[str, RabbitMqExchange]): The properties of each exchange, compared with
+            the configuration to find drift.
+        queue_definitions (dict[str, RabbitMqQueue]): The properties of each queue, compared with the
+            configuration to find drift.
+    """
+
+    vhost_exists: bool
+    users: list[str] = dataclasses.field(default_factory=list)
+    permissions: dict[str, dict[str, str]] = dataclasses.field(default_factory=dict)
+    exchanges: list[str] = dataclasses.field(default_factory=list)
+    queues: list[str] = dataclasses.field(default_factory=list)
+    bindings: list[RabbitMqBinding] = dataclasses.field(default_factory=list)
+    policies: list[RabbitMqPolicy] = dataclasses.field(default_factory=list)
+    operator_policies: list[RabbitMqPolicy] = dataclasses.field(default_factory=list)
+    topic_permissions: dict[str, list[RabbitMqTopicPermission]] = dataclasses.field(default_factory=dict)
+    exchange_definitions: dict[str, RabbitMqExchange] = dataclasses.field(default_factory=dict)
+    queue_definitions: dict[str, RabbitMqQueue] = dataclasses.field(default_factory=dict)
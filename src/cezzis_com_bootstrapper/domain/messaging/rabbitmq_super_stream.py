@@ -0,0 +1,98 @@
+import dataclasses
+from dataclasses import dataclass
+
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding import RabbitMqBinding
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_exchange import RabbitMqExchange
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_exchange_type import RabbitMqExchangeType
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_queue import RabbitMqQueue
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_queue_type import RabbitMqQueueType
+
+
+@dataclass
+class RabbitMqSuperStream:
+    """A stream partitioned over several streams behind one exchange, declared as a single entry.
+
+    The layout follows the one the stream plugin and its clients expect: a direct exchange named
+    after the super stream, one stream per partition named ``<name>-<binding key>``, and one binding
+    per partition carrying its ``x-stream-partition-order``.
+
+    Attributes:
+        name (str): The super stream name, also the name of its exchange.
+        partitions (int): The number of partitions, keyed "0" to "partitions - 1" unless binding keys are given.
+        binding_keys (list[str]): The routing key of each partition, in partition order.
+        initial_group_size (int | None): The replicas of each partition stream.
+        max_length_bytes (int | None): The retention limit of each partition stream.
+        stream_max_segment_size_bytes (int | None): The segment file size of each partition stream.
+        arguments (dict): Extra arguments of each partition stream.
+    """
+
+    name: str
+    partitions: int = 0
+    binding_keys: list[str] = dataclasses.field(default_factory=list)
+    initial_group_size: int | None = None
+    max_length_bytes: int | None = None
+    stream_max_segment_size_bytes: int | None = None
+    arguments: dict = dataclasses.field(default_factory=dict)
+
+    def partition_keys(self) -> list[str]:
+        """Gets the binding key of every partition, in partition order."""
+        return list(self.binding_keys) or [str(index) for index in range(self.partitions)]
+
+    def exchange(self) -> RabbitMqExchange:
+        """Gets the exchange publishers route through."""
+        return RabbitMqExchange(
+            name=self.name,
+            type=RabbitMqExchangeType.DIRECT,
+            arguments={"x-super-stream": True},
+        )
+
+    def queues(self) -> list[RabbitMqQueue]:
+        """Gets the partition streams."""
+        return [
+            RabbitMqQueue(
+                name=f"{self.name}-{key}",
+                arguments=dict(self.arguments),
+                type=RabbitMqQueueType.STREAM,
+                initial_group_size=self.initial_group_size,
+                max_length_bytes=self.max_length_bytes,
+                stream_max_segment_size_bytes=self.stream_max_segment_size_bytes,
+            )
+            for key in self.partition_keys()
+        ]
+
+    def bindings(self) -> list[RabbitMqBinding]:
+        """Gets the binding routing each partition key to its stream."""
+        return [
+            RabbitMqBinding(
+                source=self.name,
+                destination=f"{self.name}-{key}",
+                routing_key=key,
+                arguments={"x-stream-partition-order": order},
+            )
+            for order, key in enumerate(self.partition_keys())
+        ]
+
+
+def validate_rabbitmq_super_stream(super_stream: RabbitMqSuperStream) -> list[str]:
+    """Validates the partitioning of a super stream.
+
+    Args:
+        super_stream (RabbitMqSuperStream): The super stream definition to validate.
+
+    Returns:
+        list[str]: A list of validation error messages, empty when the super stream is valid.
+    """
+    errors: list[str] = []
+    keys = super_stream.partition_keys()
+
+    if not keys:
+        errors.append(f"Super stream '{super_stream.name}' must have at least one partition.")
+    if super_stream.binding_keys and super_stream.partitions not in (0, len(super_stream.binding_keys)):
+        errors.append(
+            f"Super stream '{super_stream.name}' has {len(super_stream.binding_keys)} binding keys "
+            f"for {super_stream.partitions} partitions."
+        )
+    if len(set(keys)) != len(keys):
+        errors.append(f"Super stream '{super_stream.name}' binding keys must be unique.")
+
+    return errors
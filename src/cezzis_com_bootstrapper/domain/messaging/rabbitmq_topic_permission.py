@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class RabbitMqTopicPermission:
+    """The routing keys a user may publish or consume with on a topic exchange.
+
+    Attributes:
+        exchange (str): The topic exchange the permission applies to.
+        write (str): The regex of the routing keys the user may publish with.
+        read (str): The regex of the routing keys the user may bind queues with.
+    """
+
+    exchange: str
+    write: str = ".*"
+    read: str = ".*"
@@ -0,0 +1,218 @@
+from collections import Counter
+from typing import Iterator
+
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding import RabbitMqBinding
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding_type import RabbitMqBindingType
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_configuration import RabbitMqConfiguration
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_vhost import RabbitMqVhost
+
+# The broker predeclares the "amq." exchanges in every vhost, and refuses to let clients declare any
+_RESERVED_PREFIX = "amq."
+
+# The type each known x-argument must have, booleans are not accepted where integers are expected
+_QUEUE_ARGUMENT_TYPES: dict[str, type] = {
+    "x-message-ttl": int,
+    "x-expires": int,
+    "x-max-length": int,
+    "x-max-length-bytes": int,
+    "x-max-priority": int,
+    "x-delivery-limit": int,
+    "x-quorum-initial-group-size": int,
+    "x-stream-max-segment-size-bytes": int,
+    "x-dead-letter-exchange": str,
+    "x-dead-letter-routing-key": str,
+    "x-dead-letter-strategy": str,
+    "x-overflow": str,
+    "x-queue-mode": str,
+    "x-queue-type": str,
+    "x-queue-leader-locator": str,
+    "x-max-age": str,
+    "x-single-active-consumer": bool,
+}
+_EXCHANGE_ARGUMENT_TYPES: dict[str, type] = {
+    "alternate-exchange": str,
+    "x-super-stream": bool,
+}
+_BINDING_ARGUMENT_TYPES: dict[str, type] = {
+    "x-match": str,
+    "x-stream-partition-order": int,
+}
+_TYPE_NAMES = {int: "an integer", str: "a string", bool: "a boolean"}
+
+
+def validate_rabbitmq_topology(topology: RabbitMqConfiguration | RabbitMqVhost) -> list[str]:
+    """Validates the references between the entities of a vhost, without contacting the broker.
+
+    Exchanges and queues are indexed by name once, then every binding, dead letter exchange and
+    alternate exchange is checked against the index, and the exchange-to-exchange bindings are
+    walked as a graph to find cycles.
+
+    Args:
+        topology (RabbitMqConfiguration | RabbitMqVhost): The default vhost topology or a listed vhost, with its
+            super streams expanded.
+
+    Returns:
+        list[str]: Every validation error found, empty when the topology is valid.
+    """
+    errors: list[str] = []
+    exchanges = {exchange_def.name: exchange_def for exchange_def in topology.exchanges}
+    queues = {queue_def.name: queue_def for queue_def in topology.queues}
+
+    def exchange_exists(name: str) -> bool:
+        return name in exchanges or name.startswith(_RESERVED_PREFIX)
+
+    # --------------------------------------------------------
+    # Names
+    # --------------------------------------------------------
+    errors.extend(duplicate_name_errors("exchange", [exchange_def.name for exchange_def in topology.exchanges]))
+    errors.extend(duplicate_name_errors("queue", [queue_def.name for queue_def in topology.queues]))
+    errors.extend(duplicate_name_errors("policy", [policy_def.name for policy_def in topology.policies]))
+    errors.extend(
+        duplicate_name_errors("operator policy", [policy_def.name for policy_def in topology.operator_policies])
+    )
+    for kind, names in (("exchange", exchanges), ("queue", queues)):
+        for name in names:
+            if not name:
+                errors.append(f"An {kind} has an empty name.")
+            elif name.startswith(_RESERVED_PREFIX):
+                errors.append(f"The {kind} '{name}' uses the reserved '{_RESERVED_PREFIX}' prefix.")
+
+    # --------------------------------------------------------
+    # Arguments and the exchanges they name
+    # --------------------------------------------------------
+    for exchange_def in exchanges.values():
+        errors.extend(
+            _argument_errors(f"Exchange '{exchange_def.name}'", exchange_def.arguments, _EXCHANGE_ARGUMENT_TYPES)
+        )
+        alternate_exchange = exchange_def.arguments.get("alternate-exchange")
+        if isinstance(alternate_exchange, str) and not exchange_exists(alternate_exchange):
+            errors.append(
+                f"Exchange '{exchange_def.name}' has the alternate exchange '{alternate_exchange}', which is not declared."
+            )
+
+    for queue_def in queues.values():
+        arguments = queue_def.declared_arguments()
+        errors.extend(_argument_errors(f"Queue '{queue_def.name}'", arguments, _QUEUE_ARGUMENT_TYPES))
+        # The empty name is the default exchange, which dead letters by routing key
+        dead_letter_exchange = arguments.get("x-dead-letter-exchange")
+        if isinstance(dead_letter_exchange, str) and dead_letter_exchange and not exchange_exists(dead_letter_exchange):
+            errors.append(
+                f"Queue '{queue_def.name}' dead letters to the exchange '{dead_letter_exchange}', which is not declared."
+            )
+
+    # --------------------------------------------------------
+    # Bindings
+    # --------------------------------------------------------
+    exchange_edges: dict[str, set[str]] = {}
+    # Bindings differing only by their arguments are distinct bindings, e.g. to a headers exchange
+    binding_counts = Counter(binding_def.key() for binding_def in topology.bindings)
+    first_bindings = {binding_def.key(): binding_def for binding_def in reversed(topology.bindings)}
+    for binding_def in topology.bindings:
+        description = _describe_binding(binding_def)
+        errors.extend(_argument_errors(description, binding_def.arguments, _BINDING_ARGUMENT_TYPES))
+
+        if not binding_def.source:
+            errors.append(f"{description} has no source, the default exchange cannot be bound.")
+        elif not exchange_exists(binding_def.source):
+            errors.append(f"{description} references the exchange '{binding_def.source}', which is not declared.")
+
+        if binding_def.destination_type == RabbitMqBindingType.EXCHANGE:
+            if not exchange_exists(binding_def.destination):
+                errors.append(
+                    f"{description} references the exchange '{binding_def.destination}', which is not declared."
+                )
+            elif binding_def.source:
+                exchange_edges.setdefault(binding_def.source, set()).add(binding_def.destination)
+        elif binding_def.destination not in queues:
+            errors.append(f"{description} references the queue '{binding_def.destination}', which is not declared.")
+    errors.extend(
+        f"{_describe_binding(first_bindings[key])} is declared more than once."
+        for key, count in binding_counts.items()
+        if count > 1
+    )
+
+    errors.extend(
+        "Exchange-to-exchange bindings form a cycle: {0}.".format(" -> ".join(cycle + [cycle[0]]))
+        for cycle in _find_cycles(exchange_edges)
+    )
+
+    return errors
+
+
+def duplicate_name_errors(kind: str, names: list[str]) -> list[str]:
+    """Reports every name declared more than once.
+
+    Args:
+        kind (str): The kind of entity named, e.g. "queue".
+        names (list[str]): The names, in declaration order.
+
+    Returns:
+        list[str]: One error per duplicated name, sorted by name.
+    """
+    return [
+        f"The {kind} '{name}' is declared more than once."
+        for name, count in sorted(Counter(names).items())
+        if count > 1
+    ]
+
+
+def _argument_errors(owner: str, arguments: dict, expected_types: dict[str, type]) -> list[str]:
+    errors = []
+    for name, value in arguments.items():
+        expected_type = expected_types.get(name)
+        if expected_type is None:
+            continue
+        # bool is a subclass of int, but the broker refuses true for a length
+        if not isinstance(value, expected_type) or (expected_type is int and isinstance(value, bool)):
+            errors.append(
+                f"{owner} argument '{name}' must be {_TYPE_NAMES[expected_type]}, got {type(value).__name__} {value!r}."
+            )
+    return errors
+
+
+def _describe_binding(binding_def: RabbitMqBinding) -> str:
+    return (
+        f"Binding from '{binding_def.source}' to {binding_def.destination_type.value} '{binding_def.destination}' "
+        f"with routing key '{binding_def.routing_key}'"
+        + (f" and arguments {binding_def.arguments}" if binding_def.arguments else "")
+    )
+
+
+def _find_cycles(edges: dict[str, set[str]]) -> list[list[str]]:
+    """Finds cycles of a directed graph with a depth-first walk, at least one per strongly connected part.
+
+    The walk keeps its own stack, so a chain of any length is walked without recursion. Each
+    cycle is reported once, starting from its smallest node.
+    """
+    cycles: list[list[str]] = []
+    seen_cycles: set[tuple[str, ...]] = set()
+    finished: set[str] = set()
+
+    for root in sorted(edges):
+        if root in finished:
+            continue
+
+        # The nodes being walked, each with the targets it has left to visit
+        path: list[str] = [root]
+        on_path: dict[str, int] = {root: 0}
+        stack: list[Iterator[str]] = [iter(sorted(edges.get(root, ())))]
+        while stack:
+            target = next(stack[-1], None)
+            if target is None:
+                stack.pop()
+                node = path.pop()
+                del on_path[node]
+                finished.add(node)
+            elif target in on_path:
+                cycle = path[on_path[target] :]
+                start = cycle.index(min(cycle))
+                normalized = tuple(cycle[start:] + cycle[:start])
+                if normalized not in seen_cycles:
+                    seen_cycles.add(normalized)
+                    cycles.append(list(normalized))
+            elif target not in finished:
+                on_path[target] = len(path)
+                path.append(target)
+                stack.append(iter(sorted(edges.get(target, ()))))
+
+    return cycles
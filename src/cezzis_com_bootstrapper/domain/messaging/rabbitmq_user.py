@@ -0,0 +1,34 @@
+import dataclasses
+from dataclasses import dataclass
+
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_topic_permission import RabbitMqTopicPermission
+
+
+@dataclass
+class RabbitMqUser:
+    """An application user of a vhost and the permissions it is granted there.
+
+    The password is never part of the configuration file, it is read from the setting named by
+    ``password_env``, in the environment or the .env files, before any vhost is reconciled.
+
+    Attributes:
+        username (str): The user name.
+        password_env (str): The setting holding the password.
+        tags (str): Comma separated user tags, e.g. "monitoring".
+        configure (str): The configure permission regex.
+        write (str): The write permission regex.
+        read (str): The read permission regex.
+        topic_permissions (list[RabbitMqTopicPermission]): The routing keys the user is limited to on topic exchanges.
+    """
+
+    username: str
+    password_env: str
+    tags: str = ""
+    configure: str = ".*"
+    write: str = ".*"
+    read: str = ".*"
+    topic_permissions: list[RabbitMqTopicPermission] = dataclasses.field(default_factory=list)
+
+    def permissions(self) -> dict[str, str]:
+        """Gets the permissions as the management API reports them."""
+        return {"configure": self.configure, "write": self.write, "read": self.read}
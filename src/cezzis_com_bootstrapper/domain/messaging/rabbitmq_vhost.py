@@ -0,0 +1,34 @@
+import dataclasses
+from dataclasses import dataclass
+
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding import RabbitMqBinding
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_exchange import RabbitMqExchange
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_policy import RabbitMqPolicy
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_queue import RabbitMqQueue
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_super_stream import RabbitMqSuperStream
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_user import RabbitMqUser
+
+
+@dataclass
+class RabbitMqVhost:
+    """A vhost reconciled alongside the default one, with its own users and topology.
+
+    Attributes:
+        name (str): The vhost name.
+        users (list[RabbitMqUser]): The users granted permissions on the vhost, every other user is removed.
+        exchanges (list[RabbitMqExchange]): The exchanges of the vhost.
+        queues (list[RabbitMqQueue]): The queues of the vhost.
+        bindings (list[RabbitMqBinding]): The bindings of the vhost.
+        policies (list[RabbitMqPolicy]): The policies of the vhost.
+        operator_policies (list[RabbitMqPolicy]): The operator policies of the vhost.
+        super_streams (list[RabbitMqSuperStream]): The super streams of the vhost.
+    """
+
+    name: str
+    users: list[RabbitMqUser] = dataclasses.field(default_factory=list)
+    exchanges: list[RabbitMqExchange] = dataclasses.field(default_factory=list)
+    queues: list[RabbitMqQueue] = dataclasses.field(default_factory=list)
+    bindings: list[RabbitMqBinding] = dataclasses.field(default_factory=list)
+    policies: list[RabbitMqPolicy] = dataclasses.field(default_factory=list)
+    operator_policies: list[RabbitMqPolicy] = dataclasses.field(default_factory=list)
+    super_streams: list[RabbitMqSuperStream] = dataclasses.field(default_factory=list)
@@ -0,0 +1,4 @@
+from cezzis_com_bootstrapper.domain.planning.change_set import ChangeSet
+from cezzis_com_bootstrapper.domain.planning.planned_change import PlannedChange
+
+__all__ = ["ChangeSet", "PlannedChange"]
@@ -0,0 +1,52 @@
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from cezzis_com_bootstrapper.domain.planning.planned_change import PlannedChange
+
+
+@dataclass
+class ChangeSet:
+    """Every change a run would make, per concern.
+
+    Attributes:
+        concerns (dict[str, list[PlannedChange]]): The planned changes per concern name, in the order they would be made.
+    """
+
+    concerns: dict[str, list[PlannedChange]] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(len(changes) for changes in self.concerns.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        """Builds the change set document.
+
+        Returns:
+            dict[str, Any]: The change set, ready to be serialized to JSON.
+        """
+        summary: dict[str, int] = {}
+        for changes in self.concerns.values():
+            for change in changes:
+                summary[change.action] = summary.get(change.action, 0) + 1
+
+        return {
+            "changes": self.total,
+            "summary": summary,
+            "concerns": {name: [asdict(change) for change in changes] for name, changes in self.concerns.items()},
+        }
+
+    def write(self, path: str) -> None:
+        """Writes the change set as JSON.
+
+        Args:
+            path (str): The file to write, or "-" for stdout.
+        """
+        content = json.dumps(self.to_dict(), indent=2)
+        if path == "-":
+            sys.stdout.write(content + "\n")
+            sys.stdout.flush()
+        else:
+            Path(path).write_text(content + "\n")
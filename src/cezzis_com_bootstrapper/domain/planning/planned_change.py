@@ -0,0 +1,21 @@
+import dataclasses
+from dataclasses import dataclass
+
+
+@dataclass
+class PlannedChange:
+    """A change the bootstrapper would make to bring a resource to its desired state.
+
+    Attributes:
+        kind (str): The kind of resource, e.g. "exchange".
+        name (str): The resource name.
+        action (str): One of "create", "update", "delete", "recreate" or "drift", the last for a resource
+            differing from its definition that is left as is.
+        details (dict): The desired properties of a created or updated resource, or the differences of a
+            recreated or drifted one.
+    """
+
+    kind: str
+    name: str
+    action: str
+    details: dict = dataclasses.field(default_factory=dict)
@@ -0,0 +1,3 @@
+from cezzis_com_bootstrapper.infrastructure.checkpoints.checkpoint_journal import CheckpointJournal, compute_spec_hash
+
+__all__ = ["CheckpointJournal", "compute_spec_hash"]
@@ -0,0 +1,133 @@
+import hashlib
+import json
+import logging
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+
+def compute_spec_hash(*parts: Any) -> str:
+    """Hashes the desired state a run applies, so a journal can tell whether it still matches.
+
+    Args:
+        *parts (Any): JSON serializable values, dataclasses and enums included.
+
+    Returns:
+        str: The hex sha256 of the canonical JSON form of the parts.
+    """
+    content = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=_encode)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class CheckpointJournal:
+    """Append-only journal of the steps a run completed, used to resume the next run after a failure.
+
+    The first line holds the hash of the desired state the steps applied, every other line one
+    completed step. Appending keeps the cost of a checkpoint constant however many steps a run
+    has. A journal written for another desired state is discarded when opened, and a run that
+    completes clears its journal so the next run checks everything again.
+
+    Attributes:
+        path (Path | None): The journal file, None when checkpoints are turned off.
+        resumed_steps (int): Steps completed by a previous run and skipped by this one.
+    """
+
+    def __init__(self, path: str | Path | None):
+        self.path = Path(path) if path else None
+        self.resumed_steps = 0
+        self.logger = logging.getLogger("checkpoint_journal")
+        self._completed: set[str] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return self.path is not None
+
+    def open(self, spec_hash: str) -> None:
+        """Loads the steps completed for a desired state, discarding a journal written for another one.
+
+        Args:
+            spec_hash (str): The hash of the desired state this run applies.
+        """
+        self._completed = set()
+        self.resumed_steps = 0
+        if self.path is None:
+            return
+
+        journal_hash, completed = self._read()
+        if journal_hash == spec_hash and completed:
+            self._completed = completed
+            self.resumed_steps = len(completed)
+            self.logger.info(
+                f"Resuming from checkpoint, {self.resumed_steps} steps already completed",
+                extra={"checkpoint_journal": str(self.path), "resumed_steps": self.resumed_steps},
+            )
+            return
+
+        if journal_hash is not None and journal_hash != spec_hash:
+            self.logger.info(
+                "Spec changed since the last checkpoint, starting over",
+                extra={"checkpoint_journal": str(self.path)},
+            )
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("w", encoding="utf-8") as file:
+            file.write(json.dumps({"spec_hash": spec_hash}) + "\n")
+
+    def is_completed(self, step: str) -> bool:
+        """Checks whether a previous run already completed a step for the same desired state.
+
+        Args:
+            step (str): The step name, e.g. "exchange:orders".
+
+        Returns:
+            bool: True when the step can be skipped.
+        """
+        return step in self._completed
+
+    def complete(self, step: str) -> None:
+        """Records a completed step.
+
+        Args:
+            step (str): The step name.
+        """
+        self._completed.add(step)
+        if self.path is None:
+            return
+
+        with self.path.open("a", encoding="utf-8") as file:
+            file.write(json.dumps({"step": step, "completed_at": datetime.now(timezone.utc).isoformat()}) + "\n")
+
+    def clear(self) -> None:
+        """Removes the journal once every step completed."""
+        self._completed = set()
+        if self.path is not None:
+            self.path.unlink(missing_ok=True)
+
+    def _read(self) -> tuple[str | None, set[str]]:
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return None, set()
+
+        journal_hash = None
+        completed: set[str] = set()
+        for index, line in enumerate(lines):
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # The run that wrote the journal may have died in the middle of a line
+                continue
+            if index == 0:
+                journal_hash = entry.get("spec_hash")
+            elif "step" in entry:
+                completed.add(entry["step"])
+        return journal_hash, completed
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, "__dataclass_fields__"):
+        return {name: getattr(value, name) for name in value.__dataclass_fields__}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,4 @@
+from cezzis_com_bootstrapper.infrastructure.flow_control.adaptive_limiter import AdaptiveConcurrencyLimiter
+from cezzis_com_bootstrapper.infrastructure.flow_control.token_bucket import TokenBucket
+
+__all__ = ["AdaptiveConcurrencyLimiter", "TokenBucket"]
@@ -0,0 +1,115 @@
+import asyncio
+import collections
+import math
+import time
+
+# Latencies under this are never taken for congestion, the jitter of a fast broker would halve the limit for nothing
+_MIN_CONGESTED_LATENCY_SECONDS = 0.05
+# How far the baseline moves towards each slower latency, so it follows a server that got slower for good
+_BASELINE_ADAPTATION = 0.05
+
+
+class AdaptiveConcurrencyLimiter:
+    """Caps the requests in flight, adapting the cap to how the server copes with additive increase, multiplicative decrease.
+
+    Every request completing in time raises the limit by 1 / limit, so a whole window of them adds
+    one slot. A request answered with an overload status, or taking longer than ``latency_tolerance``
+    times the fastest recent request of its kind, multiplies the limit by ``decrease_factor``. The
+    requests already in flight when the limit drops saw the same congestion, so the limit drops at
+    most once per window. Waiters are served in arrival order.
+
+    Attributes:
+        limit (float): The current limit, requests start while fewer than ``floor(limit)`` are in flight.
+        in_flight (int): The requests holding a slot.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        initial_limit: int | None = None,
+        min_limit: int = 1,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+    ):
+        """Initializes the limiter.
+
+        Args:
+            max_limit (int): The most requests ever in flight.
+            initial_limit (int | None, optional): The limit to start from. Defaults to ``max_limit``.
+            min_limit (int, optional): The fewest requests allowed in flight however congested the server is.
+                Defaults to 1.
+            decrease_factor (float, optional): What the limit is multiplied by on congestion. Defaults to 0.5.
+            latency_tolerance (float, optional): How many times slower than the baseline a request may be
+                before it counts as congestion. Defaults to 2.0.
+        """
+        self.max_limit = max_limit
+        self.min_limit = min(min_limit, max_limit)
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.limit = float(initial_limit if initial_limit is not None else max_limit)
+        self.in_flight = 0
+        self._waiters: collections.deque[asyncio.Future[None]] = collections.deque()
+        self._baselines: dict[str, float] = {}
+        self._last_decrease = -math.inf
+
+    async def acquire(self) -> float:
+        """Waits for a free slot and takes it.
+
+        Returns:
+            float: The time the request started, to pass to ``release``.
+        """
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return time.monotonic()
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over as the wait was cancelled, pass it on
+                self.in_flight -= 1
+                self._wake_waiters()
+            elif waiter in self._waiters:
+                # A release between the cancel and this resuming has already dropped the cancelled waiter
+                self._waiters.remove(waiter)
+            raise
+        return time.monotonic()
+
+    def release(self, started: float, kind: str = "", overloaded: bool = False, observe: bool = True) -> None:
+        """Frees the slot of a finished request and adapts the limit to how it went.
+
+        Args:
+            started (float): The time returned by ``acquire``.
+            kind (str, optional): The kind of request, e.g. the HTTP method. Latencies are only compared
+                between requests of the same kind.
+            overloaded (bool, optional): Whether the server answered that it is overloaded, e.g. with a 503.
+            observe (bool, optional): False when the request failed without an answer, e.g. on a refused
+                connection, which says nothing of the server load.
+        """
+        self.in_flight -= 1
+        if observe:
+            latency = time.monotonic() - started
+            if overloaded or self._is_congested(kind, latency):
+                if started >= self._last_decrease:
+                    self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+                    self._last_decrease = time.monotonic()
+            else:
+                self.limit = min(float(self.max_limit), self.limit + 1 / self.limit)
+        self._wake_waiters()
+
+    def _is_congested(self, kind: str, latency: float) -> bool:
+        baseline = self._baselines.get(kind)
+        if baseline is None or latency <= baseline:
+            self._baselines[kind] = latency
+            return False
+        self._baselines[kind] = baseline + (latency - baseline) * _BASELINE_ADAPTATION
+        return latency > max(baseline * self.latency_tolerance, _MIN_CONGESTED_LATENCY_SECONDS)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
@@ -0,0 +1,41 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Caps a request rate, letting bursts of up to ``capacity`` requests through at once.
+
+    The bucket refills at ``rate`` tokens per second up to its capacity and every request takes a
+    token, waiting for one when the bucket is empty. Waiters are served in arrival order.
+
+    Attributes:
+        rate (float): The tokens added per second, the sustained request rate.
+        capacity (float): The most tokens the bucket holds, the largest burst.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        """Initializes a full bucket.
+
+        Args:
+            rate (float): The requests allowed per second.
+            capacity (float | None, optional): The largest burst. Defaults to one second of requests, at least one.
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Takes a token, waiting until one is available."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
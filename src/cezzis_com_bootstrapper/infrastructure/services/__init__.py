@@ -1,9 +1,36 @@
-from cezzis_com_bootstrapper.infrastructure.services.azure_blob_service import AzureBlobService
-from cezzis_com_bootstrapper.infrastructure.services.iazure_blob_service import IAzureBlobService
-from cezzis_com_bootstrapper.infrastructure.services.ikafka_service import IKafkaService
-from cezzis_com_bootstrapper.infrastructure.services.irabbitmq_admin_service import IRabbitMqAdminService
-from cezzis_com_bootstrapper.infrastructure.services.kafka_service import KafkaService
-from cezzis_com_bootstrapper.infrastructure.services.rabbitmq_admin_service import RabbitMqAdminService
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cezzis_com_bootstrapper.infrastructure.services.azure_blob_service import AzureBlobService
+    from cezzis_com_bootstrapper.infrastructure.services.iazure_blob_service import IAzureBlobService
+    from cezzis_com_bootstrapper.infrastructure.services.ikafka_service import IKafkaService
+    from cezzis_com_bootstrapper.infrastructure.services.irabbitmq_admin_service import IRabbitMqAdminService
+    from cezzis_com_bootstrapper.infrastructure.services.kafka_service import KafkaService
+    from cezzis_com_bootstrapper.infrastructure.services.rabbitmq_admin_service import RabbitMqAdminService
+    from cezzis_com_bootstrapper.infrastructure.services.rabbitmq_amqp_service import RabbitMqAmqpService
+
+# Services are resolved on first access so that a concern's SDK (confluent_kafka,
+# azure.storage.blob, aiohttp, ...) is only imported when the concern is enabled.
+_LAZY_EXPORTS = {
+    "IAzureBlobService": f"{__name__}.iazure_blob_service",
+    "AzureBlobService": f"{__name__}.azure_blob_service",
+    "IKafkaService": f"{__name__}.ikafka_service",
+    "KafkaService": f"{__name__}.kafka_service",
+    "IRabbitMqAdminService": f"{__name__}.irabbitmq_admin_service",
+    "RabbitMqAdminService": f"{__name__}.rabbitmq_admin_service",
+    "RabbitMqAmqpService": f"{__name__}.rabbitmq_amqp_service",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "IAzureBlobService",
@@ -12,4 +39,5 @@ __all__ = [
     "KafkaService",
     "IRabbitMqAdminService",
     "RabbitMqAdminService",
+    "RabbitMqAmqpService",
 ]
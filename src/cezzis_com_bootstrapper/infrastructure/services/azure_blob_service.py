@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from azure.storage.blob import BlobServiceClient, PublicAccess
@@ -5,6 +6,11 @@ from injector import inject
 
 from cezzis_com_bootstrapper.domain.config import AzureStorageOptions
 from cezzis_com_bootstrapper.infrastructure.services.iazure_blob_service import IAzureBlobService
+from cezzis_com_bootstrapper.infrastructure.telemetry import EntityAction, get_bootstrapper_metrics, trace_operation
+
+_CONCERN = "blob_storage"
+_METRICS_API = "azure_blob"
+_PROBE_TIMEOUT_SECONDS = 5
 
 
 class AzureBlobService(IAzureBlobService):
@@ -15,6 +21,8 @@ class AzureBlobService(IAzureBlobService):
         self._connection_string = azure_storage_options.connection_string
         self._container_name = azure_storage_options.account_avatars_container_name
         self.logger = logging.getLogger("azure_blob_service")
+        self._blob_service_client: BlobServiceClient | None = None
+        self.metrics = get_bootstrapper_metrics()
 
     async def create_container(self, container_name: str) -> None:
         """Create a container in Azure Blob Storage.
@@ -23,20 +31,86 @@ class AzureBlobService(IAzureBlobService):
             container_name (str): The name of the container to create.
         """
 
-        blob_service_client = BlobServiceClient.from_connection_string(self._connection_string)
-        container_client = blob_service_client.get_container_client(container_name)
+        with trace_operation(
+            _CONCERN,
+            "create_container",
+            kind="container",
+            entity=container_name,
+            attributes={"azure.storage.container": container_name},
+        ) as operation:
+            container_client = self._get_blob_service_client().get_container_client(container_name)
+
+            try:
+                with self.metrics.time_api_call(_METRICS_API, "container_exists"):
+                    container_exists = container_client.exists()
 
-        try:
-            if not container_client.exists():
-                container_client.create_container(public_access=PublicAccess.CONTAINER)
-                self.logger.info(f"Container '{container_name}' created successfully.")
-            else:
-                container_client.set_container_access_policy(
-                    signed_identifiers={}, public_access=PublicAccess.CONTAINER
+                if not container_exists:
+                    with self.metrics.time_api_call(_METRICS_API, "create_container"):
+                        container_client.create_container(public_access=PublicAccess.CONTAINER)
+                    operation.record(EntityAction.CREATED)
+                    self.logger.info(f"Container '{container_name}' created successfully.")
+                else:
+                    with self.metrics.time_api_call(_METRICS_API, "set_container_access_policy"):
+                        container_client.set_container_access_policy(
+                            signed_identifiers={}, public_access=PublicAccess.CONTAINER
+                        )
+                    operation.record(EntityAction.UPDATED)
+                    self.logger.info(f"Container '{container_name}' already exists. Access policy updated to public.")
+            except Exception as e:
+                self.logger.exception(
+                    f"Failed to create or update container '{container_name}'", extra={"error": str(e)}
                 )
-                self.logger.info(f"Container '{container_name}' already exists. Access policy updated to public.")
-        except Exception as e:
-            self.logger.exception(f"Failed to create or update container '{container_name}'", extra={"error": str(e)})
-            raise
-        finally:
-            pass
+                raise
+            finally:
+                pass
+
+    async def list_containers(self) -> dict[str, str | None]:
+        """List the containers with a single listing request, without changing anything.
+
+        Returns:
+            dict[str, str | None]: The public access level per container name, None for private containers.
+        """
+        with (
+            trace_operation(_CONCERN, "list_containers", kind="container"),
+            self.metrics.time_api_call(_METRICS_API, "list_containers"),
+        ):
+            return await asyncio.to_thread(
+                lambda: {
+                    container.name: container.public_access
+                    for container in self._get_blob_service_client().list_containers()
+                }
+            )
+
+    async def probe(self) -> None:
+        """Checks that the blob service answers, raising when it does not.
+
+        The SDK's own retries are turned off, the caller decides when to probe again.
+
+        Raises:
+            azure.core.exceptions.AzureError: If the blob service is unreachable or answers with an error.
+        """
+        with (
+            trace_operation(_CONCERN, "probe"),
+            self.metrics.time_api_call(_METRICS_API, "get_service_properties"),
+        ):
+            await asyncio.to_thread(
+                self._get_blob_service_client().get_service_properties,
+                timeout=_PROBE_TIMEOUT_SECONDS,
+                retry_total=0,
+            )
+
+    async def close(self) -> None:
+        """Closes the pooled blob service connections."""
+        if self._blob_service_client is not None:
+            self._blob_service_client.close()
+        self._blob_service_client = None
+
+    def _get_blob_service_client(self) -> BlobServiceClient:
+        """Gets the blob service client, creating it on first use so connections stay warm between calls.
+
+        Returns:
+            BlobServiceClient: The blob service client.
+        """
+        if self._blob_service_client is None:
+            self._blob_service_client = BlobServiceClient.from_connection_string(self._connection_string)
+        return self._blob_service_client
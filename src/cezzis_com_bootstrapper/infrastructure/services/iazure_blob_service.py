@@ -5,3 +5,15 @@ class IAzureBlobService(ABC):
     @abstractmethod
     async def create_container(self, container_name: str) -> None:
         pass
+
+    @abstractmethod
+    async def list_containers(self) -> dict[str, str | None]:
+        pass
+
+    @abstractmethod
+    async def probe(self) -> None:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
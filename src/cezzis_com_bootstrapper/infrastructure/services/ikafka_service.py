@@ -5,3 +5,29 @@ class IKafkaService(ABC):
     @abstractmethod
     async def create_topic(self, topic_name: str, num_partitions: int | None = None) -> None:
         pass
+
+    @abstractmethod
+    async def create_topics(self, topics: dict[str, int | None]) -> None:
+        pass
+
+    @abstractmethod
+    async def alter_topic_configs(self, topic_configs: dict[str, dict[str, str]]) -> None:
+        pass
+
+    @abstractmethod
+    async def wait_for_topics_ready(
+        self, topic_names: list[str], timeout_seconds: float, poll_interval_seconds: float = 0.5
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def list_topic_partitions(self) -> dict[str, int]:
+        pass
+
+    @abstractmethod
+    async def probe(self) -> None:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
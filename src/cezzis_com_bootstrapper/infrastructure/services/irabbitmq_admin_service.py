@@ -1,8 +1,14 @@
 from abc import ABC, abstractmethod
+from typing import AsyncIterator
 
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding import RabbitMqBinding
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_configuration import RabbitMqConfiguration
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_drift import RabbitMqDriftStrategy
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_exchange import RabbitMqExchange
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_policy import RabbitMqPolicy
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_queue import RabbitMqQueue
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_snapshot import RabbitMqSnapshot
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_user import RabbitMqUser
 
 
 class IRabbitMqAdminService(ABC):
@@ -80,6 +86,38 @@ class IRabbitMqAdminService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_users_if_not_exist(self, user_defs: list[RabbitMqUser], passwords: dict[str, str]) -> None:
+        """Creates the missing RabbitMQ users of a list.
+
+        Args:
+            user_defs (list[RabbitMqUser]): The definitions of the users.
+            passwords (dict[str, str]): The password of each user, by user name.
+
+        """
+        pass
+
+    @abstractmethod
+    async def reconcile_vhost_permissions(self, vhost: str, user_defs: list[RabbitMqUser]) -> None:
+        """Grants each user its permissions and topic permissions on a vhost and revokes those of every other user.
+
+        Args:
+            vhost (str): The name of the virtual host.
+            user_defs (list[RabbitMqUser]): The users of the virtual host.
+
+        """
+        pass
+
+    @abstractmethod
+    async def delete_users(self, usernames: list[str]) -> None:
+        """Deletes RabbitMQ users in a single request.
+
+        Args:
+            usernames (list[str]): The names of the users to delete.
+
+        """
+        pass
+
     @abstractmethod
     async def list_exchanges_in_vhost(self, vhost: str) -> list[str]:
         """Lists all exchanges in a specific virtual host.
@@ -94,12 +132,50 @@ class IRabbitMqAdminService(ABC):
         pass
 
     @abstractmethod
-    async def create_exchange_if_not_exists(self, vhost: str, exchange_def) -> None:
+    def iter_exchanges_in_vhost(self, vhost: str) -> AsyncIterator[str]:
+        """Streams the exchanges of a specific virtual host, excluding those starting with 'amq.' and empty names.
+
+        Args:
+            vhost (str): The name of the virtual host.
+
+        Yields:
+            str: The name of each exchange in the virtual host.
+
+        """
+        pass
+
+    @abstractmethod
+    async def create_exchange_if_not_exists(
+        self, vhost: str, exchange_def, drift_strategy: RabbitMqDriftStrategy = RabbitMqDriftStrategy.REPORT
+    ) -> None:
         """Creates an exchange in a specific virtual host.
 
         Args:
             vhost (str): The name of the virtual host.
             exchange_def (RabbitMqExchange): The definition of the exchange to create.
+            drift_strategy (RabbitMqDriftStrategy, optional): What to do when the exchange exists with other
+                properties. Defaults to reporting them.
+
+        """
+        pass
+
+    @abstractmethod
+    async def create_exchanges_if_not_exist(
+        self,
+        vhost: str,
+        exchange_defs: list[RabbitMqExchange],
+        drift_strategy: RabbitMqDriftStrategy = RabbitMqDriftStrategy.REPORT,
+    ) -> None:
+        """Creates the exchanges missing from a specific virtual host, listing the virtual host once.
+
+        Existing exchanges are compared with their definition, and the differences are reported or
+        applied according to the drift strategy.
+
+        Args:
+            vhost (str): The name of the virtual host.
+            exchange_defs (list[RabbitMqExchange]): The definitions of the exchanges to create.
+            drift_strategy (RabbitMqDriftStrategy, optional): What to do with existing exchanges that differ
+                from their definition. Defaults to reporting them.
 
         """
         pass
@@ -128,6 +204,19 @@ class IRabbitMqAdminService(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_queues_in_vhost(self, vhost: str) -> AsyncIterator[str]:
+        """Streams the queues of a specific virtual host.
+
+        Args:
+            vhost (str): The name of the virtual host.
+
+        Yields:
+            str: The name of each queue in the virtual host.
+
+        """
+        pass
+
     @abstractmethod
     async def create_queue_for_vhost(self, vhost: str, queue_def: RabbitMqQueue) -> None:
         """Creates a queue in a specific virtual host.
@@ -140,12 +229,40 @@ class IRabbitMqAdminService(ABC):
         pass
 
     @abstractmethod
-    async def create_queue_if_not_exists(self, vhost: str, queue_def: RabbitMqQueue) -> None:
+    async def create_queue_if_not_exists(
+        self,
+        vhost: str,
+        queue_def: RabbitMqQueue,
+        drift_strategy: RabbitMqDriftStrategy = RabbitMqDriftStrategy.REPORT,
+    ) -> None:
         """Creates a queue in a specific virtual host if it does not already exist.
 
         Args:
             vhost (str): The name of the virtual host.
             queue_def (RabbitMqQueue): The definition of the queue to create.
+            drift_strategy (RabbitMqDriftStrategy, optional): What to do when the queue exists with other
+                properties. Defaults to reporting them.
+
+        """
+        pass
+
+    @abstractmethod
+    async def create_queues_if_not_exist(
+        self,
+        vhost: str,
+        queue_defs: list[RabbitMqQueue],
+        drift_strategy: RabbitMqDriftStrategy = RabbitMqDriftStrategy.REPORT,
+    ) -> None:
+        """Creates the queues missing from a specific virtual host, listing the virtual host once.
+
+        Existing queues are compared with their definition, and the differences are reported or
+        applied according to the drift strategy.
+
+        Args:
+            vhost (str): The name of the virtual host.
+            queue_defs (list[RabbitMqQueue]): The definitions of the queues to create.
+            drift_strategy (RabbitMqDriftStrategy, optional): What to do with existing queues that differ
+                from their definition. Defaults to reporting them.
 
         """
         pass
@@ -174,6 +291,19 @@ class IRabbitMqAdminService(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_bindings_in_vhost(self, vhost: str) -> AsyncIterator[RabbitMqBinding]:
+        """Streams the bindings of a specific virtual host.
+
+        Args:
+            vhost (str): The name of the virtual host.
+
+        Yields:
+            RabbitMqBinding: Each binding in the virtual host.
+
+        """
+        pass
+
     @abstractmethod
     async def create_binding_if_not_exists(self, vhost: str, binding_def: RabbitMqBinding) -> None:
         """Creates a binding in a specific virtual host if it does not already exist.
@@ -185,6 +315,17 @@ class IRabbitMqAdminService(ABC):
         """
         pass
 
+    @abstractmethod
+    async def create_bindings_if_not_exist(self, vhost: str, binding_defs: list[RabbitMqBinding]) -> None:
+        """Creates the bindings missing from a specific virtual host, listing the virtual host once.
+
+        Args:
+            vhost (str): The name of the virtual host.
+            binding_defs (list[RabbitMqBinding]): The definitions of the bindings to create.
+
+        """
+        pass
+
     @abstractmethod
     async def delete_binding_from_vhost(self, vhost: str, binding_def: RabbitMqBinding) -> None:
         """Deletes a binding from a specific virtual host.
@@ -195,3 +336,79 @@ class IRabbitMqAdminService(ABC):
 
         """
         pass
+
+    @abstractmethod
+    async def list_policies(self, vhost: str, operator: bool = False) -> list[RabbitMqPolicy]:
+        """Lists the policies, or the operator policies, of a specific virtual host.
+
+        Args:
+            vhost (str): The name of the virtual host.
+            operator (bool, optional): Whether to list operator policies. Defaults to False.
+
+        Returns:
+            list[RabbitMqPolicy]: The policies of the virtual host.
+
+        """
+        pass
+
+    @abstractmethod
+    async def create_or_update_policies(
+        self, vhost: str, policy_defs: list[RabbitMqPolicy], operator: bool = False
+    ) -> None:
+        """Creates the missing policies of a virtual host and updates the changed ones, listing them once.
+
+        Args:
+            vhost (str): The name of the virtual host.
+            policy_defs (list[RabbitMqPolicy]): The definitions of the policies.
+            operator (bool, optional): Whether the definitions are operator policies. Defaults to False.
+
+        """
+        pass
+
+    @abstractmethod
+    async def delete_policy(self, vhost: str, policy_name: str, operator: bool = False) -> None:
+        """Deletes a policy, or an operator policy, from a specific virtual host.
+
+        Args:
+            vhost (str): The name of the virtual host.
+            policy_name (str): The name of the policy to delete.
+            operator (bool, optional): Whether the policy is an operator policy. Defaults to False.
+
+        """
+        pass
+
+    @abstractmethod
+    async def get_snapshot(self, vhost: str) -> RabbitMqSnapshot:
+        """Reads the state of a vhost without changing anything.
+
+        Args:
+            vhost (str): The name of the virtual host.
+
+        Returns:
+            RabbitMqSnapshot: The vhost state, filtered like the list methods filter it.
+
+        """
+        pass
+
+    @abstractmethod
+    async def export_configuration(self, vhost: str) -> RabbitMqConfiguration:
+        """Reads the topology and policies of a vhost as a configuration that can be reconciled back.
+
+        Args:
+            vhost (str): The name of the virtual host.
+
+        Returns:
+            RabbitMqConfiguration: The exchanges, queues, bindings and policies of the vhost.
+
+        """
+        pass
+
+    @abstractmethod
+    async def probe(self) -> None:
+        """Checks that the management API answers, raising when it does not."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Closes the pooled connections to the broker."""
+        pass
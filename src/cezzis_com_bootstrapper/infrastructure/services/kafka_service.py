@@ -1,16 +1,31 @@
 import asyncio
 import logging
+import time
 
-from confluent_kafka.admin import AdminClient, NewTopic
+from confluent_kafka import KafkaError, KafkaException
+from confluent_kafka.admin import (
+    AdminClient,
+    AlterConfigOpType,
+    ConfigEntry,
+    ConfigResource,
+    NewTopic,
+    ResourceType,
+    TopicMetadata,
+)
 from injector import inject
 
 from cezzis_com_bootstrapper.domain.config import KafkaOptions
 from cezzis_com_bootstrapper.infrastructure.services.ikafka_service import IKafkaService
+from cezzis_com_bootstrapper.infrastructure.telemetry import EntityAction, get_bootstrapper_metrics, trace_operation
 
 _KAFKA_TIMEOUT_SECONDS = 30
 _KAFKA_SOCKET_TIMEOUT_MS = 120000
 _KAFKA_REQUEST_TIMEOUT_MS = 120000
 _KAFKA_METADATA_MAX_AGE_MS = 120000
+_KAFKA_READY_POLL_INTERVAL_SECONDS = 0.5
+_KAFKA_PROBE_TIMEOUT_SECONDS = 5
+_CONCERN = "kafka"
+_METRICS_API = "kafka_admin"
 
 
 class KafkaService(IKafkaService):
@@ -18,9 +33,234 @@ class KafkaService(IKafkaService):
     def __init__(self, kafka_options: KafkaOptions) -> None:
         self.kafka_options = kafka_options
         self.logger = logging.getLogger("kafka_service")
+        self._admin_client: AdminClient | None = None
+        self.metrics = get_bootstrapper_metrics()
 
     async def create_topic(self, topic_name: str, num_partitions: int | None = None) -> None:
-        admin_client = AdminClient(
+        with trace_operation(
+            _CONCERN, "create_topic", kind="topic", entity=topic_name, attributes={"kafka.topic": topic_name}
+        ) as operation:
+            admin_client = self._get_admin_client()
+
+            if num_partitions is None:
+                num_partitions = self.kafka_options.default_topic_partitions
+
+            existing_topics = await self._list_topics(admin_client)
+
+            if topic_name in existing_topics:
+                self.logger.info(f"Topic {topic_name} already exists. Skipping creation.")
+                operation.record(EntityAction.SKIPPED)
+                return
+
+            topics = [NewTopic(topic=topic_name, num_partitions=num_partitions)]
+            operation.span.set_attribute("kafka.topic.partitions", num_partitions)
+
+            with self.metrics.time_api_call(_METRICS_API, "create_topics"):
+                futures = await asyncio.to_thread(
+                    admin_client.create_topics, topics, operation_timeout=_KAFKA_TIMEOUT_SECONDS
+                )
+
+                for topic, future in futures.items():
+                    try:
+                        future.result()
+                    except Exception:
+                        self.logger.exception(f"Failed to create topic {topic}")
+                        raise
+
+            operation.record(EntityAction.CREATED)
+
+    async def create_topics(self, topics: dict[str, int | None]) -> None:
+        """Creates every missing topic with one metadata request and one batched CreateTopics request.
+
+        Args:
+            topics (dict[str, int | None]): The partition count per topic name, None for the default count.
+
+        Raises:
+            KafkaException: If a topic could not be created, after every other topic of the batch completed.
+        """
+        with trace_operation(
+            _CONCERN, "create_topics", kind="topic", attributes={"kafka.topics.requested": len(topics)}
+        ) as operation:
+            admin_client = self._get_admin_client()
+            existing_topics = await self._list_topics(admin_client)
+
+            new_topics: list[NewTopic] = []
+            for topic_name, num_partitions in topics.items():
+                if topic_name in existing_topics:
+                    self.logger.info(f"Topic {topic_name} already exists. Skipping creation.")
+                    operation.record(EntityAction.SKIPPED, entity=topic_name)
+                else:
+                    new_topics.append(
+                        NewTopic(
+                            topic=topic_name,
+                            num_partitions=num_partitions or self.kafka_options.default_topic_partitions,
+                        )
+                    )
+
+            operation.span.set_attribute("kafka.topics.created", len(new_topics))
+            if not new_topics:
+                return
+
+            with self.metrics.time_api_call(_METRICS_API, "create_topics"):
+                futures = await asyncio.to_thread(
+                    admin_client.create_topics, new_topics, operation_timeout=_KAFKA_TIMEOUT_SECONDS
+                )
+                results = await asyncio.gather(
+                    *(asyncio.wrap_future(future) for future in futures.values()), return_exceptions=True
+                )
+
+            errors: list[BaseException] = []
+            for topic, result in zip(futures, results, strict=True):
+                if not isinstance(result, BaseException):
+                    operation.record(EntityAction.CREATED, entity=topic)
+                elif _is_kafka_error(result, KafkaError.TOPIC_ALREADY_EXISTS):
+                    # Created concurrently since the metadata request
+                    self.logger.info(f"Topic {topic} already exists. Skipping creation.")
+                    operation.record(EntityAction.SKIPPED, entity=topic)
+                else:
+                    self.logger.error(f"Failed to create topic {topic}", exc_info=result)
+                    operation.record(EntityAction.FAILED, entity=topic)
+                    errors.append(result)
+
+            if errors:
+                raise errors[0]
+
+    async def alter_topic_configs(self, topic_configs: dict[str, dict[str, str]]) -> None:
+        """Sets the given configs on existing topics, altering only the topics whose configs differ.
+
+        The current configs of every topic are described in one request and the changes are applied in one
+        incremental alter request, configs that are not listed keep their current value.
+
+        Args:
+            topic_configs (dict[str, dict[str, str]]): The configs to set per topic name, e.g.
+                {"orders": {"retention.ms": "86400000"}}.
+
+        Raises:
+            KafkaException: If the configs of a topic could not be described or altered.
+        """
+        with trace_operation(
+            _CONCERN, "alter_topic_configs", kind="topic", attributes={"kafka.topics.requested": len(topic_configs)}
+        ) as operation:
+            if not topic_configs:
+                return
+
+            admin_client = self._get_admin_client()
+            resources = [ConfigResource(ResourceType.TOPIC, topic_name) for topic_name in topic_configs]
+
+            with self.metrics.time_api_call(_METRICS_API, "describe_configs"):
+                futures = await asyncio.to_thread(
+                    admin_client.describe_configs, resources, request_timeout=_KAFKA_TIMEOUT_SECONDS
+                )
+                described = await asyncio.gather(*(asyncio.wrap_future(future) for future in futures.values()))
+
+            changes: list[ConfigResource] = []
+            for resource, current in zip(futures, described, strict=True):
+                entries = [
+                    ConfigEntry(name, value, incremental_operation=AlterConfigOpType.SET)
+                    for name, value in topic_configs[resource.name].items()
+                    if name not in current or current[name].value != value
+                ]
+                if entries:
+                    self.logger.info(f"Updating configs {[entry.name for entry in entries]} of topic {resource.name}")
+                    changes.append(ConfigResource(ResourceType.TOPIC, resource.name, incremental_configs=entries))
+                else:
+                    operation.record(EntityAction.SKIPPED, entity=resource.name)
+
+            operation.span.set_attribute("kafka.topics.updated", len(changes))
+            if not changes:
+                return
+
+            with self.metrics.time_api_call(_METRICS_API, "incremental_alter_configs"):
+                futures = await asyncio.to_thread(
+                    admin_client.incremental_alter_configs, changes, request_timeout=_KAFKA_TIMEOUT_SECONDS
+                )
+                await asyncio.gather(*(asyncio.wrap_future(future) for future in futures.values()))
+
+            for change in changes:
+                operation.record(EntityAction.UPDATED, entity=change.name)
+
+    async def wait_for_topics_ready(
+        self,
+        topic_names: list[str],
+        timeout_seconds: float,
+        poll_interval_seconds: float = _KAFKA_READY_POLL_INTERVAL_SECONDS,
+    ) -> None:
+        """Polls the cluster metadata until every partition of the topics has a leader.
+
+        Args:
+            topic_names (list[str]): The topics to wait for.
+            timeout_seconds (float): How long to wait before giving up.
+            poll_interval_seconds (float, optional): Delay between two metadata requests. Defaults to 0.5.
+
+        Raises:
+            TimeoutError: If a topic is still missing or has a partition without leader after the timeout.
+        """
+        with trace_operation(
+            _CONCERN, "wait_for_topics_ready", attributes={"kafka.topics.requested": len(topic_names)}
+        ) as operation:
+            admin_client = self._get_admin_client()
+            deadline = time.monotonic() + timeout_seconds
+            polls = 0
+
+            while True:
+                topics = await self._list_topics(admin_client)
+                polls += 1
+                pending = [topic_name for topic_name in topic_names if not _is_topic_ready(topics.get(topic_name))]
+
+                if not pending:
+                    operation.span.set_attribute("kafka.metadata.polls", polls)
+                    return
+
+                if time.monotonic() + poll_interval_seconds > deadline:
+                    operation.span.set_attribute("kafka.metadata.polls", polls)
+                    raise TimeoutError(
+                        f"Topics {', '.join(sorted(pending))} were not ready within {timeout_seconds} seconds"
+                    )
+
+                await asyncio.sleep(poll_interval_seconds)
+
+    async def list_topic_partitions(self) -> dict[str, int]:
+        """Reads the partition count of every topic with a single metadata request, without changing anything.
+
+        Returns:
+            dict[str, int]: The partition count per topic name.
+        """
+        with trace_operation(_CONCERN, "list_topic_partitions", kind="topic"):
+            topics = await self._list_topics(self._get_admin_client())
+            return {topic_name: len(topic.partitions) for topic_name, topic in topics.items()}
+
+    async def probe(self) -> None:
+        """Checks that the cluster answers a metadata request, raising when it does not.
+
+        Raises:
+            KafkaException: If no broker answered within the probe timeout.
+        """
+        with (
+            trace_operation(_CONCERN, "probe"),
+            self.metrics.time_api_call(_METRICS_API, "list_topics"),
+        ):
+            await asyncio.to_thread(self._get_admin_client().list_topics, timeout=_KAFKA_PROBE_TIMEOUT_SECONDS)
+
+    async def close(self) -> None:
+        # The admin client has no close method, its connections are released with the instance
+        self._admin_client = None
+
+    async def _list_topics(self, admin_client: AdminClient) -> dict[str, TopicMetadata]:
+        with (
+            trace_operation(_CONCERN, "list_topics"),
+            self.metrics.time_api_call(_METRICS_API, "list_topics"),
+        ):
+            return (await asyncio.to_thread(admin_client.list_topics, timeout=_KAFKA_TIMEOUT_SECONDS)).topics
+
+    def _get_admin_client(self) -> AdminClient:
+        """Gets the admin client, creating it on first use so broker connections stay warm between calls."""
+        if self._admin_client is None:
+            self._admin_client = self._create_admin_client()
+        return self._admin_client
+
+    def _create_admin_client(self) -> AdminClient:
+        """Creates the admin client, overridden to run the service against another admin backend."""
+        return AdminClient(
             conf={
                 "bootstrap.servers": self.kafka_options.bootstrap_servers,
                 "security.protocol": self.kafka_options.security_protocol,
@@ -31,22 +271,12 @@ class KafkaService(IKafkaService):
             logger=self.logger,
         )
 
-        if num_partitions is None:
-            num_partitions = self.kafka_options.default_topic_partitions
-
-        existing_topics = (await asyncio.to_thread(admin_client.list_topics, timeout=_KAFKA_TIMEOUT_SECONDS)).topics
-
-        if topic_name in existing_topics:
-            self.logger.info(f"Topic {topic_name} already exists. Skipping creation.")
-            return
 
-        topics = [NewTopic(topic=topic_name, num_partitions=num_partitions)]
+def _is_kafka_error(error: BaseException, code: int) -> bool:
+    return isinstance(error, KafkaException) and error.args[0].code() == code
 
-        futures = await asyncio.to_thread(admin_client.create_topics, topics, operation_timeout=_KAFKA_TIMEOUT_SECONDS)
 
-        for topic, future in futures.items():
-            try:
-                future.result()
-            except Exception:
-                self.logger.exception(f"Failed to create topic {topic}")
-                raise
+def _is_topic_ready(topic: TopicMetadata | None) -> bool:
+    if topic is None or topic.error is not None or not topic.partitions:
+        return False
+    return all(partition.leader >= 0 and partition.error is None for partition in topic.partitions.values())
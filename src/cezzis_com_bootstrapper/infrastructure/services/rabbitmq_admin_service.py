@@ -1,25 +1,62 @@
 import asyncio
+import contextlib
+import dataclasses
 import json
 import logging
+import time
 import urllib.parse
-from copy import deepcopy
-from typing import Any
+from typing import Any, AsyncIterator, Iterable
 
 import aiofiles
 import aiohttp
 from dacite import Config, from_dict
 from injector import inject
-from rabbitmq_admin import AdminAPI
-from requests.exceptions import HTTPError
 
 from cezzis_com_bootstrapper.domain.config.rabbitmq_options import RabbitMqOptions
+from cezzis_com_bootstrapper.domain.config.settings_snapshot import format_settings_errors
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding import RabbitMqBinding
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding_type import RabbitMqBindingType
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_configuration import RabbitMqConfiguration
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_drift import (
+    RabbitMqDriftStrategy,
+    exchange_drift,
+    migration_queue_name,
+    queue_drift,
+)
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_exchange import RabbitMqExchange
 from cezzis_com_bootstrapper.domain.messaging.rabbitmq_exchange_type import RabbitMqExchangeType
-from cezzis_com_bootstrapper.domain.messaging.rabbitmq_queue import RabbitMqQueue
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_migration_error import RabbitMqMigrationError
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_policy import RabbitMqPolicy
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_policy_apply_to import RabbitMqPolicyApplyTo
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_queue import RabbitMqQueue, validate_rabbitmq_queue
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_queue_type import RabbitMqQueueType
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_snapshot import RabbitMqSnapshot
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_super_stream import validate_rabbitmq_super_stream
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_topic_permission import RabbitMqTopicPermission
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_topology_validation import (
+    duplicate_name_errors,
+    validate_rabbitmq_topology,
+)
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_user import RabbitMqUser
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_vhost import RabbitMqVhost
+from cezzis_com_bootstrapper.infrastructure.flow_control import AdaptiveConcurrencyLimiter, TokenBucket
 from cezzis_com_bootstrapper.infrastructure.services.irabbitmq_admin_service import IRabbitMqAdminService
+from cezzis_com_bootstrapper.infrastructure.streaming import iter_json_array
+from cezzis_com_bootstrapper.infrastructure.telemetry import (
+    EntityAction,
+    Operation,
+    get_bootstrapper_metrics,
+    trace_operation,
+)
+
+_CONCERN = "rabbitmq"
+_METRICS_API = "rabbitmq_management"
+# Large list responses are parsed a chunk at a time instead of being loaded whole
+_STREAM_CHUNK_SIZE = 64 * 1024
+# A queue being migrated parks its messages in a queue named after it with this suffix
+_SHOVEL_POLL_INTERVAL_SECONDS = 1.0
+# The answers of a management plugin that cannot keep up
+_OVERLOAD_STATUSES = (429, 503)
 
 
 class RabbitMqAdminService(IRabbitMqAdminService):
@@ -27,44 +64,76 @@ class RabbitMqAdminService(IRabbitMqAdminService):
     def __init__(self, rabbitmq_options: RabbitMqOptions):
         self.rabbitmq_options = rabbitmq_options
         self.logger = logging.getLogger("rabbitmq_admin_service")
-        self.admin_client = AdminAPI(
-            url=f"{rabbitmq_options.host}:{rabbitmq_options.admin_port}",
-            auth=(
-                rabbitmq_options.admin_username,
-                rabbitmq_options.admin_password,
-            ),
+        self.url = f"{rabbitmq_options.host}:{rabbitmq_options.admin_port}".rstrip("/")
+        self.auth = aiohttp.BasicAuth(rabbitmq_options.admin_username, rabbitmq_options.admin_password)
+        self.headers = {"Content-type": "application/json"}
+        self._session: aiohttp.ClientSession | None = None
+        self.metrics = get_bootstrapper_metrics()
+        self.concurrency_limiter = AdaptiveConcurrencyLimiter(max_limit=rabbitmq_options.max_concurrent_requests)
+        self.rate_limiter = (
+            TokenBucket(rabbitmq_options.max_requests_per_second)
+            if rabbitmq_options.max_requests_per_second > 0
+            else None
         )
 
     async def load_from_file(self, file_path: str) -> RabbitMqConfiguration:
         """Loads RabbitMQ configuration from a JSON file.
 
+        Super streams are expanded into their exchange, partition streams and bindings, which are
+        then reconciled like any other entity. The same goes for the topology of every listed vhost.
+
         Args:
             file_path (str): The path to the JSON configuration file.
 
         Returns:
             RabbitMqConfiguration: The loaded RabbitMQ configuration.
 
-        """
+        Raises:
+            ValueError: When a queue, super stream or vhost is not valid, listing every error.
 
-        self.logger.info(f"Loading RabbitMQ configuration from {file_path}")
+        """
+        with trace_operation(_CONCERN, "load_from_file", attributes={"rabbitmq.config_file": file_path}):
+            self.logger.info(f"Loading RabbitMQ configuration from {file_path}")
+
+            async with aiofiles.open(file_path, mode="r") as file:
+                content = await file.read()
+                data = json.loads(content)
+
+                rabbitmq_configuration = from_dict(
+                    data_class=RabbitMqConfiguration,
+                    data=data,
+                    config=Config(
+                        type_hooks={
+                            RabbitMqBindingType: RabbitMqBindingType,
+                            RabbitMqExchangeType: RabbitMqExchangeType,
+                            RabbitMqPolicyApplyTo: RabbitMqPolicyApplyTo,
+                            RabbitMqQueueType: RabbitMqQueueType,
+                        }
+                    ),
+                )
 
-        async with aiofiles.open(file_path, mode="r") as file:
-            content = await file.read()
-            data = json.loads(content)
+                errors = _expand_topology(rabbitmq_configuration)
+                vhost_names = [self.rabbitmq_options.vhost]
+                for vhost_def in rabbitmq_configuration.vhosts:
+                    vhost_names.append(vhost_def.name)
+                    errors.extend(f"In vhost '{vhost_def.name}': {error}" for error in _expand_topology(vhost_def))
+                    errors.extend(
+                        f"The user '{user_def.username}' of vhost '{vhost_def.name}' has no password_env."
+                        for user_def in vhost_def.users
+                        if not user_def.password_env
+                    )
+                    errors.extend(
+                        duplicate_name_errors(
+                            f"user of vhost '{vhost_def.name}'", [user.username for user in vhost_def.users]
+                        )
+                    )
+                errors.extend(duplicate_name_errors("vhost", vhost_names))
 
-            rabbitmq_configuration = from_dict(
-                data_class=RabbitMqConfiguration,
-                data=data,
-                config=Config(
-                    type_hooks={
-                        RabbitMqBindingType: RabbitMqBindingType,
-                        RabbitMqExchangeType: RabbitMqExchangeType,
-                    }
-                ),
-            )
-            self.logger.info(f"Loaded RabbitMQ configuration from {file_path}")
+                if errors:
+                    raise ValueError(format_settings_errors(errors))
+                self.logger.info(f"Loaded RabbitMQ configuration from {file_path}")
 
-            return rabbitmq_configuration
+                return rabbitmq_configuration
 
     async def create_vhost_if_not_exists(self, vhost: str) -> None:
         """Creates a RabbitMQ virtual host if it does not already exist.
@@ -73,24 +142,20 @@ class RabbitMqAdminService(IRabbitMqAdminService):
             vhost (str): The name of the virtual host to create.
 
         """
-
-        existing_vhost: Any | None = None
-
-        try:
+        with trace_operation(
+            _CONCERN, "create_vhost_if_not_exists", kind="vhost", entity=vhost, attributes={"rabbitmq.vhost": vhost}
+        ) as operation:
             self.logger.info(f"Checking if RabbitMQ vhost '{vhost}' exists", extra={"rabbitmq_vhost": vhost})
-            existing_vhost = await asyncio.to_thread(self.admin_client.get_vhost, name=vhost)
-        except HTTPError as e:
-            if e.response.status_code == 404:
+            existing_vhost = await self._get_or_none("/api/vhosts/{0}".format(urllib.parse.quote_plus(vhost)))
+
+            if existing_vhost is None:
                 self.logger.info(f"RabbitMQ vhost '{vhost}' does not exist", extra={"rabbitmq_vhost": vhost})
-                existing_vhost = None
+                self.logger.info(f"Creating RabbitMQ vhost '{vhost}'", extra={"rabbitmq_vhost": vhost})
+                await self._put(path="/api/vhosts/{0}".format(urllib.parse.quote_plus(vhost)), data={})
+                operation.record(EntityAction.CREATED)
             else:
-                raise
-
-        if existing_vhost is None:
-            self.logger.info(f"Creating RabbitMQ vhost '{vhost}'", extra={"rabbitmq_vhost": vhost})
-            await asyncio.to_thread(self.admin_client.create_vhost, name=vhost)
-        else:
-            self.logger.info(f"RabbitMQ vhost '{vhost}' already exists", extra={"rabbitmq_vhost": vhost})
+                self.logger.info(f"RabbitMQ vhost '{vhost}' already exists", extra={"rabbitmq_vhost": vhost})
+                operation.record(EntityAction.SKIPPED)
 
     async def create_user_if_not_exists(self, username: str, password: str, tags: str = "") -> None:
         """Creates a RabbitMQ user if it does not already exist.
@@ -101,23 +166,21 @@ class RabbitMqAdminService(IRabbitMqAdminService):
             tags (str, optional): Comma-separated list of tags for the user. Defaults to
 
         """
-        existing_user: Any | None = None
-
-        try:
+        with trace_operation(_CONCERN, "create_user_if_not_exists", kind="user", entity=username) as operation:
             self.logger.info(f"Checking if RabbitMQ user '{username}' exists", extra={"rabbitmq_user": username})
-            existing_user = await asyncio.to_thread(self.admin_client.get_user, name=username)
-        except HTTPError as e:
-            if e.response.status_code == 404:
+            existing_user = await self._get_or_none("/api/users/{0}".format(urllib.parse.quote_plus(username)))
+
+            if existing_user is None:
                 self.logger.info(f"RabbitMQ user '{username}' does not exist", extra={"rabbitmq_user": username})
-                existing_user = None
+                self.logger.info(f"Creating RabbitMQ user '{username}'", extra={"rabbitmq_user": username})
+                await self._put(
+                    path="/api/users/{0}".format(urllib.parse.quote_plus(username)),
+                    data={"password": password, "tags": tags},
+                )
+                operation.record(EntityAction.CREATED)
             else:
-                raise
-
-        if existing_user is None:
-            self.logger.info(f"Creating RabbitMQ user '{username}'", extra={"rabbitmq_user": username})
-            await asyncio.to_thread(self.admin_client.create_user, name=username, password=password, tags=tags)
-        else:
-            self.logger.info(f"RabbitMQ user '{username}' already exists", extra={"rabbitmq_user": username})
+                self.logger.info(f"RabbitMQ user '{username}' already exists", extra={"rabbitmq_user": username})
+                operation.record(EntityAction.SKIPPED)
 
     async def assign_vhost_permissions(
         self, vhost: str, username: str, configure: str = ".*", write: str = ".*", read: str = ".*"
@@ -132,62 +195,59 @@ class RabbitMqAdminService(IRabbitMqAdminService):
             read (str, optional): The read permission regex. Defaults to ".*".
 
         """
-        self.logger.info(
-            f"Assigning permissions for user '{username}' on vhost '{vhost}'",
-            extra={"rabbitmq_user": username, "rabbitmq_vhost": vhost},
-        )
+        with trace_operation(
+            _CONCERN,
+            "assign_vhost_permissions",
+            kind="permission",
+            entity=username,
+            attributes={"rabbitmq.vhost": vhost},
+        ) as operation:
+            self.logger.info(
+                f"Assigning permissions for user '{username}' on vhost '{vhost}'",
+                extra={"rabbitmq_user": username, "rabbitmq_vhost": vhost},
+            )
 
-        existing_user_permissions: Any | None = None
+            permissions_path = "/api/permissions/{0}/{1}".format(
+                urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(username)
+            )
 
-        try:
             self.logger.info(
                 f"Checking for existing permissions for user '{username}' on vhost '{vhost}'",
                 extra={"rabbitmq_user": username, "rabbitmq_vhost": vhost},
             )
-            existing_user_permissions = await asyncio.to_thread(
-                self.admin_client.get_user_permission, name=username, vhost=vhost
-            )
-        except HTTPError as e:
-            if e.response.status_code == 404:
+            existing_user_permissions = await self._get_or_none(permissions_path)
+
+            if existing_user_permissions is None:
                 self.logger.info(
                     f"Permissions for user '{username}' on vhost '{vhost}' do not exist",
                     extra={"rabbitmq_user": username, "rabbitmq_vhost": vhost},
                 )
-                existing_user_permissions = None
             else:
-                raise
+                self.logger.info(
+                    f"Existing user permissions found for user '{username}' on vhost '{vhost}'",
+                    extra={"rabbitmq_user": username, "rabbitmq_vhost": vhost},
+                )
 
-        if existing_user_permissions is not None:
-            self.logger.info(
-                f"Existing user permissions found for user '{username}' on vhost '{vhost}'",
-                extra={"rabbitmq_user": username, "rabbitmq_vhost": vhost},
-            )
+                if (
+                    existing_user_permissions.get("configure") == configure
+                    and existing_user_permissions.get("write") == write
+                    and existing_user_permissions.get("read") == read
+                ):
+                    self.logger.info(
+                        f"User '{username}' already has the required permissions on vhost '{vhost}'",
+                        extra={"rabbitmq_user": username, "rabbitmq_vhost": vhost},
+                    )
+                    operation.record(EntityAction.SKIPPED)
+                    return
 
-            if (
-                existing_user_permissions.get("configure") == configure
-                and existing_user_permissions.get("write") == write
-                and existing_user_permissions.get("read") == read
-            ):
                 self.logger.info(
-                    f"User '{username}' already has the required permissions on vhost '{vhost}'",
+                    f"Deleting existing permissions for user '{username}' on vhost '{vhost}'",
                     extra={"rabbitmq_user": username, "rabbitmq_vhost": vhost},
                 )
-                return
+                await self._delete(path=permissions_path)
 
-            self.logger.info(
-                f"Deleting existing permissions for user '{username}' on vhost '{vhost}'",
-                extra={"rabbitmq_user": username, "rabbitmq_vhost": vhost},
-            )
-            await asyncio.to_thread(self.admin_client.delete_user_permission, name=username, vhost=vhost)
-
-        await asyncio.to_thread(
-            self.admin_client.create_user_permission,
-            name=username,
-            vhost=vhost,
-            configure=configure,
-            write=write,
-            read=read,
-        )
+            await self._put(path=permissions_path, data={"configure": configure, "write": write, "read": read})
+            operation.record(EntityAction.CREATED if existing_user_permissions is None else EntityAction.UPDATED)
 
     async def list_vhost_users(self, vhost: str) -> list[str]:
         """Lists all RabbitMQ users for a specific virtual host.
@@ -199,19 +259,14 @@ class RabbitMqAdminService(IRabbitMqAdminService):
             list[str]: A list of usernames associated with the virtual host.
 
         """
-        existing_users = await asyncio.to_thread(self.admin_client.list_users)
-
-        vhost_users: list[str] = []
+        with trace_operation(_CONCERN, "list_vhost_users", kind="user", attributes={"rabbitmq.vhost": vhost}):
+            permissions = await self._get_or_none("/api/vhosts/{0}/permissions".format(urllib.parse.quote_plus(vhost)))
 
-        for user in existing_users:
-            if user["name"] != self.rabbitmq_options.admin_username:
-                user_permissions = await asyncio.to_thread(self.admin_client.list_user_permissions, name=user["name"])
-                for perm in user_permissions:
-                    if perm["vhost"] == vhost:
-                        vhost_users.append(user["name"])
-                        break
-
-        return vhost_users
+            return [
+                permission["user"]
+                for permission in permissions or []
+                if permission["user"] != self.rabbitmq_options.admin_username
+            ]
 
     async def delete_user(self, username: str) -> None:
         """Deletes a RabbitMQ user.
@@ -220,7 +275,116 @@ class RabbitMqAdminService(IRabbitMqAdminService):
             username (str): The username of the RabbitMQ user.
 
         """
-        await asyncio.to_thread(self.admin_client.delete_user, name=username)
+        with trace_operation(_CONCERN, "delete_user", kind="user", entity=username) as operation:
+            await self._delete(path="/api/users/{0}".format(urllib.parse.quote_plus(username)))
+            operation.record(EntityAction.DELETED)
+
+    async def create_users_if_not_exist(self, user_defs: list[RabbitMqUser], passwords: dict[str, str]) -> None:
+        """Creates the missing users, listing the users once and creating the missing ones concurrently.
+
+        Args:
+            user_defs (list[RabbitMqUser]): The definitions of the users.
+            passwords (dict[str, str]): The password of each user, by user name.
+
+        """
+        with trace_operation(
+            _CONCERN,
+            "create_users_if_not_exist",
+            kind="user",
+            attributes={"rabbitmq.users.requested": len(user_defs)},
+        ) as operation:
+            existing_users = {user["name"] for user in await self._get("/api/users")}
+
+            async def create(user_def: RabbitMqUser) -> None:
+                self.logger.info(
+                    f"Creating RabbitMQ user '{user_def.username}'", extra={"rabbitmq_user": user_def.username}
+                )
+                await self._put(
+                    path="/api/users/{0}".format(urllib.parse.quote_plus(user_def.username)),
+                    data={"password": passwords[user_def.username], "tags": user_def.tags},
+                )
+                operation.record(EntityAction.CREATED, entity=user_def.username)
+
+            missing_users = [user_def for user_def in user_defs if user_def.username not in existing_users]
+            for user_def in user_defs:
+                if user_def.username in existing_users:
+                    operation.record(EntityAction.SKIPPED, entity=user_def.username)
+
+            operation.span.set_attribute("rabbitmq.users.created", len(missing_users))
+            await asyncio.gather(*(create(user_def) for user_def in missing_users))
+
+    async def reconcile_vhost_permissions(self, vhost: str, user_defs: list[RabbitMqUser]) -> None:
+        """Grants each user its permissions and topic permissions on a vhost and revokes those of every other user.
+
+        The permissions of the vhost are read once, then the changed ones are written concurrently.
+        The administrator's permissions are left alone.
+
+        Args:
+            vhost (str): The name of the virtual host.
+            user_defs (list[RabbitMqUser]): The users of the virtual host.
+
+        """
+        quoted_vhost = urllib.parse.quote_plus(vhost)
+        with trace_operation(
+            _CONCERN, "reconcile_vhost_permissions", kind="permission", attributes={"rabbitmq.vhost": vhost}
+        ) as operation:
+            permissions, topic_permissions = await asyncio.gather(
+                self._get("/api/vhosts/{0}/permissions".format(quoted_vhost)),
+                self._get("/api/vhosts/{0}/topic-permissions".format(quoted_vhost)),
+            )
+            existing_permissions = {
+                permission["user"]: _to_permissions(permission)
+                for permission in permissions
+                if permission["user"] != self.rabbitmq_options.admin_username
+            }
+            existing_topic_permissions = _to_topic_permissions(
+                permission
+                for permission in topic_permissions
+                if permission["user"] != self.rabbitmq_options.admin_username
+            )
+
+            writes = []
+            for user_def in user_defs:
+                existing = existing_permissions.get(user_def.username)
+                if existing == user_def.permissions():
+                    operation.record(EntityAction.SKIPPED, entity=user_def.username)
+                else:
+                    writes.append(self._grant_permissions(vhost, user_def, existing is None, operation))
+
+                if sorted(existing_topic_permissions.get(user_def.username, []), key=_topic_exchange) != sorted(
+                    user_def.topic_permissions, key=_topic_exchange
+                ):
+                    writes.append(
+                        self._grant_topic_permissions(
+                            vhost, user_def, existing_topic_permissions.get(user_def.username, []), operation
+                        )
+                    )
+
+            desired_users = {user_def.username for user_def in user_defs}
+            for user in sorted((existing_permissions.keys() | existing_topic_permissions.keys()) - desired_users):
+                writes.append(
+                    self._revoke_permissions(
+                        vhost, user, user in existing_permissions, user in existing_topic_permissions, operation
+                    )
+                )
+
+            operation.span.set_attribute("rabbitmq.permissions.written", len(writes))
+            await asyncio.gather(*writes)
+
+    async def delete_users(self, usernames: list[str]) -> None:
+        """Deletes users with a single bulk delete request.
+
+        Args:
+            usernames (list[str]): The names of the users to delete.
+
+        """
+        with trace_operation(
+            _CONCERN, "delete_users", kind="user", attributes={"rabbitmq.users.deleted": len(usernames)}
+        ) as operation:
+            self.logger.info(f"Deleting RabbitMQ users {', '.join(usernames)}", extra={"rabbitmq_users": usernames})
+            await self._post(path="/api/users/bulk-delete", data={"users": usernames})
+            for username in usernames:
+                operation.record(EntityAction.DELETED, entity=username)
 
     async def list_exchanges_in_vhost(self, vhost: str) -> list[str]:
         """Lists all exchanges in a specific virtual host, excluding those starting with 'amq.' and empty names.
@@ -232,52 +396,107 @@ class RabbitMqAdminService(IRabbitMqAdminService):
             list[str]: A list of exchange names in the virtual host.
 
         """
-        exchanges = await asyncio.to_thread(self.admin_client.list_exchanges_for_vhost, vhost=vhost)
-        filtered = []
-        for exchange in exchanges:
-            name = exchange.get("name", "")
-            if name and not name.startswith("amq."):
-                filtered.append(name)
+        with trace_operation(
+            _CONCERN, "list_exchanges_in_vhost", kind="exchange", attributes={"rabbitmq.vhost": vhost}
+        ):
+            return [exchange async for exchange in self.iter_exchanges_in_vhost(vhost)]
+
+    async def iter_exchanges_in_vhost(self, vhost: str) -> AsyncIterator[str]:
+        """Streams the exchanges of a specific virtual host, excluding those starting with 'amq.' and empty names.
+
+        The response is parsed as it arrives, so memory stays bounded however many exchanges the vhost has.
+
+        Args:
+            vhost (str): The name of the virtual host.
 
-        return filtered
+        Yields:
+            str: The name of each exchange in the virtual host.
 
-    async def create_exchange_if_not_exists(self, vhost: str, exchange_def: RabbitMqExchange) -> None:
+        """
+        async for exchange in self._iter_get("/api/exchanges/{0}".format(urllib.parse.quote_plus(vhost))):
+            if _is_managed_exchange(exchange.get("name", "")):
+                yield exchange["name"]
+
+    async def create_exchange_if_not_exists(
+        self,
+        vhost: str,
+        exchange_def: RabbitMqExchange,
+        drift_strategy: RabbitMqDriftStrategy = RabbitMqDriftStrategy.REPORT,
+    ) -> None:
         """Creates an exchange in a specific virtual host if it does not already exist.
 
         Args:
             vhost (str): The name of the virtual host.
             exchange_def (RabbitMqExchange): The definition of the exchange to create.
+            drift_strategy (RabbitMqDriftStrategy, optional): What to do when the exchange exists with other
+                properties. Defaults to reporting them.
 
         """
+        await self.create_exchanges_if_not_exist(vhost, [exchange_def], drift_strategy=drift_strategy)
 
-        if exchange_def.name.startswith("amq."):
-            raise ValueError(f"Cannot create exchange with reserved name '{exchange_def.name}'.")
+    async def create_exchanges_if_not_exist(
+        self,
+        vhost: str,
+        exchange_defs: list[RabbitMqExchange],
+        drift_strategy: RabbitMqDriftStrategy = RabbitMqDriftStrategy.REPORT,
+    ) -> None:
+        """Creates the exchanges missing from a specific virtual host, listing the virtual host once.
 
-        existing_exchanges = await self.list_exchanges_in_vhost(vhost=vhost)
+        Existing exchanges are compared with their definition. An exchange holds no messages, so
+        every strategy but REPORT recreates a drifted exchange and restores its bindings right away.
 
-        for exchange in existing_exchanges:
-            if exchange == exchange_def.name:
-                self.logger.info(
-                    f"Exchange '{exchange_def.name}' already exists in vhost '{vhost}'",
-                    extra={"rabbitmq_exchange": exchange_def.name, "rabbitmq_vhost": vhost},
-                )
-                return
+        Args:
+            vhost (str): The name of the virtual host.
+            exchange_defs (list[RabbitMqExchange]): The definitions of the exchanges to create.
+            drift_strategy (RabbitMqDriftStrategy, optional): What to do with existing exchanges that differ
+                from their definition. Defaults to reporting them.
 
-        self.logger.info(
-            f"Creating exchange '{exchange_def.name}' in vhost '{vhost}'",
-            extra={"rabbitmq_exchange": exchange_def.name, "rabbitmq_vhost": vhost},
-        )
-        await asyncio.to_thread(
-            self.admin_client.create_exchange_for_vhost,
-            exchange=exchange_def.name,
-            vhost=vhost,
-            body={
-                "type": exchange_def.type.value,
-                "durable": exchange_def.durable,
-                "auto_delete": exchange_def.auto_delete,
-                "internal": exchange_def.internal,
-            },
-        )
+        """
+        with trace_operation(
+            _CONCERN,
+            "create_exchanges_if_not_exist",
+            kind="exchange",
+            attributes={"rabbitmq.vhost": vhost, "rabbitmq.exchanges.requested": len(exchange_defs)},
+        ) as operation:
+            for exchange_def in exchange_defs:
+                if exchange_def.name.startswith("amq."):
+                    raise ValueError(f"Cannot create exchange with reserved name '{exchange_def.name}'.")
+
+            requested_exchanges = {exchange_def.name for exchange_def in exchange_defs}
+            existing_exchanges = {
+                exchange["name"]: _to_exchange(exchange)
+                async for exchange in self._iter_get("/api/exchanges/{0}".format(urllib.parse.quote_plus(vhost)))
+                if exchange.get("name") in requested_exchanges
+            }
+
+            missing_exchanges: list[RabbitMqExchange] = []
+            drifted_exchanges: list[tuple[RabbitMqExchange, dict[str, dict[str, Any]]]] = []
+            for exchange_def in exchange_defs:
+                existing_exchange = existing_exchanges.get(exchange_def.name)
+                if existing_exchange is None:
+                    missing_exchanges.append(exchange_def)
+                    continue
+
+                drift = exchange_drift(exchange_def, existing_exchange)
+                if drift:
+                    drifted_exchanges.append((exchange_def, drift))
+                else:
+                    self.logger.info(
+                        f"Exchange '{exchange_def.name}' already exists in vhost '{vhost}'",
+                        extra={"rabbitmq_exchange": exchange_def.name, "rabbitmq_vhost": vhost},
+                    )
+                    operation.record(EntityAction.SKIPPED, entity=exchange_def.name)
+
+            operation.span.set_attribute("rabbitmq.exchanges.created", len(missing_exchanges))
+            operation.span.set_attribute("rabbitmq.exchanges.drifted", len(drifted_exchanges))
+            if missing_exchanges:
+                await self._declare_exchanges(vhost, missing_exchanges, operation)
+
+            for exchange_def, drift in drifted_exchanges:
+                if drift_strategy == RabbitMqDriftStrategy.REPORT:
+                    self._report_drift(vhost, "exchange", exchange_def.name, drift, operation)
+                else:
+                    await self._recreate_exchange(vhost, exchange_def, drift)
 
     async def delete_exchange_from_vhost(self, vhost: str, exchange_name: str) -> None:
         """Deletes an exchange from a specific virtual host.
@@ -287,18 +506,22 @@ class RabbitMqAdminService(IRabbitMqAdminService):
             exchange_name (str): The name of the exchange to delete.
 
         """
-        if exchange_name.startswith("amq."):
-            raise ValueError(f"Cannot delete exchange with reserved name '{exchange_name}'.")
+        with trace_operation(
+            _CONCERN,
+            "delete_exchange_from_vhost",
+            kind="exchange",
+            entity=exchange_name,
+            attributes={"rabbitmq.vhost": vhost},
+        ) as operation:
+            if exchange_name.startswith("amq."):
+                raise ValueError(f"Cannot delete exchange with reserved name '{exchange_name}'.")
 
-        self.logger.info(
-            f"Deleting exchange '{exchange_name}' from vhost '{vhost}'",
-            extra={"rabbitmq_exchange": exchange_name, "rabbitmq_vhost": vhost},
-        )
-        await asyncio.to_thread(
-            self.admin_client.delete_exchange_for_vhost,
-            exchange=exchange_name,
-            vhost=vhost,
-        )
+            self.logger.info(
+                f"Deleting exchange '{exchange_name}' from vhost '{vhost}'",
+                extra={"rabbitmq_exchange": exchange_name, "rabbitmq_vhost": vhost},
+            )
+            await self._remove_exchange(vhost, exchange_name)
+            operation.record(EntityAction.DELETED)
 
     async def list_queues_in_vhost(self, vhost: str) -> list[str]:
         """Lists all queues in a specific virtual host.
@@ -310,10 +533,23 @@ class RabbitMqAdminService(IRabbitMqAdminService):
             list[str]: A list of queue names in the virtual host.
 
         """
+        with trace_operation(_CONCERN, "list_queues_in_vhost", kind="queue", attributes={"rabbitmq.vhost": vhost}):
+            return [queue async for queue in self.iter_queues_in_vhost(vhost)]
 
-        queues = await self._get("/api/queues/{0}".format(urllib.parse.quote_plus(vhost)))
+    async def iter_queues_in_vhost(self, vhost: str) -> AsyncIterator[str]:
+        """Streams the queues of a specific virtual host.
 
-        return [queue["name"] for queue in queues]
+        The response is parsed as it arrives, so memory stays bounded however many queues the vhost has.
+
+        Args:
+            vhost (str): The name of the virtual host.
+
+        Yields:
+            str: The name of each queue in the virtual host.
+
+        """
+        async for queue in self._iter_get("/api/queues/{0}".format(urllib.parse.quote_plus(vhost))):
+            yield queue["name"]
 
     async def create_queue_for_vhost(self, vhost: str, queue_def: RabbitMqQueue) -> None:
         """Creates a queue in a specific virtual host.
@@ -323,44 +559,118 @@ class RabbitMqAdminService(IRabbitMqAdminService):
             queue_def (RabbitMqQueue): The definition of the queue to create.
 
         """
-        self.logger.info(
-            f"Creating queue '{queue_def.name}' in vhost '{vhost}'",
-            extra={"rabbitmq_queue": queue_def.name, "rabbitmq_vhost": vhost},
-        )
-        await self._put(
-            path="/api/queues/{0}/{1}".format(urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(queue_def.name)),
-            data={
-                "durable": queue_def.durable,
-                "auto_delete": queue_def.auto_delete,
-                "exclusive": queue_def.exclusive,
-                "arguments": queue_def.arguments,
-            },
-        )
-
-    async def create_queue_if_not_exists(self, vhost: str, queue_def: RabbitMqQueue) -> None:
+        with trace_operation(
+            _CONCERN,
+            "create_queue_for_vhost",
+            kind="queue",
+            entity=queue_def.name,
+            attributes={"rabbitmq.vhost": vhost},
+        ) as operation:
+            await self._declare_queues(vhost, [queue_def], operation)
+
+    async def create_queue_if_not_exists(
+        self,
+        vhost: str,
+        queue_def: RabbitMqQueue,
+        drift_strategy: RabbitMqDriftStrategy = RabbitMqDriftStrategy.REPORT,
+    ) -> None:
         """Creates a queue in a specific virtual host if it does not already exist.
 
         Args:
             vhost (str): The name of the virtual host.
             queue_def (RabbitMqQueue): The definition of the queue to create.
+            drift_strategy (RabbitMqDriftStrategy, optional): What to do when the queue exists with other
+                properties. Defaults to reporting them.
 
         """
-        existing_queues = await self.list_queues_in_vhost(vhost=vhost)
+        await self.create_queues_if_not_exist(vhost, [queue_def], drift_strategy=drift_strategy)
 
-        for queue in existing_queues:
-            if queue == queue_def.name:
-                self.logger.info(
-                    f"Queue '{queue_def.name}' already exists in vhost '{vhost}'",
-                    extra={"rabbitmq_queue": queue_def.name, "rabbitmq_vhost": vhost},
-                )
-                return
+    async def create_queues_if_not_exist(
+        self,
+        vhost: str,
+        queue_defs: list[RabbitMqQueue],
+        drift_strategy: RabbitMqDriftStrategy = RabbitMqDriftStrategy.REPORT,
+    ) -> None:
+        """Creates the queues missing from a specific virtual host, listing the virtual host once.
 
-        self.logger.info(
-            f"Creating queue '{queue_def.name}' in vhost '{vhost}'",
-            extra={"rabbitmq_queue": queue_def.name, "rabbitmq_vhost": vhost},
-        )
+        Existing queues are compared with their definition. RECREATE_EMPTY recreates the drifted
+        queues holding no messages and having no consumers, and only reports the others. MIGRATE also
+        moves the messages of the others through a temporary queue, see ``_migrate_queue``. A queue
+        whose temporary queue is still there has its interrupted migration finished, whatever the
+        strategy and whether or not it drifted.
 
-        await self.create_queue_for_vhost(vhost=vhost, queue_def=queue_def)
+        Args:
+            vhost (str): The name of the virtual host.
+            queue_defs (list[RabbitMqQueue]): The definitions of the queues to create.
+            drift_strategy (RabbitMqDriftStrategy, optional): What to do with existing queues that differ
+                from their definition. Defaults to reporting them.
+
+        """
+        with trace_operation(
+            _CONCERN,
+            "create_queues_if_not_exist",
+            kind="queue",
+            attributes={"rabbitmq.vhost": vhost, "rabbitmq.queues.requested": len(queue_defs)},
+        ) as operation:
+            requested_queues = {queue_def.name for queue_def in queue_defs}
+            migration_queues = {migration_queue_name(queue_def.name) for queue_def in queue_defs}
+            # The listing carries the message and consumer counts the strategies decide on
+            existing_queues = {
+                queue["name"]: queue
+                async for queue in self._iter_get("/api/queues/{0}".format(urllib.parse.quote_plus(vhost)))
+                if queue["name"] in requested_queues or queue["name"] in migration_queues
+            }
+
+            missing_queues: list[RabbitMqQueue] = []
+            drifted_queues: list[tuple[RabbitMqQueue, dict[str, Any], dict[str, dict[str, Any]]]] = []
+            interrupted_migrations: list[tuple[RabbitMqQueue, dict[str, dict[str, Any]]]] = []
+            for queue_def in queue_defs:
+                existing_queue = existing_queues.get(queue_def.name)
+                if existing_queue is None:
+                    missing_queues.append(queue_def)
+                drift = queue_drift(queue_def, _to_queue(existing_queue)) if existing_queue is not None else {}
+
+                # The temporary queue of an interrupted migration may hold the only copy of the messages,
+                # the migration is finished whatever the strategy and the state of the queue
+                if migration_queue_name(queue_def.name) in existing_queues:
+                    interrupted_migrations.append((queue_def, drift))
+                elif existing_queue is None:
+                    continue
+                elif drift:
+                    drifted_queues.append((queue_def, existing_queue, drift))
+                else:
+                    self.logger.info(
+                        f"Queue '{queue_def.name}' already exists in vhost '{vhost}'",
+                        extra={"rabbitmq_queue": queue_def.name, "rabbitmq_vhost": vhost},
+                    )
+                    operation.record(EntityAction.SKIPPED, entity=queue_def.name)
+
+            operation.span.set_attribute("rabbitmq.queues.created", len(missing_queues))
+            operation.span.set_attribute("rabbitmq.queues.drifted", len(drifted_queues))
+            if missing_queues:
+                await self._declare_queues(vhost, missing_queues, operation)
+
+            for queue_def, drift in interrupted_migrations:
+                await self._migrate_queue(vhost, queue_def, drift)
+
+            for queue_def, existing_queue, drift in drifted_queues:
+                in_use = bool(existing_queue.get("messages") or existing_queue.get("consumers"))
+                if drift_strategy == RabbitMqDriftStrategy.REPORT:
+                    self._report_drift(vhost, "queue", queue_def.name, drift, operation)
+                elif not in_use:
+                    await self._recreate_queue(vhost, queue_def, drift)
+                elif drift_strategy == RabbitMqDriftStrategy.MIGRATE and _can_migrate(queue_def, existing_queue):
+                    await self._migrate_queue(vhost, queue_def, drift)
+                else:
+                    self._report_drift(
+                        vhost,
+                        "queue",
+                        queue_def.name,
+                        drift,
+                        operation,
+                        reason=f"it holds {existing_queue.get('messages', 0)} messages and has "
+                        f"{existing_queue.get('consumers', 0)} consumers",
+                    )
 
     async def delete_queue_for_vhost(self, vhost: str, queue_name: str) -> None:
         """Deletes a queue from a specific virtual host.
@@ -370,13 +680,19 @@ class RabbitMqAdminService(IRabbitMqAdminService):
             queue_name (str): The name of the queue to delete.
 
         """
-        self.logger.info(
-            f"Deleting queue '{queue_name}' from vhost '{vhost}'",
-            extra={"rabbitmq_queue": queue_name, "rabbitmq_vhost": vhost},
-        )
-        await self._delete(
-            path="/api/queues/{0}/{1}".format(urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(queue_name))
-        )
+        with trace_operation(
+            _CONCERN,
+            "delete_queue_for_vhost",
+            kind="queue",
+            entity=queue_name,
+            attributes={"rabbitmq.vhost": vhost},
+        ) as operation:
+            self.logger.info(
+                f"Deleting queue '{queue_name}' from vhost '{vhost}'",
+                extra={"rabbitmq_queue": queue_name, "rabbitmq_vhost": vhost},
+            )
+            await self._remove_queue(vhost, queue_name)
+            operation.record(EntityAction.DELETED)
 
     async def list_bindings_in_vhost(self, vhost: str) -> list[RabbitMqBinding]:
         """Lists all bindings in a specific virtual host.
@@ -388,31 +704,25 @@ class RabbitMqAdminService(IRabbitMqAdminService):
             list[RabbitMqBinding]: A list of bindings in the virtual host.
 
         """
-        bindings = await self._get("/api/bindings/{0}".format(urllib.parse.quote_plus(vhost)))
+        with trace_operation(_CONCERN, "list_bindings_in_vhost", kind="binding", attributes={"rabbitmq.vhost": vhost}):
+            return [binding async for binding in self.iter_bindings_in_vhost(vhost)]
 
-        binding_list: list[RabbitMqBinding] = []
+    async def iter_bindings_in_vhost(self, vhost: str) -> AsyncIterator[RabbitMqBinding]:
+        """Streams the bindings of a specific virtual host, excluding those the bootstrapper does not manage.
 
-        for binding in bindings:
-            existing_binding = RabbitMqBinding(
-                source=binding.get("source", ""),
-                destination=binding.get("destination", ""),
-                destination_type=RabbitMqBindingType(binding.get("destination_type", "")),
-                routing_key=binding.get("routing_key", ""),
-                arguments=binding.get("arguments", {}),
-            )
+        The response is parsed as it arrives, so memory stays bounded however many bindings the vhost has.
 
-            if (
-                not existing_binding.source
-                and existing_binding.routing_key == existing_binding.destination
-                and existing_binding.destination_type == RabbitMqBindingType.QUEUE
-            ):
-                # Skip default direct queue bindings
-                continue
+        Args:
+            vhost (str): The name of the virtual host.
 
-            if existing_binding.source and existing_binding.destination:
-                binding_list.append(existing_binding)
+        Yields:
+            RabbitMqBinding: Each managed binding in the virtual host.
 
-        return binding_list
+        """
+        async for binding in self._iter_get("/api/bindings/{0}".format(urllib.parse.quote_plus(vhost))):
+            managed_binding = _to_managed_binding(binding)
+            if managed_binding is not None:
+                yield managed_binding
 
     async def create_binding_if_not_exists(self, vhost: str, binding_def: RabbitMqBinding) -> None:
         """Creates a binding in a specific virtual host if it does not already exist.
@@ -422,71 +732,485 @@ class RabbitMqAdminService(IRabbitMqAdminService):
             binding_def (RabbitMqBinding): The definition of the binding to create.
 
         """
+        with trace_operation(
+            _CONCERN,
+            "create_binding_if_not_exists",
+            kind="binding",
+            entity=_binding_entity(binding_def),
+            attributes={"rabbitmq.vhost": vhost, "rabbitmq.routing_key": binding_def.routing_key},
+        ) as operation:
+            if binding_def.destination_type not in [RabbitMqBindingType.QUEUE, RabbitMqBindingType.EXCHANGE]:
+                raise ValueError(f"Invalid destination_type '{binding_def.destination_type}' for binding.")
+
+            # Closing the stream as soon as the binding is found leaves the rest of the response unread
+            async with contextlib.aclosing(self.iter_bindings_in_vhost(vhost=vhost)) as existing_bindings:
+                async for binding in existing_bindings:
+                    if binding.key() == binding_def.key():
+                        self.logger.info(
+                            f"Binding from '{binding_def.source}' to '{binding_def.destination}' already exists in vhost '{vhost}'",
+                            extra={
+                                "rabbitmq_vhost": vhost,
+                                "rabbitmq_exchange": binding_def.source,
+                                "rabbitmq_routing_key": binding_def.routing_key,
+                                "rabbitmq_destination": binding_def.destination,
+                            },
+                        )
+                        operation.record(EntityAction.SKIPPED)
+                        return
+
+            await self._declare_bindings(vhost, [binding_def], operation)
+
+    async def create_bindings_if_not_exist(self, vhost: str, binding_defs: list[RabbitMqBinding]) -> None:
+        """Creates the bindings missing from a specific virtual host, listing the virtual host once.
+
+        Args:
+            vhost (str): The name of the virtual host.
+            binding_defs (list[RabbitMqBinding]): The definitions of the bindings to create.
+
+        """
+        with trace_operation(
+            _CONCERN,
+            "create_bindings_if_not_exist",
+            kind="binding",
+            attributes={"rabbitmq.vhost": vhost, "rabbitmq.bindings.requested": len(binding_defs)},
+        ) as operation:
+            for binding_def in binding_defs:
+                if binding_def.destination_type not in [RabbitMqBindingType.QUEUE, RabbitMqBindingType.EXCHANGE]:
+                    raise ValueError(f"Invalid destination_type '{binding_def.destination_type}' for binding.")
+
+            # Only the existing bindings matching a definition are kept while the vhost is streamed
+            wanted_bindings = {binding_def.key() for binding_def in binding_defs}
+            existing_bindings = {
+                binding.key()
+                async for binding in self.iter_bindings_in_vhost(vhost=vhost)
+                if binding.key() in wanted_bindings
+            }
+
+            missing_bindings: list[RabbitMqBinding] = []
+            for binding_def in binding_defs:
+                if binding_def.key() in existing_bindings:
+                    self.logger.info(
+                        f"Binding from '{binding_def.source}' to '{binding_def.destination}' already exists in vhost '{vhost}'",
+                        extra={
+                            "rabbitmq_vhost": vhost,
+                            "rabbitmq_exchange": binding_def.source,
+                            "rabbitmq_routing_key": binding_def.routing_key,
+                            "rabbitmq_destination": binding_def.destination,
+                        },
+                    )
+                    operation.record(EntityAction.SKIPPED, entity=_binding_entity(binding_def))
+                else:
+                    missing_bindings.append(binding_def)
+
+            operation.span.set_attribute("rabbitmq.bindings.created", len(missing_bindings))
+            if missing_bindings:
+                await self._declare_bindings(vhost, missing_bindings, operation)
 
-        if binding_def.destination_type not in [RabbitMqBindingType.QUEUE, RabbitMqBindingType.EXCHANGE]:
-            raise ValueError(f"Invalid destination_type '{binding_def.destination_type}' for binding.")
+    async def delete_binding_from_vhost(self, vhost: str, binding_def: RabbitMqBinding) -> None:
+        """Deletes a binding from a specific virtual host.
 
-        existing_bindings = await self.list_bindings_in_vhost(vhost=vhost)
+        Args:
+            vhost (str): The name of the virtual host.
+            binding_def (RabbitMqBinding): The definition of the binding to delete.
+
+        """
+        with trace_operation(
+            _CONCERN,
+            "delete_binding_from_vhost",
+            kind="binding",
+            entity=_binding_entity(binding_def),
+            attributes={"rabbitmq.vhost": vhost, "rabbitmq.routing_key": binding_def.routing_key},
+        ) as operation:
+            self.logger.info(
+                f"Deleting binding from '{binding_def.source}' to '{binding_def.destination}' in vhost '{vhost}'",
+                extra={
+                    "rabbitmq_vhost": vhost,
+                    "rabbitmq_exchange": binding_def.source,
+                    "rabbitmq_routing_key": binding_def.routing_key,
+                    "rabbitmq_destination": binding_def.destination,
+                },
+            )
+
+            if await self._remove_binding(vhost, binding_def):
+                operation.record(EntityAction.DELETED)
+
+    async def list_policies(self, vhost: str, operator: bool = False) -> list[RabbitMqPolicy]:
+        """Lists the policies, or the operator policies, of a specific virtual host.
+
+        Args:
+            vhost (str): The name of the virtual host.
+            operator (bool, optional): Whether to list operator policies. Defaults to False.
+
+        Returns:
+            list[RabbitMqPolicy]: The policies of the virtual host.
+
+        """
+        with trace_operation(
+            _CONCERN, "list_policies", kind=_policy_kind(operator), attributes={"rabbitmq.vhost": vhost}
+        ):
+            policies = await self._get("{0}/{1}".format(_policies_path(operator), urllib.parse.quote_plus(vhost)))
+
+            return [_to_policy(policy) for policy in policies]
+
+    async def create_or_update_policies(
+        self, vhost: str, policy_defs: list[RabbitMqPolicy], operator: bool = False
+    ) -> None:
+        """Creates the missing policies of a virtual host and updates the changed ones, listing them once.
+
+        Unlike queue arguments, a policy change applies to the queues it matches without recreating them.
+
+        Args:
+            vhost (str): The name of the virtual host.
+            policy_defs (list[RabbitMqPolicy]): The definitions of the policies.
+            operator (bool, optional): Whether the definitions are operator policies. Defaults to False.
+
+        """
+        kind = _policy_kind(operator)
+        with trace_operation(
+            _CONCERN,
+            "create_or_update_policies",
+            kind=kind,
+            attributes={"rabbitmq.vhost": vhost, "rabbitmq.policies.requested": len(policy_defs)},
+        ) as operation:
+            existing_policies = {policy.name: policy for policy in await self.list_policies(vhost, operator=operator)}
+
+            for policy_def in policy_defs:
+                existing_policy = existing_policies.get(policy_def.name)
+                if existing_policy == policy_def:
+                    self.logger.info(
+                        f"Policy '{policy_def.name}' is up to date in vhost '{vhost}'",
+                        extra={"rabbitmq_policy": policy_def.name, "rabbitmq_vhost": vhost},
+                    )
+                    operation.record(EntityAction.SKIPPED, entity=policy_def.name)
+                    continue
 
-        for binding in existing_bindings:
-            if (
-                binding.source == binding_def.source
-                and binding.destination == binding_def.destination
-                and binding.destination_type == binding_def.destination_type
-                and binding.routing_key == binding_def.routing_key
-            ):
                 self.logger.info(
-                    f"Binding from '{binding_def.source}' to '{binding_def.destination}' already exists in vhost '{vhost}'",
-                    extra={
-                        "rabbitmq_vhost": vhost,
-                        "rabbitmq_exchange": binding_def.source,
-                        "rabbitmq_routing_key": binding_def.routing_key,
-                        "rabbitmq_destination": binding_def.destination,
+                    f"{'Creating' if existing_policy is None else 'Updating'} {kind.replace('_', ' ')} "
+                    f"'{policy_def.name}' in vhost '{vhost}'",
+                    extra={"rabbitmq_policy": policy_def.name, "rabbitmq_vhost": vhost},
+                )
+                await self._put(
+                    path="{0}/{1}/{2}".format(
+                        _policies_path(operator),
+                        urllib.parse.quote_plus(vhost),
+                        urllib.parse.quote_plus(policy_def.name),
+                    ),
+                    data={
+                        "pattern": policy_def.pattern,
+                        "definition": policy_def.definition,
+                        "priority": policy_def.priority,
+                        "apply-to": policy_def.apply_to.value,
                     },
                 )
-                return
+                operation.record(
+                    EntityAction.CREATED if existing_policy is None else EntityAction.UPDATED, entity=policy_def.name
+                )
+
+    async def delete_policy(self, vhost: str, policy_name: str, operator: bool = False) -> None:
+        """Deletes a policy, or an operator policy, from a specific virtual host.
+
+        Args:
+            vhost (str): The name of the virtual host.
+            policy_name (str): The name of the policy to delete.
+            operator (bool, optional): Whether the policy is an operator policy. Defaults to False.
 
+        """
+        with trace_operation(
+            _CONCERN,
+            "delete_policy",
+            kind=_policy_kind(operator),
+            entity=policy_name,
+            attributes={"rabbitmq.vhost": vhost},
+        ) as operation:
+            self.logger.info(
+                f"Deleting policy '{policy_name}' from vhost '{vhost}'",
+                extra={"rabbitmq_policy": policy_name, "rabbitmq_vhost": vhost},
+            )
+            await self._delete(
+                path="{0}/{1}/{2}".format(
+                    _policies_path(operator), urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(policy_name)
+                )
+            )
+            operation.record(EntityAction.DELETED)
+
+    async def export_configuration(self, vhost: str) -> RabbitMqConfiguration:
+        """Reads the topology and policies of a vhost as a configuration that can be reconciled back.
+
+        The vhost's definitions are read in one request, plus one for its operator policies, which the
+        definitions leave out. The "amq." exchanges and the default bindings are filtered out like the
+        list methods filter them, and the typed queue arguments become the matching queue fields.
+
+        Args:
+            vhost (str): The name of the virtual host.
+
+        Returns:
+            RabbitMqConfiguration: The exchanges, queues, bindings and policies of the vhost.
+
+        Raises:
+            ValueError: When the vhost does not exist.
+
+        """
+        quoted_vhost = urllib.parse.quote_plus(vhost)
+        with trace_operation(_CONCERN, "export_configuration", attributes={"rabbitmq.vhost": vhost}) as operation:
+            definitions, operator_policies = await asyncio.gather(
+                self._get_or_none("/api/definitions/{0}".format(quoted_vhost)),
+                self._get_or_none("/api/operator-policies/{0}".format(quoted_vhost)),
+            )
+            if definitions is None:
+                raise ValueError(f"The vhost '{vhost}' does not exist.")
+
+            configuration = RabbitMqConfiguration(
+                exchanges=[
+                    _to_exchange(exchange)
+                    for exchange in definitions.get("exchanges") or []
+                    if _is_managed_exchange(exchange.get("name", ""))
+                ],
+                queues=[_to_queue(queue) for queue in definitions.get("queues") or []],
+                bindings=[
+                    binding
+                    for binding in map(_to_managed_binding, definitions.get("bindings") or [])
+                    if binding is not None
+                ],
+                policies=[_to_policy(policy) for policy in definitions.get("policies") or []],
+                operator_policies=[_to_policy(policy) for policy in operator_policies or []],
+            )
+            operation.span.set_attribute("rabbitmq.exchanges.exported", len(configuration.exchanges))
+            operation.span.set_attribute("rabbitmq.queues.exported", len(configuration.queues))
+            operation.span.set_attribute("rabbitmq.bindings.exported", len(configuration.bindings))
+            return configuration
+
+    async def get_snapshot(self, vhost: str) -> RabbitMqSnapshot:
+        """Reads the state of a vhost without changing anything.
+
+        Everything is read with a single definitions request, except operator policies which the
+        definitions do not hold.
+
+        Args:
+            vhost (str): The name of the virtual host.
+
+        Returns:
+            RabbitMqSnapshot: The vhost state, filtered like the list methods filter it.
+
+        """
+        with trace_operation(_CONCERN, "get_snapshot", attributes={"rabbitmq.vhost": vhost}):
+            definitions, operator_policies = await asyncio.gather(
+                self._get("/api/definitions"),
+                self._get_or_none("/api/operator-policies/{0}".format(urllib.parse.quote_plus(vhost))),
+            )
+
+            def in_vhost(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+                return [entry for entry in entries or [] if entry.get("vhost") == vhost]
+
+            exchanges = [
+                _to_exchange(exchange)
+                for exchange in in_vhost(definitions.get("exchanges"))
+                if _is_managed_exchange(exchange.get("name", ""))
+            ]
+            queues = [_to_queue(queue) for queue in in_vhost(definitions.get("queues"))]
+            return RabbitMqSnapshot(
+                vhost_exists=any(entry.get("name") == vhost for entry in definitions.get("vhosts") or []),
+                users=[
+                    user["name"]
+                    for user in definitions.get("users") or []
+                    if user["name"] != self.rabbitmq_options.admin_username
+                ],
+                permissions={
+                    permission["user"]: _to_permissions(permission)
+                    for permission in in_vhost(definitions.get("permissions"))
+                },
+                topic_permissions=_to_topic_permissions(in_vhost(definitions.get("topic_permissions"))),
+                exchanges=[exchange.name for exchange in exchanges],
+                queues=[queue.name for queue in queues],
+                exchange_definitions={exchange.name: exchange for exchange in exchanges},
+                queue_definitions={queue.name: queue for queue in queues},
+                bindings=[
+                    binding
+                    for binding in map(_to_managed_binding, in_vhost(definitions.get("bindings")))
+                    if binding is not None
+                ],
+                policies=[_to_policy(policy) for policy in in_vhost(definitions.get("policies"))],
+                operator_policies=[_to_policy(policy) for policy in operator_policies or []],
+            )
+
+    async def probe(self) -> None:
+        """Checks that the management API answers, raising when it does not.
+
+        Raises:
+            aiohttp.ClientError: If the management API is unreachable or answers with an error.
+        """
+        with trace_operation(_CONCERN, "probe"):
+            await self._get("/api/overview")
+
+    async def close(self) -> None:
+        """Closes the pooled connections to the broker."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _grant_permissions(self, vhost: str, user_def: RabbitMqUser, is_new: bool, operation: Operation) -> None:
         self.logger.info(
-            f"Creating binding from '{binding_def.source}' to '{binding_def.destination}' in vhost '{vhost}'",
-            extra={
-                "rabbitmq_vhost": vhost,
-                "rabbitmq_exchange": binding_def.source,
-                "rabbitmq_routing_key": binding_def.routing_key,
-                "rabbitmq_destination": binding_def.destination,
-            },
+            f"{'Granting' if is_new else 'Updating'} permissions of user '{user_def.username}' on vhost '{vhost}'",
+            extra={"rabbitmq_user": user_def.username, "rabbitmq_vhost": vhost},
         )
-
-        await self._post(
-            path="/api/bindings/{0}/e/{1}/{2}/{3}".format(
-                urllib.parse.quote_plus(vhost),
-                urllib.parse.quote_plus(binding_def.source),
-                binding_def.destination_type.value[0],
-                urllib.parse.quote_plus(binding_def.destination),
+        # Putting permissions replaces the existing ones, they do not have to be deleted first
+        await self._put(
+            path="/api/permissions/{0}/{1}".format(
+                urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(user_def.username)
             ),
-            data={
-                "routing_key": binding_def.routing_key,
-                "arguments": binding_def.arguments,
-            },
+            data=user_def.permissions(),
         )
+        operation.record(EntityAction.CREATED if is_new else EntityAction.UPDATED, entity=user_def.username)
+
+    async def _grant_topic_permissions(
+        self,
+        vhost: str,
+        user_def: RabbitMqUser,
+        existing: list[RabbitMqTopicPermission],
+        operation: Operation,
+    ) -> None:
+        path = "/api/topic-permissions/{0}/{1}".format(
+            urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(user_def.username)
+        )
+        self.logger.info(
+            f"Setting topic permissions of user '{user_def.username}' on vhost '{vhost}'",
+            extra={"rabbitmq_user": user_def.username, "rabbitmq_vhost": vhost},
+        )
+        # Topic permissions can only be deleted all at once, a user that loses one exchange gets the others put back
+        desired_exchanges = {permission.exchange for permission in user_def.topic_permissions}
+        if any(permission.exchange not in desired_exchanges for permission in existing):
+            await self._delete(path=path)
+            existing = []
+        for permission in user_def.topic_permissions:
+            if permission not in existing:
+                await self._put(
+                    path=path,
+                    data={"exchange": permission.exchange, "write": permission.write, "read": permission.read},
+                )
+        operation.record(EntityAction.UPDATED, entity=f"{user_def.username}:topics")
 
-    async def delete_binding_from_vhost(self, vhost: str, binding_def: RabbitMqBinding) -> None:
-        """Deletes a binding from a specific virtual host.
+    async def _revoke_permissions(
+        self, vhost: str, username: str, permissions: bool, topic_permissions: bool, operation: Operation
+    ) -> None:
+        self.logger.info(
+            f"Revoking permissions of user '{username}' on vhost '{vhost}'",
+            extra={"rabbitmq_user": username, "rabbitmq_vhost": vhost},
+        )
+        quoted = "{0}/{1}".format(urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(username))
+        if permissions:
+            await self._delete(path=f"/api/permissions/{quoted}")
+        if topic_permissions:
+            await self._delete(path=f"/api/topic-permissions/{quoted}")
+        operation.record(EntityAction.DELETED, entity=username)
+
+    async def _declare_exchanges(self, vhost: str, exchange_defs: list[RabbitMqExchange], operation: Operation) -> None:
+        """Declares exchanges known to be missing, recording each one on the operation.
 
         Args:
             vhost (str): The name of the virtual host.
-            binding_def (RabbitMqBinding): The definition of the binding to delete.
+            exchange_defs (list[RabbitMqExchange]): The definitions of the exchanges to declare.
+            operation (Operation): The operation the declares are part of.
 
         """
-        self.logger.info(
-            f"Deleting binding from '{binding_def.source}' to '{binding_def.destination}' in vhost '{vhost}'",
-            extra={
-                "rabbitmq_vhost": vhost,
-                "rabbitmq_exchange": binding_def.source,
-                "rabbitmq_routing_key": binding_def.routing_key,
-                "rabbitmq_destination": binding_def.destination,
-            },
+        for exchange_def in exchange_defs:
+            self.logger.info(
+                f"Creating exchange '{exchange_def.name}' in vhost '{vhost}'",
+                extra={"rabbitmq_exchange": exchange_def.name, "rabbitmq_vhost": vhost},
+            )
+            await self._put(
+                path="/api/exchanges/{0}/{1}".format(
+                    urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(exchange_def.name)
+                ),
+                data={
+                    "type": exchange_def.type.value,
+                    "durable": exchange_def.durable,
+                    "auto_delete": exchange_def.auto_delete,
+                    "internal": exchange_def.internal,
+                    "arguments": exchange_def.arguments,
+                },
+            )
+            operation.record(EntityAction.CREATED, entity=exchange_def.name)
+
+    async def _declare_queues(self, vhost: str, queue_defs: list[RabbitMqQueue], operation: Operation) -> None:
+        """Declares queues known to be missing, recording each one on the operation.
+
+        Args:
+            vhost (str): The name of the virtual host.
+            queue_defs (list[RabbitMqQueue]): The definitions of the queues to declare.
+            operation (Operation): The operation the declares are part of.
+
+        """
+        for queue_def in queue_defs:
+            self.logger.info(
+                f"Creating queue '{queue_def.name}' in vhost '{vhost}'",
+                extra={"rabbitmq_queue": queue_def.name, "rabbitmq_vhost": vhost},
+            )
+            await self._put(
+                path="/api/queues/{0}/{1}".format(
+                    urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(queue_def.name)
+                ),
+                data={
+                    "durable": queue_def.durable,
+                    "auto_delete": queue_def.auto_delete,
+                    "exclusive": queue_def.exclusive,
+                    "arguments": queue_def.declared_arguments(),
+                },
+            )
+            operation.record(EntityAction.CREATED, entity=queue_def.name)
+
+    async def _declare_bindings(self, vhost: str, binding_defs: list[RabbitMqBinding], operation: Operation) -> None:
+        """Declares bindings known to be missing, recording each one on the operation.
+
+        Args:
+            vhost (str): The name of the virtual host.
+            binding_defs (list[RabbitMqBinding]): The definitions of the bindings to declare.
+            operation (Operation): The operation the declares are part of.
+
+        """
+        for binding_def in binding_defs:
+            self.logger.info(
+                f"Creating binding from '{binding_def.source}' to '{binding_def.destination}' in vhost '{vhost}'",
+                extra={
+                    "rabbitmq_vhost": vhost,
+                    "rabbitmq_exchange": binding_def.source,
+                    "rabbitmq_routing_key": binding_def.routing_key,
+                    "rabbitmq_destination": binding_def.destination,
+                },
+            )
+            await self._post(
+                path="/api/bindings/{0}/e/{1}/{2}/{3}".format(
+                    urllib.parse.quote_plus(vhost),
+                    urllib.parse.quote_plus(binding_def.source),
+                    binding_def.destination_type.value[0],
+                    urllib.parse.quote_plus(binding_def.destination),
+                ),
+                data={
+                    "routing_key": binding_def.routing_key,
+                    "arguments": binding_def.arguments,
+                },
+            )
+            operation.record(EntityAction.CREATED, entity=_binding_entity(binding_def))
+
+    async def _remove_exchange(self, vhost: str, exchange_name: str) -> None:
+        """Removes an exchange, and every binding from or to it, from the broker."""
+        await self._delete(
+            path="/api/exchanges/{0}/{1}".format(urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(exchange_name))
         )
 
+    async def _remove_queue(self, vhost: str, queue_name: str) -> None:
+        """Removes a queue, and every binding to it, from the broker."""
+        await self._delete(
+            path="/api/queues/{0}/{1}".format(urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(queue_name))
+        )
+
+    async def _remove_binding(self, vhost: str, binding_def: RabbitMqBinding) -> bool:
+        """Removes a binding from the broker.
+
+        The bindings between the same source and destination are told apart by their routing key and
+        arguments, like ``RabbitMqBinding.key``.
+
+        Returns:
+            bool: False when the binding did not exist.
+        """
         bindings = await self._get(
             "/api/bindings/{0}/e/{1}/{2}/{3}".format(
                 urllib.parse.quote_plus(vhost),
@@ -497,7 +1221,10 @@ class RabbitMqAdminService(IRabbitMqAdminService):
         )
 
         for binding in bindings:
-            if binding.get("routing_key", "") == binding_def.routing_key:
+            existing_binding = dataclasses.replace(
+                binding_def, routing_key=binding.get("routing_key", ""), arguments=binding.get("arguments") or {}
+            )
+            if existing_binding.key() == binding_def.key():
                 await self._delete(
                     path="/api/bindings/{0}/e/{1}/{2}/{3}/{4}".format(
                         urllib.parse.quote_plus(vhost),
@@ -507,8 +1234,257 @@ class RabbitMqAdminService(IRabbitMqAdminService):
                         str(binding.get("properties_key", "")),
                     )
                 )
+                return True
+        return False
+
+    def _report_drift(
+        self,
+        vhost: str,
+        kind: str,
+        name: str,
+        drift: dict[str, dict[str, Any]],
+        operation: Operation,
+        reason: str = "",
+    ) -> None:
+        """Logs the properties of an exchange or queue that differ from its definition, leaving it as it is."""
+        self.logger.warning(
+            f"{kind.capitalize()} '{name}' in vhost '{vhost}' differs from its definition: {_describe_drift(drift)}. "
+            f"It is left as is{f' because {reason}' if reason else ''}.",
+            extra={f"rabbitmq_{kind}": name, "rabbitmq_vhost": vhost, "rabbitmq_drift": drift},
+        )
+        operation.record(EntityAction.DRIFTED, entity=name)
+
+    async def _recreate_exchange(
+        self, vhost: str, exchange_def: RabbitMqExchange, drift: dict[str, dict[str, Any]]
+    ) -> None:
+        """Deletes a drifted exchange and declares it again, restoring the bindings from and to it."""
+        path = "/api/exchanges/{0}/{1}".format(
+            urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(exchange_def.name)
+        )
+        with trace_operation(
+            _CONCERN,
+            "recreate_exchange",
+            kind="exchange",
+            entity=exchange_def.name,
+            attributes={"rabbitmq.vhost": vhost},
+        ) as operation:
+            source_bindings, destination_bindings = await asyncio.gather(
+                self._get(f"{path}/bindings/source"),
+                self._get(f"{path}/bindings/destination"),
+            )
+            bindings = _to_managed_bindings([*source_bindings, *destination_bindings])
+
+            self.logger.warning(
+                f"Recreating exchange '{exchange_def.name}' in vhost '{vhost}' to apply {_describe_drift(drift)}",
+                extra={"rabbitmq_exchange": exchange_def.name, "rabbitmq_vhost": vhost, "rabbitmq_drift": drift},
+            )
+            await self._remove_exchange(vhost, exchange_def.name)
+            await self._declare_exchanges(vhost, [exchange_def], operation)
+            # The broker removed the bindings along with the exchange
+            await self._declare_bindings(vhost, bindings, operation)
+
+    async def _recreate_queue(self, vhost: str, queue_def: RabbitMqQueue, drift: dict[str, dict[str, Any]]) -> None:
+        """Deletes a drifted queue holding no messages and declares it again, restoring the bindings to it.
+
+        The queue is deleted with ``if-empty`` and ``if-unused``, the listed counts are sampled and a
+        queue that received a message or a consumer since is only reported.
+        """
+        path = "/api/queues/{0}/{1}".format(urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(queue_def.name))
+        with trace_operation(
+            _CONCERN,
+            "recreate_queue",
+            kind="queue",
+            entity=queue_def.name,
+            attributes={"rabbitmq.vhost": vhost},
+        ) as operation:
+            bindings = _to_managed_bindings(await self._get(f"{path}/bindings"))
+
+            self.logger.warning(
+                f"Recreating empty queue '{queue_def.name}' in vhost '{vhost}' to apply {_describe_drift(drift)}",
+                extra={"rabbitmq_queue": queue_def.name, "rabbitmq_vhost": vhost, "rabbitmq_drift": drift},
+            )
+            try:
+                await self._delete(f"{path}?if-empty=true&if-unused=true")
+            except aiohttp.ClientResponseError as e:
+                if e.status != 400:
+                    raise
+                self._report_drift(vhost, "queue", queue_def.name, drift, operation, reason="it is no longer empty")
                 return
 
+            await self._declare_queues(vhost, [queue_def], operation)
+            await self._declare_bindings(vhost, bindings, operation)
+
+    async def _migrate_queue(self, vhost: str, queue_def: RabbitMqQueue, drift: dict[str, dict[str, Any]]) -> None:
+        """Recreates a drifted queue holding messages, moving them out and back in with dynamic shovels.
+
+        The messages are parked in a temporary queue declared with the desired properties, which
+        takes over the bindings of the queue while it is recreated, so messages published meanwhile
+        are kept. Consumers of the queue are cancelled when it is deleted, and the messages moved back
+        are delivered after those published once the queue is bound again.
+
+        A migration interrupted by a failure is finished by the next run: the temporary queue is
+        declared again as is, and its bindings are handed back to the queue.
+        """
+        temporary_def = dataclasses.replace(
+            queue_def, name=migration_queue_name(queue_def.name), exclusive=False, auto_delete=False
+        )
+        path = "/api/queues/{0}/{1}".format(urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(queue_def.name))
+        temporary_path = "/api/queues/{0}/{1}".format(
+            urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(temporary_def.name)
+        )
+        with trace_operation(
+            _CONCERN,
+            "migrate_queue",
+            kind="queue",
+            entity=queue_def.name,
+            attributes={"rabbitmq.vhost": vhost, "rabbitmq.queue.temporary": temporary_def.name},
+        ) as operation:
+            queue_bindings, temporary_bindings = await asyncio.gather(
+                self._get(f"{path}/bindings"),
+                self._get_or_none(f"{temporary_path}/bindings"),
+            )
+            bindings = _unique_bindings(
+                [
+                    *_to_managed_bindings(queue_bindings),
+                    *(
+                        dataclasses.replace(binding, destination=queue_def.name)
+                        for binding in _to_managed_bindings(temporary_bindings or [])
+                    ),
+                ]
+            )
+            parked_bindings = [dataclasses.replace(binding, destination=temporary_def.name) for binding in bindings]
+
+            self.logger.warning(
+                f"Migrating queue '{queue_def.name}' in vhost '{vhost}' through '{temporary_def.name}' "
+                + (f"to apply {_describe_drift(drift)}" if drift else "to finish an interrupted migration"),
+                extra={"rabbitmq_queue": queue_def.name, "rabbitmq_vhost": vhost, "rabbitmq_drift": drift},
+            )
+
+            # Park the messages. The temporary queue is bound before the queue is unbound, a message
+            # published in between is delivered twice rather than lost
+            await self._declare_queues(vhost, [temporary_def], operation)
+            await self._declare_bindings(vhost, parked_bindings, operation)
+            for binding in bindings:
+                await self._remove_binding(vhost, binding)
+            await self._move_messages(vhost, queue_def.name, temporary_def.name, queue_def.name)
+            await self._delete_drained_queue(vhost, queue_def.name, queue_def.name)
+
+            # Recreate the queue and bring the messages back
+            await self._declare_queues(vhost, [queue_def], operation)
+            await self._declare_bindings(vhost, bindings, operation)
+            for binding in parked_bindings:
+                await self._remove_binding(vhost, binding)
+            await self._move_messages(vhost, temporary_def.name, queue_def.name, queue_def.name)
+            await self._delete_drained_queue(vhost, temporary_def.name, queue_def.name)
+            operation.record(EntityAction.DELETED, entity=temporary_def.name)
+
+    async def _move_messages(self, vhost: str, source: str, destination: str, migrated_queue: str) -> None:
+        """Moves the messages of a queue to another with a dynamic shovel, waiting for the shovel to finish.
+
+        The shovel deletes itself once it has moved the messages the source held when it started.
+
+        Raises:
+            ValueError: If the broker refuses the shovel, e.g. because the shovel plugin is not enabled.
+            RabbitMqMigrationError: If the shovel is still running after ``migration_timeout_seconds``.
+        """
+        uri = "amqp:///" + urllib.parse.quote(vhost, safe="")
+        path = "/api/parameters/shovel/{0}/{1}".format(
+            urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(f"{source}-to-{destination}")
+        )
+        try:
+            await self._put(
+                path=path,
+                data={
+                    "value": {
+                        "src-protocol": "amqp091",
+                        "src-uri": uri,
+                        "src-queue": source,
+                        "src-delete-after": "queue-length",
+                        "dest-protocol": "amqp091",
+                        "dest-uri": uri,
+                        "dest-queue": destination,
+                        "ack-mode": "on-confirm",
+                    }
+                },
+            )
+        except aiohttp.ClientResponseError as e:
+            if e.status not in (400, 404):
+                raise
+            raise ValueError(
+                f"Could not move the messages of queue '{source}' to '{destination}' in vhost '{vhost}', "
+                f"the rabbitmq_shovel plugin must be enabled to migrate queues: {e.message}"
+            ) from e
+
+        deadline = time.monotonic() + self.rabbitmq_options.migration_timeout_seconds
+        while await self._get_or_none(path) is not None:
+            if time.monotonic() >= deadline:
+                migration_queue = migration_queue_name(migrated_queue)
+                raise RabbitMqMigrationError(
+                    f"Moving the messages of queue '{source}' to '{destination}' in vhost '{vhost}' did not finish "
+                    f"within {self.rabbitmq_options.migration_timeout_seconds} seconds, queue '{migration_queue}' "
+                    f"was left in place, run the bootstrapper again to finish migrating queue '{migrated_queue}'.",
+                    vhost=vhost,
+                    queue=migrated_queue,
+                    migration_queue=migration_queue,
+                )
+            await asyncio.sleep(_SHOVEL_POLL_INTERVAL_SECONDS)
+
+    async def _delete_drained_queue(self, vhost: str, queue_name: str, migrated_queue: str) -> None:
+        """Deletes a queue a shovel emptied, refusing to lose a message that reached it since.
+
+        Raises:
+            ValueError: If the queue is not empty.
+        """
+        try:
+            await self._delete(
+                "/api/queues/{0}/{1}?if-empty=true".format(
+                    urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(queue_name)
+                )
+            )
+        except aiohttp.ClientResponseError as e:
+            if e.status != 400:
+                raise
+            raise ValueError(
+                f"Queue '{queue_name}' in vhost '{vhost}' received messages while they were being moved and was "
+                f"left in place, run the bootstrapper again to finish migrating queue '{migrated_queue}'."
+            ) from e
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Gets the pooled session, creating it on first use so connections stay warm between calls.
+
+        Returns:
+            aiohttp.ClientSession: The session used for every management API call.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(auth=self.auth, headers=self.headers)
+        return self._session
+
+    @contextlib.asynccontextmanager
+    async def _throttle(self, method: str) -> AsyncIterator[None]:
+        """Waits for the request rate cap and a concurrency slot, then tells the limiter how the request went.
+
+        Args:
+            method (str): The HTTP method, latencies are compared between requests of the same method.
+
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        started = await self.concurrency_limiter.acquire()
+        overloaded = False
+        observe = True
+        try:
+            yield
+        except aiohttp.ClientResponseError as e:
+            overloaded = e.status in _OVERLOAD_STATUSES
+            raise
+        except BaseException:
+            # No answer, e.g. a refused connection or a cancelled call, says nothing of the broker load
+            observe = False
+            raise
+        finally:
+            self.concurrency_limiter.release(started, kind=method, overloaded=overloaded, observe=observe)
+            self.metrics.management_api_concurrency_limit.set(self.concurrency_limiter.limit, api=_METRICS_API)
+
     async def _get(self, path: str) -> Any:
         """A wrapper for getting things from the RabbitMQ Management HTTP API using aiohttp.
 
@@ -519,14 +1495,49 @@ class RabbitMqAdminService(IRabbitMqAdminService):
             Any: The JSON response from the API.
 
         """
-        url = self.admin_client.url + path
-        auth = aiohttp.BasicAuth(*self.admin_client.auth)
-        headers = deepcopy(self.admin_client.headers)
+        async with self._throttle("GET"):
+            with self.metrics.time_api_call(_METRICS_API, "GET"):
+                async with self._get_session().get(self.url + path) as response:
+                    response.raise_for_status()
+                    return await response.json()
+
+    async def _iter_get(self, path: str) -> AsyncIterator[Any]:
+        """A wrapper for streaming a JSON array from the RabbitMQ Management HTTP API using aiohttp.
+
+        The concurrency slot is only held until the answer starts, the caller may make other requests
+        while it reads the stream.
+
+        Args:
+            path (str): The API path to get.
 
-        async with aiohttp.ClientSession(auth=auth, headers=headers) as session:
-            async with session.get(url) as response:
+        Yields:
+            Any: Each element of the JSON array answered by the API, as soon as it is parsed.
+
+        """
+        with self.metrics.time_api_call(_METRICS_API, "GET"):
+            async with self._throttle("GET"):
+                response = await self._get_session().get(self.url + path)
                 response.raise_for_status()
-                return await response.json()
+            async with response:
+                async for element in iter_json_array(response.content.iter_chunked(_STREAM_CHUNK_SIZE)):
+                    yield element
+
+    async def _get_or_none(self, path: str) -> Any | None:
+        """A wrapper for getting a single thing from the RabbitMQ Management HTTP API, returning None when it does not exist.
+
+        Args:
+            path (str): The API path to get.
+
+        Returns:
+            Any | None: The JSON response from the API, or None on a 404 response.
+
+        """
+        try:
+            return await self._get(path)
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
+                return None
+            raise
 
     async def _put(self, path: str, data: dict) -> None:
         """A wrapper for upserting things from the RabbitMQ Management HTTP API using aiohttp.
@@ -536,13 +1547,10 @@ class RabbitMqAdminService(IRabbitMqAdminService):
             data (dict): The JSON data to send.
 
         """
-        url = self.admin_client.url + path
-        auth = aiohttp.BasicAuth(*self.admin_client.auth)
-        headers = deepcopy(self.admin_client.headers)
-
-        async with aiohttp.ClientSession(auth=auth, headers=headers) as session:
-            async with session.put(url, json=data) as response:
-                response.raise_for_status()
+        async with self._throttle("PUT"):
+            with self.metrics.time_api_call(_METRICS_API, "PUT"):
+                async with self._get_session().put(self.url + path, json=data) as response:
+                    response.raise_for_status()
 
     async def _post(self, path: str, data: dict) -> None:
         """A wrapper for creating things from the RabbitMQ Management HTTP API using aiohttp.
@@ -552,13 +1560,10 @@ class RabbitMqAdminService(IRabbitMqAdminService):
             data (dict): The JSON data to send.
 
         """
-        url = self.admin_client.url + path
-        auth = aiohttp.BasicAuth(*self.admin_client.auth)
-        headers = deepcopy(self.admin_client.headers)
-
-        async with aiohttp.ClientSession(auth=auth, headers=headers) as session:
-            async with session.post(url, json=data) as response:
-                response.raise_for_status()
+        async with self._throttle("POST"):
+            with self.metrics.time_api_call(_METRICS_API, "POST"):
+                async with self._get_session().post(self.url + path, json=data) as response:
+                    response.raise_for_status()
 
     async def _delete(self, path: str) -> None:
         """A wrapper for deleting things from the RabbitMQ Management HTTP API using aiohttp.
@@ -567,10 +1572,169 @@ class RabbitMqAdminService(IRabbitMqAdminService):
             path (str): The API path to delete.
 
         """
-        url = self.admin_client.url + path
-        auth = aiohttp.BasicAuth(*self.admin_client.auth)
-        headers = deepcopy(self.admin_client.headers)
+        async with self._throttle("DELETE"):
+            with self.metrics.time_api_call(_METRICS_API, "DELETE"):
+                async with self._get_session().delete(self.url + path) as response:
+                    response.raise_for_status()
 
-        async with aiohttp.ClientSession(auth=auth, headers=headers) as session:
-            async with session.delete(url) as response:
-                response.raise_for_status()
+
+def _is_managed_exchange(name: str) -> bool:
+    """Checks whether an exchange is managed by the bootstrapper, the default and "amq." exchanges are not."""
+    return bool(name) and not name.startswith("amq.")
+
+
+def _binding_entity(binding_def: RabbitMqBinding) -> str:
+    return f"{binding_def.source}->{binding_def.destination}"
+
+
+def _unique_bindings(bindings: Iterable[RabbitMqBinding]) -> list[RabbitMqBinding]:
+    unique: dict[tuple[str, RabbitMqBindingType, str, str, str], RabbitMqBinding] = {}
+    for binding in bindings:
+        unique.setdefault(binding.key(), binding)
+    return list(unique.values())
+
+
+def _to_managed_bindings(bindings: Iterable[dict[str, Any]]) -> list[RabbitMqBinding]:
+    """Converts the bindings answered by the management API, without duplicates or those the bootstrapper does not manage."""
+    return _unique_bindings(binding for binding in map(_to_managed_binding, bindings) if binding is not None)
+
+
+def _describe_drift(drift: dict[str, dict[str, Any]]) -> str:
+    return ", ".join(
+        f"{name} {difference['existing']!r} -> {difference['desired']!r}" for name, difference in drift.items()
+    )
+
+
+def _can_migrate(queue_def: RabbitMqQueue, existing_queue: dict[str, Any]) -> bool:
+    """Checks whether the messages of a queue can be moved by a shovel.
+
+    Shovels consume streams from their end, and exclusive queues belong to the connection that declared them.
+    """
+    return (
+        (existing_queue.get("arguments") or {}).get("x-queue-type") != RabbitMqQueueType.STREAM.value
+        and not existing_queue.get("exclusive", False)
+        and not queue_def.exclusive
+    )
+
+
+def _expand_topology(topology: RabbitMqConfiguration | RabbitMqVhost) -> list[str]:
+    """Expands the super streams of a topology in place and validates its queues, names and references.
+
+    Args:
+        topology (RabbitMqConfiguration | RabbitMqVhost): The default vhost topology or a listed vhost.
+
+    Returns:
+        list[str]: Every validation error found, empty when the topology is valid.
+    """
+    errors: list[str] = []
+    for super_stream in topology.super_streams:
+        errors.extend(validate_rabbitmq_super_stream(super_stream))
+        topology.exchanges.append(super_stream.exchange())
+        topology.queues.extend(super_stream.queues())
+        topology.bindings.extend(super_stream.bindings())
+
+    for queue_def in topology.queues:
+        errors.extend(validate_rabbitmq_queue(queue_def))
+    errors.extend(validate_rabbitmq_topology(topology))
+    return errors
+
+
+def _to_permissions(permission: dict[str, Any]) -> dict[str, str]:
+    return {
+        "configure": permission.get("configure", ""),
+        "write": permission.get("write", ""),
+        "read": permission.get("read", ""),
+    }
+
+
+def _to_topic_permissions(permissions: Iterable[dict[str, Any]]) -> dict[str, list[RabbitMqTopicPermission]]:
+    """Groups the topic permissions answered by the management API by user."""
+    by_user: dict[str, list[RabbitMqTopicPermission]] = {}
+    for permission in permissions:
+        by_user.setdefault(permission["user"], []).append(
+            RabbitMqTopicPermission(
+                exchange=permission.get("exchange", ""),
+                write=permission.get("write", ""),
+                read=permission.get("read", ""),
+            )
+        )
+    return by_user
+
+
+def _topic_exchange(permission: RabbitMqTopicPermission) -> str:
+    return permission.exchange
+
+
+def _policies_path(operator: bool) -> str:
+    return "/api/operator-policies" if operator else "/api/policies"
+
+
+def _policy_kind(operator: bool) -> str:
+    return "operator_policy" if operator else "policy"
+
+
+def _to_exchange(exchange: dict[str, Any]) -> RabbitMqExchange:
+    """Converts an exchange answered by the management API."""
+    return RabbitMqExchange(
+        name=exchange["name"],
+        type=RabbitMqExchangeType(exchange.get("type", RabbitMqExchangeType.TOPIC.value)),
+        durable=exchange.get("durable", True),
+        auto_delete=exchange.get("auto_delete", False),
+        internal=exchange.get("internal", False),
+        arguments=exchange.get("arguments") or {},
+    )
+
+
+def _to_queue(queue: dict[str, Any]) -> RabbitMqQueue:
+    """Converts a queue answered by the management API, moving the typed arguments to their queue fields."""
+    arguments = dict(queue.get("arguments") or {})
+    queue_type = arguments.pop("x-queue-type", None)
+    initial_group_size = arguments.pop("x-quorum-initial-group-size", None)
+    max_length_bytes = arguments.pop("x-max-length-bytes", None)
+    stream_max_segment_size_bytes = arguments.pop("x-stream-max-segment-size-bytes", None)
+    return RabbitMqQueue(
+        name=queue["name"],
+        durable=queue.get("durable", True),
+        exclusive=queue.get("exclusive", False),
+        auto_delete=queue.get("auto_delete", False),
+        arguments=arguments,
+        type=RabbitMqQueueType(queue_type) if queue_type is not None else None,
+        initial_group_size=initial_group_size,
+        max_length_bytes=max_length_bytes,
+        stream_max_segment_size_bytes=stream_max_segment_size_bytes,
+    )
+
+
+def _to_policy(policy: dict[str, Any]) -> RabbitMqPolicy:
+    """Converts a policy answered by the management API."""
+    return RabbitMqPolicy(
+        name=policy["name"],
+        pattern=policy.get("pattern", ""),
+        definition=policy.get("definition") or {},
+        apply_to=RabbitMqPolicyApplyTo(policy.get("apply-to", RabbitMqPolicyApplyTo.ALL.value)),
+        priority=policy.get("priority", 0),
+    )
+
+
+def _to_managed_binding(binding: dict[str, Any]) -> RabbitMqBinding | None:
+    """Converts a binding answered by the management API, returning None for bindings the bootstrapper does not manage."""
+    existing_binding = RabbitMqBinding(
+        source=binding.get("source", ""),
+        destination=binding.get("destination", ""),
+        destination_type=RabbitMqBindingType(binding.get("destination_type", "")),
+        routing_key=binding.get("routing_key", ""),
+        arguments=binding.get("arguments", {}),
+    )
+
+    if (
+        not existing_binding.source
+        and existing_binding.routing_key == existing_binding.destination
+        and existing_binding.destination_type == RabbitMqBindingType.QUEUE
+    ):
+        # Skip default direct queue bindings
+        return None
+
+    if not existing_binding.source or not existing_binding.destination:
+        return None
+
+    return existing_binding
@@ -0,0 +1,233 @@
+import asyncio
+import urllib.parse
+
+import aiormq
+from aiormq.abc import AbstractChannel, AbstractConnection
+from injector import inject
+
+from cezzis_com_bootstrapper.domain.config.rabbitmq_options import RabbitMqOptions
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding import RabbitMqBinding
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_binding_type import RabbitMqBindingType
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_exchange import RabbitMqExchange
+from cezzis_com_bootstrapper.domain.messaging.rabbitmq_queue import RabbitMqQueue
+from cezzis_com_bootstrapper.infrastructure.services.rabbitmq_admin_service import RabbitMqAdminService
+from cezzis_com_bootstrapper.infrastructure.telemetry import EntityAction, Operation
+
+_METRICS_API = "rabbitmq_amqp"
+
+
+class RabbitMqAmqpService(RabbitMqAdminService):
+    """Declares exchanges, queues and bindings over an AMQP connection instead of the management API.
+
+    Vhosts, users and permissions, and every read, still go through the management API. The
+    declares of a batch are pipelined on one channel with ``nowait`` and confirmed by the reply to
+    the last one, so creating a whole topology costs one round trip per entity kind instead of one
+    request per entity. Each vhost gets its own aiormq connection, which negotiates heartbeats
+    with the broker, authenticated as the administrator. The management API grants the
+    administrator full permissions on the vhosts it creates, a vhost created some other way is
+    granted them before its first connection.
+
+    Exclusive queues belong to the connection that declares them, they are still declared through
+    the management API.
+    """
+
+    @inject
+    def __init__(self, rabbitmq_options: RabbitMqOptions):
+        super().__init__(rabbitmq_options)
+        host = urllib.parse.urlsplit(
+            rabbitmq_options.host if "://" in rabbitmq_options.host else f"//{rabbitmq_options.host}"
+        )
+        self.amqp_host = host.hostname or "localhost"
+        self.amqp_use_tls = host.scheme in ("https", "amqps")
+        self._connections: dict[str, AbstractConnection] = {}
+        self._channels: dict[str, AbstractChannel] = {}
+        self._channel_locks: dict[str, asyncio.Lock] = {}
+
+    async def close(self) -> None:
+        """Closes the AMQP connections, then the pooled management API connections."""
+        connections = list(self._connections.values())
+        self._connections = {}
+        self._channels = {}
+        await asyncio.gather(*(connection.close() for connection in connections), return_exceptions=True)
+        await super().close()
+
+    async def _declare_exchanges(self, vhost: str, exchange_defs: list[RabbitMqExchange], operation: Operation) -> None:
+        async with self._channel_locks.setdefault(vhost, asyncio.Lock()):
+            channel = await self._get_channel(vhost)
+            with self.metrics.time_api_call(_METRICS_API, "exchange.declare"):
+                for index, exchange_def in enumerate(exchange_defs):
+                    await channel.exchange_declare(
+                        exchange_def.name,
+                        exchange_type=exchange_def.type.value,
+                        durable=exchange_def.durable,
+                        auto_delete=exchange_def.auto_delete,
+                        internal=exchange_def.internal,
+                        arguments=exchange_def.arguments,
+                        nowait=index < len(exchange_defs) - 1,
+                    )
+
+        for exchange_def in exchange_defs:
+            self.logger.info(
+                f"Created exchange '{exchange_def.name}' in vhost '{vhost}'",
+                extra={"rabbitmq_exchange": exchange_def.name, "rabbitmq_vhost": vhost},
+            )
+            operation.record(EntityAction.CREATED, entity=exchange_def.name)
+
+    async def _declare_queues(self, vhost: str, queue_defs: list[RabbitMqQueue], operation: Operation) -> None:
+        exclusive_queues = [queue_def for queue_def in queue_defs if queue_def.exclusive]
+        if exclusive_queues:
+            await super()._declare_queues(vhost, exclusive_queues, operation)
+
+        shared_queues = [queue_def for queue_def in queue_defs if not queue_def.exclusive]
+        if not shared_queues:
+            return
+
+        async with self._channel_locks.setdefault(vhost, asyncio.Lock()):
+            channel = await self._get_channel(vhost)
+            with self.metrics.time_api_call(_METRICS_API, "queue.declare"):
+                for index, queue_def in enumerate(shared_queues):
+                    await channel.queue_declare(
+                        queue_def.name,
+                        durable=queue_def.durable,
+                        exclusive=False,
+                        auto_delete=queue_def.auto_delete,
+                        arguments=queue_def.declared_arguments(),
+                        nowait=index < len(shared_queues) - 1,
+                    )
+
+        for queue_def in shared_queues:
+            self.logger.info(
+                f"Created queue '{queue_def.name}' in vhost '{vhost}'",
+                extra={"rabbitmq_queue": queue_def.name, "rabbitmq_vhost": vhost},
+            )
+            operation.record(EntityAction.CREATED, entity=queue_def.name)
+
+    async def _declare_bindings(self, vhost: str, binding_defs: list[RabbitMqBinding], operation: Operation) -> None:
+        async with self._channel_locks.setdefault(vhost, asyncio.Lock()):
+            channel = await self._get_channel(vhost)
+            with self.metrics.time_api_call(_METRICS_API, "bind"):
+                for index, binding_def in enumerate(binding_defs):
+                    nowait = index < len(binding_defs) - 1
+                    if binding_def.destination_type == RabbitMqBindingType.EXCHANGE:
+                        await channel.exchange_bind(
+                            destination=binding_def.destination,
+                            source=binding_def.source,
+                            routing_key=binding_def.routing_key,
+                            arguments=binding_def.arguments,
+                            nowait=nowait,
+                        )
+                    else:
+                        await channel.queue_bind(
+                            queue=binding_def.destination,
+                            exchange=binding_def.source,
+                            routing_key=binding_def.routing_key,
+                            arguments=binding_def.arguments,
+                            nowait=nowait,
+                        )
+
+        for binding_def in binding_defs:
+            self.logger.info(
+                f"Created binding from '{binding_def.source}' to '{binding_def.destination}' in vhost '{vhost}'",
+                extra={
+                    "rabbitmq_vhost": vhost,
+                    "rabbitmq_exchange": binding_def.source,
+                    "rabbitmq_routing_key": binding_def.routing_key,
+                    "rabbitmq_destination": binding_def.destination,
+                },
+            )
+            operation.record(EntityAction.CREATED, entity=f"{binding_def.source}->{binding_def.destination}")
+
+    async def _remove_exchange(self, vhost: str, exchange_name: str) -> None:
+        async with self._channel_locks.setdefault(vhost, asyncio.Lock()):
+            channel = await self._get_channel(vhost)
+            with self.metrics.time_api_call(_METRICS_API, "exchange.delete"):
+                await channel.exchange_delete(exchange_name)
+
+    async def _remove_queue(self, vhost: str, queue_name: str) -> None:
+        async with self._channel_locks.setdefault(vhost, asyncio.Lock()):
+            channel = await self._get_channel(vhost)
+            with self.metrics.time_api_call(_METRICS_API, "queue.delete"):
+                await channel.queue_delete(queue_name)
+
+    async def _remove_binding(self, vhost: str, binding_def: RabbitMqBinding) -> bool:
+        # Unbinding a binding that does not exist succeeds, the broker cannot tell it apart
+        async with self._channel_locks.setdefault(vhost, asyncio.Lock()):
+            channel = await self._get_channel(vhost)
+            with self.metrics.time_api_call(_METRICS_API, "unbind"):
+                if binding_def.destination_type == RabbitMqBindingType.EXCHANGE:
+                    await channel.exchange_unbind(
+                        destination=binding_def.destination,
+                        source=binding_def.source,
+                        routing_key=binding_def.routing_key,
+                        arguments=binding_def.arguments,
+                    )
+                else:
+                    await channel.queue_unbind(
+                        queue=binding_def.destination,
+                        exchange=binding_def.source,
+                        routing_key=binding_def.routing_key,
+                        arguments=binding_def.arguments,
+                    )
+        return True
+
+    async def _get_channel(self, vhost: str) -> AbstractChannel:
+        """Gets the open channel to a vhost, opening a new one on first use or once it was closed.
+
+        A refused method closes only its channel, the connection is kept for the next one. A lost
+        connection is opened again.
+
+        Args:
+            vhost (str): The name of the virtual host.
+
+        Returns:
+            AbstractChannel: The channel, on a connection authenticated as the administrator.
+        """
+        channel = self._channels.get(vhost)
+        if channel is not None and not channel.is_closed:
+            return channel
+
+        connection = self._connections.get(vhost)
+        if connection is None or connection.is_closed:
+            await self._grant_administrator_permissions(vhost)
+            with self.metrics.time_api_call(_METRICS_API, "connection.open"):
+                connection = await aiormq.connect(self._amqp_url(vhost))
+            self._connections[vhost] = connection
+
+        with self.metrics.time_api_call(_METRICS_API, "channel.open"):
+            channel = await connection.channel(publisher_confirms=False)
+        self._channels[vhost] = channel
+        return channel
+
+    async def _grant_administrator_permissions(self, vhost: str) -> None:
+        """Grants the administrator full permissions on a vhost it has none on, leaving existing ones alone.
+
+        Args:
+            vhost (str): The name of the virtual host.
+        """
+        path = "/api/permissions/{0}/{1}".format(
+            urllib.parse.quote_plus(vhost), urllib.parse.quote_plus(self.rabbitmq_options.admin_username)
+        )
+        if await self._get_or_none(path) is None:
+            self.logger.info(
+                f"Granting the administrator permissions on vhost '{vhost}' for AMQP declares",
+                extra={"rabbitmq_vhost": vhost},
+            )
+            await self._put(path=path, data={"configure": ".*", "write": ".*", "read": ".*"})
+
+    def _amqp_url(self, vhost: str) -> str:
+        """Builds the AMQP URL of a vhost, credentials and vhost quoted.
+
+        Args:
+            vhost (str): The name of the virtual host.
+
+        Returns:
+            str: The ``amqp://`` or ``amqps://`` URL aiormq connects to.
+        """
+        return "{0}://{1}:{2}@{3}:{4}/{5}".format(
+            "amqps" if self.amqp_use_tls else "amqp",
+            urllib.parse.quote(self.rabbitmq_options.admin_username, safe=""),
+            urllib.parse.quote(self.rabbitmq_options.admin_password, safe=""),
+            f"[{self.amqp_host}]" if ":" in self.amqp_host else self.amqp_host,
+            self.rabbitmq_options.amqp_port,
+            urllib.parse.quote(vhost, safe=""),
+        )
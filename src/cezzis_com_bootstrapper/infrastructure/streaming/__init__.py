@@ -0,0 +1,3 @@
+from cezzis_com_bootstrapper.infrastructure.streaming.json_stream import iter_json_array
+
+__all__ = ["iter_json_array"]
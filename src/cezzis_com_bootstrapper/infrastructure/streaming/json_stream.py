@@ -0,0 +1,93 @@
+import codecs
+import json
+from typing import Any, AsyncIterable, AsyncIterator
+
+_WHITESPACE = " \t\n\r"
+
+# A value ending with one of these is complete. Any other, e.g. the "-0" of "-0.5", is only
+# complete once followed by a delimiter, it may continue in the next chunk
+_CLOSING = '}]"'
+_DELIMITERS = tuple(_WHITESPACE + ",]")
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """Parses a UTF-8 JSON array from a stream of chunks, yielding each element as soon as it is complete.
+
+    Only the element being parsed and the rest of the current chunk are held in memory, however
+    long the array is. Each chunk is appended to what is left of the previous one, so the buffer
+    never holds more than one chunk and one element.
+
+    Args:
+        chunks (AsyncIterable[bytes]): The body of the response, e.g. ``response.content.iter_chunked(...)``.
+
+    Yields:
+        Any: Each element of the array, decoded like ``json.loads`` would decode it.
+
+    Raises:
+        json.JSONDecodeError: If the stream is not a JSON array or ends before the array does.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    iterator = chunks.__aiter__()
+    buffer = ""
+    position = 0
+    finished = False
+
+    async def read_more() -> bool:
+        nonlocal buffer, position, finished
+        if finished:
+            return False
+        try:
+            chunk = await iterator.__anext__()
+        except StopAsyncIteration:
+            finished = True
+            buffer = buffer[position:] + text_decoder.decode(b"", final=True)
+        else:
+            buffer = buffer[position:] + text_decoder.decode(chunk)
+        position = 0
+        return True
+
+    async def next_token() -> str:
+        """Skips whitespace and returns the next character without consuming it, empty at the end of the stream."""
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not await read_more():
+                return ""
+
+    if await next_token() != "[":
+        raise json.JSONDecodeError("Expecting '['", buffer, position)
+    position += 1
+
+    if await next_token() == "]":
+        position += 1
+    else:
+        while True:
+            if not await next_token():
+                raise json.JSONDecodeError("Unterminated array", buffer, position)
+
+            # An element split across chunks fails to decode until its last chunk is read
+            while True:
+                try:
+                    element, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if not await read_more():
+                        raise
+                    continue
+                if buffer[end - 1] in _CLOSING or buffer[end : end + 1] in _DELIMITERS or not await read_more():
+                    break
+            position = end
+            yield element
+
+            separator = await next_token()
+            position += 1
+            if separator == "]":
+                break
+            if separator != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, position - 1)
+
+    if await next_token():
+        raise json.JSONDecodeError("Extra data", buffer, position)
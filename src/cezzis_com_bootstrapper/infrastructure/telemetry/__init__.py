@@ -0,0 +1,31 @@
+from cezzis_com_bootstrapper.infrastructure.telemetry.bootstrapper_metrics import (
+    BootstrapperMetrics,
+    get_bootstrapper_metrics,
+)
+from cezzis_com_bootstrapper.infrastructure.telemetry.metrics_registry import (
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+)
+from cezzis_com_bootstrapper.infrastructure.telemetry.operation_telemetry import (
+    EntityAction,
+    Operation,
+    trace_operation,
+)
+from cezzis_com_bootstrapper.infrastructure.telemetry.run_report import RunReport, get_run_report, reset_run_report
+
+__all__ = [
+    "BootstrapperMetrics",
+    "get_bootstrapper_metrics",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "EntityAction",
+    "Operation",
+    "trace_operation",
+    "RunReport",
+    "get_run_report",
+    "reset_run_report",
+]
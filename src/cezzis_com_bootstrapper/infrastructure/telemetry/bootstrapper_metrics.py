@@ -0,0 +1,140 @@
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from cezzis_com_bootstrapper.infrastructure.telemetry.metrics_registry import MetricsRegistry
+from cezzis_com_bootstrapper.infrastructure.telemetry.run_report import record_api_call
+
+_RECONCILE_BUCKETS: tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+class BootstrapperMetrics:
+    """The metrics the bootstrapper exposes on its metrics endpoint.
+
+    Attributes:
+        registry (MetricsRegistry): The registry rendering the metrics.
+        reconcile_duration_seconds (Histogram): Duration of each concern's reconcile, by outcome.
+        reconcile_failures_total (Counter): Reconciles that raised, per concern.
+        last_success_timestamp_seconds (Gauge): Unix time of each concern's last successful reconcile.
+        management_api_request_duration_seconds (Histogram): Latency of every management API call.
+        management_api_concurrency_limit (Gauge): The requests the adaptive limiter lets in flight, per API.
+        entities_created_total (Counter): Entities created, per concern and kind.
+        entities_deleted_total (Counter): Entities deleted, per concern and kind.
+        command_duration_seconds (Histogram): Wall-clock time of each mediator command, by outcome.
+        command_retries_total (Counter): Command attempts retried after a transient error.
+        peak_rss_bytes (Gauge): Peak resident set size of the process.
+    """
+
+    def __init__(self):
+        self.registry = MetricsRegistry()
+        self.reconcile_duration_seconds = self.registry.histogram(
+            "bootstrapper_reconcile_duration_seconds",
+            "Duration of a concern reconcile in seconds.",
+            ("concern", "outcome"),
+            buckets=_RECONCILE_BUCKETS,
+        )
+        self.reconcile_failures_total = self.registry.counter(
+            "bootstrapper_reconcile_failures_total",
+            "Number of concern reconciles that failed.",
+            ("concern",),
+        )
+        self.last_success_timestamp_seconds = self.registry.gauge(
+            "bootstrapper_last_success_timestamp_seconds",
+            "Unix time of the last successful reconcile of a concern.",
+            ("concern",),
+        )
+        self.management_api_request_duration_seconds = self.registry.histogram(
+            "bootstrapper_management_api_request_duration_seconds",
+            "Latency of management API requests in seconds.",
+            ("api", "operation", "outcome"),
+        )
+        self.management_api_concurrency_limit = self.registry.gauge(
+            "bootstrapper_management_api_concurrency_limit",
+            "Management API requests the adaptive limiter currently lets in flight.",
+            ("api",),
+        )
+        self.entities_created_total = self.registry.counter(
+            "bootstrapper_entities_created_total",
+            "Number of entities created.",
+            ("concern", "kind"),
+        )
+        self.entities_deleted_total = self.registry.counter(
+            "bootstrapper_entities_deleted_total",
+            "Number of entities deleted.",
+            ("concern", "kind"),
+        )
+        self.command_duration_seconds = self.registry.histogram(
+            "bootstrapper_command_duration_seconds",
+            "Wall-clock time of a mediator command in seconds.",
+            ("command", "outcome"),
+            buckets=_RECONCILE_BUCKETS,
+        )
+        self.command_retries_total = self.registry.counter(
+            "bootstrapper_command_retries_total",
+            "Number of command attempts retried after a transient error.",
+            ("command",),
+        )
+        self.peak_rss_bytes = self.registry.gauge(
+            "bootstrapper_peak_rss_bytes",
+            "Peak resident set size of the bootstrapper process in bytes.",
+        )
+
+    def record_reconcile(self, concern: str, duration_seconds: float, succeeded: bool) -> None:
+        """Records the outcome of a concern reconcile.
+
+        Args:
+            concern (str): The name of the concern.
+            duration_seconds (float): How long the reconcile took.
+            succeeded (bool): Whether the reconcile completed without raising.
+        """
+        self.reconcile_duration_seconds.observe(
+            duration_seconds, concern=concern, outcome="success" if succeeded else "failure"
+        )
+        if succeeded:
+            self.last_success_timestamp_seconds.set(time.time(), concern=concern)
+        else:
+            self.reconcile_failures_total.inc(concern=concern)
+
+    def record_entity_created(self, concern: str, kind: str) -> None:
+        """Counts an entity created by a concern, e.g. a queue or a topic."""
+        self.entities_created_total.inc(concern=concern, kind=kind)
+
+    def record_entity_deleted(self, concern: str, kind: str) -> None:
+        """Counts an entity deleted by a concern, e.g. a stale exchange or user."""
+        self.entities_deleted_total.inc(concern=concern, kind=kind)
+
+    @contextmanager
+    def time_api_call(self, api: str, operation: str) -> Iterator[None]:
+        """Times a management API call, labelling it as failed when the block raises.
+
+        The call is also counted on the operations in progress for the run report.
+
+        Args:
+            api (str): The API called, e.g. "rabbitmq_management".
+            operation (str): The operation, e.g. the HTTP method.
+        """
+        record_api_call()
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            yield
+            outcome = "success"
+        finally:
+            self.management_api_request_duration_seconds.observe(
+                time.perf_counter() - started, api=api, operation=operation, outcome=outcome
+            )
+
+
+_bootstrapper_metrics: BootstrapperMetrics | None = None
+
+
+def get_bootstrapper_metrics() -> BootstrapperMetrics:
+    """Get the singleton instance of BootstrapperMetrics.
+
+    Returns:
+        BootstrapperMetrics: The bootstrapper metrics instance.
+    """
+    global _bootstrapper_metrics
+    if _bootstrapper_metrics is None:
+        _bootstrapper_metrics = BootstrapperMetrics()
+    return _bootstrapper_metrics
@@ -0,0 +1,184 @@
+import time
+from contextlib import contextmanager
+from enum import Enum
+from typing import Iterator
+
+from opentelemetry import metrics, trace
+from opentelemetry.trace import Span
+
+from cezzis_com_bootstrapper.infrastructure.telemetry.bootstrapper_metrics import get_bootstrapper_metrics
+from cezzis_com_bootstrapper.infrastructure.telemetry.run_report import OperationStats, get_run_report, track_operation
+
+_INSTRUMENTATION_NAME = "cezzis_com_bootstrapper"
+
+_tracer = trace.get_tracer(_INSTRUMENTATION_NAME)
+_meter = metrics.get_meter(_INSTRUMENTATION_NAME)
+
+_operation_duration = _meter.create_histogram(
+    "bootstrapper.operation.duration",
+    unit="s",
+    description="Duration of bootstrapper operations such as vhost checks, binding listings or topic creation.",
+)
+_entity_actions = _meter.create_counter(
+    "bootstrapper.entities",
+    unit="{entity}",
+    description="Entities created, updated, deleted, skipped or failed by the bootstrapper.",
+)
+
+
+class EntityAction(str, Enum):
+    """The action an operation took on an entity."""
+
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    SKIPPED = "skipped"
+    DRIFTED = "drifted"
+    FAILED = "failed"
+
+
+# Skipped entities already matched their definition, the run report calls them unchanged
+_REPORT_ACTIONS = {
+    EntityAction.CREATED: "created",
+    EntityAction.UPDATED: "updated",
+    EntityAction.DELETED: "deleted",
+    EntityAction.SKIPPED: "unchanged",
+    EntityAction.DRIFTED: "drifted",
+    EntityAction.FAILED: "failed",
+}
+
+
+class Operation:
+    """Handle on an operation in progress, used to record what it did to its entity.
+
+    Attributes:
+        concern (str): The concern the operation belongs to.
+        name (str): The operation name, e.g. "create_vhost_if_not_exists".
+        kind (str): The kind of entity the operation works on, e.g. "exchange".
+        span (Span): The span wrapping the operation.
+        entity (str): The name of the entity the operation works on, empty for batched operations.
+        stats (OperationStats): The API calls made by the operation.
+        actions (list[tuple[str, EntityAction]]): Every action recorded, with the entity it was taken on.
+    """
+
+    def __init__(
+        self,
+        concern: str,
+        name: str,
+        kind: str,
+        span: Span,
+        entity: str = "",
+        stats: OperationStats | None = None,
+    ):
+        self.concern = concern
+        self.name = name
+        self.kind = kind
+        self.span = span
+        self.entity = entity
+        self.stats = stats or OperationStats()
+        self.action: EntityAction | None = None
+        self.actions: list[tuple[str, EntityAction]] = []
+
+    @property
+    def api_calls(self) -> int:
+        return self.stats.api_calls
+
+    def record(self, action: EntityAction, entity: str = "") -> None:
+        """Records the action taken on the operation's entity on the span, the OTel counter and the Prometheus counters.
+
+        Args:
+            action (EntityAction): The action taken.
+            entity (str, optional): The entity the action was taken on, for operations working on several
+                entities. Defaults to the operation's entity.
+        """
+        self.action = action
+        self.actions.append((entity or self.entity, action))
+        self.span.set_attribute("bootstrapper.action", action.value)
+        _entity_actions.add(1, {"concern": self.concern, "entity.kind": self.kind, "action": action.value})
+
+        if action == EntityAction.CREATED:
+            get_bootstrapper_metrics().record_entity_created(self.concern, self.kind)
+        elif action == EntityAction.DELETED:
+            get_bootstrapper_metrics().record_entity_deleted(self.concern, self.kind)
+
+
+@contextmanager
+def trace_operation(
+    concern: str, operation: str, kind: str = "", entity: str = "", attributes: dict[str, str] | None = None
+) -> Iterator[Operation]:
+    """Wraps a bootstrapper operation in a span named "<concern>.<operation>" and records its duration.
+
+    Args:
+        concern (str): The concern the operation belongs to, e.g. "rabbitmq".
+        operation (str): The operation name, e.g. "create_vhost_if_not_exists".
+        kind (str, optional): The kind of entity the operation works on. Defaults to "".
+        entity (str, optional): The name of the entity the operation works on. Defaults to "".
+        attributes (dict[str, str] | None, optional): Extra span attributes, e.g. {"rabbitmq.vhost": "cezzis"}.
+
+    Yields:
+        Operation: The handle used to record the action taken.
+    """
+    span_attributes = {"bootstrapper.concern": concern, "bootstrapper.operation": operation}
+    if kind:
+        span_attributes["bootstrapper.entity.kind"] = kind
+    if entity:
+        span_attributes["bootstrapper.entity.name"] = entity
+    span_attributes.update(attributes or {})
+
+    started = time.perf_counter()
+    outcome = "error"
+    # The span records the exception and sets an error status itself when the block raises
+    with (
+        _tracer.start_as_current_span(f"{concern}.{operation}", attributes=span_attributes) as span,
+        track_operation() as stats,
+    ):
+        handle = Operation(concern, operation, kind, span, entity=entity, stats=stats)
+        try:
+            yield handle
+            outcome = "success"
+        finally:
+            duration_seconds = time.perf_counter() - started
+            _operation_duration.record(
+                duration_seconds, {"concern": concern, "operation": operation, "outcome": outcome}
+            )
+            _report_operation(handle, duration_seconds, outcome)
+
+
+def _report_operation(operation: Operation, duration_seconds: float, outcome: str) -> None:
+    report = get_run_report()
+    for entity, action in operation.actions:
+        if entity:
+            report.record_resource(
+                operation.concern,
+                operation.kind,
+                entity,
+                operation.name,
+                _REPORT_ACTIONS[action],
+                duration_seconds,
+                operation.api_calls,
+            )
+
+    if any(action == EntityAction.FAILED for _, action in operation.actions):
+        operation.stats.failure_reported = True
+
+    # Only the innermost operation working on an entity reports a failure that propagates through several
+    if outcome == "error" and not operation.stats.failure_reported:
+        if operation.entity and not operation.actions:
+            report.record_resource(
+                operation.concern,
+                operation.kind,
+                operation.entity,
+                operation.name,
+                "failed",
+                duration_seconds,
+                operation.api_calls,
+            )
+            operation.stats.failure_reported = True
+    if operation.stats.failure_reported and operation.stats.parent is not None:
+        operation.stats.parent.failure_reported = True
+
+    # Operations that only group others, like a concern reconcile, would always top the slowest list
+    if operation.kind or not operation.stats.has_children:
+        report.record_operation(
+            operation.concern, operation.name, operation.entity, duration_seconds, operation.api_calls, outcome
+        )
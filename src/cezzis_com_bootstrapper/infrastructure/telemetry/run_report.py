@@ -0,0 +1,265 @@
+import heapq
+import json
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+_SLOWEST_OPERATIONS = 10
+
+
+class OperationStats:
+    """Counters of an operation in progress, shared with the operations nested in it.
+
+    Attributes:
+        parent (OperationStats | None): The counters of the operation this one is nested in.
+        api_calls (int): API calls made by the operation and the operations nested in it.
+        has_children (bool): Whether other operations ran nested in this one.
+        failure_reported (bool): Whether a failure of this operation, or of one nested in it, was reported.
+    """
+
+    def __init__(self, parent: "OperationStats | None" = None):
+        self.parent = parent
+        self.api_calls = 0
+        self.has_children = False
+        self.failure_reported = False
+
+
+_active_operations: ContextVar[tuple[OperationStats, ...]] = ContextVar("bootstrapper_active_operations", default=())
+
+
+@contextmanager
+def track_operation() -> Iterator[OperationStats]:
+    """Tracks an operation so the API calls made while it runs are counted on it and its parents.
+
+    Yields:
+        OperationStats: The counters of the operation.
+    """
+    active = _active_operations.get()
+    stats = OperationStats(parent=active[-1] if active else None)
+    if stats.parent is not None:
+        stats.parent.has_children = True
+    token = _active_operations.set((*active, stats))
+    try:
+        yield stats
+    finally:
+        _active_operations.reset(token)
+
+
+def record_api_call() -> None:
+    """Counts an API call on every operation in progress."""
+    for stats in _active_operations.get():
+        stats.api_calls += 1
+
+
+@dataclass
+class ResourceReport:
+    """What an operation did to one resource.
+
+    Attributes:
+        kind (str): The kind of resource, e.g. "exchange".
+        name (str): The resource name.
+        operation (str): The operation that acted on it, e.g. "create_exchanges_if_not_exist".
+        action (str): One of "created", "updated", "deleted", "unchanged", "drifted" or "failed".
+        duration_seconds (float): Duration of the operation, shared by every resource of a batched operation.
+        api_calls (int): API calls made by the operation.
+    """
+
+    kind: str
+    name: str
+    operation: str
+    action: str
+    duration_seconds: float
+    api_calls: int
+
+
+@dataclass
+class TargetReport:
+    """The outcome of one of the targets a concern reconciles separately, e.g. a RabbitMQ vhost.
+
+    Attributes:
+        outcome (str): "succeeded" or "failed".
+        duration_seconds (float): Duration of the target reconcile.
+        error (str): The error the target failed with, empty when it succeeded.
+    """
+
+    outcome: str
+    duration_seconds: float
+    error: str = ""
+
+
+@dataclass
+class ConcernReport:
+    """The outcome of a concern and of every resource it acted on.
+
+    Attributes:
+        outcome (str): "succeeded", "failed" or "pending" while the concern has not finished.
+        duration_seconds (float): Duration of the concern reconcile.
+        api_calls (int): API calls made by the concern.
+        actions (dict[str, int]): Number of resources per action.
+        resources (list[ResourceReport]): Every resource acted on, in order.
+        targets (dict[str, TargetReport]): The outcome of each target reconciled separately, if any.
+    """
+
+    outcome: str = "pending"
+    duration_seconds: float = 0.0
+    api_calls: int = 0
+    actions: dict[str, int] = field(default_factory=dict)
+    resources: list[ResourceReport] = field(default_factory=list)
+    targets: dict[str, TargetReport] = field(default_factory=dict)
+
+
+class RunReport:
+    """Collects what a bootstrapper run did so it can be written as one JSON document."""
+
+    def __init__(self, slowest_operations: int = _SLOWEST_OPERATIONS):
+        self.started_at = datetime.now(timezone.utc)
+        self.concerns: dict[str, ConcernReport] = {}
+        self._slowest_count = slowest_operations
+        self._slowest: list[tuple[float, int, dict[str, Any]]] = []
+        self._sequence = 0
+
+    def record_resource(
+        self,
+        concern: str,
+        kind: str,
+        name: str,
+        operation: str,
+        action: str,
+        duration_seconds: float,
+        api_calls: int,
+    ) -> None:
+        """Records the action an operation took on a resource.
+
+        Args:
+            concern (str): The concern the operation belongs to.
+            kind (str): The kind of resource.
+            name (str): The resource name.
+            operation (str): The operation name.
+            action (str): The action taken.
+            duration_seconds (float): Duration of the operation.
+            api_calls (int): API calls made by the operation.
+        """
+        report = self.concerns.setdefault(concern, ConcernReport())
+        report.resources.append(ResourceReport(kind, name, operation, action, duration_seconds, api_calls))
+        report.actions[action] = report.actions.get(action, 0) + 1
+
+    def record_operation(
+        self, concern: str, operation: str, entity: str, duration_seconds: float, api_calls: int, outcome: str
+    ) -> None:
+        """Offers a finished operation to the slowest operations list.
+
+        Args:
+            concern (str): The concern the operation belongs to.
+            operation (str): The operation name.
+            entity (str): The entity the operation worked on, empty when it has none.
+            duration_seconds (float): Duration of the operation.
+            api_calls (int): API calls made by the operation.
+            outcome (str): "success" or "error".
+        """
+        self._sequence += 1
+        entry = (
+            duration_seconds,
+            self._sequence,
+            {
+                "concern": concern,
+                "operation": operation,
+                "entity": entity,
+                "duration_seconds": duration_seconds,
+                "api_calls": api_calls,
+                "outcome": outcome,
+            },
+        )
+        # A bounded min-heap keeps the slowest operations without holding every operation of the run
+        if len(self._slowest) < self._slowest_count:
+            heapq.heappush(self._slowest, entry)
+        elif duration_seconds > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def record_target(
+        self, concern: str, target: str, duration_seconds: float, succeeded: bool, error: str = ""
+    ) -> None:
+        """Records the outcome of a target a concern reconciles separately from its other targets.
+
+        Args:
+            concern (str): The concern name.
+            target (str): The target name, e.g. the vhost.
+            duration_seconds (float): Duration of the target reconcile.
+            succeeded (bool): Whether the target reconcile succeeded.
+            error (str, optional): The error the target failed with. Defaults to "".
+        """
+        report = self.concerns.setdefault(concern, ConcernReport())
+        report.targets[target] = TargetReport("succeeded" if succeeded else "failed", duration_seconds, error)
+
+    def record_concern(self, concern: str, duration_seconds: float, succeeded: bool, api_calls: int) -> None:
+        """Records the outcome of a concern reconcile.
+
+        Args:
+            concern (str): The concern name.
+            duration_seconds (float): Duration of the reconcile.
+            succeeded (bool): Whether the reconcile succeeded.
+            api_calls (int): API calls made by the reconcile.
+        """
+        report = self.concerns.setdefault(concern, ConcernReport())
+        report.outcome = "succeeded" if succeeded else "failed"
+        report.duration_seconds = duration_seconds
+        report.api_calls = api_calls
+
+    def to_dict(self) -> dict[str, Any]:
+        """Builds the report document.
+
+        Returns:
+            dict[str, Any]: The report, ready to be serialized to JSON.
+        """
+        finished_at = datetime.now(timezone.utc)
+        outcomes = {report.outcome for report in self.concerns.values()}
+        return {
+            "started_at": self.started_at.isoformat(),
+            "finished_at": finished_at.isoformat(),
+            "duration_seconds": (finished_at - self.started_at).total_seconds(),
+            "outcome": "failed" if "failed" in outcomes else "pending" if "pending" in outcomes else "succeeded",
+            "concerns": {name: asdict(report) for name, report in self.concerns.items()},
+            "slowest_operations": [entry for _, _, entry in sorted(self._slowest, key=lambda item: -item[0])],
+        }
+
+    def write(self, path: str) -> None:
+        """Writes the report as JSON.
+
+        Args:
+            path (str): The file to write, or "-" for stdout.
+        """
+        content = json.dumps(self.to_dict(), indent=2)
+        if path == "-":
+            sys.stdout.write(content + "\n")
+            sys.stdout.flush()
+        else:
+            Path(path).write_text(content + "\n")
+
+
+_run_report: RunReport | None = None
+
+
+def get_run_report() -> RunReport:
+    """Get the report of the current run.
+
+    Returns:
+        RunReport: The run report instance.
+    """
+    global _run_report
+    if _run_report is None:
+        _run_report = RunReport()
+    return _run_report
+
+
+def reset_run_report() -> RunReport:
+    """Start a new run report, e.g. for the next daemon reconcile cycle.
+
+    Returns:
+        RunReport: The new run report instance.
+    """
+    global _run_report
+    _run_report = RunReport()
+    return _run_report
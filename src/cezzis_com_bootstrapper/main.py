@@ -9,12 +9,15 @@ from cezzis_com_bootstrapper.application import initialize_opentelemetry
 from cezzis_com_bootstrapper.application.behaviors.exception_handling.global_exception_handler import (
     global_exception_handler,
 )
-from cezzis_com_bootstrapper.application.concerns import (
-    CreateBlobStorageCommand,
-    CreateKafkaCommand,
-    CreateRabbitMqCommand,
-)
+from cezzis_com_bootstrapper.application.behaviors.otel import shutdown_opentelemetry
+from cezzis_com_bootstrapper.application.behaviors.planning import export_when_ready, plan_when_ready
+from cezzis_com_bootstrapper.application.behaviors.readiness import ReadinessGate, reconcile_when_ready
+from cezzis_com_bootstrapper.application.behaviors.reconcile import ReconcileDaemon
+from cezzis_com_bootstrapper.application.behaviors.shutdown import GracefulShutdown
+from cezzis_com_bootstrapper.concern_registry import CONCERN_REGISTRY, get_enabled_concerns, import_target
 from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+from cezzis_com_bootstrapper.domain.planning import ChangeSet
+from cezzis_com_bootstrapper.infrastructure.telemetry import get_bootstrapper_metrics, reset_run_report
 
 sys.excepthook = global_exception_handler
 
@@ -31,23 +34,90 @@ async def main():
 
     mediator = injector.get(Mediator)
     options = injector.get(BootstrapperOptions)
+    enabled_concerns = get_enabled_concerns(options)
+
+    # SIGTERM and SIGINT cancel this task, so in-flight calls unwind and the clients are closed below
+    shutdown = GracefulShutdown(options)
+    shutdown.install(asyncio.current_task())
+
+    health_server = None
+    if options.enable_health_server:
+        # aiohttp.web is only imported when the endpoints are turned on
+        from cezzis_com_bootstrapper.application.behaviors.health import HealthServer
 
-    if options.enable_rabbitmq:
-        await mediator.send_async(CreateRabbitMqCommand())
-    else:
-        logger.info("RabbitMQ bootstrapping is disabled, skipping...")
+        health_server = HealthServer(
+            port=options.health_server_port,
+            concerns=[concern.name for concern in enabled_concerns],
+            metrics=get_bootstrapper_metrics(),
+        )
+        await health_server.start()
 
-    if options.enable_blob_storage:
-        await mediator.send_async(CreateBlobStorageCommand())
-    else:
-        logger.info("Blob Storage bootstrapping is disabled, skipping...")
+    report = reset_run_report()
 
-    if options.enable_kafka:
-        await mediator.send_async(CreateKafkaCommand())
-    else:
-        logger.info("Kafka bootstrapping is disabled, skipping...")
+    try:
+        if options.run_mode == "daemon":
+            await ReconcileDaemon(mediator, options, enabled_concerns).run()
+            return
+
+        for concern in CONCERN_REGISTRY:
+            if not concern.is_enabled(options):
+                logger.info(f"{concern.display_name} bootstrapping is disabled, skipping...")
+
+        running_concerns = enabled_concerns
+        if options.run_mode == "export":
+            running_concerns = [concern for concern in enabled_concerns if concern.export_command]
+            for concern in enabled_concerns:
+                if not concern.export_command:
+                    logger.info(f"{concern.display_name} cannot be exported, skipping...")
+
+        # Every target is probed concurrently and each concern starts as soon as its own target answers
+        gate = ReadinessGate(options)
+        run_concern = {"plan": plan_when_ready, "export": export_when_ready}.get(options.run_mode, reconcile_when_ready)
+        results = await asyncio.gather(
+            *(
+                run_concern(mediator, concern, gate, injector.get(import_target(concern.service_interface)).probe)
+                for concern in running_concerns
+            ),
+            return_exceptions=True,
+        )
+
+        errors = [result for result in results if isinstance(result, BaseException)]
+        for error in errors[1:]:
+            logger.error("Bootstrapping a concern failed", exc_info=error)
+        if errors:
+            raise errors[0]
+
+        if options.run_mode == "plan":
+            change_set = ChangeSet(
+                concerns={concern.name: changes for concern, changes in zip(enabled_concerns, results, strict=True)}
+            )
+            change_set.write(options.plan_output_path)
+            logger.info(f"Planning completed, {change_set.total} changes to make")
+            return
+
+        if options.run_mode == "export":
+            # Only RabbitMQ can be exported, so a single spec is written
+            for concern, spec in zip(running_concerns, results, strict=True):
+                spec.write(options.export_output_path)
+                logger.info(f"Exported {concern.display_name} to {options.export_output_path}")
+            return
+
+        logger.info("Bootstrapping completed successfully")
+    except asyncio.CancelledError:
+        if shutdown.received_signal is None:
+            raise
+        logger.info(f"Bootstrapping stopped by {shutdown.received_signal.name}")
+        raise SystemExit(shutdown.exit_code)
+    finally:
+        # The daemon writes a report per reconcile cycle, a job writes one even when a concern failed
+        if options.run_report_path and options.run_mode != "daemon":
+            report.write(options.run_report_path)
 
-    logger.info("Bootstrapping completed successfully")
+        closers = [injector.get(import_target(concern.service_interface)).close for concern in enabled_concerns]
+        if health_server is not None:
+            closers.append(health_server.stop)
+        await shutdown.close_all(closers)
+        shutdown.uninstall()
 
 
 def main_entry():
@@ -57,6 +127,8 @@ def main_entry():
         logger.info("Keyboard interrupt received. Shutting down...")
     finally:
         logger.info("Application shutdown complete.")
+        # Bounded, an unreachable collector must not use up the pod's termination grace period
+        shutdown_opentelemetry(injector.get(BootstrapperOptions).telemetry_flush_timeout_seconds)
 
 
 if __name__ == "__main__":
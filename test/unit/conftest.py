@@ -0,0 +1,43 @@
+import contextlib
+from typing import AsyncIterator
+
+import pytest
+
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement, FakeRabbitMqServer
+from cezzis_com_bootstrapper.domain.config import RabbitMqOptions
+from cezzis_com_bootstrapper.domain.config.settings_snapshot import clear_options_cache
+from cezzis_com_bootstrapper.infrastructure.services.rabbitmq_admin_service import RabbitMqAdminService
+
+
+@pytest.fixture(autouse=True)
+def fresh_settings():
+    # Settings such as the vhost user passwords are read from the shared snapshot, which tests change
+    clear_options_cache()
+    yield
+    clear_options_cache()
+
+
+@contextlib.asynccontextmanager
+async def _serve_rabbitmq(
+    management: FakeRabbitMqManagement | None = None,
+    service_type: type[RabbitMqAdminService] = RabbitMqAdminService,
+    **settings,
+) -> AsyncIterator[RabbitMqAdminService]:
+    async with FakeRabbitMqServer(management) as server:
+        service = service_type(
+            RabbitMqOptions(_env_file=None, RABBITMQ_HOST=server.host, RABBITMQ_ADMIN_PORT=server.port, **settings)
+        )
+        try:
+            yield service
+        finally:
+            await service.close()
+
+
+@pytest.fixture
+def serve_rabbitmq():
+    """Serves a fake management API and yields a service pointed at it, closed on exit.
+
+    Use as ``async with serve_rabbitmq(management, RABBITMQ_VHOST="cocktails") as service``, the
+    keyword arguments are RabbitMqOptions settings and ``service.rabbitmq_options`` holds them all.
+    """
+    return _serve_rabbitmq
@@ -0,0 +1,71 @@
+import pytest
+
+from cezzis_com_bootstrapper.domain.config import get_bootstrapper_settings, get_kafka_options, settings_snapshot
+from cezzis_com_bootstrapper.domain.config.bootstrapper_settings import clear_bootstrapper_settings_cache
+from cezzis_com_bootstrapper.domain.config.settings_snapshot import clear_options_cache
+
+_OTEL_ENV = {
+    "OTEL_EXPORTER_OTLP_ENDPOINT": "http://localhost:4318",
+    "OTEL_SERVICE_NAME": "cezzis-com-bootstrapper",
+    "OTEL_SERVICE_NAMESPACE": "cezzis",
+    "OTEL_OTLP_AUTH_HEADER": "test",
+}
+
+
+@pytest.fixture(autouse=True)
+def isolated_settings(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("ENV", raising=False)
+    for name in ("ENABLE_RABBITMQ", "ENABLE_BLOB_STORAGE", "ENABLE_KAFKA"):
+        monkeypatch.setenv(name, "false")
+    for name, value in _OTEL_ENV.items():
+        monkeypatch.setenv(name, value)
+
+    clear_options_cache()
+    clear_bootstrapper_settings_cache()
+    yield
+    clear_options_cache()
+    clear_bootstrapper_settings_cache()
+
+
+class TestBootstrapperSettings:
+    def test_sections_are_read_from_env_files_once(self, monkeypatch, tmp_path, mocker):
+        monkeypatch.setenv("ENV", "test")
+        monkeypatch.setenv("ENABLE_KAFKA", "true")
+        (tmp_path / ".env").write_text("KAFKA_BOOTSTRAP_SERVERS=from-env-file:9092\nKAFKA_COCKTAILS_TOPIC_DEFS=a:2\n")
+        (tmp_path / ".env.test").write_text("KAFKA_COCKTAILS_TOPIC_DEFS=b:3\n")
+        dotenv_values = mocker.spy(settings_snapshot, "dotenv_values")
+
+        settings = get_bootstrapper_settings()
+
+        assert settings.kafka is not None
+        assert settings.kafka.bootstrap_servers == "from-env-file:9092"
+        assert settings.kafka.cocktails_topic_defs == "b:3"
+        assert settings.rabbitmq is None
+        assert get_kafka_options() is settings.kafka
+        assert dotenv_values.call_count == 2
+
+    def test_environment_overrides_env_files(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("ENABLE_KAFKA", "true")
+        monkeypatch.setenv("KAFKA_BOOTSTRAP_SERVERS", "from-environment:9092")
+        (tmp_path / ".env").write_text("KAFKA_BOOTSTRAP_SERVERS=from-env-file:9092\nKAFKA_COCKTAILS_TOPIC_DEFS=a:2\n")
+
+        settings = get_bootstrapper_settings()
+
+        assert settings.kafka is not None
+        assert settings.kafka.bootstrap_servers == "from-environment:9092"
+
+    def test_all_configuration_errors_are_reported_together(self, monkeypatch):
+        monkeypatch.setenv("ENABLE_KAFKA", "true")
+        monkeypatch.setenv("ENABLE_BLOB_STORAGE", "true")
+        monkeypatch.setenv("KAFKA_DEFAULT_TOPIC_PARTITIONS", "not-a-number")
+        monkeypatch.delenv("OTEL_SERVICE_NAME")
+
+        with pytest.raises(ValueError) as error:
+            get_bootstrapper_settings()
+
+        message = str(error.value)
+        assert "OTEL_SERVICE_NAME environment variable is required" in message
+        assert "KAFKA_DEFAULT_TOPIC_PARTITIONS" in message
+        assert "AZURE_STORAGE_CONNECTION_STRING environment variable is required" in message
+        assert "ACCOUNT_AVATARS_CONTAINER_NAME environment variable is required" in message
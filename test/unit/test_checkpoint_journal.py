@@ -0,0 +1,186 @@
+import asyncio
+import json
+
+import aiohttp
+import pytest
+
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement, FaultInjection
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.create_rabbitmq_command import (
+    CreateRabbitMqCommand,
+    CreateRabbitMqCommandHandler,
+)
+from cezzis_com_bootstrapper.domain import RabbitMqBinding, RabbitMqQueue
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+from cezzis_com_bootstrapper.infrastructure.checkpoints import CheckpointJournal, compute_spec_hash
+
+
+class TestCheckpointJournal:
+    def test_resumes_the_steps_completed_for_the_same_spec(self, tmp_path):
+        path = tmp_path / "rabbitmq.journal"
+        first = CheckpointJournal(path)
+        first.open("hash-a")
+        first.complete("vhost")
+        first.complete("exchange:orders")
+
+        second = CheckpointJournal(path)
+        second.open("hash-a")
+
+        assert second.resumed_steps == 2
+        assert second.is_completed("exchange:orders")
+        assert not second.is_completed("queue:orders")
+
+    def test_a_spec_change_discards_the_journal(self, tmp_path):
+        path = tmp_path / "rabbitmq.journal"
+        first = CheckpointJournal(path)
+        first.open(compute_spec_hash("vhost", {"exchanges": ["orders"]}))
+        first.complete("vhost")
+
+        second = CheckpointJournal(path)
+        second.open(compute_spec_hash("vhost", {"exchanges": ["orders", "payments"]}))
+
+        assert second.resumed_steps == 0
+        assert not second.is_completed("vhost")
+        assert len(path.read_text().splitlines()) == 1
+
+    def test_ignores_a_partially_written_line(self, tmp_path):
+        path = tmp_path / "rabbitmq.journal"
+        journal = CheckpointJournal(path)
+        journal.open("hash-a")
+        journal.complete("vhost")
+        with path.open("a") as file:
+            file.write('{"step": "us')
+
+        resumed = CheckpointJournal(path)
+        resumed.open("hash-a")
+
+        assert resumed.resumed_steps == 1
+        assert resumed.is_completed("vhost")
+
+    def test_clear_removes_the_journal(self, tmp_path):
+        path = tmp_path / "checkpoints" / "rabbitmq.journal"
+        journal = CheckpointJournal(path)
+        journal.open("hash-a")
+        journal.complete("vhost")
+
+        journal.clear()
+
+        assert not path.exists()
+        assert not journal.is_completed("vhost")
+
+
+class TestRabbitMqResume:
+    def _run_twice(
+        self,
+        serve_rabbitmq,
+        tmp_path,
+        management: FakeRabbitMqManagement,
+        drift_strategies: tuple[str, str] = ("report", "report"),
+    ) -> list[bool | Exception]:
+        """Runs the command twice on the same checkpoint directory, counting the requests of the second run only."""
+        config_path = tmp_path / "rabbitmq.json"
+        config_path.write_text(
+            json.dumps(
+                {
+                    "exchanges": [{"name": "orders", "type": "topic"}, {"name": "payments", "type": "topic"}],
+                    "queues": [{"name": "orders-queue"}],
+                    "bindings": [],
+                }
+            )
+        )
+        bootstrapper_options = BootstrapperOptions(
+            _env_file=None, BOOTSTRAPPER_CHECKPOINT_DIR=str(tmp_path / "checkpoints")
+        )
+
+        async def run() -> list[bool | Exception]:
+            results: list[bool | Exception] = []
+            for drift_strategy in drift_strategies:
+                async with serve_rabbitmq(
+                    management,
+                    RABBITMQ_APP_USERNAME="app",
+                    RABBITMQ_APP_PASSWORD="app",
+                    RABBITMQ_APP_CONFIG_FILE_PATH=str(config_path),
+                    RABBITMQ_DRIFT_STRATEGY=drift_strategy,
+                ) as service:
+                    handler = CreateRabbitMqCommandHandler(service, service.rabbitmq_options, bootstrapper_options)
+                    management.reset_counts()
+                    try:
+                        results.append(await handler.handle(CreateRabbitMqCommand()))
+                    except Exception as e:
+                        results.append(e)
+            return results
+
+        return asyncio.run(run())
+
+    def test_a_retried_run_resumes_from_the_first_incomplete_step(self, serve_rabbitmq, tmp_path):
+        management = FakeRabbitMqManagement(faults=FaultInjection(fail_routes={"PUT /api/queues/{vhost}/{name}": 1}))
+
+        results = self._run_twice(serve_rabbitmq, tmp_path, management)
+
+        assert isinstance(results[0], Exception)
+        assert results[1] is True
+        assert management.request_counts["GET /api/vhosts/{vhost}"] == 0
+        assert management.request_counts["PUT /api/exchanges/{vhost}/{name}"] == 0
+        assert management.request_counts["PUT /api/queues/{vhost}/{name}"] == 1
+        assert not (tmp_path / "checkpoints" / "rabbitmq.journal").exists()
+
+    def test_a_run_with_another_drift_strategy_starts_over(self, serve_rabbitmq, tmp_path):
+        management = FakeRabbitMqManagement(faults=FaultInjection(fail_routes={"PUT /api/queues/{vhost}/{name}": 1}))
+
+        results = self._run_twice(serve_rabbitmq, tmp_path, management, ("report", "recreate_empty"))
+
+        assert isinstance(results[0], Exception)
+        assert results[1] is True
+        assert management.request_counts["GET /api/vhosts/{vhost}"] == 1
+        assert management.request_counts["GET /api/exchanges/{vhost}"] >= 1
+
+    def test_bindings_differing_only_by_arguments_are_separate_steps(self, serve_rabbitmq, tmp_path):
+        config_path = tmp_path / "rabbitmq.json"
+        config_path.write_text(
+            json.dumps(
+                {
+                    "exchanges": [],
+                    "queues": [{"name": "orders-queue"}],
+                    "bindings": [
+                        {"source": "amq.headers", "destination": "orders-queue", "arguments": {"kind": 1}},
+                        {"source": "amq.headers", "destination": "orders-queue", "arguments": {"kind": 2}},
+                    ],
+                }
+            )
+        )
+        # Pruning the bindings fails after both bindings were created and journaled
+        management = FakeRabbitMqManagement(
+            faults=FaultInjection(
+                fail_routes={"DELETE /api/bindings/{vhost}/e/{source}/{type}/{destination}/{props}": 1},
+                failure_status=400,
+            )
+        )
+        journal_path = tmp_path / "checkpoints" / "rabbitmq.journal"
+
+        async def run() -> None:
+            async with serve_rabbitmq(
+                management,
+                RABBITMQ_APP_USERNAME="app",
+                RABBITMQ_APP_PASSWORD="app",
+                RABBITMQ_APP_CONFIG_FILE_PATH=str(config_path),
+            ) as service:
+                rabbitmq_options = service.rabbitmq_options
+                bootstrapper_options = BootstrapperOptions(
+                    _env_file=None, BOOTSTRAPPER_CHECKPOINT_DIR=str(journal_path.parent)
+                )
+                await service.create_vhost_if_not_exists(rabbitmq_options.vhost)
+                await service.create_queues_if_not_exist(rabbitmq_options.vhost, [RabbitMqQueue(name="orders-queue")])
+                await service.create_bindings_if_not_exist(
+                    rabbitmq_options.vhost,
+                    [RabbitMqBinding(source="amq.headers", destination="orders-queue", arguments={"kind": 3})],
+                )
+                handler = CreateRabbitMqCommandHandler(service, rabbitmq_options, bootstrapper_options)
+                with pytest.raises(aiohttp.ClientResponseError):
+                    await handler.handle(CreateRabbitMqCommand())
+
+        asyncio.run(run())
+
+        steps = [json.loads(line).get("step", "") for line in journal_path.read_text().splitlines()]
+        assert sorted(step for step in steps if "/binding:" in step) == [
+            '/binding:amq.headers:queue:orders-queue::{"kind": 1}',
+            '/binding:amq.headers:queue:orders-queue::{"kind": 2}',
+        ]
@@ -0,0 +1,73 @@
+import json
+import os
+import subprocess
+import sys
+
+from cezzis_com_bootstrapper.concern_registry import CONCERN_REGISTRY, get_enabled_concerns, import_target
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions, RabbitMqOptions
+
+_SETTINGS_ENV = {
+    "OTEL_EXPORTER_OTLP_ENDPOINT": "http://localhost:4318",
+    "OTEL_SERVICE_NAME": "cezzis-com-bootstrapper",
+    "OTEL_SERVICE_NAMESPACE": "cezzis",
+    "OTEL_OTLP_AUTH_HEADER": "test",
+    "RABBITMQ_VHOST": "cezzis-test",
+    "RABBITMQ_HOST": "http://localhost",
+    "RABBITMQ_ADMIN_PORT": "15672",
+    "RABBITMQ_ADMIN_USERNAME": "admin",
+    "RABBITMQ_ADMIN_PASSWORD": "admin",
+    "RABBITMQ_APP_USERNAME": "app",
+    "RABBITMQ_APP_PASSWORD": "app",
+}
+
+
+def _imported_modules_after(code: str, env: dict[str, str], cwd: str) -> list[str]:
+    script = f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        env={**os.environ, **env},
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestConcernRegistry:
+    def test_all_targets_resolve(self):
+        for concern in CONCERN_REGISTRY:
+            interface = import_target(concern.service_interface)
+            assert issubclass(import_target(concern.service), interface)
+            for _, service in concern.service_backends:
+                assert issubclass(import_target(service), interface)
+            assert callable(import_target(concern.options_factory))
+            assert import_target(concern.command).__name__.endswith("Command")
+            assert import_target(concern.handler).__name__.endswith("CommandHandler")
+            assert import_target(concern.plan_command).__name__.startswith("Plan")
+            assert import_target(concern.plan_handler).__name__.endswith("CommandHandler")
+
+    def test_the_rabbitmq_service_follows_the_topology_backend(self):
+        concern = next(concern for concern in CONCERN_REGISTRY if concern.name == "rabbitmq")
+
+        assert concern.get_service(RabbitMqOptions(_env_file=None)) == concern.service
+        assert concern.get_service(RabbitMqOptions(_env_file=None, RABBITMQ_TOPOLOGY_BACKEND="amqp")).endswith(
+            ":RabbitMqAmqpService"
+        )
+
+    def test_get_enabled_concerns_follows_feature_flags(self):
+        options = BootstrapperOptions(ENABLE_RABBITMQ=True, ENABLE_BLOB_STORAGE=False, ENABLE_KAFKA=True)
+
+        enabled = get_enabled_concerns(options)
+
+        assert [concern.name for concern in enabled] == ["rabbitmq", "kafka"]
+
+    def test_disabled_concern_sdks_are_not_imported(self, tmp_path):
+        env = {"ENABLE_RABBITMQ": "true", "ENABLE_BLOB_STORAGE": "false", "ENABLE_KAFKA": "false", **_SETTINGS_ENV}
+
+        modules = _imported_modules_after("import cezzis_com_bootstrapper.app_module", env, str(tmp_path))
+
+        assert "cezzis_com_bootstrapper.infrastructure.services.rabbitmq_admin_service" in modules
+        assert "confluent_kafka" not in modules
+        assert "azure.storage.blob" not in modules
+        assert "cezzis_com_bootstrapper.infrastructure.services.kafka_service" not in modules
@@ -0,0 +1,137 @@
+import asyncio
+import time
+
+import pytest
+
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement, FaultInjection
+from cezzis_com_bootstrapper.infrastructure.flow_control import AdaptiveConcurrencyLimiter, TokenBucket
+from cezzis_com_bootstrapper.infrastructure.services.rabbitmq_admin_service import RabbitMqAdminService
+
+_VHOST = "cezzis-test"
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_requests_wait_for_a_free_slot(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=2)
+        peak = 0
+
+        async def request() -> None:
+            nonlocal peak
+            started = await limiter.acquire()
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.001)
+            limiter.release(started)
+
+        async def run() -> None:
+            await asyncio.gather(*(request() for _ in range(10)))
+
+        asyncio.run(run())
+
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    def test_the_limit_grows_by_one_per_window_and_halves_once_per_window_on_overload(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=16, initial_limit=4)
+
+        async def run() -> None:
+            for _ in range(4):
+                limiter.release(await limiter.acquire())
+            assert limiter.limit == pytest.approx(4.9, abs=0.1)
+
+            # Requests in flight together report the same congestion, the limit only drops once
+            in_flight = [await limiter.acquire() for _ in range(3)]
+            for started in in_flight:
+                limiter.release(started, overloaded=True)
+            assert limiter.limit == pytest.approx(2.45, abs=0.05)
+
+            limiter.release(await limiter.acquire(), overloaded=True)
+            limiter.release(await limiter.acquire(), overloaded=True)
+            assert limiter.limit == 1.0
+
+        asyncio.run(run())
+
+    def test_a_request_much_slower_than_the_baseline_is_congestion(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+        # Both started in the past, the first sets the baseline
+        limiter.in_flight = 2
+        limiter.release(time.monotonic() - 0.06, kind="GET")
+        limiter.release(time.monotonic() - 0.5, kind="GET")
+
+        assert limiter.limit == 4.0
+
+    def test_a_cancelled_waiter_gives_up_its_place(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=1)
+
+        async def run() -> None:
+            started = await limiter.acquire()
+            waiter = asyncio.create_task(limiter.acquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            limiter.release(started)
+            started = await asyncio.wait_for(limiter.acquire(), timeout=1)
+
+            # A release between the cancel and the waiter resuming drops the cancelled waiter first
+            waiter = asyncio.create_task(limiter.acquire())
+            await asyncio.sleep(0)
+            waiter.cancel()
+            limiter.release(started)
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+            limiter.release(await asyncio.wait_for(limiter.acquire(), timeout=1))
+
+        asyncio.run(run())
+
+        assert limiter.in_flight == 0
+
+
+class TestTokenBucket:
+    def test_requests_beyond_the_burst_are_paced_at_the_rate(self):
+        bucket = TokenBucket(rate=100, capacity=2)
+
+        async def run() -> float:
+            started = time.monotonic()
+            await asyncio.gather(*(bucket.acquire() for _ in range(6)))
+            return time.monotonic() - started
+
+        # Two requests go through at once, the other four wait 10ms each
+        assert asyncio.run(run()) >= 0.035
+
+
+class TestManagementApiFlowControl:
+    def _run(
+        self, serve_rabbitmq, management: FakeRabbitMqManagement, requests: int, **options
+    ) -> RabbitMqAdminService:
+        async def run() -> RabbitMqAdminService:
+            async with serve_rabbitmq(management, **options) as service:
+                await asyncio.gather(
+                    *(service.create_vhost_if_not_exists(f"{_VHOST}-{index}") for index in range(requests)),
+                    return_exceptions=True,
+                )
+            return service
+
+        return asyncio.run(run())
+
+    def test_requests_in_flight_never_exceed_the_limit(self, serve_rabbitmq):
+        management = FakeRabbitMqManagement(faults=FaultInjection(latency_seconds=0.005))
+
+        self._run(serve_rabbitmq, management, 20, RABBITMQ_MAX_CONCURRENT_REQUESTS=3)
+
+        assert management.peak_in_flight == 3
+
+    def test_overloaded_answers_lower_the_limit(self, serve_rabbitmq):
+        management = FakeRabbitMqManagement(faults=FaultInjection(fail_routes={"GET /api/vhosts/{vhost}": 4}))
+
+        service = self._run(serve_rabbitmq, management, 4, RABBITMQ_MAX_CONCURRENT_REQUESTS=8)
+
+        assert service.concurrency_limiter.limit == 4.0
+
+    def test_the_rate_cap_is_only_applied_when_set(self, serve_rabbitmq):
+        assert self._run(serve_rabbitmq, FakeRabbitMqManagement(), 1).rate_limiter is None
+        assert (
+            self._run(
+                serve_rabbitmq, FakeRabbitMqManagement(), 1, RABBITMQ_MAX_REQUESTS_PER_SECOND=50
+            ).rate_limiter.rate
+            == 50
+        )
@@ -0,0 +1,66 @@
+import asyncio
+import os
+import signal
+import time
+
+from cezzis_com_bootstrapper.application.behaviors.otel import initialize_otel, shutdown_opentelemetry
+from cezzis_com_bootstrapper.application.behaviors.shutdown import GracefulShutdown
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+
+
+def _shutdown(timeout_seconds: float = 1) -> GracefulShutdown:
+    return GracefulShutdown(BootstrapperOptions(_env_file=None, BOOTSTRAPPER_SHUTDOWN_TIMEOUT_SECONDS=timeout_seconds))
+
+
+class TestGracefulShutdown:
+    def test_sigterm_cancels_the_running_task_cooperatively(self):
+        shutdown = _shutdown()
+        unwound: list[str] = []
+
+        async def bootstrap():
+            shutdown.install(asyncio.current_task())
+            try:
+                os.kill(os.getpid(), signal.SIGTERM)
+                await asyncio.sleep(10)
+            finally:
+                unwound.append("bootstrap")
+                shutdown.uninstall()
+
+        async def run():
+            try:
+                await asyncio.create_task(bootstrap())
+            except asyncio.CancelledError:
+                return "cancelled"
+
+        assert asyncio.run(run()) == "cancelled"
+        assert unwound == ["bootstrap"]
+        assert shutdown.received_signal == signal.SIGTERM
+        assert shutdown.exit_code == 143
+        assert signal.getsignal(signal.SIGTERM) == signal.SIG_DFL
+
+    def test_close_all_gives_up_on_hanging_clients_at_the_budget(self):
+        closed: list[str] = []
+
+        async def close_quickly():
+            closed.append("rabbitmq")
+
+        async def close_never():
+            await asyncio.sleep(10)
+
+        async def close_failing():
+            raise ConnectionResetError()
+
+        started = time.monotonic()
+        asyncio.run(_shutdown(timeout_seconds=0.05).close_all([close_quickly, close_never, close_failing]))
+
+        assert time.monotonic() - started < 1
+        assert closed == ["rabbitmq"]
+
+    def test_telemetry_flush_is_bounded(self, mocker):
+        mocker.patch.object(initialize_otel, "shutdown_otel", side_effect=lambda: time.sleep(5))
+
+        started = time.monotonic()
+        flushed = shutdown_opentelemetry(timeout_seconds=0.05)
+
+        assert not flushed
+        assert time.monotonic() - started < 1
@@ -0,0 +1,47 @@
+import asyncio
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from cezzis_com_bootstrapper.application.behaviors.health import HealthServer
+from cezzis_com_bootstrapper.infrastructure.telemetry import BootstrapperMetrics
+
+
+async def _get(server: HealthServer, path: str) -> tuple[int, str, str]:
+    async with TestClient(TestServer(server.app)) as client:
+        response = await client.get(path)
+        return response.status, response.headers["Content-Type"], await response.text()
+
+
+class TestHealthServer:
+    def test_live_is_always_ok(self):
+        server = HealthServer(port=8000, concerns=["rabbitmq"], metrics=BootstrapperMetrics())
+
+        status, _, _ = asyncio.run(_get(server, "/health/live"))
+
+        assert status == 200
+
+    def test_ready_once_every_concern_succeeded(self):
+        metrics = BootstrapperMetrics()
+        server = HealthServer(port=8000, concerns=["rabbitmq", "kafka"], metrics=metrics)
+
+        async def probe_before_and_after_kafka():
+            async with TestClient(TestServer(server.app)) as client:
+                metrics.record_reconcile("rabbitmq", 0.1, succeeded=True)
+                before = await client.get("/health/ready")
+                pending = (await before.json())["pending_concerns"]
+                metrics.record_reconcile("kafka", 0.1, succeeded=True)
+                after = await client.get("/health/ready")
+                return before.status, pending, after.status
+
+        assert asyncio.run(probe_before_and_after_kafka()) == (503, ["kafka"], 200)
+
+    def test_metrics_are_served_in_prometheus_format(self):
+        metrics = BootstrapperMetrics()
+        metrics.record_entity_created("rabbitmq", "queue")
+        server = HealthServer(port=8000, concerns=[], metrics=metrics)
+
+        status, content_type, body = asyncio.run(_get(server, "/metrics"))
+
+        assert status == 200
+        assert content_type.startswith("text/plain; version=0.0.4")
+        assert 'bootstrapper_entities_created_total{concern="rabbitmq",kind="queue"} 1.0' in body
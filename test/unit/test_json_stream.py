@@ -0,0 +1,105 @@
+import asyncio
+import json
+
+import pytest
+
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement
+from cezzis_com_bootstrapper.domain import RabbitMqBinding
+from cezzis_com_bootstrapper.infrastructure.services import rabbitmq_admin_service
+from cezzis_com_bootstrapper.infrastructure.streaming import iter_json_array
+
+_VHOST = "cezzis-test"
+
+
+def _parse(body: bytes, chunk_size: int) -> list:
+    async def chunks():
+        for start in range(0, len(body), chunk_size):
+            yield body[start : start + chunk_size]
+
+    async def run() -> list:
+        return [element async for element in iter_json_array(chunks())]
+
+    return asyncio.run(run())
+
+
+class TestIterJsonArray:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 4096])
+    def test_elements_split_across_chunks_are_parsed_like_json_loads(self, chunk_size):
+        elements = [{"name": "orders", "arguments": {"x-max-length": 1000}}, 12345, -0.5, "ingrédients", True, None, []]
+        body = json.dumps(elements, ensure_ascii=False, indent=2).encode("utf-8")
+
+        assert _parse(body, chunk_size) == elements
+
+    def test_an_empty_array_yields_nothing(self):
+        assert _parse(b" [ ] ", 1) == []
+
+    @pytest.mark.parametrize("body", [b'{"name": "orders"}', b'[{"name": "orders"}', b"[1 2]", b"[1] 2"])
+    def test_anything_but_one_complete_array_is_rejected(self, body):
+        with pytest.raises(json.JSONDecodeError):
+            _parse(body, 3)
+
+
+class TestStreamedListings:
+    def test_bindings_are_streamed_a_chunk_at_a_time(self, serve_rabbitmq, monkeypatch):
+        monkeypatch.setattr(rabbitmq_admin_service, "_STREAM_CHUNK_SIZE", 256)
+        management = FakeRabbitMqManagement()
+        vhost = management.add_vhost(_VHOST)
+        for index in range(500):
+            vhost.bindings.append(
+                {
+                    "source": "orders",
+                    "destination": f"orders-{index}",
+                    "destination_type": "queue",
+                    "routing_key": str(index),
+                    "arguments": {},
+                    "vhost": _VHOST,
+                }
+            )
+
+        async def run() -> list:
+            async with serve_rabbitmq(management) as service:
+                return [binding async for binding in service.iter_bindings_in_vhost(_VHOST)]
+
+        bindings = asyncio.run(run())
+
+        assert [binding.destination for binding in bindings] == [f"orders-{index}" for index in range(500)]
+
+    def test_bindings_differing_only_by_arguments_are_distinct(self, serve_rabbitmq):
+        management = FakeRabbitMqManagement()
+        vhost = management.add_vhost(_VHOST)
+        vhost.queues["orders"] = {"name": "orders", "vhost": _VHOST, "arguments": {}}
+        existing = RabbitMqBinding(
+            source="amq.headers", destination="orders", arguments={"kind": "order", "x-match": "all"}
+        )
+        # The existing binding with its arguments in another order, and one with other arguments
+        wanted = [
+            RabbitMqBinding(source="amq.headers", destination="orders", arguments={"x-match": "all", "kind": "order"}),
+            RabbitMqBinding(source="amq.headers", destination="orders", arguments={"x-match": "any", "kind": "order"}),
+        ]
+
+        async def run() -> None:
+            async with serve_rabbitmq(management) as service:
+                await service.create_bindings_if_not_exist(_VHOST, [existing])
+                management.reset_counts()
+                await service.create_bindings_if_not_exist(_VHOST, wanted)
+
+        asyncio.run(run())
+
+        assert management.request_counts["POST /api/bindings/{vhost}/e/{source}/{type}/{destination}"] == 1
+        assert [binding["arguments"]["x-match"] for binding in vhost.bindings if binding["source"]] == ["all", "any"]
+
+    def test_deleting_a_binding_leaves_the_one_differing_by_arguments(self, serve_rabbitmq):
+        management = FakeRabbitMqManagement()
+        vhost = management.add_vhost(_VHOST)
+        vhost.queues["orders"] = {"name": "orders", "vhost": _VHOST, "arguments": {}}
+        desired = RabbitMqBinding(source="amq.headers", destination="orders", arguments={"a": 2})
+        stale = RabbitMqBinding(source="amq.headers", destination="orders", arguments={"a": 1})
+
+        async def run() -> None:
+            async with serve_rabbitmq(management) as service:
+                await service.create_bindings_if_not_exist(_VHOST, [desired, stale])
+                await service.delete_binding_from_vhost(_VHOST, stale)
+
+        asyncio.run(run())
+
+        assert [binding["arguments"] for binding in vhost.bindings if binding["source"]] == [{"a": 2}]
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from confluent_kafka import KafkaException
+
+from benchmarks.fakes.kafka_admin import FakeKafkaAdmin, FakeKafkaService, KafkaFaultInjection
+from cezzis_com_bootstrapper.application.behaviors.pipeline import is_transient_error
+from cezzis_com_bootstrapper.application.concerns.eventing.commands.create_kafka_command import (
+    CreateKafkaCommand,
+    CreateKafkaCommandHandler,
+)
+from cezzis_com_bootstrapper.domain.config import KafkaOptions
+
+
+def _options(**overrides) -> KafkaOptions:
+    return KafkaOptions(_env_file=None, KAFKA_BOOTSTRAP_SERVERS="fake:9092", **overrides)
+
+
+def _service(admin: FakeKafkaAdmin, **overrides) -> FakeKafkaService:
+    return FakeKafkaService(_options(**overrides), admin)
+
+
+class TestCreateTopics:
+    def test_creates_missing_topics_in_one_batch(self):
+        admin = FakeKafkaAdmin()
+        admin.add_topics(1, 3, prefix="orders")
+
+        asyncio.run(_service(admin).create_topics({"orders-00000": 6, "payments": 2, "refunds": None}))
+
+        assert admin.call_counts == {"list_topics": 1, "create_topics": 1}
+        assert admin.topics["orders-00000"].partitions == 3
+        assert admin.topics["payments"].partitions == 2
+        assert admin.topics["refunds"].partitions == 4
+
+    def test_controller_errors_are_raised_as_transient(self):
+        admin = FakeKafkaAdmin(faults=KafkaFaultInjection(controller_error_rate=1.0))
+
+        with pytest.raises(KafkaException) as error:
+            asyncio.run(_service(admin).create_topics({"payments": 2}))
+
+        assert is_transient_error(error.value)
+
+    def test_handler_creates_every_topic_definition_in_one_call(self):
+        admin = FakeKafkaAdmin()
+        options = _options(KAFKA_COCKTAILS_TOPIC_DEFS="cocktails:8,ratings,searches:0")
+
+        asyncio.run(CreateKafkaCommandHandler(FakeKafkaService(options, admin), options).handle(CreateKafkaCommand()))
+
+        assert admin.call_counts["create_topics"] == 1
+        assert {name: topic.partitions for name, topic in admin.topics.items()} == {
+            "cocktails": 8,
+            "ratings": 4,
+            "searches": 4,
+        }
+
+
+class TestAlterTopicConfigs:
+    def test_alters_only_differing_configs(self):
+        admin = FakeKafkaAdmin()
+        admin.add_topics(2, 1)
+        admin.topics["existing-00001"].configs["retention.ms"] = "1000"
+
+        asyncio.run(
+            _service(admin).alter_topic_configs(
+                {"existing-00000": {"retention.ms": "604800000"}, "existing-00001": {"retention.ms": "604800000"}}
+            )
+        )
+
+        assert admin.call_counts == {"describe_configs": 1, "incremental_alter_configs": 1}
+        assert admin.topics["existing-00001"].configs["retention.ms"] == "604800000"
+
+
+class TestWaitForTopicsReady:
+    def test_polls_until_partitions_have_leaders(self):
+        admin = FakeKafkaAdmin(faults=KafkaFaultInjection(ready_after_polls=2))
+        service = _service(admin)
+
+        async def create_and_wait():
+            await service.create_topics({"payments": 3})
+            admin.reset_counts()
+            await service.wait_for_topics_ready(["payments"], timeout_seconds=1, poll_interval_seconds=0.001)
+
+        asyncio.run(create_and_wait())
+
+        assert admin.call_counts["list_topics"] == 3
+
+    def test_times_out_on_missing_topics(self):
+        service = _service(FakeKafkaAdmin())
+
+        with pytest.raises(TimeoutError, match="Topics payments were not ready within 0.01 seconds"):
+            asyncio.run(service.wait_for_topics_ready(["payments"], timeout_seconds=0.01, poll_interval_seconds=0.005))
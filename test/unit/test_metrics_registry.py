@@ -0,0 +1,55 @@
+import pytest
+
+from cezzis_com_bootstrapper.infrastructure.telemetry import BootstrapperMetrics, MetricsRegistry
+
+
+class TestMetricsRegistry:
+    def test_renders_prometheus_text_format(self):
+        registry = MetricsRegistry()
+        created = registry.counter("entities_created_total", "Entities created.", ("kind",))
+        latency = registry.histogram("request_seconds", "Request latency.", ("method",), buckets=(0.1, 1.0))
+
+        created.inc(kind="queue")
+        created.inc(2, kind="queue")
+        latency.observe(0.05, method="GET")
+        latency.observe(0.5, method="GET")
+
+        assert registry.render().splitlines() == [
+            "# HELP entities_created_total Entities created.",
+            "# TYPE entities_created_total counter",
+            'entities_created_total{kind="queue"} 3.0',
+            "# HELP request_seconds Request latency.",
+            "# TYPE request_seconds histogram",
+            'request_seconds_bucket{method="GET",le="0.1"} 1',
+            'request_seconds_bucket{method="GET",le="1.0"} 2',
+            'request_seconds_bucket{method="GET",le="+Inf"} 2',
+            'request_seconds_sum{method="GET"} 0.55',
+            'request_seconds_count{method="GET"} 2',
+        ]
+
+    def test_rejects_unknown_labels(self):
+        counter = MetricsRegistry().counter("entities_created_total", "Entities created.", ("kind",))
+
+        with pytest.raises(ValueError):
+            counter.inc(kind="queue", vhost="cezzis")
+
+    def test_time_api_call_records_failures(self):
+        metrics = BootstrapperMetrics()
+
+        with pytest.raises(RuntimeError):
+            with metrics.time_api_call("rabbitmq_management", "PUT"):
+                raise RuntimeError("boom")
+
+        histogram = metrics.management_api_request_duration_seconds
+        assert histogram.count(api="rabbitmq_management", operation="PUT", outcome="error") == 1
+        assert histogram.count(api="rabbitmq_management", operation="PUT", outcome="success") == 0
+
+    def test_record_reconcile_tracks_last_success(self):
+        metrics = BootstrapperMetrics()
+
+        metrics.record_reconcile("kafka", 0.2, succeeded=False)
+        assert metrics.last_success_timestamp_seconds.value(concern="kafka") is None
+        assert metrics.reconcile_failures_total.value(concern="kafka") == 1
+
+        metrics.record_reconcile("kafka", 0.2, succeeded=True)
+        assert metrics.last_success_timestamp_seconds.value(concern="kafka") is not None
@@ -0,0 +1,76 @@
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import StatusCode
+
+from cezzis_com_bootstrapper.infrastructure.telemetry import (
+    EntityAction,
+    get_bootstrapper_metrics,
+    operation_telemetry,
+    trace_operation,
+)
+
+
+@pytest.fixture
+def telemetry(mocker):
+    span_exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    metric_reader = InMemoryMetricReader()
+    meter = MeterProvider(metric_readers=[metric_reader]).get_meter("test")
+
+    mocker.patch.object(operation_telemetry, "_tracer", tracer_provider.get_tracer("test"))
+    mocker.patch.object(operation_telemetry, "_operation_duration", meter.create_histogram("duration"))
+    mocker.patch.object(operation_telemetry, "_entity_actions", meter.create_counter("entities"))
+
+    return span_exporter, metric_reader
+
+
+def _data_points(metric_reader: InMemoryMetricReader, name: str) -> list:
+    for resource_metrics in metric_reader.get_metrics_data().resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                if metric.name == name:
+                    return list(metric.data.data_points)
+    return []
+
+
+class TestOperationTelemetry:
+    def test_records_span_attributes_and_entity_action(self, telemetry):
+        span_exporter, metric_reader = telemetry
+        created_before = get_bootstrapper_metrics().entities_created_total.value(concern="rabbitmq", kind="queue")
+
+        with trace_operation(
+            "rabbitmq", "create_queue_for_vhost", kind="queue", entity="orders", attributes={"rabbitmq.vhost": "cezzis"}
+        ) as operation:
+            operation.record(EntityAction.CREATED)
+
+        (span,) = span_exporter.get_finished_spans()
+        assert span.name == "rabbitmq.create_queue_for_vhost"
+        assert span.attributes["rabbitmq.vhost"] == "cezzis"
+        assert span.attributes["bootstrapper.entity.name"] == "orders"
+        assert span.attributes["bootstrapper.action"] == "created"
+
+        (entities,) = _data_points(metric_reader, "entities")
+        assert entities.value == 1
+        assert entities.attributes == {"concern": "rabbitmq", "entity.kind": "queue", "action": "created"}
+        assert (
+            get_bootstrapper_metrics().entities_created_total.value(concern="rabbitmq", kind="queue")
+            == created_before + 1
+        )
+
+    def test_failed_operation_sets_error_status_and_outcome(self, telemetry):
+        span_exporter, metric_reader = telemetry
+
+        with pytest.raises(RuntimeError):
+            with trace_operation("kafka", "create_topic", kind="topic", entity="cocktails"):
+                raise RuntimeError("broker unavailable")
+
+        (span,) = span_exporter.get_finished_spans()
+        assert span.status.status_code == StatusCode.ERROR
+
+        (duration,) = _data_points(metric_reader, "duration")
+        assert duration.attributes == {"concern": "kafka", "operation": "create_topic", "outcome": "error"}
@@ -0,0 +1,125 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiormq.exceptions import ChannelPreconditionFailed, ConnectionClosed, ProbableAuthenticationError
+from confluent_kafka import KafkaError, KafkaException
+
+from cezzis_com_bootstrapper.application.behaviors.pipeline import (
+    DeadlineBehavior,
+    RetryBehavior,
+    TimingBehavior,
+    is_transient_error,
+)
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+from cezzis_com_bootstrapper.infrastructure.telemetry import get_bootstrapper_metrics
+
+
+class _TestCommand:
+    pass
+
+
+def _options(**overrides) -> BootstrapperOptions:
+    values = {
+        "BOOTSTRAPPER_COMMAND_TIMEOUT_SECONDS": 5,
+        "BOOTSTRAPPER_RETRY_MAX_ATTEMPTS": 3,
+        "BOOTSTRAPPER_RETRY_BASE_DELAY_SECONDS": 0,
+        "BOOTSTRAPPER_RETRY_MAX_DELAY_SECONDS": 0,
+        **overrides,
+    }
+    return BootstrapperOptions(**values)
+
+
+def _failing_then_succeeding(errors: list[Exception]):
+    attempts: list[int] = []
+
+    async def next():
+        attempts.append(len(attempts) + 1)
+        if errors:
+            raise errors.pop(0)
+        return True
+
+    return next, attempts
+
+
+def _response_error(status: int) -> aiohttp.ClientResponseError:
+    return aiohttp.ClientResponseError(request_info=None, history=(), status=status)
+
+
+class TestTransientErrors:
+    @pytest.mark.parametrize(
+        "error, expected",
+        [
+            (ConnectionRefusedError(), True),
+            (_response_error(503), True),
+            (_response_error(429), True),
+            (_response_error(404), False),
+            (KafkaException(KafkaError(KafkaError._TRANSPORT)), True),
+            (KafkaException(KafkaError(KafkaError.TOPIC_ALREADY_EXISTS)), False),
+            (ConnectionClosed(320, "CONNECTION_FORCED"), True),
+            (ProbableAuthenticationError("ACCESS_REFUSED"), False),
+            (ChannelPreconditionFailed("PRECONDITION_FAILED"), False),
+            (ValueError("bad config"), False),
+        ],
+    )
+    def test_classifies_errors(self, error, expected):
+        assert is_transient_error(error) is expected
+
+
+class TestRetryBehavior:
+    def test_retries_transient_errors_until_success(self):
+        next, attempts = _failing_then_succeeding([ConnectionRefusedError(), _response_error(502)])
+
+        result = asyncio.run(RetryBehavior(_options()).handle(_TestCommand(), next))
+
+        assert result is True
+        assert attempts == [1, 2, 3]
+
+    def test_gives_up_after_max_attempts(self):
+        next, attempts = _failing_then_succeeding([ConnectionRefusedError()] * 5)
+
+        with pytest.raises(ConnectionRefusedError):
+            asyncio.run(RetryBehavior(_options()).handle(_TestCommand(), next))
+
+        assert attempts == [1, 2, 3]
+
+    def test_does_not_retry_permanent_errors(self):
+        next, attempts = _failing_then_succeeding([_response_error(401)])
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            asyncio.run(RetryBehavior(_options()).handle(_TestCommand(), next))
+
+        assert attempts == [1]
+
+    def test_backoff_is_capped_and_jittered(self):
+        behavior = RetryBehavior(
+            _options(BOOTSTRAPPER_RETRY_BASE_DELAY_SECONDS=1, BOOTSTRAPPER_RETRY_MAX_DELAY_SECONDS=4)
+        )
+
+        delays = [behavior.get_backoff_seconds(attempt) for attempt in range(1, 10) for _ in range(20)]
+
+        assert all(0 <= delay <= 4 for delay in delays)
+        assert len(set(delays)) > 1
+
+
+class TestDeadlineBehavior:
+    def test_fails_commands_past_their_deadline(self):
+        async def next():
+            await asyncio.sleep(1)
+
+        behavior = DeadlineBehavior(_options(BOOTSTRAPPER_COMMAND_TIMEOUT_SECONDS=0.01))
+
+        with pytest.raises(TimeoutError, match="_TestCommand did not complete within 0.01 seconds"):
+            asyncio.run(behavior.handle(_TestCommand(), next))
+
+
+class TestTimingBehavior:
+    def test_records_duration_and_peak_rss(self):
+        metrics = get_bootstrapper_metrics()
+        count_before = metrics.command_duration_seconds.count(command="_TestCommand", outcome="success")
+        next, _ = _failing_then_succeeding([])
+
+        asyncio.run(TimingBehavior().handle(_TestCommand(), next))
+
+        assert metrics.command_duration_seconds.count(command="_TestCommand", outcome="success") == count_before + 1
+        assert metrics.peak_rss_bytes.value() > 0
@@ -0,0 +1,189 @@
+import asyncio
+import json
+
+from benchmarks.fakes.kafka_admin import FakeKafkaAdmin, FakeKafkaService
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement
+from cezzis_com_bootstrapper.application.concerns.eventing.commands.plan_kafka_command import (
+    PlanKafkaCommand,
+    PlanKafkaCommandHandler,
+)
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.create_rabbitmq_command import (
+    CreateRabbitMqCommand,
+    CreateRabbitMqCommandHandler,
+)
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.plan_rabbitmq_command import (
+    PlanRabbitMqCommand,
+    PlanRabbitMqCommandHandler,
+    plan_rabbitmq_changes,
+)
+from cezzis_com_bootstrapper.application.concerns.storage.commands.plan_blobstorage_command import (
+    plan_blob_storage_changes,
+)
+from cezzis_com_bootstrapper.domain import (
+    ChangeSet,
+    PlannedChange,
+    RabbitMqBinding,
+    RabbitMqBindingType,
+    RabbitMqConfiguration,
+    RabbitMqExchange,
+    RabbitMqQueue,
+    RabbitMqSnapshot,
+)
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions, KafkaOptions
+
+
+def _actions(changes: list[PlannedChange]) -> list[tuple[str, str, str]]:
+    return [(change.action, change.kind, change.name) for change in changes]
+
+
+class TestPlanRabbitMq:
+    def test_plans_every_change_of_a_spec_edit_with_one_read(self, serve_rabbitmq, tmp_path):
+        config_path = tmp_path / "rabbitmq.json"
+        applied = {
+            "exchanges": [{"name": "orders"}, {"name": "legacy"}],
+            "queues": [{"name": "orders-queue"}, {"name": "legacy-queue"}],
+            "bindings": [
+                {"source": "orders", "destination": "orders-queue", "routing_key": "orders.#"},
+                {"source": "legacy", "destination": "legacy-queue"},
+            ],
+        }
+        edited = {
+            "exchanges": [{"name": "orders"}, {"name": "payments", "type": "fanout"}],
+            "queues": [{"name": "orders-queue"}],
+            "bindings": [
+                {"source": "orders", "destination": "orders-queue", "routing_key": "orders.created"},
+                {"source": "payments", "destination": "orders-queue"},
+            ],
+        }
+        management = FakeRabbitMqManagement()
+
+        async def run() -> list[PlannedChange]:
+            async with serve_rabbitmq(
+                management,
+                RABBITMQ_APP_USERNAME="app",
+                RABBITMQ_APP_PASSWORD="app",
+                RABBITMQ_APP_CONFIG_FILE_PATH=str(config_path),
+            ) as service:
+                rabbitmq_options = service.rabbitmq_options
+                config_path.write_text(json.dumps(applied))
+                await CreateRabbitMqCommandHandler(
+                    service, rabbitmq_options, BootstrapperOptions(_env_file=None)
+                ).handle(CreateRabbitMqCommand())
+
+                config_path.write_text(json.dumps(edited))
+                management.reset_counts()
+                return await PlanRabbitMqCommandHandler(service, rabbitmq_options).handle(PlanRabbitMqCommand())
+
+        changes = asyncio.run(run())
+
+        # Operator policies are the only state the definitions do not hold
+        assert management.request_counts == {"GET /api/definitions": 1, "GET /api/operator-policies/{vhost}": 1}
+        assert _actions(changes) == [
+            ("create", "exchange", "payments"),
+            ("delete", "exchange", "legacy"),
+            ("delete", "queue", "legacy-queue"),
+            ("create", "binding", "orders->orders-queue"),
+            ("create", "binding", "payments->orders-queue"),
+            ("delete", "binding", "orders->orders-queue"),
+        ]
+        assert changes[0].details["type"] == "fanout"
+
+    def test_plans_the_vhost_user_and_permissions_of_an_empty_broker(self):
+        configuration = RabbitMqConfiguration(
+            exchanges=[RabbitMqExchange(name="orders")],
+            queues=[RabbitMqQueue(name="orders-queue")],
+            bindings=[RabbitMqBinding(source="orders", destination="orders-queue")],
+        )
+        snapshot = RabbitMqSnapshot(
+            vhost_exists=True,
+            users=["app", "intruder"],
+            permissions={"app": {"configure": ".*", "write": "", "read": ".*"}, "intruder": {}},
+        )
+
+        changes = plan_rabbitmq_changes(configuration, snapshot, vhost="cezzis", app_username="app")
+
+        assert _actions(changes) == [
+            ("delete", "user", "intruder"),
+            ("update", "permission", "app"),
+            ("create", "exchange", "orders"),
+            ("create", "queue", "orders-queue"),
+            ("create", "binding", "orders->orders-queue"),
+        ]
+        assert "password" not in json.dumps(ChangeSet(concerns={"rabbitmq": changes}).to_dict())
+
+    def test_an_applied_spec_plans_no_changes(self):
+        binding = RabbitMqBinding(source="orders", destination="audit", destination_type=RabbitMqBindingType.EXCHANGE)
+        configuration = RabbitMqConfiguration(
+            exchanges=[RabbitMqExchange(name="orders"), RabbitMqExchange(name="audit")], queues=[], bindings=[binding]
+        )
+        snapshot = RabbitMqSnapshot(
+            vhost_exists=True,
+            users=["app"],
+            permissions={"app": {"configure": ".*", "write": ".*", "read": ".*"}},
+            exchanges=["orders", "audit"],
+            bindings=[binding],
+        )
+
+        assert plan_rabbitmq_changes(configuration, snapshot, vhost="cezzis", app_username="app") == []
+
+    def test_a_binding_with_other_arguments_is_replaced(self):
+        existing = RabbitMqBinding(source="orders", destination="audit", arguments={"x-match": "all", "kind": "order"})
+        configuration = RabbitMqConfiguration(
+            exchanges=[RabbitMqExchange(name="orders")],
+            queues=[RabbitMqQueue(name="audit")],
+            bindings=[
+                RabbitMqBinding(source="orders", destination="audit", arguments={"kind": "order", "x-match": "any"})
+            ],
+        )
+        snapshot = RabbitMqSnapshot(
+            vhost_exists=True,
+            users=["app"],
+            permissions={"app": {"configure": ".*", "write": ".*", "read": ".*"}},
+            exchanges=["orders"],
+            queues=["audit"],
+            bindings=[existing],
+        )
+
+        changes = plan_rabbitmq_changes(configuration, snapshot, vhost="cezzis", app_username="app")
+
+        assert _actions(changes) == [("create", "binding", "orders->audit"), ("delete", "binding", "orders->audit")]
+
+
+class TestPlanKafkaAndBlobStorage:
+    def test_plans_missing_topics_with_one_metadata_request(self):
+        admin = FakeKafkaAdmin()
+        admin.add_topics(1, 3, prefix="cocktails")
+        kafka_options = KafkaOptions(
+            _env_file=None,
+            KAFKA_BOOTSTRAP_SERVERS="fake:9092",
+            KAFKA_COCKTAILS_TOPIC_DEFS="cocktails-00000:3,orders:6,payments",
+            KAFKA_DEFAULT_TOPIC_PARTITIONS=2,
+        )
+        handler = PlanKafkaCommandHandler(FakeKafkaService(kafka_options, admin), kafka_options)
+
+        changes = asyncio.run(handler.handle(PlanKafkaCommand()))
+
+        assert admin.call_counts == {"list_topics": 1}
+        assert [(change.name, change.details["partitions"]) for change in changes] == [("orders", 6), ("payments", 2)]
+
+    def test_plans_a_missing_container_and_a_private_one(self):
+        assert _actions(plan_blob_storage_changes(["avatars"], {})) == [("create", "container", "avatars")]
+        assert _actions(plan_blob_storage_changes(["avatars"], {"avatars": None})) == [
+            ("update", "container", "avatars")
+        ]
+        assert plan_blob_storage_changes(["avatars"], {"avatars": "container"}) == []
+
+    def test_change_set_summarizes_actions(self, capsys):
+        change_set = ChangeSet(
+            concerns={
+                "kafka": [PlannedChange(kind="topic", name="orders", action="create", details={"partitions": 6})],
+                "blob_storage": [PlannedChange(kind="container", name="avatars", action="update")],
+            }
+        )
+
+        change_set.write("-")
+
+        document = json.loads(capsys.readouterr().out)
+        assert document["changes"] == 2
+        assert document["summary"] == {"create": 1, "update": 1}
+        assert document["concerns"]["kafka"][0]["details"] == {"partitions": 6}
@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+from aiormq.exceptions import ChannelPreconditionFailed, ConnectionClosed
+
+from benchmarks.fakes.amqp_broker import FakeAmqpServer
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement
+from benchmarks.reconcile.rabbitmq_benchmark import build_topology, run_reconcile
+from cezzis_com_bootstrapper.application.behaviors.pipeline.transient_errors import is_transient_error
+from cezzis_com_bootstrapper.domain.config import RabbitMqOptions
+from cezzis_com_bootstrapper.domain.config.rabbitmq_options import validate_rabbitmq_options
+from cezzis_com_bootstrapper.domain.messaging import RabbitMqExchange, RabbitMqExchangeType, RabbitMqQueue
+from cezzis_com_bootstrapper.infrastructure.services.rabbitmq_amqp_service import RabbitMqAmqpService
+
+_VHOST = "cezzis-test"
+
+
+def _management() -> FakeRabbitMqManagement:
+    # The vhost was not created through the management API, the administrator has no permissions on it
+    management = FakeRabbitMqManagement(admin_username="admin")
+    management.add_vhost(_VHOST)
+    return management
+
+
+def _serve(serve_rabbitmq, management: FakeRabbitMqManagement, broker: FakeAmqpServer):
+    return serve_rabbitmq(
+        management,
+        RabbitMqAmqpService,
+        RABBITMQ_ADMIN_USERNAME="admin",
+        RABBITMQ_ADMIN_PASSWORD="admin",
+        RABBITMQ_VHOST=_VHOST,
+        RABBITMQ_AMQP_PORT=broker.port,
+    )
+
+
+def _topology(management: FakeRabbitMqManagement) -> tuple[set, set, set]:
+    vhost = management.vhosts["cezzis-benchmark"]
+    return (
+        set(vhost.exchanges),
+        set(vhost.queues),
+        {
+            (binding["source"], binding["destination_type"], binding["destination"], binding["routing_key"])
+            for binding in vhost.bindings
+        },
+    )
+
+
+class _NoOperation:
+    def record(self, *args, **kwargs) -> None:
+        pass
+
+
+class TestRabbitMqAmqpService:
+    def test_reconciles_the_same_topology_as_the_management_api(self):
+        topology = build_topology(100)
+        results = {}
+        states = {}
+        for backend in ("management", "amqp"):
+            management = FakeRabbitMqManagement(admin_username="admin")
+            results[backend] = asyncio.run(run_reconcile(topology, 100, backend=backend, management=management))
+            states[backend] = _topology(management)
+
+        assert states["amqp"] == states["management"]
+        amqp = results["amqp"].cold
+        assert amqp.amqp_round_trips == 3
+        assert amqp.amqp_methods["queue.declare"] == results["amqp"].entities["queues"]
+        # Only vhost, user and permission writes still go through the management API
+        assert sorted(route for route in amqp.requests_by_route if not route.startswith("GET ")) == [
+            "PUT /api/permissions/{vhost}/{user}",
+            "PUT /api/users/{user}",
+            "PUT /api/vhosts/{vhost}",
+        ]
+        assert results["amqp"].warm.amqp_methods == {}
+
+    def test_a_forced_close_is_transient_and_the_next_call_reconnects(self, serve_rabbitmq):
+        management = _management()
+
+        async def run() -> Exception:
+            async with (
+                FakeAmqpServer(management, fail_methods={"queue.declare": 1}) as broker,
+                _serve(serve_rabbitmq, management, broker) as service,
+            ):
+                queues = [RabbitMqQueue(name="orders"), RabbitMqQueue(name="payments")]
+                with pytest.raises(ConnectionClosed) as error:
+                    await service.create_queues_if_not_exist(_VHOST, queues)
+                await service.create_queues_if_not_exist(_VHOST, queues)
+                return error.value
+
+        error = asyncio.run(run())
+
+        assert is_transient_error(error)
+        assert set(management.vhosts[_VHOST].queues) == {"orders", "payments"}
+
+    def test_a_refused_declare_closes_only_the_channel(self, serve_rabbitmq):
+        management = _management()
+        management.vhosts[_VHOST].exchanges["orders"] = {
+            "name": "orders",
+            "vhost": _VHOST,
+            "type": "fanout",
+            "durable": True,
+            "auto_delete": False,
+            "internal": False,
+        }
+
+        async def run() -> tuple[Exception, FakeAmqpServer]:
+            async with FakeAmqpServer(management) as broker, _serve(serve_rabbitmq, management, broker) as service:
+                # Declared over AMQP directly, the drift check of the batch method would skip it
+                with pytest.raises(ChannelPreconditionFailed) as error:
+                    await service._declare_exchanges(
+                        _VHOST, [RabbitMqExchange(name="orders")], operation=_NoOperation()
+                    )
+                await service.create_exchanges_if_not_exist(_VHOST, [RabbitMqExchange(name="payments")])
+                return error.value, broker
+
+        error, broker = asyncio.run(run())
+
+        assert "PRECONDITION_FAILED" in str(error)
+        assert not is_transient_error(error)
+        assert management.vhosts[_VHOST].exchanges["orders"]["type"] == "fanout"
+        assert management.vhosts[_VHOST].exchanges["payments"]["type"] == RabbitMqExchangeType.TOPIC.value
+        assert broker.connections == 1
+
+    def test_every_vhost_is_declared_over_a_heartbeating_connection(self, serve_rabbitmq):
+        management = _management()
+        management.add_vhost("cezzis-other")
+
+        async def run() -> FakeAmqpServer:
+            async with FakeAmqpServer(management) as broker:
+                async with _serve(serve_rabbitmq, management, broker) as service:
+                    for vhost in (_VHOST, "cezzis-other"):
+                        await service.create_queues_if_not_exist(vhost, [RabbitMqQueue(name="orders")])
+                return broker
+
+        broker = asyncio.run(run())
+
+        assert "orders" in management.vhosts["cezzis-other"].queues
+        assert management.request_counts["PUT /api/queues/{vhost}/{name}"] == 0
+        assert management.permissions[("cezzis-other", "admin")] == {"configure": ".*", "write": ".*", "read": ".*"}
+        assert broker.connections == 2
+        assert broker.heartbeats == [60, 60]
+
+    def test_the_topology_backend_is_validated(self):
+        options = RabbitMqOptions(_env_file=None, RABBITMQ_TOPOLOGY_BACKEND="grpc")
+
+        assert "RABBITMQ_TOPOLOGY_BACKEND must be 'management' or 'amqp', got 'grpc'." in validate_rabbitmq_options(
+            options
+        )
@@ -0,0 +1,274 @@
+import asyncio
+import json
+
+import pytest
+
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement, FaultInjection
+from cezzis_com_bootstrapper.application.behaviors.pipeline import RetryBehavior, is_transient_error
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.create_rabbitmq_command import (
+    CreateRabbitMqCommand,
+    CreateRabbitMqCommandHandler,
+)
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.plan_rabbitmq_command import (
+    PlanRabbitMqCommand,
+    PlanRabbitMqCommandHandler,
+)
+from cezzis_com_bootstrapper.domain import (
+    RabbitMqExchange,
+    RabbitMqExchangeType,
+    RabbitMqMigrationError,
+    RabbitMqQueue,
+    RabbitMqQueueType,
+)
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+from cezzis_com_bootstrapper.domain.messaging import exchange_drift, queue_drift
+
+_VHOST = "cezzis-test"
+
+
+def _spec(queue_arguments: dict, exchange_type: str = "topic") -> dict:
+    return {
+        "exchanges": [{"name": "orders", "type": exchange_type}, {"name": "audit", "type": "fanout"}],
+        "queues": [{"name": "orders-queue", "arguments": queue_arguments}],
+        "bindings": [
+            {"source": "orders", "destination": "orders-queue", "routing_key": "created"},
+            {"source": "orders", "destination": "audit", "destination_type": "exchange", "routing_key": "#"},
+        ],
+    }
+
+
+def _reconcile(
+    serve_rabbitmq,
+    tmp_path,
+    management: FakeRabbitMqManagement,
+    strategy: str,
+    *specs: dict,
+    messages: int = 0,
+    migration_timeout_seconds: float = 300.0,
+    retry_max_attempts: int = 1,
+):
+    """Reconciles each spec in turn, the queue holding ``messages`` before the last one, then plans the last one.
+
+    Each reconcile goes through the retry behavior, replaying it up to ``retry_max_attempts`` times.
+    """
+    config_path = tmp_path / "rabbitmq.json"
+    result = {}
+
+    async def run() -> None:
+        async with serve_rabbitmq(
+            management,
+            RABBITMQ_VHOST=_VHOST,
+            RABBITMQ_APP_USERNAME="app",
+            RABBITMQ_APP_PASSWORD="app",
+            RABBITMQ_APP_CONFIG_FILE_PATH=str(config_path),
+            RABBITMQ_DRIFT_STRATEGY=strategy,
+            RABBITMQ_MIGRATION_TIMEOUT_SECONDS=migration_timeout_seconds,
+        ) as service:
+            options = service.rabbitmq_options
+            bootstrapper_options = BootstrapperOptions(
+                _env_file=None,
+                BOOTSTRAPPER_RETRY_MAX_ATTEMPTS=retry_max_attempts,
+                BOOTSTRAPPER_RETRY_BASE_DELAY_SECONDS=0,
+                BOOTSTRAPPER_RETRY_MAX_DELAY_SECONDS=0,
+            )
+            handler = CreateRabbitMqCommandHandler(service, options, bootstrapper_options)
+            for index, spec in enumerate(specs):
+                config_path.write_text(json.dumps(spec))
+                if index == len(specs) - 1:
+                    result["plan"] = await PlanRabbitMqCommandHandler(service, options).handle(PlanRabbitMqCommand())
+                    management.vhosts[_VHOST].queues["orders-queue"]["messages"] = messages
+                    management.reset_counts()
+                command = CreateRabbitMqCommand()
+                await RetryBehavior(bootstrapper_options).handle(command, lambda: handler.handle(command))
+
+    asyncio.run(run())
+    return result
+
+
+def _queue_bindings(management: FakeRabbitMqManagement, queue: str) -> list[tuple[str, str]]:
+    return [
+        (binding["source"], binding["routing_key"])
+        for binding in management.vhosts[_VHOST].bindings
+        if binding["destination"] == queue and binding["source"]
+    ]
+
+
+class TestDriftDetection:
+    def test_every_differing_property_is_reported(self):
+        existing = RabbitMqQueue(name="orders", arguments={"x-message-ttl": 1000, "x-queue-type": "classic"})
+        desired = RabbitMqQueue(name="orders", durable=False, arguments={"x-max-length": 10})
+
+        assert queue_drift(desired, existing) == {
+            "durable": {"existing": True, "desired": False},
+            "arguments.x-max-length": {"existing": None, "desired": 10},
+            "arguments.x-message-ttl": {"existing": 1000, "desired": None},
+        }
+
+    def test_a_queue_without_type_is_a_classic_queue(self):
+        existing = RabbitMqQueue(name="orders", arguments={"x-queue-type": "classic"})
+
+        assert queue_drift(RabbitMqQueue(name="orders"), existing) == {}
+        assert queue_drift(RabbitMqQueue(name="orders", type=RabbitMqQueueType.QUORUM), existing) == {
+            "arguments.x-queue-type": {"existing": "classic", "desired": "quorum"}
+        }
+
+    def test_exchange_type_and_arguments_are_compared(self):
+        existing = RabbitMqExchange(name="orders")
+        desired = RabbitMqExchange(
+            name="orders", type=RabbitMqExchangeType.DIRECT, arguments={"alternate-exchange": "unrouted"}
+        )
+
+        assert exchange_drift(desired, existing) == {
+            "type": {"existing": "topic", "desired": "direct"},
+            "arguments.alternate-exchange": {"existing": None, "desired": "unrouted"},
+        }
+
+
+class TestDriftStrategies:
+    def test_drift_is_only_reported_by_default(self, serve_rabbitmq, tmp_path):
+        management = FakeRabbitMqManagement()
+
+        result = _reconcile(
+            serve_rabbitmq,
+            tmp_path,
+            management,
+            "report",
+            _spec({}),
+            _spec({"x-message-ttl": 60000}, exchange_type="direct"),
+        )
+
+        assert [(change.kind, change.name, change.action) for change in result["plan"]] == [
+            ("exchange", "orders", "drift"),
+            ("queue", "orders-queue", "drift"),
+        ]
+        assert result["plan"][1].details == {
+            "strategy": "report",
+            "drift": {"arguments.x-message-ttl": {"existing": None, "desired": 60000}},
+        }
+        assert management.vhosts[_VHOST].exchanges["orders"]["type"] == "topic"
+        assert management.vhosts[_VHOST].queues["orders-queue"]["arguments"] == {}
+        assert not any(route.startswith(("PUT", "DELETE")) for route in management.request_counts)
+
+    def test_drifted_exchanges_and_empty_queues_are_recreated_with_their_bindings(self, serve_rabbitmq, tmp_path):
+        management = FakeRabbitMqManagement()
+
+        result = _reconcile(
+            serve_rabbitmq,
+            tmp_path,
+            management,
+            "recreate_empty",
+            _spec({}),
+            _spec({"x-message-ttl": 60000}, exchange_type="direct"),
+        )
+
+        vhost = management.vhosts[_VHOST]
+        assert [change.action for change in result["plan"]] == ["recreate", "recreate"]
+        assert vhost.exchanges["orders"]["type"] == "direct"
+        assert vhost.queues["orders-queue"]["arguments"] == {"x-message-ttl": 60000}
+        assert _queue_bindings(management, "orders-queue") == [("orders", "created")]
+        assert [(binding["source"], binding["destination"]) for binding in vhost.bindings if binding["source"]] == [
+            ("orders", "audit"),
+            ("orders", "orders-queue"),
+        ]
+        assert management.request_counts["DELETE /api/queues/{vhost}/{name}"] == 1
+
+    def test_queues_holding_messages_are_not_recreated(self, serve_rabbitmq, tmp_path):
+        management = FakeRabbitMqManagement()
+
+        _reconcile(
+            serve_rabbitmq,
+            tmp_path,
+            management,
+            "recreate_empty",
+            _spec({}),
+            _spec({"x-message-ttl": 60000}),
+            messages=3,
+        )
+
+        queue = management.vhosts[_VHOST].queues["orders-queue"]
+        assert queue["arguments"] == {}
+        assert queue["messages"] == 3
+        assert management.request_counts["DELETE /api/queues/{vhost}/{name}"] == 0
+
+    def test_queues_holding_messages_are_migrated_through_a_temporary_queue(self, serve_rabbitmq, tmp_path):
+        management = FakeRabbitMqManagement()
+
+        _reconcile(
+            serve_rabbitmq,
+            tmp_path,
+            management,
+            "migrate",
+            _spec({}),
+            _spec({"x-message-ttl": 60000, "x-queue-type": "quorum"}),
+            messages=5,
+        )
+
+        vhost = management.vhosts[_VHOST]
+        assert vhost.queues["orders-queue"]["arguments"] == {"x-message-ttl": 60000, "x-queue-type": "quorum"}
+        assert vhost.queues["orders-queue"]["messages"] == 5
+        assert "orders-queue.migrating" not in vhost.queues
+        assert _queue_bindings(management, "orders-queue") == [("orders", "created")]
+        assert _queue_bindings(management, "orders-queue.migrating") == []
+        assert management.request_counts["PUT /api/parameters/shovel/{vhost}/{name}"] == 2
+
+    def test_a_migration_that_does_not_finish_is_not_retried(self, serve_rabbitmq, tmp_path):
+        management = FakeRabbitMqManagement(faults=FaultInjection(stuck_shovels=True))
+
+        with pytest.raises(RabbitMqMigrationError, match="queue 'orders-queue.migrating' was left in place") as error:
+            _reconcile(
+                serve_rabbitmq,
+                tmp_path,
+                management,
+                "migrate",
+                _spec({}),
+                _spec({"x-message-ttl": 60000}),
+                messages=5,
+                migration_timeout_seconds=0.05,
+                retry_max_attempts=3,
+            )
+
+        assert not is_transient_error(error.value)
+        assert error.value.migration_queue == "orders-queue.migrating"
+        # The command was not replayed to wait for the shovel again
+        assert management.request_counts["PUT /api/parameters/shovel/{vhost}/{name}"] == 1
+        assert "orders-queue.migrating" in management.vhosts[_VHOST].queues
+
+    def test_a_rerun_after_a_migration_timed_out_finishes_it(self, serve_rabbitmq, tmp_path):
+        management = FakeRabbitMqManagement(faults=FaultInjection(stuck_shovels=True))
+        config_path = tmp_path / "rabbitmq.json"
+        config_path.write_text(json.dumps(_spec({})))
+
+        async def run() -> None:
+            async with serve_rabbitmq(
+                management,
+                RABBITMQ_VHOST=_VHOST,
+                RABBITMQ_APP_USERNAME="app",
+                RABBITMQ_APP_PASSWORD="app",
+                RABBITMQ_APP_CONFIG_FILE_PATH=str(config_path),
+                RABBITMQ_DRIFT_STRATEGY="migrate",
+                RABBITMQ_MIGRATION_TIMEOUT_SECONDS=0.05,
+            ) as service:
+                handler = CreateRabbitMqCommandHandler(
+                    service, service.rabbitmq_options, BootstrapperOptions(_env_file=None)
+                )
+                await handler.handle(CreateRabbitMqCommand())
+                vhost = management.vhosts[_VHOST]
+                vhost.queues["orders-queue"]["messages"] = 5
+                config_path.write_text(json.dumps(_spec({"x-message-ttl": 60000})))
+                with pytest.raises(RabbitMqMigrationError):
+                    await handler.handle(CreateRabbitMqCommand())
+
+                # The shovel finishes after the run gave up on it, the messages are all parked
+                vhost.queues["orders-queue.migrating"]["messages"] += vhost.queues["orders-queue"]["messages"]
+                vhost.queues["orders-queue"]["messages"] = 0
+                vhost.shovels.clear()
+                management.faults.stuck_shovels = False
+
+                await handler.handle(CreateRabbitMqCommand())
+
+        asyncio.run(run())
+
+        vhost = management.vhosts[_VHOST]
+        assert {name: queue["messages"] for name, queue in vhost.queues.items()} == {"orders-queue": 5}
+        assert vhost.queues["orders-queue"]["arguments"] == {"x-message-ttl": 60000}
+        assert _queue_bindings(management, "orders-queue") == [("orders", "created")]
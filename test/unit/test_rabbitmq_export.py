@@ -0,0 +1,115 @@
+import asyncio
+import json
+
+import pytest
+
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.create_rabbitmq_command import (
+    CreateRabbitMqCommand,
+    CreateRabbitMqCommandHandler,
+)
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.export_rabbitmq_command import (
+    ExportRabbitMqCommand,
+    ExportRabbitMqCommandHandler,
+)
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.plan_rabbitmq_command import (
+    PlanRabbitMqCommand,
+    PlanRabbitMqCommandHandler,
+)
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+
+_VHOST = "cezzis-test"
+
+_SPEC = {
+    "exchanges": [{"name": "orders", "type": "direct"}, {"name": "audit", "type": "fanout"}],
+    "queues": [
+        {"name": "orders-queue", "type": "quorum", "max_length_bytes": 1048576},
+        {"name": "audit-queue", "arguments": {"x-message-ttl": 60000}},
+    ],
+    "bindings": [
+        {"source": "orders", "destination": "orders-queue", "routing_key": "created"},
+        {"source": "orders", "destination": "audit", "destination_type": "exchange"},
+        {"source": "audit", "destination": "audit-queue"},
+        {"source": "amq.topic", "destination": "audit", "destination_type": "exchange", "routing_key": "#"},
+    ],
+    "policies": [{"name": "audit-limits", "pattern": "^audit", "definition": {"max-length": 1000}}],
+    "operator_policies": [{"name": "memory-cap", "pattern": ".*", "definition": {"max-length-bytes": 1073741824}}],
+}
+
+
+def _serve(serve_rabbitmq, management: FakeRabbitMqManagement, config_path):
+    return serve_rabbitmq(
+        management,
+        RABBITMQ_VHOST=_VHOST,
+        RABBITMQ_APP_USERNAME="app",
+        RABBITMQ_APP_PASSWORD="app",
+        RABBITMQ_APP_CONFIG_FILE_PATH=str(config_path),
+    )
+
+
+class TestRabbitMqExport:
+    def test_the_export_is_sorted_and_reconciles_back_without_changes(self, serve_rabbitmq, tmp_path):
+        spec_path = tmp_path / "rabbitmq.json"
+        spec_path.write_text(json.dumps(_SPEC))
+        export_path = tmp_path / "exported.json"
+        management = FakeRabbitMqManagement()
+        result = {}
+
+        async def run() -> None:
+            async with _serve(serve_rabbitmq, management, spec_path) as service:
+                rabbitmq_options = service.rabbitmq_options
+                await CreateRabbitMqCommandHandler(
+                    service, rabbitmq_options, BootstrapperOptions(_env_file=None)
+                ).handle(CreateRabbitMqCommand())
+
+                management.reset_counts()
+                exported = await ExportRabbitMqCommandHandler(service, rabbitmq_options).handle(ExportRabbitMqCommand())
+                result["requests"] = dict(management.request_counts)
+                exported.write(str(export_path))
+
+                export_options = rabbitmq_options.model_copy(update={"app_config_file_path": str(export_path)})
+                result["changes"] = await PlanRabbitMqCommandHandler(service, export_options).handle(
+                    PlanRabbitMqCommand()
+                )
+
+        asyncio.run(run())
+
+        document = json.loads(export_path.read_text())
+        assert [exchange["name"] for exchange in document["exchanges"]] == ["audit", "orders"]
+        assert document["queues"] == [
+            {
+                "name": "audit-queue",
+                "durable": True,
+                "exclusive": False,
+                "auto_delete": False,
+                "arguments": {"x-message-ttl": 60000},
+            },
+            {
+                "name": "orders-queue",
+                "durable": True,
+                "exclusive": False,
+                "auto_delete": False,
+                "arguments": {},
+                "type": "quorum",
+                "max_length_bytes": 1048576,
+            },
+        ]
+        assert [(binding["source"], binding["destination"]) for binding in document["bindings"]] == [
+            ("amq.topic", "audit"),
+            ("audit", "audit-queue"),
+            ("orders", "audit"),
+            ("orders", "orders-queue"),
+        ]
+        assert [policy["name"] for policy in document["policies"]] == ["audit-limits"]
+        assert [policy["name"] for policy in document["operator_policies"]] == ["memory-cap"]
+        assert result["requests"] == {"GET /api/definitions/{vhost}": 1, "GET /api/operator-policies/{vhost}": 1}
+        # Reconciling the exported file against the vhost it came from changes nothing
+        assert result["changes"] == []
+
+    def test_exporting_a_missing_vhost_fails(self, serve_rabbitmq, tmp_path):
+        async def run() -> None:
+            async with _serve(serve_rabbitmq, FakeRabbitMqManagement(), tmp_path / "rabbitmq.json") as service:
+                await service.export_configuration("missing")
+
+        with pytest.raises(ValueError, match="The vhost 'missing' does not exist."):
+            asyncio.run(run())
@@ -0,0 +1,110 @@
+import asyncio
+import json
+
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.create_rabbitmq_command import (
+    CreateRabbitMqCommand,
+    CreateRabbitMqCommandHandler,
+)
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.plan_rabbitmq_command import (
+    plan_rabbitmq_changes,
+)
+from cezzis_com_bootstrapper.domain import (
+    RabbitMqConfiguration,
+    RabbitMqPolicy,
+    RabbitMqPolicyApplyTo,
+    RabbitMqSnapshot,
+)
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+
+_VHOST = "cezzis-test"
+
+
+def _spec(lazy_max_length: int, with_quorum: bool) -> dict:
+    policies = [
+        {
+            "name": "lazy-queues",
+            "pattern": "^lazy\\.",
+            "apply_to": "queues",
+            "priority": 1,
+            "definition": {"max-length": lazy_max_length, "overflow": "reject-publish"},
+        }
+    ]
+    if with_quorum:
+        policies.append({"name": "quorum-delivery", "pattern": ".*", "apply_to": "quorum_queues", "definition": {}})
+    return {
+        "exchanges": [],
+        "queues": [{"name": "lazy.orders"}],
+        "bindings": [],
+        "policies": policies,
+        "operator_policies": [{"name": "memory-cap", "pattern": ".*", "definition": {"max-length-bytes": 1048576}}],
+    }
+
+
+class TestRabbitMqPolicies:
+    def test_policies_are_created_updated_in_place_and_pruned(self, serve_rabbitmq, tmp_path):
+        config_path = tmp_path / "rabbitmq.json"
+        management = FakeRabbitMqManagement()
+        puts = []
+
+        async def run() -> None:
+            async with serve_rabbitmq(
+                management,
+                RABBITMQ_VHOST=_VHOST,
+                RABBITMQ_APP_USERNAME="app",
+                RABBITMQ_APP_PASSWORD="app",
+                RABBITMQ_APP_CONFIG_FILE_PATH=str(config_path),
+            ) as service:
+                handler = CreateRabbitMqCommandHandler(
+                    service, service.rabbitmq_options, BootstrapperOptions(_env_file=None)
+                )
+                for spec in (
+                    _spec(1000, with_quorum=True),
+                    _spec(5000, with_quorum=False),
+                    _spec(5000, with_quorum=False),
+                ):
+                    config_path.write_text(json.dumps(spec))
+                    management.reset_counts()
+                    await handler.handle(CreateRabbitMqCommand())
+                    puts.append(management.request_counts["PUT /api/policies/{vhost}/{name}"])
+
+        asyncio.run(run())
+
+        vhost = management.vhosts[_VHOST]
+        assert set(vhost.policies) == {"lazy-queues"}
+        assert vhost.policies["lazy-queues"]["definition"]["max-length"] == 5000
+        assert vhost.policies["lazy-queues"]["apply-to"] == "queues"
+        assert vhost.operator_policies["memory-cap"]["definition"] == {"max-length-bytes": 1048576}
+        # The queue is never recreated to pick up the new limits
+        assert "lazy.orders" in vhost.queues
+        assert puts == [2, 1, 0]
+
+    def test_plans_policy_changes_against_the_snapshot(self):
+        configuration = RabbitMqConfiguration(
+            queues=[],
+            exchanges=[],
+            bindings=[],
+            policies=[
+                RabbitMqPolicy(name="lazy-queues", pattern="^lazy\\.", definition={"max-length": 5000}),
+                RabbitMqPolicy(name="streams", pattern=".*", apply_to=RabbitMqPolicyApplyTo.STREAMS),
+            ],
+        )
+        snapshot = RabbitMqSnapshot(
+            vhost_exists=True,
+            users=["app"],
+            permissions={"app": {"configure": ".*", "write": ".*", "read": ".*"}},
+            policies=[
+                RabbitMqPolicy(name="lazy-queues", pattern="^lazy\\.", definition={"max-length": 1000}),
+            ],
+            operator_policies=[RabbitMqPolicy(name="memory-cap", pattern=".*")],
+        )
+
+        changes = plan_rabbitmq_changes(configuration, snapshot, vhost=_VHOST, app_username="app")
+
+        assert [(change.action, change.kind, change.name) for change in changes] == [
+            ("update", "policy", "lazy-queues"),
+            ("create", "policy", "streams"),
+            ("delete", "operator_policy", "memory-cap"),
+        ]
+        assert changes[0].details["definition"] == {"max-length": 5000}
+        assert changes[1].details["apply_to"] == "streams"
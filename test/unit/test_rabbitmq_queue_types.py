@@ -0,0 +1,152 @@
+import asyncio
+import contextlib
+import json
+
+import pytest
+
+from benchmarks.fakes.amqp_broker import FakeAmqpServer
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.create_rabbitmq_command import (
+    CreateRabbitMqCommand,
+    CreateRabbitMqCommandHandler,
+)
+from cezzis_com_bootstrapper.domain import RabbitMqQueue, RabbitMqQueueType
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions, RabbitMqOptions
+from cezzis_com_bootstrapper.domain.messaging import validate_rabbitmq_queue
+from cezzis_com_bootstrapper.infrastructure.services.rabbitmq_admin_service import RabbitMqAdminService
+from cezzis_com_bootstrapper.infrastructure.services.rabbitmq_amqp_service import RabbitMqAmqpService
+
+_VHOST = "cezzis-test"
+
+_SPEC = {
+    "exchanges": [],
+    "queues": [
+        {"name": "cocktail-updates", "type": "quorum", "initial_group_size": 3, "max_length_bytes": 1048576},
+        {"name": "audit", "arguments": {"x-message-ttl": 60000}},
+    ],
+    "bindings": [],
+    "super_streams": [
+        {
+            "name": "cocktail-feed",
+            "partitions": 3,
+            "max_length_bytes": 20000000,
+            "stream_max_segment_size_bytes": 500000,
+        }
+    ],
+}
+
+
+def _load(tmp_path, spec: dict):
+    config_path = tmp_path / "rabbitmq.json"
+    config_path.write_text(json.dumps(spec))
+    return asyncio.run(RabbitMqAdminService(RabbitMqOptions(_env_file=None)).load_from_file(str(config_path)))
+
+
+class TestRabbitMqQueueTypes:
+    def test_typed_fields_become_queue_arguments(self, tmp_path):
+        configuration = _load(tmp_path, _SPEC)
+
+        queues = {queue.name: queue for queue in configuration.queues}
+        assert queues["cocktail-updates"].type == RabbitMqQueueType.QUORUM
+        assert queues["cocktail-updates"].declared_arguments() == {
+            "x-queue-type": "quorum",
+            "x-quorum-initial-group-size": 3,
+            "x-max-length-bytes": 1048576,
+        }
+        assert queues["audit"].declared_arguments() == {"x-message-ttl": 60000}
+
+    def test_a_super_stream_expands_into_its_exchange_partitions_and_bindings(self, tmp_path):
+        configuration = _load(tmp_path, _SPEC)
+
+        exchange = configuration.exchanges[0]
+        assert (exchange.name, exchange.type.value, exchange.arguments) == (
+            "cocktail-feed",
+            "direct",
+            {"x-super-stream": True},
+        )
+        partitions = [queue for queue in configuration.queues if queue.name.startswith("cocktail-feed-")]
+        assert [queue.name for queue in partitions] == ["cocktail-feed-0", "cocktail-feed-1", "cocktail-feed-2"]
+        assert partitions[0].declared_arguments() == {
+            "x-queue-type": "stream",
+            "x-max-length-bytes": 20000000,
+            "x-stream-max-segment-size-bytes": 500000,
+        }
+        assert [(binding.routing_key, binding.arguments) for binding in configuration.bindings] == [
+            ("0", {"x-stream-partition-order": 0}),
+            ("1", {"x-stream-partition-order": 1}),
+            ("2", {"x-stream-partition-order": 2}),
+        ]
+
+    def test_every_invalid_queue_and_super_stream_is_reported(self, tmp_path):
+        spec = {
+            "exchanges": [],
+            "queues": [
+                {"name": "replicated", "type": "quorum", "exclusive": True},
+                {"name": "classic", "stream_max_segment_size_bytes": 500000, "initial_group_size": 3},
+                {"name": "feed-a"},
+            ],
+            "bindings": [],
+            "super_streams": [{"name": "feed", "binding_keys": ["a", "a"]}],
+        }
+
+        with pytest.raises(ValueError) as error:
+            _load(tmp_path, spec)
+
+        message = str(error.value)
+        assert "Queue 'replicated' of type 'quorum' must be durable, not exclusive nor auto delete." in message
+        assert "Queue 'classic' sets initial_group_size" in message
+        assert "Queue 'classic' sets stream_max_segment_size_bytes" in message
+        assert "Super stream 'feed' binding keys must be unique." in message
+        assert "The queue 'feed-a' is declared more than once." in message
+
+    def test_a_queue_type_conflicting_with_its_arguments_is_reported(self):
+        queue = RabbitMqQueue(name="orders", type=RabbitMqQueueType.QUORUM, arguments={"x-queue-type": "classic"})
+
+        assert validate_rabbitmq_queue(queue) == [
+            "Queue 'orders' has type 'quorum' but its x-queue-type argument is 'classic'."
+        ]
+
+    @pytest.mark.parametrize("backend", ["management", "amqp"])
+    def test_quorum_queues_and_super_streams_are_declared_once(self, serve_rabbitmq, tmp_path, backend):
+        config_path = tmp_path / "rabbitmq.json"
+        config_path.write_text(json.dumps(_SPEC))
+        management = FakeRabbitMqManagement()
+        writes = []
+
+        async def run() -> None:
+            async with contextlib.AsyncExitStack() as stack:
+                broker = await stack.enter_async_context(FakeAmqpServer(management)) if backend == "amqp" else None
+                service = await stack.enter_async_context(
+                    serve_rabbitmq(
+                        management,
+                        RabbitMqAmqpService if backend == "amqp" else RabbitMqAdminService,
+                        RABBITMQ_ADMIN_USERNAME="admin",
+                        RABBITMQ_VHOST=_VHOST,
+                        RABBITMQ_APP_USERNAME="app",
+                        RABBITMQ_APP_PASSWORD="app",
+                        RABBITMQ_APP_CONFIG_FILE_PATH=str(config_path),
+                        RABBITMQ_AMQP_PORT=broker.port if broker is not None else 5672,
+                    )
+                )
+                handler = CreateRabbitMqCommandHandler(
+                    service, service.rabbitmq_options, BootstrapperOptions(_env_file=None)
+                )
+                for _ in range(2):
+                    management.reset_counts()
+                    if broker is not None:
+                        broker.reset_counts()
+                    await handler.handle(CreateRabbitMqCommand())
+                    writes.append(
+                        sum(count for route, count in management.request_counts.items() if "GET" not in route)
+                        + (broker.round_trips if broker is not None else 0)
+                    )
+
+        asyncio.run(run())
+
+        vhost = management.vhosts[_VHOST]
+        assert vhost.queues["cocktail-updates"]["arguments"]["x-queue-type"] == "quorum"
+        assert vhost.queues["cocktail-feed-2"]["arguments"]["x-queue-type"] == "stream"
+        assert vhost.exchanges["cocktail-feed"]["arguments"] == {"x-super-stream": True}
+        assert len([binding for binding in vhost.bindings if binding["source"] == "cocktail-feed"]) == 3
+        # The second run finds everything in place, including the partition bindings and their arguments
+        assert writes[1] == 0
@@ -0,0 +1,30 @@
+import asyncio
+
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement, FaultInjection
+from benchmarks.reconcile.rabbitmq_benchmark import build_topology, run_reconcile
+
+
+class TestRunReconcile:
+    def test_warm_pass_only_reads(self):
+        result = asyncio.run(run_reconcile(build_topology(40), 40))
+
+        assert result.entities == {"exchanges": 10, "queues": 15, "bindings": 15}
+        assert result.cold.requests_by_route["PUT /api/exchanges/{vhost}/{name}"] == 10
+        assert result.cold.requests_by_route["PUT /api/queues/{vhost}/{name}"] == 15
+        assert not [route for route in result.warm.requests_by_route if not route.startswith("GET ")]
+
+    def test_injected_failures_are_retried(self):
+        faults = FaultInjection(fail_routes={"PUT /api/queues/{vhost}/{name}": 1})
+
+        result = asyncio.run(run_reconcile(build_topology(20), 20, faults, retry_attempts=2))
+
+        assert faults.fail_routes["PUT /api/queues/{vhost}/{name}"] == 0
+        assert result.cold.requests_by_route["PUT /api/queues/{vhost}/{name}"] == 8
+
+
+class TestFakeRabbitMqManagement:
+    def test_new_vhosts_hold_the_default_exchanges(self):
+        vhost = FakeRabbitMqManagement().add_vhost("test")
+
+        assert "" in vhost.exchanges
+        assert vhost.exchanges["amq.topic"]["type"] == "topic"
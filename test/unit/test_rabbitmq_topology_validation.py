@@ -0,0 +1,138 @@
+import asyncio
+import json
+
+import pytest
+
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.create_rabbitmq_command import (
+    CreateRabbitMqCommand,
+    CreateRabbitMqCommandHandler,
+)
+from cezzis_com_bootstrapper.domain import (
+    RabbitMqBinding,
+    RabbitMqBindingType,
+    RabbitMqConfiguration,
+    RabbitMqExchange,
+    RabbitMqQueue,
+)
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+from cezzis_com_bootstrapper.domain.messaging import validate_rabbitmq_topology
+
+_INVALID_SPEC = {
+    "exchanges": [
+        {"name": "orders"},
+        {"name": "orders"},
+        {"name": "amq.custom"},
+        {"name": "audit", "arguments": {"alternate-exchange": "unrouted"}},
+    ],
+    "queues": [
+        {"name": "orders-queue", "arguments": {"x-message-ttl": "60s", "x-dead-letter-exchange": "deadletter"}},
+        {"name": "capped", "arguments": {"x-max-length": True}},
+    ],
+    "bindings": [
+        {"source": "orders", "destination": "orders-queue", "routing_key": "created"},
+        {"source": "orders", "destination": "orders-queue", "routing_key": "created"},
+        {"source": "payments", "destination": "orders-queue"},
+        {"source": "orders", "destination": "missing-queue"},
+    ],
+}
+
+
+def _binding(source: str, destination: str) -> RabbitMqBinding:
+    return RabbitMqBinding(source=source, destination=destination, destination_type=RabbitMqBindingType.EXCHANGE)
+
+
+class TestRabbitMqTopologyValidation:
+    def test_every_problem_is_reported_before_any_request(self, serve_rabbitmq, tmp_path):
+        config_path = tmp_path / "rabbitmq.json"
+        config_path.write_text(json.dumps(_INVALID_SPEC))
+        management = FakeRabbitMqManagement()
+
+        async def run() -> None:
+            async with serve_rabbitmq(
+                management, RABBITMQ_VHOST="cezzis-test", RABBITMQ_APP_CONFIG_FILE_PATH=str(config_path)
+            ) as service:
+                await CreateRabbitMqCommandHandler(
+                    service, service.rabbitmq_options, BootstrapperOptions(_env_file=None)
+                ).handle(CreateRabbitMqCommand())
+
+        with pytest.raises(ValueError) as error:
+            asyncio.run(run())
+
+        message = str(error.value)
+        for expected in (
+            "The exchange 'orders' is declared more than once.",
+            "The exchange 'amq.custom' uses the reserved 'amq.' prefix.",
+            "Exchange 'audit' has the alternate exchange 'unrouted', which is not declared.",
+            "Queue 'orders-queue' argument 'x-message-ttl' must be an integer, got str '60s'.",
+            "Queue 'orders-queue' dead letters to the exchange 'deadletter', which is not declared.",
+            "Queue 'capped' argument 'x-max-length' must be an integer, got bool True.",
+            "Binding from 'orders' to queue 'orders-queue' with routing key 'created' is declared more than once.",
+            "Binding from 'payments' to queue 'orders-queue' with routing key '' references the exchange "
+            "'payments', which is not declared.",
+            "Binding from 'orders' to queue 'missing-queue' with routing key '' references the queue "
+            "'missing-queue', which is not declared.",
+        ):
+            assert expected in message
+        assert management.total_requests == 0
+
+    def test_cycles_of_exchange_to_exchange_bindings_are_reported_once(self):
+        configuration = RabbitMqConfiguration(
+            exchanges=[RabbitMqExchange(name=name) for name in ("a", "b", "c", "d")],
+            queues=[],
+            bindings=[
+                _binding("b", "c"),
+                _binding("c", "a"),
+                _binding("a", "b"),
+                _binding("a", "d"),
+                _binding("d", "d"),
+            ],
+        )
+
+        assert validate_rabbitmq_topology(configuration) == [
+            "Exchange-to-exchange bindings form a cycle: a -> b -> c -> a.",
+            "Exchange-to-exchange bindings form a cycle: d -> d.",
+        ]
+
+    def test_a_deep_chain_of_exchange_to_exchange_bindings_is_not_a_cycle(self):
+        names = [f"e{index}" for index in range(2000)]
+        configuration = RabbitMqConfiguration(
+            exchanges=[RabbitMqExchange(name=name) for name in names],
+            queues=[],
+            bindings=[_binding(source, destination) for source, destination in zip(names, names[1:])],
+        )
+
+        assert validate_rabbitmq_topology(configuration) == []
+
+        # Closing the chain is found without walking it recursively
+        configuration.bindings.append(_binding(names[-1], names[0]))
+        errors = validate_rabbitmq_topology(configuration)
+        assert len(errors) == 1
+        assert errors[0].startswith("Exchange-to-exchange bindings form a cycle: e0 -> e1 -> e2 -> ")
+
+    def test_bindings_differing_only_by_arguments_are_not_duplicates(self):
+        def headers_binding(kind: int) -> RabbitMqBinding:
+            return RabbitMqBinding(source="amq.headers", destination="q", arguments={"x-match": "all", "kind": kind})
+
+        configuration = RabbitMqConfiguration(
+            exchanges=[],
+            queues=[RabbitMqQueue(name="q")],
+            bindings=[headers_binding(1), headers_binding(2)],
+        )
+
+        assert validate_rabbitmq_topology(configuration) == []
+
+        configuration.bindings.append(headers_binding(2))
+        assert validate_rabbitmq_topology(configuration) == [
+            "Binding from 'amq.headers' to queue 'q' with routing key '' and arguments {'x-match': 'all', 'kind': 2} "
+            "is declared more than once."
+        ]
+
+    def test_predeclared_exchanges_can_be_bound(self):
+        configuration = RabbitMqConfiguration(
+            exchanges=[RabbitMqExchange(name="orders")],
+            queues=[],
+            bindings=[_binding("amq.topic", "orders")],
+        )
+
+        assert validate_rabbitmq_topology(configuration) == []
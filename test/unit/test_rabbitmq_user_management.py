@@ -0,0 +1,177 @@
+import asyncio
+import json
+from typing import Callable
+
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.create_rabbitmq_command import (
+    CreateRabbitMqCommand,
+    CreateRabbitMqCommandHandler,
+)
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.plan_rabbitmq_command import (
+    plan_rabbitmq_changes,
+)
+from cezzis_com_bootstrapper.domain import (
+    RabbitMqConfiguration,
+    RabbitMqSnapshot,
+    RabbitMqTopicPermission,
+    RabbitMqUser,
+)
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+
+_SPEC = {
+    "exchanges": [],
+    "queues": [],
+    "bindings": [],
+    "vhosts": [
+        {
+            "name": "accounts",
+            "users": [
+                {
+                    "username": "accounts-api",
+                    "password_env": "ACCOUNTS_API_PASSWORD",
+                    "configure": "^accounts\\.",
+                    "topic_permissions": [{"exchange": "amq.topic", "write": "^accounts\\.", "read": ".*"}],
+                },
+                {"username": "auditor", "password_env": "AUDITOR_PASSWORD", "configure": "", "write": ""},
+            ],
+        }
+    ],
+}
+
+
+def _run(
+    serve_rabbitmq, tmp_path, management: FakeRabbitMqManagement, *runs: tuple[dict, Callable[[], None]]
+) -> list[dict[str, int]]:
+    """Reconciles each spec in turn after its setup, returning the writes each run made."""
+    config_path = tmp_path / "rabbitmq.json"
+    writes = []
+
+    async def run() -> None:
+        async with serve_rabbitmq(
+            management,
+            RABBITMQ_VHOST="cocktails",
+            RABBITMQ_APP_USERNAME="app",
+            RABBITMQ_APP_PASSWORD="app",
+            RABBITMQ_APP_CONFIG_FILE_PATH=str(config_path),
+        ) as service:
+            handler = CreateRabbitMqCommandHandler(
+                service, service.rabbitmq_options, BootstrapperOptions(_env_file=None)
+            )
+            for spec, setup in runs:
+                config_path.write_text(json.dumps(spec))
+                setup()
+                management.reset_counts()
+                await handler.handle(CreateRabbitMqCommand())
+                writes.append(
+                    {route: count for route, count in management.request_counts.items() if not route.startswith("GET")}
+                )
+
+    asyncio.run(run())
+    return writes
+
+
+def _nothing() -> None:
+    pass
+
+
+class TestRabbitMqUserManagement:
+    def test_users_permissions_and_topic_permissions_are_reconciled(self, serve_rabbitmq, tmp_path, monkeypatch):
+        monkeypatch.setenv("ACCOUNTS_API_PASSWORD", "secret")
+        monkeypatch.setenv("AUDITOR_PASSWORD", "secret")
+        management = FakeRabbitMqManagement()
+
+        writes = _run(serve_rabbitmq, tmp_path, management, (_SPEC, _nothing), (_SPEC, _nothing))
+
+        assert management.permissions[("accounts", "accounts-api")] == {
+            "configure": "^accounts\\.",
+            "write": ".*",
+            "read": ".*",
+        }
+        assert management.permissions[("accounts", "auditor")] == {"configure": "", "write": "", "read": ".*"}
+        assert management.topic_permissions[("accounts", "accounts-api")] == [
+            {"exchange": "amq.topic", "write": "^accounts\\.", "read": ".*"}
+        ]
+
+        # The second run finds every user and permission in place
+        assert writes[1] == {}
+
+    def test_stale_users_are_deleted_in_one_request(self, serve_rabbitmq, tmp_path, monkeypatch):
+        monkeypatch.setenv("ACCOUNTS_API_PASSWORD", "secret")
+        monkeypatch.setenv("AUDITOR_PASSWORD", "secret")
+        management = FakeRabbitMqManagement()
+
+        def add_intruders() -> None:
+            for user in ("intruder-1", "intruder-2", "intruder-3"):
+                management.users[user] = {"name": user, "tags": []}
+                management.permissions[("accounts", user)] = {"configure": ".*", "write": ".*", "read": ".*"}
+
+        writes = _run(serve_rabbitmq, tmp_path, management, (_SPEC, _nothing), (_SPEC, add_intruders))
+
+        assert not {"intruder-1", "intruder-2", "intruder-3"} & set(management.users)
+        assert writes[1] == {"POST /api/users/bulk-delete": 1}
+
+    def test_permissions_are_updated_and_revoked_concurrently(self, serve_rabbitmq, tmp_path, monkeypatch):
+        monkeypatch.setenv("ACCOUNTS_API_PASSWORD", "secret")
+        monkeypatch.setenv("AUDITOR_PASSWORD", "secret")
+        management = FakeRabbitMqManagement()
+
+        def grant_app_access() -> None:
+            # The application user of the default vhost was granted access to this vhost by hand
+            management.permissions[("accounts", "app")] = {"configure": ".*", "write": ".*", "read": ".*"}
+
+        spec = json.loads(json.dumps(_SPEC))
+        spec["vhosts"][0]["users"][0]["topic_permissions"] = [{"exchange": "events", "write": ".*", "read": ".*"}]
+        spec["vhosts"][0]["users"][1]["read"] = "^audit\\."
+
+        writes = _run(serve_rabbitmq, tmp_path, management, (_SPEC, _nothing), (spec, grant_app_access))
+
+        assert "app" in management.users
+        assert ("accounts", "app") not in management.permissions
+        assert management.permissions[("accounts", "auditor")]["read"] == "^audit\\."
+        assert management.topic_permissions[("accounts", "accounts-api")] == [
+            {"exchange": "events", "write": ".*", "read": ".*"}
+        ]
+        assert writes[1] == {
+            "PUT /api/permissions/{vhost}/{user}": 1,
+            "DELETE /api/permissions/{vhost}/{user}": 1,
+            "DELETE /api/topic-permissions/{vhost}/{user}": 1,
+            "PUT /api/topic-permissions/{vhost}/{user}": 1,
+        }
+
+    def test_passwords_are_read_from_the_dotenv_files(self, serve_rabbitmq, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("ENV", "test")
+        monkeypatch.delenv("ACCOUNTS_API_PASSWORD", raising=False)
+        monkeypatch.delenv("AUDITOR_PASSWORD", raising=False)
+        (tmp_path / ".env").write_text("ACCOUNTS_API_PASSWORD=from-dotenv\nAUDITOR_PASSWORD=from-dotenv\n")
+        (tmp_path / ".env.test").write_text("AUDITOR_PASSWORD=from-env-file\n")
+        management = FakeRabbitMqManagement()
+
+        _run(serve_rabbitmq, tmp_path, management, (_SPEC, _nothing))
+
+        assert management.passwords["accounts-api"] == "from-dotenv"
+        assert management.passwords["auditor"] == "from-env-file"
+
+    def test_plans_topic_permission_changes_and_revocations(self):
+        configuration = RabbitMqConfiguration(queues=[], exchanges=[], bindings=[])
+        user = RabbitMqUser(
+            username="accounts-api",
+            password_env="ACCOUNTS_API_PASSWORD",
+            topic_permissions=[RabbitMqTopicPermission(exchange="events", write="^accounts\\.")],
+        )
+        snapshot = RabbitMqSnapshot(
+            vhost_exists=True,
+            users=["accounts-api", "app"],
+            permissions={"accounts-api": user.permissions(), "app": user.permissions()},
+            topic_permissions={"accounts-api": [RabbitMqTopicPermission(exchange="amq.topic")]},
+        )
+
+        changes = plan_rabbitmq_changes(
+            configuration, snapshot, vhost="accounts", users=[user], managed_users={"accounts-api", "app"}
+        )
+
+        assert [(change.action, change.kind, change.name) for change in changes] == [
+            ("create", "topic_permission", "accounts-api:events"),
+            ("delete", "topic_permission", "accounts-api:amq.topic"),
+            ("delete", "permission", "app"),
+        ]
@@ -0,0 +1,145 @@
+import asyncio
+import json
+
+import aiohttp
+import pytest
+
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement, FaultInjection
+from cezzis_com_bootstrapper.application.behaviors.pipeline.transient_errors import is_transient_error
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.create_rabbitmq_command import (
+    CreateRabbitMqCommand,
+    CreateRabbitMqCommandHandler,
+)
+from cezzis_com_bootstrapper.application.concerns.messaging.commands.plan_rabbitmq_command import (
+    PlanRabbitMqCommand,
+    PlanRabbitMqCommandHandler,
+)
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+from cezzis_com_bootstrapper.infrastructure.telemetry import reset_run_report
+
+_SPEC = {
+    "exchanges": [{"name": "cocktails"}],
+    "queues": [],
+    "bindings": [],
+    "vhosts": [
+        {
+            "name": "accounts",
+            "users": [
+                {"username": "accounts-api", "password_env": "ACCOUNTS_API_PASSWORD"},
+                {"username": "auditor", "password_env": "AUDITOR_PASSWORD", "configure": "", "write": ""},
+            ],
+            "exchanges": [{"name": "accounts"}],
+            "queues": [{"name": "accounts-created"}],
+            "bindings": [{"source": "accounts", "destination": "accounts-created", "routing_key": "created"}],
+        },
+        {
+            "name": "ingredients",
+            "users": [{"username": "ingredients-api", "password_env": "INGREDIENTS_API_PASSWORD"}],
+            "queues": [{"name": "ingredients-updated", "type": "quorum"}],
+        },
+    ],
+}
+
+
+def _run(
+    serve_rabbitmq,
+    tmp_path,
+    management: FakeRabbitMqManagement,
+    command: str = "create",
+    checkpoint_dir: str = "",
+):
+    config_path = tmp_path / "rabbitmq.json"
+    config_path.write_text(json.dumps(_SPEC))
+
+    async def run():
+        async with serve_rabbitmq(
+            management,
+            RABBITMQ_VHOST="cocktails",
+            RABBITMQ_APP_USERNAME="app",
+            RABBITMQ_APP_PASSWORD="app",
+            RABBITMQ_APP_CONFIG_FILE_PATH=str(config_path),
+        ) as service:
+            if command == "plan":
+                return await PlanRabbitMqCommandHandler(service, service.rabbitmq_options).handle(PlanRabbitMqCommand())
+            bootstrapper_options = BootstrapperOptions(_env_file=None, BOOTSTRAPPER_CHECKPOINT_DIR=checkpoint_dir)
+            return await CreateRabbitMqCommandHandler(service, service.rabbitmq_options, bootstrapper_options).handle(
+                CreateRabbitMqCommand()
+            )
+
+    return asyncio.run(run())
+
+
+class TestRabbitMqVhosts:
+    def test_every_vhost_gets_its_users_and_topology(self, serve_rabbitmq, tmp_path, monkeypatch):
+        for variable in ("ACCOUNTS_API_PASSWORD", "AUDITOR_PASSWORD", "INGREDIENTS_API_PASSWORD"):
+            monkeypatch.setenv(variable, "secret")
+        management = FakeRabbitMqManagement()
+        report = reset_run_report()
+
+        assert _run(serve_rabbitmq, tmp_path, management)
+
+        assert set(management.vhosts) == {"cocktails", "accounts", "ingredients"}
+        assert set(management.vhosts["accounts"].exchanges) >= {"accounts"}
+        assert "cocktails" not in management.vhosts["accounts"].exchanges
+        assert "ingredients-updated" in management.vhosts["ingredients"].queues
+        assert management.permissions[("accounts", "auditor")] == {"configure": "", "write": "", "read": ".*"}
+        # Users of one vhost are not pruned as extraneous users of another
+        assert {"app", "accounts-api", "auditor", "ingredients-api"} <= set(management.users)
+        assert {vhost: target.outcome for vhost, target in report.concerns["rabbitmq"].targets.items()} == {
+            "cocktails": "succeeded",
+            "accounts": "succeeded",
+            "ingredients": "succeeded",
+        }
+
+    def test_a_failing_vhost_does_not_stop_the_others(self, serve_rabbitmq, tmp_path, monkeypatch):
+        for variable in ("ACCOUNTS_API_PASSWORD", "AUDITOR_PASSWORD", "INGREDIENTS_API_PASSWORD"):
+            monkeypatch.setenv(variable, "secret")
+        # Only the ingredients vhost is missing, and the broker refuses to create it
+        management = FakeRabbitMqManagement(
+            faults=FaultInjection(fail_routes={"PUT /api/vhosts/{vhost}": 1}, failure_status=400)
+        )
+        management.add_vhost("cocktails")
+        management.add_vhost("accounts")
+        report = reset_run_report()
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            _run(serve_rabbitmq, tmp_path, management, checkpoint_dir=str(tmp_path))
+
+        assert "accounts-created" in management.vhosts["accounts"].queues
+        assert "ingredients" not in management.vhosts
+        targets = report.concerns["rabbitmq"].targets
+        assert targets["ingredients"].outcome == "failed"
+        assert targets["accounts"].outcome == "succeeded"
+        # The journal is kept so the retry only redoes the failed vhost
+        assert (tmp_path / "rabbitmq.journal").exists()
+
+    def test_missing_passwords_fail_before_any_request(self, serve_rabbitmq, tmp_path, monkeypatch):
+        monkeypatch.setenv("ACCOUNTS_API_PASSWORD", "secret")
+        monkeypatch.delenv("AUDITOR_PASSWORD", raising=False)
+        monkeypatch.delenv("INGREDIENTS_API_PASSWORD", raising=False)
+        management = FakeRabbitMqManagement()
+
+        with pytest.raises(ValueError, match="AUDITOR_PASSWORD(.|\n)*INGREDIENTS_API_PASSWORD"):
+            _run(serve_rabbitmq, tmp_path, management, checkpoint_dir=str(tmp_path))
+
+        assert not management.request_counts
+        assert not (tmp_path / "rabbitmq.journal").exists()
+
+    def test_plans_the_changes_of_every_vhost(self, serve_rabbitmq, tmp_path):
+        management = FakeRabbitMqManagement()
+        management.add_vhost("accounts")
+
+        changes = _run(serve_rabbitmq, tmp_path, management, command="plan")
+
+        listed = [(change.details.get("vhost"), change.action, change.kind, change.name) for change in changes]
+        assert ("accounts", "create", "permission", "auditor") in listed
+        assert ("ingredients", "create", "vhost", "ingredients") in listed
+        assert ("ingredients", "create", "queue", "ingredients-updated") in listed
+        assert (None, "create", "exchange", "cocktails") in listed
+        assert not any(action == "delete" for _, action, _, _ in listed)
+
+
+class TestTransientErrorGroups:
+    def test_a_group_is_transient_only_when_every_error_is(self):
+        assert is_transient_error(ExceptionGroup("vhosts", [ConnectionResetError(), TimeoutError()]))
+        assert not is_transient_error(ExceptionGroup("vhosts", [ConnectionResetError(), ValueError("bad")]))
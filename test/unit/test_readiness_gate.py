@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from benchmarks.fakes.rabbitmq_management import FakeRabbitMqManagement
+from cezzis_com_bootstrapper.application.behaviors.readiness import ReadinessGate, reconcile_when_ready
+from cezzis_com_bootstrapper.concern_registry import CONCERN_REGISTRY
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+
+
+def _gate(**overrides) -> ReadinessGate:
+    values = {
+        "BOOTSTRAPPER_READINESS_TIMEOUT_SECONDS": 1,
+        "BOOTSTRAPPER_READINESS_BASE_DELAY_SECONDS": 0.001,
+        "BOOTSTRAPPER_READINESS_MAX_DELAY_SECONDS": 0.005,
+        **overrides,
+    }
+    return ReadinessGate(BootstrapperOptions(_env_file=None, **values))
+
+
+def _probe(failures: int):
+    attempts: list[int] = []
+
+    async def probe():
+        attempts.append(len(attempts) + 1)
+        if len(attempts) <= failures:
+            raise ConnectionRefusedError()
+
+    return probe, attempts
+
+
+class TestReadinessGate:
+    def test_probes_until_the_target_answers(self):
+        probe, attempts = _probe(failures=2)
+
+        asyncio.run(_gate().wait_until_ready("rabbitmq", probe))
+
+        assert attempts == [1, 2, 3]
+
+    def test_fails_at_the_deadline_with_the_last_error(self):
+        probe, attempts = _probe(failures=1000)
+
+        with pytest.raises(TimeoutError, match="rabbitmq was not ready within 0.05 seconds") as error:
+            asyncio.run(_gate(BOOTSTRAPPER_READINESS_TIMEOUT_SECONDS=0.05).wait_until_ready("rabbitmq", probe))
+
+        assert isinstance(error.value.__cause__, ConnectionRefusedError)
+        assert len(attempts) > 1
+
+    def test_a_zero_timeout_skips_probing(self):
+        probe, attempts = _probe(failures=1000)
+
+        asyncio.run(_gate(BOOTSTRAPPER_READINESS_TIMEOUT_SECONDS=0).wait_until_ready("rabbitmq", probe))
+
+        assert attempts == []
+
+    def test_concerns_start_as_soon_as_their_own_target_answers(self, mocker):
+        concerns = {concern.name: concern for concern in CONCERN_REGISTRY}
+        reconciled: list[str] = []
+        mediator = mocker.Mock()
+
+        async def send_async(command):
+            reconciled.append(type(command).__name__)
+
+        mediator.send_async = send_async
+        slow_probe, _ = _probe(failures=1000)
+        ready_probe, _ = _probe(failures=0)
+        gate = _gate(BOOTSTRAPPER_READINESS_TIMEOUT_SECONDS=0.1)
+
+        async def run():
+            return await asyncio.gather(
+                reconcile_when_ready(mediator, concerns["rabbitmq"], gate, slow_probe),
+                reconcile_when_ready(mediator, concerns["kafka"], gate, ready_probe),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+
+        assert isinstance(results[0], TimeoutError)
+        assert results[1] is None
+        assert reconciled == ["CreateKafkaCommand"]
+
+
+class TestRabbitMqProbe:
+    def test_probes_the_management_overview(self, serve_rabbitmq):
+        management = FakeRabbitMqManagement()
+
+        async def probe():
+            async with serve_rabbitmq(management) as service:
+                await _gate().wait_until_ready("rabbitmq", service.probe)
+
+        asyncio.run(probe())
+
+        assert management.request_counts == {"GET /api/overview": 1}
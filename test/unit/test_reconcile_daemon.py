@@ -0,0 +1,133 @@
+import asyncio
+import json
+
+from cezzis_com_bootstrapper.application.behaviors.reconcile import reconcile_daemon
+from cezzis_com_bootstrapper.application.behaviors.reconcile.reconcile_daemon import ReconcileDaemon
+from cezzis_com_bootstrapper.application.behaviors.reconcile.spec_file_watcher import SpecFileWatcher
+from cezzis_com_bootstrapper.concern_registry import CONCERN_REGISTRY
+from cezzis_com_bootstrapper.domain.config import BootstrapperOptions
+
+
+class _RecordingMediator:
+    def __init__(self, failing: set[str] | None = None):
+        self.sent: list[str] = []
+        self.failing = failing or set()
+
+    async def send_async(self, request):
+        name = type(request).__name__
+        self.sent.append(name)
+        if name in self.failing:
+            raise RuntimeError(f"{name} failed")
+
+
+class TestSpecFileWatcher:
+    def test_reports_changed_file_after_debounce(self, tmp_path):
+        spec_file = tmp_path / "rabbitmq.json"
+        other_file = tmp_path / "other.json"
+        spec_file.write_text("{}")
+        other_file.write_text("{}")
+        watcher = SpecFileWatcher([str(spec_file), str(other_file)], poll_interval_seconds=0.01, debounce_seconds=0.05)
+
+        async def change_then_wait():
+            task = asyncio.create_task(watcher.wait_for_changes())
+            await asyncio.sleep(0.02)
+            spec_file.write_text('{"vhosts": []}')
+            return await asyncio.wait_for(task, timeout=2)
+
+        assert asyncio.run(change_then_wait()) == {str(spec_file)}
+
+    def test_unchanged_content_is_not_reported(self, tmp_path):
+        spec_file = tmp_path / "rabbitmq.json"
+        spec_file.write_text("{}")
+        watcher = SpecFileWatcher([str(spec_file)], poll_interval_seconds=0.01, debounce_seconds=0)
+
+        async def rewrite_then_wait():
+            task = asyncio.create_task(watcher.wait_for_changes())
+            spec_file.write_text("{}")
+            try:
+                await asyncio.wait_for(task, timeout=0.1)
+            except asyncio.TimeoutError:
+                return False
+            return True
+
+        assert asyncio.run(rewrite_then_wait()) is False
+
+
+class TestReconcileDaemon:
+    def _options(self, **overrides) -> BootstrapperOptions:
+        values = {
+            "BOOTSTRAPPER_RUN_MODE": "daemon",
+            "BOOTSTRAPPER_RECONCILE_INTERVAL_SECONDS": 60,
+            "BOOTSTRAPPER_WATCH_POLL_INTERVAL_SECONDS": 0.01,
+            "BOOTSTRAPPER_WATCH_DEBOUNCE_SECONDS": 0,
+            **overrides,
+        }
+        return BootstrapperOptions(**values)
+
+    def test_spec_change_only_reconciles_affected_concerns(self, tmp_path, mocker):
+        spec_file = tmp_path / "rabbitmq.json"
+        spec_file.write_text("{}")
+        mocker.patch.object(
+            reconcile_daemon,
+            "get_spec_files",
+            side_effect=lambda concern: [str(spec_file)] if concern.name == "rabbitmq" else [],
+        )
+        mediator = _RecordingMediator()
+        daemon = ReconcileDaemon(mediator, self._options(), list(CONCERN_REGISTRY))
+
+        async def run_and_change():
+            task = asyncio.create_task(daemon.run())
+            await asyncio.sleep(0.05)
+            spec_file.write_text('{"vhosts": []}')
+            await asyncio.sleep(0.1)
+            task.cancel()
+
+        asyncio.run(run_and_change())
+
+        assert mediator.sent == [
+            "CreateRabbitMqCommand",
+            "CreateBlobStorageCommand",
+            "CreateKafkaCommand",
+            "CreateRabbitMqCommand",
+        ]
+
+    def test_failing_concern_does_not_stop_drift_correction(self, mocker):
+        mocker.patch.object(reconcile_daemon, "get_spec_files", return_value=[])
+        mediator = _RecordingMediator(failing={"CreateRabbitMqCommand"})
+        concerns = [concern for concern in CONCERN_REGISTRY if concern.name in {"rabbitmq", "kafka"}]
+        daemon = ReconcileDaemon(mediator, self._options(BOOTSTRAPPER_RECONCILE_INTERVAL_SECONDS=0.1), concerns)
+
+        async def run_two_cycles():
+            task = asyncio.create_task(daemon.run())
+            await asyncio.sleep(0.15)
+            task.cancel()
+
+        asyncio.run(run_two_cycles())
+
+        assert mediator.sent == ["CreateRabbitMqCommand", "CreateKafkaCommand"] * 2
+
+    def test_frequent_spec_changes_do_not_delay_drift_correction(self, tmp_path, mocker):
+        spec_file = tmp_path / "rabbitmq.json"
+        spec_file.write_text("{}")
+        mocker.patch.object(
+            reconcile_daemon,
+            "get_spec_files",
+            side_effect=lambda concern: [str(spec_file)] if concern.name == "rabbitmq" else [],
+        )
+        mediator = _RecordingMediator()
+        concerns = [concern for concern in CONCERN_REGISTRY if concern.name in {"rabbitmq", "kafka"}]
+        daemon = ReconcileDaemon(mediator, self._options(BOOTSTRAPPER_RECONCILE_INTERVAL_SECONDS=0.1), concerns)
+
+        async def run_and_keep_changing():
+            task = asyncio.create_task(daemon.run())
+            # The spec file changes more often than the drift-correction interval
+            for index in range(12):
+                await asyncio.sleep(0.03)
+                spec_file.write_text(json.dumps({"revision": index}))
+            task.cancel()
+
+        asyncio.run(run_and_keep_changing())
+
+        # Kafka has no spec file, it only runs at startup and on drift correction
+        assert mediator.sent.count("CreateKafkaCommand") >= 2
+        assert mediator.sent.count("CreateRabbitMqCommand") > mediator.sent.count("CreateKafkaCommand")
@@ -0,0 +1,99 @@
+import asyncio
+import json
+
+import pytest
+from confluent_kafka import KafkaException
+
+from benchmarks.fakes.kafka_admin import FakeKafkaAdmin, FakeKafkaService, KafkaFaultInjection
+from cezzis_com_bootstrapper.application.behaviors.reconcile import reconcile_concern
+from cezzis_com_bootstrapper.concern_registry import CONCERN_REGISTRY
+from cezzis_com_bootstrapper.domain.config import KafkaOptions
+from cezzis_com_bootstrapper.infrastructure.telemetry import (
+    EntityAction,
+    RunReport,
+    get_bootstrapper_metrics,
+    reset_run_report,
+    trace_operation,
+)
+
+
+@pytest.fixture
+def report() -> RunReport:
+    return reset_run_report()
+
+
+def _kafka_service(admin: FakeKafkaAdmin) -> FakeKafkaService:
+    return FakeKafkaService(KafkaOptions(_env_file=None, KAFKA_BOOTSTRAP_SERVERS="fake:9092"), admin)
+
+
+class TestRunReport:
+    def test_records_each_resource_of_a_batched_operation(self, report):
+        admin = FakeKafkaAdmin()
+        admin.add_topics(1, 3, prefix="orders")
+
+        asyncio.run(_kafka_service(admin).create_topics({"orders-00000": 3, "payments": 2}))
+
+        kafka = report.to_dict()["concerns"]["kafka"]
+        assert [(resource["name"], resource["action"]) for resource in kafka["resources"]] == [
+            ("orders-00000", "unchanged"),
+            ("payments", "created"),
+        ]
+        assert all(resource["api_calls"] == 2 for resource in kafka["resources"])
+        assert kafka["actions"] == {"unchanged": 1, "created": 1}
+
+    def test_reports_a_failure_once_on_the_innermost_entity(self, report):
+        with pytest.raises(RuntimeError):
+            with trace_operation("rabbitmq", "create_queue_if_not_exists", kind="queue", entity="orders"):
+                with trace_operation("rabbitmq", "create_queue_for_vhost", kind="queue", entity="orders"):
+                    with get_bootstrapper_metrics().time_api_call("rabbitmq_management", "PUT"):
+                        raise RuntimeError("boom")
+
+        resources = report.to_dict()["concerns"]["rabbitmq"]["resources"]
+        assert resources == [
+            {
+                "kind": "queue",
+                "name": "orders",
+                "operation": "create_queue_for_vhost",
+                "action": "failed",
+                "duration_seconds": resources[0]["duration_seconds"],
+                "api_calls": 1,
+            }
+        ]
+
+    def test_keeps_only_the_slowest_operations(self):
+        report = RunReport(slowest_operations=2)
+        for duration in (0.3, 0.1, 0.5, 0.2):
+            report.record_operation("kafka", "list_topics", "", duration, 1, "success")
+
+        durations = [entry["duration_seconds"] for entry in report.to_dict()["slowest_operations"]]
+        assert durations == [0.5, 0.3]
+
+    def test_writes_to_stdout_or_a_file(self, report, capsys, tmp_path):
+        with trace_operation("blob_storage", "create_container", kind="container", entity="images") as operation:
+            operation.record(EntityAction.CREATED)
+
+        report.write("-")
+        report.write(str(tmp_path / "report.json"))
+
+        written = json.loads((tmp_path / "report.json").read_text())
+        assert json.loads(capsys.readouterr().out)["concerns"] == written["concerns"]
+        assert written["slowest_operations"][0]["entity"] == "images"
+
+    def test_reconcile_concern_records_the_concern_outcome(self, report, mocker):
+        concern = next(concern for concern in CONCERN_REGISTRY if concern.name == "kafka")
+        admin = FakeKafkaAdmin(faults=KafkaFaultInjection(controller_error_rate=1.0))
+        mediator = mocker.Mock()
+
+        async def send_async(command):
+            await _kafka_service(admin).create_topics({"payments": 2})
+
+        mediator.send_async = send_async
+
+        with pytest.raises(KafkaException):
+            asyncio.run(reconcile_concern(mediator, concern))
+
+        document = report.to_dict()
+        assert document["outcome"] == "failed"
+        assert document["concerns"]["kafka"]["outcome"] == "failed"
+        assert document["concerns"]["kafka"]["api_calls"] == 2
+        assert document["concerns"]["kafka"]["actions"] == {"failed": 1}
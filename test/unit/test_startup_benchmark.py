@@ -0,0 +1,47 @@
+from benchmarks.startup.startup_benchmark import ScenarioResult, check_budgets, compare_to_baseline, parse_importtime
+
+_IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      1500 |       2100 |     pydantic.types
+import time:       300 |       2400 |   pydantic
+import time:       900 |       3300 | cezzis_com_bootstrapper.domain
+Some unrelated stderr line
+"""
+
+
+def _result(**phases_ms: float) -> ScenarioResult:
+    return ScenarioResult(scenario="kafka_only", runs=1, phases_ms=phases_ms, import_total_ms=50.0)
+
+
+class TestStartupBenchmark:
+    def test_parse_importtime_reads_depth_and_timings(self):
+        timings = parse_importtime(_IMPORTTIME_OUTPUT)
+
+        assert [timing.module for timing in timings] == [
+            "_io",
+            "pydantic.types",
+            "pydantic",
+            "cezzis_com_bootstrapper.domain",
+        ]
+        assert [timing.depth for timing in timings] == [1, 2, 1, 0]
+        assert timings[-1].self_us == 900
+        assert timings[-1].cumulative_us == 3300
+
+    def test_check_budgets_applies_scenario_overrides(self):
+        budgets = {"default": {"imports": 100, "total": 1000}, "scenarios": {"kafka_only": {"imports": 10}}}
+
+        violations = check_budgets(_result(imports=20.0, settings=1.0), budgets)
+
+        assert violations == ["kafka_only: imports took 20.0ms, budget is 10.0ms"]
+
+    def test_check_budgets_passes_within_budget(self):
+        budgets = {"default": {"imports": 100, "imports_total": 60}}
+
+        assert check_budgets(_result(imports=20.0), budgets) == []
+
+    def test_compare_to_baseline_reports_phase_deltas(self):
+        baseline = {"kafka_only": {"phases_ms": {"imports": 15.0, "otel": 5.0}}}
+
+        deltas = compare_to_baseline(_result(imports=20.0, otel=4.0, settings=1.0), baseline)
+
+        assert deltas == {"imports": 5.0, "otel": -1.0}
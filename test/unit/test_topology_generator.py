@@ -0,0 +1,66 @@
+import asyncio
+
+import pytest
+
+from benchmarks.topology.topology_generator import TopologySpec, generate_topology, to_document, write_topology
+from cezzis_com_bootstrapper.domain.config import RabbitMqOptions
+from cezzis_com_bootstrapper.domain.messaging import RabbitMqBindingType
+from cezzis_com_bootstrapper.infrastructure.services.rabbitmq_admin_service import RabbitMqAdminService
+
+_SPEC = TopologySpec(exchanges=20, queues=50, bindings=80, argument_queues=10, exchange_bindings=15, seed=7)
+
+
+class TestGenerateTopology:
+    def test_generates_the_requested_counts(self):
+        configuration = generate_topology(_SPEC)
+
+        assert len(configuration.exchanges) == 20
+        assert len(configuration.queues) == 50
+        assert len([queue for queue in configuration.queues if queue.arguments]) == 10
+        assert len([b for b in configuration.bindings if b.destination_type == RabbitMqBindingType.QUEUE]) == 80
+        assert len([b for b in configuration.bindings if b.destination_type == RabbitMqBindingType.EXCHANGE]) == 15
+
+    def test_is_deterministic_for_a_seed(self):
+        assert to_document(generate_topology(_SPEC)) == to_document(generate_topology(_SPEC))
+        assert to_document(generate_topology(_SPEC)) != to_document(
+            generate_topology(TopologySpec(**{**vars(_SPEC), "seed": 8}))
+        )
+
+    def test_references_only_declared_entities(self):
+        configuration = generate_topology(_SPEC)
+        exchanges = [exchange.name for exchange in configuration.exchanges]
+        queues = {queue.name for queue in configuration.queues}
+
+        assert len(set(exchanges)) == len(exchanges)
+        for binding in configuration.bindings:
+            assert binding.source in exchanges
+            if binding.destination_type == RabbitMqBindingType.EXCHANGE:
+                assert exchanges.index(binding.source) < exchanges.index(binding.destination)
+            else:
+                assert binding.destination in queues
+        for queue in configuration.queues:
+            if queue.arguments:
+                assert queue.arguments["x-dead-letter-exchange"] in exchanges
+
+    def test_rejects_impossible_specs(self):
+        with pytest.raises(ValueError, match="argument_queues must not exceed queues"):
+            generate_topology(TopologySpec(exchanges=1, queues=1, bindings=0, argument_queues=2))
+        with pytest.raises(ValueError, match="exchange_bindings require at least two exchanges"):
+            generate_topology(TopologySpec(exchanges=1, queues=1, bindings=0, exchange_bindings=1))
+
+    def test_round_trips_through_the_service_loader(self, tmp_path):
+        configuration = generate_topology(_SPEC)
+        file_path = tmp_path / "rabbitmq.json"
+        write_topology(configuration, file_path)
+
+        loaded = asyncio.run(RabbitMqAdminService(RabbitMqOptions(_env_file=None)).load_from_file(str(file_path)))
+
+        assert loaded == configuration
+
+
+class TestTopologySpec:
+    def test_for_size_spreads_the_entities(self):
+        spec = TopologySpec.for_size(100)
+
+        assert (spec.exchanges, spec.queues, spec.bindings, spec.exchange_bindings) == (25, 37, 35, 3)
+        assert spec.argument_queues == 3